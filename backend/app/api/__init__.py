@@ -24,7 +24,7 @@ from .jobs import (
 from .queue import router as queue_router, set_job_queue as set_queue_job_queue
 from .cleanup import router as cleanup_router
 from .segments import router as segments_router
-from .export import router as export_router
+from .export import router as export_router, set_export_progress_registry
 from .media import router as media_router
 from .channels import router as channels_router
 from .scenemind import (
@@ -113,6 +113,7 @@ __all__ = [
     "set_waveform_worker",
     "set_timelines_frame_capture_worker",
     "set_jobs_dir",
+    "set_export_progress_registry",
     # Job/Queue Setup functions
     "set_job_manager",
     "set_job_queue",
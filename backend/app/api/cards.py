@@ -17,6 +17,8 @@ from app.models.card import (
     TimelineAnnotations,
 )
 from app.services.card_cache import CardCache
+from app.services.image_store import get_image_store
+from app.services.transcript_index import TranscriptIndex
 from app.services.timeline_manager import TimelineManager
 from app.workers.card_generator import CardGeneratorWorker
 from app.workers.ner import NERWorker
@@ -68,6 +70,12 @@ def _get_card_generator() -> CardGeneratorWorker:
     return _card_generator
 
 
+def _forget_card(card_type: str, card_id: str) -> None:
+    """Drop the generator's recent lookup results for a card changed here."""
+    if _card_generator is not None:
+        _card_generator.forget(card_type, card_id)
+
+
 def _get_ner_worker() -> NERWorker:
     """Get the NER worker instance."""
     if _ner_worker is None:
@@ -128,6 +136,7 @@ async def delete_word_card(word: str):
     """Delete a word card from cache."""
     cache = _get_card_cache()
 
+    _forget_card("word", word)
     if cache.delete_word_card(word):
         return {"message": f"Word card '{word}' deleted from cache"}
     else:
@@ -355,6 +364,7 @@ async def delete_entity_card(entity_id: str):
     """Delete an entity card from cache."""
     cache = _get_card_cache()
 
+    _forget_card("entity", entity_id)
     if cache.delete_entity_card(entity_id):
         return {"message": f"Entity card '{entity_id}' deleted from cache"}
     else:
@@ -384,7 +394,7 @@ async def generate_cards_for_timeline(
     generator = _get_card_generator()
 
     # Extract vocabulary and entities
-    annotations = ner_worker.process_timeline(
+    annotations = await ner_worker.annotate_timeline(
         timeline,
         extract_vocabulary=True,
         extract_entities=True,
@@ -437,6 +447,8 @@ async def get_timeline_annotations(
     """Get NER annotations for a timeline.
 
     Returns vocabulary words and entities extracted from the timeline.
+    Results are cached by segment text, so this is a cache read unless
+    segments changed since the last request.
     """
     manager = _get_timeline_manager()
     timeline = manager.get_timeline(timeline_id)
@@ -446,7 +458,7 @@ async def get_timeline_annotations(
 
     ner_worker = _get_ner_worker()
 
-    annotations = ner_worker.process_timeline(
+    annotations = await ner_worker.annotate_timeline(
         timeline,
         extract_vocabulary=True,
         extract_entities=True,
@@ -498,25 +510,11 @@ async def analyze_timeline_entities(
     if not timeline:
         raise HTTPException(status_code=404, detail="Timeline not found")
 
-    # Build full text with segment boundaries
-    # Format: each segment's English text with a marker
-    segment_texts = []
-    segment_boundaries = []  # (start_char, end_char, segment_id)
-    current_pos = 0
-
-    for segment in timeline.segments:
-        text = segment.en.strip()
-        if not text:
-            continue
-        start = current_pos
-        end = current_pos + len(text)
-        segment_texts.append(text)
-        segment_boundaries.append((start, end, segment.id))
-        current_pos = end + 1  # +1 for separator
-
-    full_text = " ".join(segment_texts)
+    # Full text (segments joined by spaces) with a char offset → segment index
+    index = TranscriptIndex(timeline.segments)
+    full_text = index.text
 
-    logger.info(f"Analyzing entities for timeline {timeline_id}: {len(full_text)} chars, {len(segment_boundaries)} segments")
+    logger.info(f"Analyzing entities for timeline {timeline_id}: {len(full_text)} chars, {len(index)} segments")
 
     # Call TomTrove for full-text entity recognition
     generator = _get_card_generator()
@@ -579,36 +577,36 @@ async def analyze_timeline_entities(
     except Exception as e:
         logger.error(f"Failed to call TomTrove for full-text entity recognition: {e}")
 
-    # Map entities back to segments
-    segment_annotations = {}
+    # Map entities back to segments; a mention straddling a segment boundary
+    # is split into one annotation per segment
+    segment_entities = [[] for _ in range(len(index))]
     unique_entity_ids = set()
 
-    for start, end, segment_id in segment_boundaries:
-        segment_entities = []
-        for entity in all_entities:
-            # Check if entity overlaps with this segment
-            e_start = entity["char_start"]
-            e_end = entity["char_end"]
-            if e_start >= start and e_end <= end:
-                # Adjust position relative to segment
-                segment_entities.append(EntityAnnotation(
-                    text=entity["text"],
-                    entity_id=entity["entity_id"],
-                    entity_type=entity["entity_type"],
-                    start_char=e_start - start,
-                    end_char=e_end - start,
-                    confidence=entity["confidence"],
-                ))
-                if entity["entity_id"]:
-                    unique_entity_ids.add(entity["entity_id"])
-
-        # Create annotation for this segment
-        annotation = SegmentAnnotations(
+    for entity in all_entities:
+        parts = index.split(entity["char_start"], entity["char_end"])
+        for position, local_start, local_end in parts:
+            text = entity["text"]
+            if len(parts) > 1:
+                text = index.texts[position][local_start:local_end]
+            segment_entities[position].append(EntityAnnotation(
+                text=text,
+                entity_id=entity["entity_id"],
+                entity_type=entity["entity_type"],
+                start_char=local_start,
+                end_char=local_end,
+                confidence=entity["confidence"],
+            ))
+        if parts and entity["entity_id"]:
+            unique_entity_ids.add(entity["entity_id"])
+
+    segment_annotations = {
+        segment_id: SegmentAnnotations(
             segment_id=segment_id,
             words=[],
-            entities=segment_entities,
-        )
-        segment_annotations[segment_id] = annotation.model_dump()
+            entities=entities,
+        ).model_dump()
+        for segment_id, entities in zip(index.segment_ids, segment_entities)
+    }
 
     # Update timeline with all annotations
     timeline.segment_annotations = segment_annotations
@@ -618,10 +616,10 @@ async def analyze_timeline_entities(
 
     return FullTextEntityResponse(
         timeline_id=timeline_id,
-        segments_analyzed=len(segment_boundaries),
+        segments_analyzed=len(index),
         total_entities=len(all_entities),
         unique_entities=len(unique_entity_ids),
-        message=f"Analyzed {len(segment_boundaries)} segments, found {len(unique_entity_ids)} unique entities",
+        message=f"Analyzed {len(index)} segments, found {len(unique_entity_ids)} unique entities",
     )
 
 
@@ -761,8 +759,7 @@ async def add_manual_entity(
 
             # Create and cache a custom EntityCard
             from app.models.card import EntityCard
-            from app.services.card_cache import CardCache
-            cache = CardCache()
+            cache = _get_card_cache()
             custom_card = EntityCard(
                 entity_id=entity_id,
                 entity_type=entity_type,
@@ -771,6 +768,7 @@ async def add_manual_entity(
                 source="custom",
             )
             cache.set_entity_card(custom_card)
+            _forget_card("entity", entity_id)
         else:
             return ManualEntityResponse(
                 success=False,
@@ -785,8 +783,7 @@ async def add_manual_entity(
         # Update cached entity card if custom fields provided
         if request.custom_name or request.custom_description:
             from app.models.card import EntityCard as EC
-            from app.services.card_cache import CardCache
-            cache = CardCache()
+            cache = _get_card_cache()
             updated_card = EC(
                 entity_id=entity_id,
                 entity_type=entity_type,
@@ -799,6 +796,7 @@ async def add_manual_entity(
                 localizations=entity_card.localizations if entity_card else {},
             )
             cache.set_entity_card(updated_card)
+            _forget_card("entity", entity_id)
             entity_name = updated_card.name
 
     # Calculate position if not provided
@@ -940,6 +938,7 @@ async def add_manual_idiom(
         if card:
             cache = _get_card_cache()
             cache.set_idiom_card(card)
+            _forget_card("idiom", request.text)
             logger.info(f"Cached idiom card for '{request.text}'")
     except Exception as e:
         logger.warning(f"Failed to fetch idiom card for '{request.text}': {e}")
@@ -1201,9 +1200,18 @@ async def get_segment_annotations(request: SegmentAnnotationRequest):
 
 @router.get("/cache/stats")
 async def get_cache_stats():
-    """Get card cache statistics."""
+    """Get card cache statistics, with the generator's lookup hit/miss/coalesced counts."""
     cache = _get_card_cache()
-    return cache.get_stats()
+    stats = cache.get_stats()
+    if _card_generator is not None:
+        stats["lookups"] = _card_generator.get_lookup_stats()
+    return stats
+
+
+@router.get("/images/stats")
+async def get_image_stats():
+    """Get card image store statistics (hit rate, memory and disk usage)."""
+    return get_image_store().stats()
 
 
 @router.post("/cache/clear-expired")
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import time
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -71,6 +72,7 @@ class DubbingConfig(BaseModel):
     bgm_volume: float = Field(default=0.3, ge=0, le=1)
     sfx_volume: float = Field(default=0.5, ge=0, le=1)
     vocal_volume: float = Field(default=1.0, ge=0, le=1)
+    duck_volume: float = Field(default=1.0, ge=0, le=1)  # BGM/SFX gain under dubbed speech
     target_language: str = "zh-cn"
     keep_bgm: bool = True
     keep_sfx: bool = True
@@ -86,6 +88,7 @@ class DubbingConfigUpdate(BaseModel):
     bgm_volume: Optional[float] = Field(default=None, ge=0, le=1)
     sfx_volume: Optional[float] = Field(default=None, ge=0, le=1)
     vocal_volume: Optional[float] = Field(default=None, ge=0, le=1)
+    duck_volume: Optional[float] = Field(default=None, ge=0, le=1)
     target_language: Optional[str] = None
     keep_bgm: Optional[bool] = None
     keep_sfx: Optional[bool] = None
@@ -127,6 +130,8 @@ class DubbingStatus(BaseModel):
     dubbed_segments: int = 0
     total_segments: int = 0
     error: Optional[str] = None
+    # Seconds per step, plus synthesis throughput (synthesis_segments_per_minute)
+    step_timings: Dict[str, float] = Field(default_factory=dict)
 
 
 class PreviewRequest(BaseModel):
@@ -490,12 +495,15 @@ async def _run_dubbing_pipeline(timeline_id: str):
         timeline = _timeline_manager.get_timeline(timeline_id)
         config = _dubbing_configs.get(timeline_id, DubbingConfig())
         dubbing_dir = _get_dubbing_dir(timeline_id)
+        step_timings = _dubbing_status[timeline_id].step_timings
 
         # Step 1: Ensure audio is separated
         _dubbing_status[timeline_id].current_step = "Separating audio"
         if timeline_id not in _separation_status or _separation_status[timeline_id].status != "completed":
             video_path = get_config().jobs_dir / timeline.job_id / "source" / "video.mp4"
+            start = time.time()
             await _run_separation(timeline_id, video_path)
+            step_timings["separation"] = round(time.time() - start, 1)
 
         sep_status = _separation_status.get(timeline_id)
         if not sep_status or sep_status.status != "completed":
@@ -514,6 +522,7 @@ async def _run_dubbing_pipeline(timeline_id: str):
 
         samples_dir = dubbing_dir / "speaker_samples"
         speaker_samples = {}
+        start = time.time()
 
         for speaker_id in speakers:
             sample_path = await _voice_clone_worker.extract_speaker_sample(
@@ -532,6 +541,7 @@ async def _run_dubbing_pipeline(timeline_id: str):
                         speaker_id=speaker_id
                     )
                 _speaker_configs[timeline_id][speaker_id].voice_sample_path = str(sample_path)
+        step_timings["speaker_samples"] = round(time.time() - start, 1)
 
         # Step 3: Synthesize dubbed audio
         _dubbing_status[timeline_id].status = "synthesizing"
@@ -553,6 +563,7 @@ async def _run_dubbing_pipeline(timeline_id: str):
 
         dubbed_dir = dubbing_dir / "dubbed_segments"
         temperature = 1.0 - config.voice_similarity
+        start = time.time()
         dubbed_segments = await _voice_clone_worker.dub_segments(
             segments=segments_to_dub,
             speaker_samples=speaker_samples,
@@ -560,6 +571,10 @@ async def _run_dubbing_pipeline(timeline_id: str):
             language=config.target_language,
             temperature=temperature,
         )
+        elapsed = time.time() - start
+        synthesized = len([s for s in dubbed_segments if s.get("dubbed_path") and not s.get("resumed")])
+        step_timings["synthesis"] = round(elapsed, 1)
+        step_timings["synthesis_segments_per_minute"] = round(synthesized / elapsed * 60, 1) if elapsed else 0.0
 
         _dubbing_status[timeline_id].dubbed_segments = len([s for s in dubbed_segments if s.get("dubbed_path")])
         _dubbing_status[timeline_id].progress = 70
@@ -569,6 +584,7 @@ async def _run_dubbing_pipeline(timeline_id: str):
         _dubbing_status[timeline_id].current_step = "Mixing audio tracks"
 
         mixed_path = dubbing_dir / "mixed.wav"
+        start = time.time()
         await _audio_mixer_worker.mix_dubbed_audio(
             dubbed_segments=dubbed_segments,
             bgm_path=Path(sep_status.bgm_path) if config.keep_bgm else None,
@@ -578,8 +594,10 @@ async def _run_dubbing_pipeline(timeline_id: str):
             bgm_volume=config.bgm_volume,
             sfx_volume=config.sfx_volume,
             vocal_volume=config.vocal_volume,
+            duck_volume=config.duck_volume,
         )
 
+        step_timings["mixing"] = round(time.time() - start, 1)
         _dubbing_status[timeline_id].progress = 90
 
         # Step 5: Replace video audio
@@ -599,6 +617,7 @@ async def _run_dubbing_pipeline(timeline_id: str):
             progress=100,
             dubbed_segments=_dubbing_status[timeline_id].dubbed_segments,
             total_segments=_dubbing_status[timeline_id].total_segments,
+            step_timings=step_timings,
         )
 
         logger.info(f"Dubbing completed for timeline {timeline_id}")
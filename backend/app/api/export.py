@@ -1,5 +1,6 @@
 """Export API endpoints for video rendering."""
 
+import asyncio
 from pathlib import Path
 from typing import List, Optional
 
@@ -9,6 +10,9 @@ from pydantic import BaseModel
 
 from app.models.timeline import ExportStatus, SubtitleStyleMode, TimelineExportRequest
 from app.models.job import JobStatus
+from app.services.export_progress import ExportProgressRegistry
+from app.services.scheduler import Resource, get_resource_pools
+from app.workers.card_prefetch import prefetch_cards
 from app.workers.export import ExportCancelledError
 from app.api.timelines import (
     _get_manager,
@@ -20,6 +24,22 @@ from app.api.jobs import _get_job_manager
 
 router = APIRouter(prefix="/timelines", tags=["export"])
 
+# Module-level progress registry (set at startup)
+_export_progress: Optional[ExportProgressRegistry] = None
+
+
+def set_export_progress_registry(registry: ExportProgressRegistry) -> None:
+    """Set the export progress registry instance."""
+    global _export_progress
+    _export_progress = registry
+
+
+def _get_export_progress() -> ExportProgressRegistry:
+    """Get the export progress registry instance."""
+    if _export_progress is None:
+        raise RuntimeError("ExportProgressRegistry not initialized")
+    return _export_progress
+
 
 class ExportResponse(BaseModel):
     """Response for export request."""
@@ -162,7 +182,7 @@ async def cancel_export(timeline_id: str):
         )
 
     # Set status to CANCELLING so background task detects it
-    manager.update_export_status(
+    _get_export_progress().update(
         timeline_id,
         status=ExportStatus.CANCELLING,
         progress=timeline.export_progress,
@@ -196,6 +216,7 @@ async def _run_export(
     from loguru import logger
 
     manager = _get_manager()
+    export_progress = _get_export_progress()
     export_worker = _get_export_worker()
     job_manager = _get_job_manager()
 
@@ -214,12 +235,7 @@ async def _run_export(
 
     try:
         # Initialize export status
-        manager.update_export_status(
-            timeline_id,
-            status=ExportStatus.EXPORTING,
-            progress=0.0,
-            message="Preparing export...",
-        )
+        export_progress.begin(timeline_id, message="Preparing export...")
 
         # Start export timing
         if job:
@@ -227,7 +243,7 @@ async def _run_export(
             job_manager.save_job(job)
 
         # Step 1: Export video with subtitles
-        manager.update_export_status(
+        export_progress.update(
             timeline_id,
             status=ExportStatus.EXPORTING,
             progress=10.0,
@@ -235,22 +251,32 @@ async def _run_export(
         )
 
         def on_render_progress(progress: float, message: str):
-            """Callback to stream Remotion render progress with ETA to the UI."""
-            manager.update_export_status(
+            """Callback to stream Remotion render progress with ETA to the UI.
+
+            Ticks stay in memory and are pushed over WebSocket at a bounded
+            rate; they are not written to disk.
+            """
+            export_progress.update(
                 timeline_id,
                 status=ExportStatus.EXPORTING,
                 progress=progress,
                 message=message,
             )
 
-        full_path, essence_path = await export_worker.export(
-            timeline=timeline,
-            video_path=video_path,
-            output_dir=output_dir,
-            subtitle_style=subtitle_style,
-            progress_callback=on_render_progress,
-            timeline_id=timeline_id,
-        )
+        # Resolve pinned cards and download their images while the export
+        # waits for a CPU slot; the export joins whatever is still in flight
+        prefetch = asyncio.create_task(prefetch_cards(list(timeline.pinned_cards or [])))
+
+        async with get_resource_pools().acquire(Resource.CPU, timeline_id, "export"):
+            full_path, essence_path = await export_worker.export(
+                timeline=timeline,
+                video_path=video_path,
+                output_dir=output_dir,
+                subtitle_style=subtitle_style,
+                progress_callback=on_render_progress,
+                timeline_id=timeline_id,
+            )
+        await prefetch  # Long done by now; prefetch never raises
 
         # Update timeline with output paths
         manager.set_output_paths(
@@ -259,7 +285,7 @@ async def _run_export(
             essence_path=str(essence_path) if essence_path else None,
         )
 
-        manager.update_export_status(
+        export_progress.update(
             timeline_id,
             status=ExportStatus.EXPORTING,
             progress=70.0,
@@ -277,7 +303,7 @@ async def _run_export(
             description = youtube_description or f"Original: {timeline.source_url}"
             tags = youtube_tags or []
 
-            manager.update_export_status(
+            export_progress.update(
                 timeline_id,
                 status=ExportStatus.UPLOADING,
                 progress=75.0,
@@ -290,7 +316,7 @@ async def _run_export(
             def upload_progress_callback(upload_percent: int):
                 # Map upload progress (0-100) to overall progress (75-99)
                 overall_progress = 75.0 + (upload_percent * 0.24)
-                manager.update_export_status(
+                export_progress.update(
                     timeline_id,
                     status=ExportStatus.UPLOADING,
                     progress=overall_progress,
@@ -298,14 +324,15 @@ async def _run_export(
                 )
 
             try:
-                upload_result = await youtube_worker.upload(
-                    video_path=full_path,
-                    title=title,
-                    description=description,
-                    tags=tags,
-                    privacy_status=youtube_privacy,
-                    progress_callback=upload_progress_callback,
-                )
+                async with get_resource_pools().acquire(Resource.NETWORK, timeline_id, "upload"):
+                    upload_result = await youtube_worker.upload(
+                        video_path=full_path,
+                        title=title,
+                        description=description,
+                        tags=tags,
+                        privacy_status=youtube_privacy,
+                        progress_callback=upload_progress_callback,
+                    )
 
                 # Update timeline with YouTube info
                 manager.set_youtube_info(
@@ -314,7 +341,7 @@ async def _run_export(
                     url=upload_result["url"],
                 )
 
-                manager.update_export_status(
+                export_progress.update(
                     timeline_id,
                     status=ExportStatus.COMPLETED,
                     progress=100.0,
@@ -330,7 +357,7 @@ async def _run_export(
 
             except Exception as yt_err:
                 logger.exception(f"YouTube upload failed for timeline {timeline_id}: {yt_err}")
-                manager.update_export_status(
+                export_progress.update(
                     timeline_id,
                     status=ExportStatus.FAILED,
                     progress=75.0,
@@ -339,7 +366,7 @@ async def _run_export(
                 )
         else:
             # No YouTube upload, mark as completed
-            manager.update_export_status(
+            export_progress.update(
                 timeline_id,
                 status=ExportStatus.COMPLETED,
                 progress=100.0,
@@ -361,7 +388,7 @@ async def _run_export(
             except OSError:
                 pass
         # Reset status back to IDLE
-        manager.update_export_status(
+        export_progress.update(
             timeline_id,
             status=ExportStatus.IDLE,
             progress=0.0,
@@ -370,7 +397,7 @@ async def _run_export(
 
     except Exception as e:
         logger.exception(f"Export failed for timeline {timeline_id}: {e}")
-        manager.update_export_status(
+        export_progress.update(
             timeline_id,
             status=ExportStatus.FAILED,
             progress=0.0,
@@ -1,6 +1,5 @@
 """Media API endpoints - thumbnails and waveforms."""
 
-import subprocess
 import time
 from pathlib import Path
 from typing import List
@@ -14,6 +13,7 @@ from app.api.timelines import (
     _get_waveform_worker,
     _get_jobs_dir,
 )
+from app.services.process_runner import ProcessError, check_process
 
 router = APIRouter(prefix="/timelines", tags=["media"])
 
@@ -83,6 +83,18 @@ class WaveformResponse(BaseModel):
     track_type: str = "original"
 
 
+class WaveformRangeResponse(BaseModel):
+    """Response for a range of waveform min/max peaks."""
+    track_type: str
+    rate: int  # Peaks per second of the zoom level used
+    start: float  # Start of the first peak window (seconds)
+    end: float  # End of the last peak window (seconds)
+    duration: float
+    scale: int  # Value of a full-height peak
+    min: List[int]
+    max: List[int]
+
+
 class WaveformGenerateResponse(BaseModel):
     """Response for waveform generation request."""
     timeline_id: str
@@ -608,7 +620,7 @@ async def capture_cover_frame(
             "-q:v", "2",
             str(cover_path),
         ]
-        subprocess.run(cmd, capture_output=True, check=True)
+        await check_process(cmd, timeout=60)
 
         if not cover_path.exists():
             raise HTTPException(
@@ -631,7 +643,7 @@ async def capture_cover_frame(
             message=f"Cover frame captured at {timestamp:.1f}s",
         )
 
-    except subprocess.CalledProcessError as e:
+    except ProcessError as e:
         logger.exception(f"FFmpeg failed for timeline {timeline_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to extract frame")
     except HTTPException:
@@ -755,22 +767,8 @@ async def generate_thumbnail(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/{timeline_id}/waveform/{track_type}", response_model=WaveformResponse)
-async def get_waveform(
-    timeline_id: str,
-    track_type: str = "original",
-):
-    """Get waveform peak data for a timeline's audio track.
-
-    Args:
-        timeline_id: Timeline ID
-        track_type: Audio track type (original, dubbing, bgm)
-
-    Returns cached waveform data if available, otherwise 404.
-    Use POST /timelines/{id}/waveform/generate to generate if not available.
-    """
-    from loguru import logger
-
+def _waveform_job_dir(timeline_id: str, track_type: str) -> Path:
+    """Validate a waveform request and return the timeline's job directory."""
     if track_type not in ("original", "dubbing", "bgm"):
         raise HTTPException(
             status_code=400,
@@ -786,12 +784,36 @@ async def get_waveform(
     if jobs_dir is None:
         raise HTTPException(status_code=500, detail="Jobs directory not configured")
 
+    return jobs_dir / timeline.job_id
+
+
+@router.get("/{timeline_id}/waveform/{track_type}", response_model=WaveformResponse)
+async def get_waveform(
+    timeline_id: str,
+    track_type: str = "original",
+    rate: float | None = Query(default=None, gt=0, description="Peaks per second"),
+):
+    """Get waveform peak data for a timeline's audio track.
+
+    Args:
+        timeline_id: Timeline ID
+        track_type: Audio track type (original, dubbing, bgm)
+        rate: Peaks per second; the coarsest stored level with at least
+            this rate is returned (default: finest level)
+
+    Returns cached waveform data if available, otherwise 404.
+    Use POST /timelines/{id}/waveform/generate to generate if not available.
+    Use GET /timelines/{id}/waveform/{track}/range for the visible window only.
+    """
+    job_dir = _waveform_job_dir(timeline_id, track_type)
     waveform_worker = _get_waveform_worker()
-    job_dir = jobs_dir / timeline.job_id
-    peaks_path = job_dir / "waveforms" / f"{track_type}.json"
+    peaks_path = waveform_worker.peaks_path(job_dir, track_type)
+    if not peaks_path.exists():
+        # Waveforms generated before the binary pyramid
+        peaks_path = job_dir / "waveforms" / f"{track_type}.json"
 
     # Try to load cached waveform
-    waveform_data = await waveform_worker.load_peaks(peaks_path)
+    waveform_data = await waveform_worker.load_peaks(peaks_path, rate=rate)
 
     if not waveform_data:
         raise HTTPException(
@@ -808,6 +830,39 @@ async def get_waveform(
     )
 
 
+@router.get("/{timeline_id}/waveform/{track_type}/range", response_model=WaveformRangeResponse)
+async def get_waveform_range(
+    timeline_id: str,
+    track_type: str,
+    start: float = Query(default=0.0, ge=0, description="Range start (seconds)"),
+    end: float = Query(..., gt=0, description="Range end (seconds)"),
+    rate: float | None = Query(default=None, gt=0, description="Peaks per second"),
+    width: int | None = Query(default=None, gt=0, description="Pixels to draw the range on"),
+):
+    """Get min/max waveform peaks for a time range at a zoom level.
+
+    The zoom level is the coarsest stored level (1000/100/10 peaks per
+    second) with at least ``rate`` peaks per second, or about one peak per
+    pixel when only ``width`` is given. Only the requested windows are read.
+    """
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end must be greater than start")
+
+    job_dir = _waveform_job_dir(timeline_id, track_type)
+    waveform_worker = _get_waveform_worker()
+
+    waveform_range = await waveform_worker.load_range(
+        waveform_worker.peaks_path(job_dir, track_type), start, end, rate=rate, width=width
+    )
+    if not waveform_range:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Waveform not found for track: {track_type}. Use POST to generate."
+        )
+
+    return WaveformRangeResponse(track_type=track_type, **waveform_range)
+
+
 @router.post("/{timeline_id}/waveform/generate", response_model=WaveformGenerateResponse)
 async def generate_waveform(
     timeline_id: str,
@@ -825,23 +880,8 @@ async def generate_waveform(
     """
     from loguru import logger
 
-    if track_type not in ("original", "dubbing", "bgm"):
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid track type: {track_type}. Must be one of: original, dubbing, bgm"
-        )
-
-    manager = _get_manager()
-    timeline = manager.get_timeline(timeline_id)
-    if not timeline:
-        raise HTTPException(status_code=404, detail="Timeline not found")
-
-    jobs_dir = _get_jobs_dir()
-    if jobs_dir is None:
-        raise HTTPException(status_code=500, detail="Jobs directory not configured")
-
+    job_dir = _waveform_job_dir(timeline_id, track_type)
     waveform_worker = _get_waveform_worker()
-    job_dir = jobs_dir / timeline.job_id
 
     try:
         # Generate waveform (this is relatively fast, so we do it synchronously)
@@ -70,7 +70,7 @@ def _get_ambient_library() -> AmbientLibrary:
 async def list_ambient_sounds():
     """List available ambient sounds."""
     library = _get_ambient_library()
-    return library.list_sounds()
+    return await library.list_sounds()
 
 
 @router.get("/ambient/{name}/audio")
@@ -3,7 +3,7 @@
 Handles job queue management operations.
 """
 
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter
 from pydantic import BaseModel
@@ -29,6 +29,7 @@ class QueueStats(BaseModel):
     active_jobs: List[str]
     processed: int
     failed: int
+    resources: Optional[Dict[str, Dict[str, Any]]] = None  # Per-resource stage pools
 
 
 @router.get("/stats", response_model=QueueStats)
@@ -861,12 +861,9 @@ async def pin_card(timeline_id: str, create: PinnedCardCreate, background_tasks:
     if not pinned:
         raise HTTPException(status_code=500, detail="Failed to pin card")
 
-    # Pre-cache card images in the background so they're ready for export
-    if pinned.card_data:
-        from app.workers.card_renderer import precache_card_images
-        background_tasks.add_task(
-            precache_card_images, pinned.card_data, pinned.card_type.value
-        )
+    # Prefetch card data and images in the background so they're ready for export
+    from app.workers.card_prefetch import prefetch_cards
+    background_tasks.add_task(prefetch_cards, [pinned])
 
     return pinned
 
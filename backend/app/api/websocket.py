@@ -29,13 +29,17 @@ class ConnectionManager:
         # Source-specific subscriptions: source_id -> set of websockets
         self.source_subscriptions: Dict[str, Set[WebSocket]] = {}
 
+        # Timeline-specific subscriptions: timeline_id -> set of websockets
+        self.timeline_subscriptions: Dict[str, Set[WebSocket]] = {}
+
         # Topic subscriptions: topic -> set of websockets
-        # Topics: "jobs", "items", "sources", "overview"
+        # Topics: "jobs", "items", "sources", "overview", "exports"
         self.topic_subscriptions: Dict[str, Set[WebSocket]] = {
             "jobs": set(),
             "items": set(),
             "sources": set(),
             "overview": set(),
+            "exports": set(),
             "all": set(),
         }
 
@@ -61,6 +65,12 @@ class ConnectionManager:
             if not sockets:
                 del self.source_subscriptions[source_id]
 
+        # Remove from all timeline subscriptions
+        for timeline_id, sockets in list(self.timeline_subscriptions.items()):
+            sockets.discard(websocket)
+            if not sockets:
+                del self.timeline_subscriptions[timeline_id]
+
         # Remove from all topic subscriptions
         for topic, sockets in self.topic_subscriptions.items():
             sockets.discard(websocket)
@@ -81,8 +91,15 @@ class ConnectionManager:
         self.source_subscriptions[source_id].add(websocket)
         logger.debug(f"WebSocket subscribed to source {source_id}")
 
+    def subscribe_timeline(self, websocket: WebSocket, timeline_id: str):
+        """Subscribe to updates (e.g. export progress) for a specific timeline."""
+        if timeline_id not in self.timeline_subscriptions:
+            self.timeline_subscriptions[timeline_id] = set()
+        self.timeline_subscriptions[timeline_id].add(websocket)
+        logger.debug(f"WebSocket subscribed to timeline {timeline_id}")
+
     def subscribe_topic(self, websocket: WebSocket, topic: str):
-        """Subscribe to a topic (jobs, items, sources, overview, all)."""
+        """Subscribe to a topic (jobs, items, sources, overview, exports, all)."""
         if topic in self.topic_subscriptions:
             self.topic_subscriptions[topic].add(websocket)
             logger.debug(f"WebSocket subscribed to topic {topic}")
@@ -193,6 +210,31 @@ class ConnectionManager:
         await self._broadcast_to_topic("overview", message)
         await self._broadcast_to_topic("all", message)
 
+    async def broadcast_export_update(self, timeline_id: str, data: dict):
+        """Broadcast a timeline export progress update to subscribers."""
+        message = {
+            "type": "export_update",
+            "timeline_id": timeline_id,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "data": data,
+        }
+
+        # Send to timeline-specific subscribers
+        if timeline_id in self.timeline_subscriptions:
+            disconnected = []
+            for websocket in self.timeline_subscriptions[timeline_id]:
+                try:
+                    await websocket.send_json(message)
+                except Exception:
+                    disconnected.append(websocket)
+
+            for ws in disconnected:
+                self.disconnect(ws)
+
+        # Send to topic subscribers
+        await self._broadcast_to_topic("exports", message)
+        await self._broadcast_to_topic("all", message)
+
     async def _broadcast_to_topic(self, topic: str, message: dict):
         """Broadcast to all subscribers of a topic."""
         if topic not in self.topic_subscriptions:
@@ -214,6 +256,7 @@ class ConnectionManager:
             "total_connections": len(self.active_connections),
             "job_subscriptions": len(self.job_subscriptions),
             "source_subscriptions": len(self.source_subscriptions),
+            "timeline_subscriptions": len(self.timeline_subscriptions),
             "topic_subscriptions": {
                 topic: len(sockets)
                 for topic, sockets in self.topic_subscriptions.items()
@@ -244,6 +287,7 @@ async def websocket_endpoint(websocket: WebSocket):
     {"action": "subscribe", "topic": "items"}
     {"action": "subscribe", "job_id": "abc123"}
     {"action": "subscribe", "source_id": "yt_lex"}
+    {"action": "subscribe", "timeline_id": "a1b2c3d4"}
     {"action": "unsubscribe", "topic": "jobs"}
     {"action": "ping"}
     ```
@@ -252,7 +296,7 @@ async def websocket_endpoint(websocket: WebSocket):
 
     ```json
     {
-        "type": "job_update|item_update|source_update|overview_update",
+        "type": "job_update|item_update|source_update|overview_update|export_update",
         "timestamp": "2024-01-01T00:00:00",
         "data": {...}
     }
@@ -296,6 +340,12 @@ async def websocket_endpoint(websocket: WebSocket):
                             "type": "subscribed",
                             "source_id": message["source_id"],
                         })
+                    elif "timeline_id" in message:
+                        manager.subscribe_timeline(websocket, message["timeline_id"])
+                        await manager.send_personal(websocket, {
+                            "type": "subscribed",
+                            "timeline_id": message["timeline_id"],
+                        })
 
                 elif action == "unsubscribe":
                     # Handle unsubscribe (remove from topic)
@@ -401,6 +451,40 @@ async def source_websocket(websocket: WebSocket, source_id: str):
         manager.disconnect(websocket)
 
 
+@router.websocket("/ws/timelines/{timeline_id}")
+async def timeline_websocket(websocket: WebSocket, timeline_id: str):
+    """WebSocket endpoint for a specific timeline's export progress.
+
+    Automatically subscribes to the specified timeline.
+    """
+    await manager.connect(websocket)
+    manager.subscribe_timeline(websocket, timeline_id)
+
+    # Send subscription confirmation
+    await manager.send_personal(websocket, {
+        "type": "subscribed",
+        "timeline_id": timeline_id,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    })
+
+    try:
+        while True:
+            data = await websocket.receive_text()
+
+            try:
+                message = json.loads(data)
+                if message.get("action") == "ping":
+                    await manager.send_personal(websocket, {
+                        "type": "pong",
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                    })
+            except json.JSONDecodeError:
+                pass
+
+    except WebSocketDisconnect:
+        manager.disconnect(websocket)
+
+
 # ============ HTTP Endpoints for WebSocket Status ============
 
 @router.get("/ws/stats")
@@ -89,6 +89,11 @@ class Settings(BaseSettings):
         """Path to music commentary sessions directory."""
         return self.data_dir / "music_commentary"
 
+    @property
+    def still_cache_dir(self) -> Path:
+        """Path to the cache of rendered export stills."""
+        return self.data_dir / "cache" / "stills"
+
     # Music generation settings
     music_device: str = "cuda"
 
@@ -99,18 +104,33 @@ class Settings(BaseSettings):
     # Upload settings
     max_upload_size_mb: int = 4096  # 4GB max upload
 
+    # Storage settings
+    document_cache_mb: int = 256  # Per-manager budget for hydrated JSON documents (jobs, timelines, ...)
+    metadata_backend: str = "json"  # "json" (file per document) or "sqlite" (data_dir/metadata.db)
+
     # Whisper settings
     whisper_model: str = "large-v3"
     whisper_device: str = "cuda"
     whisper_compute_type: str = "float16"
+    whisper_streaming: bool = True  # Checkpointed streaming; cleanup/translation start early
+    whisper_workers: int = 1  # >1: split long audio at silences, transcribe chunks in parallel
+    whisper_chunk_seconds: float = 600.0  # Target chunk length for parallel transcription
 
     # Diarization settings
     hf_token: str = ""  # HuggingFace token for pyannote.audio
-    diarization_device: str = "cuda"
+    diarization_device: str = "cuda"  # "cpu" keeps it off the GPU while Whisper runs
+    parallel_diarization: bool = True  # Diarize concurrently with Whisper transcription
+    diarization_split_segments: bool = True  # Split sentences where the speaker changes
 
     # TTS settings (optional, for dubbing mode)
     tts_model: str = "tts_models/multilingual/multi-dataset/xtts_v2"
     tts_device: str = "cuda"
+    tts_workers: int = 1  # Synthesis threads; inference on the shared model is serialized
+    tts_batch_size: int = 8  # Segments of one speaker per synthesis batch
+
+    # Audio separation settings (dubbing mode)
+    separation_memory_mb: int = 2048  # Peak memory budget; long audio is separated in windows
+    separation_crossfade_seconds: float = 3.0  # Overlap blended between separation windows
 
     # Translation LLM settings (supports OpenAI, Grok, Azure, or any OpenAI-compatible API)
     llm_api_key: str = ""
@@ -148,10 +168,22 @@ class Settings(BaseSettings):
 
     # Video settings
     ffmpeg_nvenc: bool = True
+    export_chunk_seconds: float = 60.0  # Encode exports in chunks, reusing unchanged ones on re-export (0 = one pass)
     max_video_duration: int = 14400  # 4 hours in seconds
 
+    # External tool concurrency (max processes per tool; 0 = unlimited)
+    ytdlp_max_concurrency: int = 2
+    ffmpeg_max_concurrency: int = 4
+    ffprobe_max_concurrency: int = 8
+
     # Queue settings
-    max_concurrent_jobs: int = 2  # Max concurrent job processing (adjust based on GPU memory)
+    max_concurrent_jobs: int = 6  # Jobs in flight; each stage is bounded by the pools below
+
+    # Stage resource pools (stages running at once per resource; 0 = unlimited)
+    network_pool_size: int = 3  # Downloads and uploads
+    gpu_pool_size: int = 1  # Whisper / diarization (adjust based on GPU memory)
+    llm_pool_size: int = 4  # Disfluency cleanup and translation
+    cpu_pool_size: int = 2  # ffmpeg-heavy rendering (exports)
 
     # YouTube settings
     youtube_credentials_file: str = "credentials/youtube_oauth.json"
@@ -166,6 +198,17 @@ class Settings(BaseSettings):
     # TomTrove API settings (for word cards and entity cards)
     tomtrove_api_url: str = "http://localhost:8000/api/v1/public"
     tomtrove_api_key: str = ""  # Set via TOMTROVE_API_KEY env var
+    card_prefetch_concurrency: int = 8  # Pinned-card lookups and image downloads in flight at once
+    card_image_cache_mb: int = 2048  # Disk quota for downloaded card images (LRU eviction)
+    card_image_memory_mb: int = 256  # Decoded card images kept in memory for rendering
+    card_image_host_rate: float = 2.0  # Image downloads per second per host
+    card_cache_backend: str = "json"  # "json" (file per card) or "sqlite" (data/cards/cards.db)
+    card_cache_memory_items: int = 20000  # Decoded cards kept in memory in front of the card store
+    card_lookup_ttl_seconds: float = 60.0  # How long card lookup results (found or not) are reused
+    card_lookup_cache_items: int = 5000  # Recent card lookup results kept by the card generator
+    ner_batch_size: int = 256  # Segment texts per spaCy nlp.pipe batch
+    ner_n_process: int = 1  # spaCy worker processes for timelines larger than one batch
+    ner_cache_segments: int = 50000  # Per-segment NER results kept in memory
 
     # Azure Translator settings (for subtitle translation - fast and consistent)
     azure_translator_key: str = ""  # Set via AZURE_TRANSLATOR_KEY env var
@@ -180,6 +223,7 @@ class Settings(BaseSettings):
     # Frontend settings
     frontend_url: str = "http://localhost:3001"
     frontend_dir: Path = Path("../frontend")  # Path to frontend directory for Remotion
+    still_cache_mb: int = 1024  # Rendered card/subtitle stills reused across exports (0 = off)
     cors_origins: List[str] = ["http://localhost:3001", "http://127.0.0.1:3001"]
 
     @field_validator("cors_origins", mode="before")
@@ -15,10 +15,13 @@ from app import __version__
 from app.config import settings
 from app.services.job_manager import JobManager
 from app.services.queue import JobQueue, BatchProcessor
+from app.services.scheduler import get_resource_pools
 from app.services.webhook import WebhookService, job_status_callback
 from app.services.timeline_manager import TimelineManager
+from app.services.export_progress import ExportProgressRegistry
 from app.services.source_manager import SourceManager
 from app.services.item_manager import ItemManager
+from app.services.metadata_store import close_databases
 from app.services.pipeline_manager import PipelineManager
 from app.workers.download import DownloadWorker
 from app.workers.whisper import WhisperWorker
@@ -59,6 +62,7 @@ from app.api import (
     set_waveform_worker,
     set_timelines_frame_capture_worker,
     set_jobs_dir,
+    set_export_progress_registry,
     set_job_manager,
     set_job_queue,
     set_webhook_service,
@@ -149,6 +153,13 @@ async def lifespan(app: FastAPI):
     set_waveform_worker(waveform_worker)
     set_jobs_dir(settings.jobs_dir)
 
+    # Export progress: in-memory, pushed over WebSocket, transitions persisted
+    export_progress = ExportProgressRegistry(
+        timeline_manager,
+        broadcast_callback=get_connection_manager().broadcast_export_update,
+    )
+    set_export_progress_registry(export_progress)
+
     logger.info(f"Initialized timeline manager: {timeline_manager.get_stats()['total']} timelines")
 
     # ========== Frame Capture: Initialize frame capture worker ==========
@@ -169,16 +180,18 @@ async def lifespan(app: FastAPI):
     logger.info(f"Initialized SceneMind: {scenemind_session_manager.get_stats()['total']} sessions")
 
     # ========== Cards: Initialize card cache and workers ==========
-    from app.services.card_cache import CardCache
+    from app.services.card_cache import get_card_cache
     from app.workers.card_generator import CardGeneratorWorker
+    from app.workers.card_prefetch import set_card_generator as set_prefetch_card_generator
     from app.workers.ner import NERWorker
 
-    card_cache = CardCache()
+    card_cache = get_card_cache()
     card_generator = CardGeneratorWorker(card_cache=card_cache)
     ner_worker = NERWorker(use_spacy=False)  # Start with rule-based, can enable spaCy later
 
     set_card_cache(card_cache)
     set_card_generator(card_generator)
+    set_prefetch_card_generator(card_generator)  # Export prefetch shares its lookups
     set_ner_worker(ner_worker)
     set_cards_timeline_manager(timeline_manager)
 
@@ -242,7 +255,7 @@ async def lifespan(app: FastAPI):
 
     # ========== Music: Initialize music manager, ambient library, and generator ==========
     from app.services.music_manager import MusicManager
-    from app.services.ambient_library import AmbientLibrary
+    from app.services.ambient_library import AMBIENT_SOUNDS, AmbientLibrary
     from app.workers.music_generator import MusicGeneratorWorker, AUDIOCRAFT_AVAILABLE
 
     music_manager = MusicManager()
@@ -254,7 +267,7 @@ async def lifespan(app: FastAPI):
     music_generator = MusicGeneratorWorker(music_manager=music_manager, ambient_library=ambient_library)
     set_music_generator(music_generator)
 
-    ambient_count = sum(1 for s in ambient_library.list_sounds() if s["available"])
+    ambient_count = sum(1 for name in AMBIENT_SOUNDS if ambient_library.is_available(name))
     music_features = []
     if AUDIOCRAFT_AVAILABLE:
         music_features.append("musicgen")
@@ -337,6 +350,9 @@ async def lifespan(app: FastAPI):
     # Set overview managers
     set_overview_managers(source_manager, item_manager, pipeline_manager, job_manager)
 
+    # Stage resource pools shared by the job pipeline and exports
+    resource_pools = get_resource_pools()
+
     # Create process_job wrapper with all dependencies
     async def process_job_wrapper(job_id: str):
         await process_job(
@@ -348,12 +364,14 @@ async def lifespan(app: FastAPI):
             whisper_worker=whisper_worker,
             diarization_worker=diarization_worker,
             translation_worker=translation_worker,
+            resources=resource_pools,
         )
 
     # Initialize job queue
     job_queue = JobQueue(
         max_concurrent=settings.max_concurrent_jobs,
         process_func=process_job_wrapper,
+        resources=resource_pools,
     )
     await job_queue.start()
 
@@ -400,6 +418,12 @@ async def lifespan(app: FastAPI):
     await card_generator.close()
     await creative_config_generator.close()
     await studio_manager.close()
+    for manager in (
+        job_manager, item_manager, timeline_manager,
+        memory_book_manager, scenemind_session_manager,
+    ):
+        manager.flush_index()
+    close_databases()
     logger.info("Shutting down SceneMind")
 
 
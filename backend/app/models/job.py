@@ -343,11 +343,21 @@ class Job(BaseModel):
 
     def _recalculate_totals(self) -> None:
         """Recalculate total processing time and cost."""
-        # Total processing time
+        # Total processing time: wall time covered by steps, so steps that
+        # ran concurrently (transcribe + diarize) are not counted twice
+        intervals = sorted(
+            (datetime.fromisoformat(timing["started_at"]), datetime.fromisoformat(timing["ended_at"]))
+            for timing in self.step_timings.values()
+            if timing.get("duration_seconds")
+        )
         total_seconds = 0.0
-        for timing in self.step_timings.values():
-            if timing.get("duration_seconds"):
-                total_seconds += timing["duration_seconds"]
+        covered_until = None
+        for start, end in intervals:
+            if covered_until is not None and start < covered_until:
+                start = covered_until
+            if end > start:
+                total_seconds += (end - start).total_seconds()
+                covered_until = end
         self.total_processing_seconds = total_seconds if total_seconds > 0 else None
 
         # Total cost
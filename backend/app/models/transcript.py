@@ -1,7 +1,15 @@
 """Transcript data models."""
 
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+
+class Word(BaseModel):
+    """A recognized word with its timing."""
+
+    start: float
+    end: float
+    word: str
 
 
 class Segment(BaseModel):
@@ -10,6 +18,8 @@ class Segment(BaseModel):
     start: float
     end: float
     text: str
+    # Word timings from Whisper; kept in memory only, not saved with the transcript
+    words: Optional[List[Word]] = Field(default=None, exclude=True)
 
 
 class DiarizedSegment(Segment):
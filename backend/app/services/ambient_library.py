@@ -1,11 +1,13 @@
 """Ambient sound library - manages real ambient sound files for mixing with AI music."""
 
-import subprocess
+import asyncio
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from loguru import logger
 
+from app.services.process_runner import run_process
+
 AMBIENT_SOUNDS: Dict[str, dict] = {
     "rain":      {"label": "Rain",      "label_zh": "雨声"},
     "thunder":   {"label": "Thunder",   "label_zh": "雷声"},
@@ -25,18 +27,16 @@ AMBIENT_SOUNDS: Dict[str, dict] = {
 }
 
 
-def _get_audio_duration(path: Path) -> Optional[float]:
+async def _get_audio_duration(path: Path) -> Optional[float]:
     """Get audio file duration in seconds using ffprobe."""
     try:
-        result = subprocess.run(
+        result = await run_process(
             [
                 "ffprobe", "-v", "quiet",
                 "-show_entries", "format=duration",
                 "-of", "default=noprint_wrappers=1:nokey=1",
                 str(path),
             ],
-            capture_output=True,
-            text=True,
             timeout=10,
         )
         if result.returncode == 0 and result.stdout.strip():
@@ -53,13 +53,18 @@ class AmbientLibrary:
         self._dir = ambient_dir
         self._dir.mkdir(parents=True, exist_ok=True)
 
-    def list_sounds(self) -> List[dict]:
+    async def list_sounds(self) -> List[dict]:
         """Return all ambient sounds with availability status."""
+        paths = {name: self._find_file(name) for name in AMBIENT_SOUNDS}
+        durations = await asyncio.gather(*(
+            _get_audio_duration(path) for path in paths.values() if path
+        ))
+        duration_by_name = dict(zip([name for name, path in paths.items() if path], durations))
+
         results = []
         for name, meta in AMBIENT_SOUNDS.items():
-            path = self._find_file(name)
-            available = path is not None
-            duration = _get_audio_duration(path) if path else None
+            available = paths[name] is not None
+            duration = duration_by_name.get(name)
             results.append({
                 "name": name,
                 "label": meta["label"],
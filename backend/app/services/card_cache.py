@@ -1,21 +1,296 @@
-"""Card cache service for storing and retrieving word/entity cards."""
-
+"""Card cache service for storing and retrieving word/entity cards.
+
+Cards are kept by a pluggable ``CardStore`` backend, chosen with
+``settings.card_cache_backend``:
+
+- ``JsonCardStore``: one JSON file per card under data/cards/{words,
+  entities,idioms}/ (the default and the original layout)
+- ``SqliteCardStore``: one table in data/cards/cards.db, with
+  ``fetched_at`` in an indexed column so stats and expiry are queries
+  instead of directory scans
+
+In front of the backend, ``CardCache`` keeps a bounded LRU of decoded
+cards and a bloom filter of negative-cache keys, so a lookup of a word
+that is not known to be missing never touches storage to find that out.
+Both live in the instance, so the process shares one cache through
+``get_card_cache()``: a card edited or deleted through one instance would
+otherwise stay visible in another's memory.
+Existing card directories are imported with
+``scripts/migrate_card_cache.py``.
+"""
+
+import hashlib
 import json
+import math
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Tuple
 from loguru import logger
 
 from app.config import settings
 from app.models.card import WordCard, EntityCard, IdiomCard
+from app.services.metadata_store import _connect
+
+# Database file name inside the cards directory
+CARD_DB_FILENAME = "cards.db"
+
+# Record kinds; negative-cache markers are "notfound" records
+WORD, ENTITY, IDIOM, NOT_FOUND = "word", "entity", "idiom", "notfound"
+CARD_KINDS = (WORD, ENTITY, IDIOM)
+_MODELS = {WORD: WordCard, ENTITY: EntityCard, IDIOM: IdiomCard}
+
+
+def _fetched_at(body: str) -> float:
+    """``fetched_at`` of a stored record as a timestamp (0 if missing)."""
+    try:
+        value = json.loads(body).get("fetched_at")
+        return datetime.fromisoformat(value).timestamp() if value else 0.0
+    except (ValueError, TypeError, AttributeError):
+        return 0.0
+
+
+class CardStore(ABC):
+    """Storage of JSON card records by (kind, key).
+
+    Keys are already sanitized by ``CardCache``. Records carry their
+    ``fetched_at`` as a timestamp for expiry.
+    """
+
+    name = ""
+
+    @abstractmethod
+    def get(self, kind: str, key: str) -> Optional[str]:
+        """JSON body of a record, or None."""
+
+    @abstractmethod
+    def put(self, kind: str, key: str, body: str, fetched_at: float) -> None:
+        """Insert or replace a record."""
+
+    @abstractmethod
+    def delete(self, kind: str, key: str) -> bool:
+        """Delete a record; returns whether it existed."""
+
+    @abstractmethod
+    def count(self, kind: str) -> int:
+        """Number of records of a kind."""
+
+    @abstractmethod
+    def delete_older_than(self, kind: str, cutoff: float) -> int:
+        """Delete records fetched before ``cutoff``; returns how many."""
+
+    @abstractmethod
+    def keys(self, kind: str) -> Iterator[str]:
+        """Keys of all records of a kind."""
+
+    @abstractmethod
+    def items(self, kind: str) -> Iterator[Tuple[str, str, float]]:
+        """(key, body, fetched_at) of all records of a kind."""
+
+
+class JsonCardStore(CardStore):
+    """One JSON file per card: data/cards/{words,entities,idioms}/{key}.json.
+
+    Negative-cache markers are words/{key}.notfound.
+    """
+
+    name = "json"
+
+    def __init__(self, cards_dir: Path):
+        self.cards_dir = Path(cards_dir)
+        self.words_dir = self.cards_dir / "words"
+        self.entities_dir = self.cards_dir / "entities"
+        self.idioms_dir = self.cards_dir / "idioms"
+        self._layout = {
+            WORD: (self.words_dir, ".json"),
+            ENTITY: (self.entities_dir, ".json"),
+            IDIOM: (self.idioms_dir, ".json"),
+            NOT_FOUND: (self.words_dir, ".notfound"),
+        }
+
+        # Create directories
+        self.words_dir.mkdir(parents=True, exist_ok=True)
+        self.entities_dir.mkdir(parents=True, exist_ok=True)
+        self.idioms_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, kind: str, key: str) -> Path:
+        directory, suffix = self._layout[kind]
+        return directory / (key + suffix)
+
+    def _files(self, kind: str) -> Iterator[Path]:
+        directory, suffix = self._layout[kind]
+        return directory.glob("*" + suffix)
+
+    def get(self, kind: str, key: str) -> Optional[str]:
+        try:
+            return self._path(kind, key).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def put(self, kind: str, key: str, body: str, fetched_at: float) -> None:
+        self._path(kind, key).write_text(body, encoding="utf-8")
+
+    def delete(self, kind: str, key: str) -> bool:
+        path = self._path(kind, key)
+        if path.exists():
+            path.unlink()
+            return True
+        return False
+
+    def count(self, kind: str) -> int:
+        return sum(1 for _ in self._files(kind))
+
+    def delete_older_than(self, kind: str, cutoff: float) -> int:
+        deleted = 0
+        for path in self._files(kind):
+            try:
+                if _fetched_at(path.read_text(encoding="utf-8")) < cutoff:
+                    path.unlink()
+                    deleted += 1
+            except OSError:
+                pass
+        return deleted
+
+    def keys(self, kind: str) -> Iterator[str]:
+        return (path.stem for path in self._files(kind))
+
+    def items(self, kind: str) -> Iterator[Tuple[str, str, float]]:
+        for path in self._files(kind):
+            try:
+                body = path.read_text(encoding="utf-8")
+            except OSError:
+                continue
+            yield path.stem, body, _fetched_at(body)
+
+
+class SqliteCardStore(CardStore):
+    """All card records in one SQLite table (WAL), expiry by indexed ``fetched_at``."""
+
+    name = "sqlite"
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._conn, self._lock = _connect(self.db_path)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cards (kind TEXT NOT NULL, key TEXT NOT NULL, "
+                "body TEXT NOT NULL, fetched_at REAL NOT NULL, PRIMARY KEY (kind, key))"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS cards_fetched_at ON cards (kind, fetched_at)"
+            )
+
+    def _execute(self, sql: str, params=()) -> list:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def get(self, kind: str, key: str) -> Optional[str]:
+        rows = self._execute("SELECT body FROM cards WHERE kind = ? AND key = ?", (kind, key))
+        return rows[0][0] if rows else None
+
+    def put(self, kind: str, key: str, body: str, fetched_at: float) -> None:
+        self._execute(
+            "INSERT OR REPLACE INTO cards (kind, key, body, fetched_at) VALUES (?, ?, ?, ?)",
+            (kind, key, body, fetched_at),
+        )
+
+    def put_many(self, records) -> None:
+        """Insert or replace (kind, key, body, fetched_at) records in one transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO cards (kind, key, body, fetched_at) VALUES (?, ?, ?, ?)",
+                    records,
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def delete(self, kind: str, key: str) -> bool:
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM cards WHERE kind = ? AND key = ?", (kind, key))
+            return cursor.rowcount > 0
+
+    def count(self, kind: str) -> int:
+        return self._execute("SELECT COUNT(*) FROM cards WHERE kind = ?", (kind,))[0][0]
+
+    def delete_older_than(self, kind: str, cutoff: float) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM cards WHERE kind = ? AND fetched_at < ?", (kind, cutoff)
+            )
+            return cursor.rowcount
+
+    def keys(self, kind: str) -> Iterator[str]:
+        return (row[0] for row in self._execute("SELECT key FROM cards WHERE kind = ?", (kind,)))
+
+    def items(self, kind: str) -> Iterator[Tuple[str, str, float]]:
+        return iter(self._execute("SELECT key, body, fetched_at FROM cards WHERE kind = ?", (kind,)))
+
+
+class BloomFilter:
+    """Set membership with no false negatives and ~``error_rate`` false positives."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = max(1, capacity)
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+def open_card_store(cards_dir: Path, backend: Optional[str] = None) -> CardStore:
+    """Open the card store of the configured backend.
+
+    Args:
+        cards_dir: Card directory (JSON layout root, home of cards.db)
+        backend: "json" or "sqlite" (defaults to settings.card_cache_backend)
+    """
+    backend = backend or settings.card_cache_backend
+    if backend == "sqlite":
+        return SqliteCardStore(Path(cards_dir) / CARD_DB_FILENAME)
+    if backend != "json":
+        raise ValueError(f"Unknown card cache backend: {backend}")
+    return JsonCardStore(cards_dir)
+
+
+def migrate_cards(source: CardStore, target: SqliteCardStore) -> dict:
+    """Copy every record of every kind from one store into another.
+
+    Returns:
+        Dict of kind -> records copied
+    """
+    copied = {}
+    for kind in (*CARD_KINDS, NOT_FOUND):
+        records = [(kind, key, body, fetched_at) for key, body, fetched_at in source.items(kind)]
+        target.put_many(records)
+        copied[kind] = len(records)
+    return copied
 
 
 class CardCache:
     """Cache for word and entity cards.
 
-    Cards are stored as JSON files on disk:
-    - data/cards/words/{word}.json
-    - data/cards/entities/{entity_id}.json
+    Cards are stored by a ``CardStore`` (JSON files or SQLite), with a
+    bounded LRU of decoded cards in front of it.
 
     Cache entries expire after a configurable TTL (default 30 days).
     Negative cache (not-found markers) expire after a shorter TTL (default 7 days).
@@ -26,6 +301,7 @@ class CardCache:
         cards_dir: Optional[Path] = None,
         ttl_days: int = 30,
         negative_ttl_days: int = 7,
+        backend: Optional[str] = None,
     ):
         """Initialize card cache.
 
@@ -33,20 +309,28 @@ class CardCache:
             cards_dir: Directory for card storage. Defaults to data/cards.
             ttl_days: Cache TTL in days.
             negative_ttl_days: Negative cache TTL in days.
+            backend: Storage backend, "json" or "sqlite". Defaults to
+                settings.card_cache_backend.
         """
         self.cards_dir = cards_dir or settings.data_dir / "cards"
-        self.words_dir = self.cards_dir / "words"
-        self.entities_dir = self.cards_dir / "entities"
-        self.idioms_dir = self.cards_dir / "idioms"
         self.ttl = timedelta(days=ttl_days)
         self.negative_ttl = timedelta(days=negative_ttl_days)
+        self.store = open_card_store(self.cards_dir, backend)
 
-        # Create directories
-        self.words_dir.mkdir(parents=True, exist_ok=True)
-        self.entities_dir.mkdir(parents=True, exist_ok=True)
-        self.idioms_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[Tuple[str, str], object]" = OrderedDict()
+        self._memory_limit = settings.card_cache_memory_items
+        self._negatives: Optional[BloomFilter] = None  # Built on first negative lookup
 
-        logger.info(f"CardCache initialized at {self.cards_dir}")
+        if isinstance(self.store, SqliteCardStore) and not any(self.store.count(k) for k in CARD_KINDS):
+            pending = JsonCardStore(self.cards_dir).count(WORD)
+            if pending:
+                logger.warning(
+                    f"{pending} word cards found in the JSON layout but not in "
+                    f"{self.store.db_path}; run scripts/migrate_card_cache.py to import them"
+                )
+
+        logger.info(f"CardCache initialized at {self.cards_dir} ({self.store.name})")
 
     def _is_expired(self, fetched_at: datetime) -> bool:
         """Check if a cached entry has expired."""
@@ -59,6 +343,81 @@ class CardCache:
         # Remove any remaining non-alphanumeric characters except underscore and hyphen
         return "".join(c for c in sanitized if c.isalnum() or c in "_-")
 
+    # ============ Storage ============
+
+    def _negative_filter(self) -> BloomFilter:
+        """The bloom filter of negative-cache keys, read from storage once."""
+        negatives = self._negatives
+        if negatives is None:
+            keys = list(self.store.keys(NOT_FOUND))
+            negatives = BloomFilter(max(100_000, 2 * len(keys)))
+            for key in keys:
+                negatives.add(key)
+            with self._lock:
+                if self._negatives is None:
+                    self._negatives = negatives
+                negatives = self._negatives
+        return negatives
+
+    def _get_card(self, kind: str, name: str):
+        """Decoded card of ``kind`` from memory or storage, or None if absent or expired."""
+        key = self._sanitize_filename(name)
+        with self._lock:
+            card = self._memory.get((kind, key))
+            if card is not None:
+                self._memory.move_to_end((kind, key))
+
+        if card is None:
+            try:
+                body = self.store.get(kind, key)
+                if body is None:
+                    return None
+                card = _MODELS[kind].model_validate_json(body)
+            except Exception as e:
+                logger.warning(f"Failed to load {kind} card {name}: {e}")
+                return None
+            self._remember(kind, key, card)
+
+        # Check expiration
+        if self._is_expired(card.fetched_at):
+            logger.debug(f"{kind.capitalize()} card expired: {name}")
+            return None
+
+        logger.debug(f"{kind.capitalize()} card cache hit: {name}")
+        return card.model_copy(deep=True)
+
+    def _set_card(self, kind: str, name: str, card) -> None:
+        key = self._sanitize_filename(name)
+        try:
+            # Update fetch time
+            card.fetched_at = datetime.now()
+            self.store.put(
+                kind, key,
+                json.dumps(card.model_dump(mode="json"), ensure_ascii=False, indent=2),
+                card.fetched_at.timestamp(),
+            )
+            self._remember(kind, key, card.model_copy(deep=True))
+            logger.debug(f"{kind.capitalize()} card cached: {name}")
+
+        except Exception as e:
+            logger.error(f"Failed to cache {kind} card {name}: {e}")
+
+    def _delete_card(self, kind: str, name: str) -> bool:
+        key = self._sanitize_filename(name)
+        with self._lock:
+            self._memory.pop((kind, key), None)
+        if self.store.delete(kind, key):
+            logger.debug(f"{kind.capitalize()} card deleted: {name}")
+            return True
+        return False
+
+    def _remember(self, kind: str, key: str, card) -> None:
+        with self._lock:
+            self._memory[(kind, key)] = card
+            self._memory.move_to_end((kind, key))
+            while len(self._memory) > self._memory_limit:
+                self._memory.popitem(last=False)
+
     # ============ Word Cards ============
 
     def get_word_card(self, word: str, cache_key: Optional[str] = None) -> Optional[WordCard]:
@@ -71,30 +430,7 @@ class CardCache:
         Returns:
             WordCard if found and not expired, None otherwise.
         """
-        key = cache_key or word
-        filename = self._sanitize_filename(key) + ".json"
-        file_path = self.words_dir / filename
-
-        if not file_path.exists():
-            return None
-
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            card = WordCard.model_validate(data)
-
-            # Check expiration
-            if self._is_expired(card.fetched_at):
-                logger.debug(f"Word card expired: {word}")
-                return None
-
-            logger.debug(f"Word card cache hit: {word}")
-            return card
-
-        except Exception as e:
-            logger.warning(f"Failed to load word card {word}: {e}")
-            return None
+        return self._get_card(WORD, cache_key or word)
 
     def set_word_card(self, card: WordCard, cache_key: Optional[str] = None) -> None:
         """Store a word card in cache.
@@ -103,21 +439,7 @@ class CardCache:
             card: WordCard to store.
             cache_key: Optional custom cache key (e.g., "word:zh-TW" for translated cards).
         """
-        key = cache_key or card.word
-        filename = self._sanitize_filename(key) + ".json"
-        file_path = self.words_dir / filename
-
-        try:
-            # Update fetch time
-            card.fetched_at = datetime.now()
-
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(card.model_dump(mode="json"), f, ensure_ascii=False, indent=2)
-
-            logger.debug(f"Word card cached: {card.word}")
-
-        except Exception as e:
-            logger.error(f"Failed to cache word card {card.word}: {e}")
+        self._set_card(WORD, cache_key or card.word, card)
 
     def delete_word_card(self, word: str) -> bool:
         """Delete a word card from cache.
@@ -128,20 +450,15 @@ class CardCache:
         Returns:
             True if deleted, False if not found.
         """
-        filename = self._sanitize_filename(word) + ".json"
-        file_path = self.words_dir / filename
-
-        if file_path.exists():
-            file_path.unlink()
-            logger.debug(f"Word card deleted: {word}")
-            return True
-        return False
+        return self._delete_card(WORD, word)
 
     # ============ Negative Cache ============
 
     def is_negative_cached(self, word: str, cache_key: Optional[str] = None) -> bool:
         """Check if a word is in the negative cache (known not found).
 
+        Most lookups are answered by the bloom filter without reading storage.
+
         Args:
             word: The word to check.
             cache_key: Optional custom cache key.
@@ -149,21 +466,19 @@ class CardCache:
         Returns:
             True if word is negatively cached (should skip API calls).
         """
-        key = cache_key or word
-        filename = self._sanitize_filename(key) + ".notfound"
-        file_path = self.words_dir / filename
-
-        if not file_path.exists():
+        key = self._sanitize_filename(cache_key or word)
+        if key not in self._negative_filter():
             return False
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            body = self.store.get(NOT_FOUND, key)
+            if body is None:
+                return False
 
-            fetched_at = datetime.fromisoformat(data.get("fetched_at", "2000-01-01"))
+            fetched_at = datetime.fromisoformat(json.loads(body).get("fetched_at", "2000-01-01"))
             if datetime.now() - fetched_at > self.negative_ttl:
                 # Expired negative cache — remove and retry
-                file_path.unlink()
+                self.store.delete(NOT_FOUND, key)
                 logger.debug(f"Negative cache expired: {word}")
                 return False
 
@@ -180,17 +495,22 @@ class CardCache:
             word: The word to mark.
             cache_key: Optional custom cache key.
         """
-        key = cache_key or word
-        filename = self._sanitize_filename(key) + ".notfound"
-        file_path = self.words_dir / filename
+        key = self._sanitize_filename(cache_key or word)
+        now = datetime.now()
 
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump({
-                    "word": word,
-                    "not_found": True,
-                    "fetched_at": datetime.now().isoformat(),
-                }, f)
+            self.store.put(
+                NOT_FOUND, key,
+                json.dumps({"word": word, "not_found": True, "fetched_at": now.isoformat()}),
+                now.timestamp(),
+            )
+            negatives = self._negative_filter()
+            with self._lock:
+                if negatives.count >= negatives.capacity:
+                    # Rebuilt larger from storage, which already has this key
+                    self._negatives = None
+                else:
+                    negatives.add(key)
 
             logger.debug(f"Negative cached: {word}")
 
@@ -208,29 +528,7 @@ class CardCache:
         Returns:
             EntityCard if found and not expired, None otherwise.
         """
-        filename = self._sanitize_filename(entity_id) + ".json"
-        file_path = self.entities_dir / filename
-
-        if not file_path.exists():
-            return None
-
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            card = EntityCard.model_validate(data)
-
-            # Check expiration
-            if self._is_expired(card.fetched_at):
-                logger.debug(f"Entity card expired: {entity_id}")
-                return None
-
-            logger.debug(f"Entity card cache hit: {entity_id}")
-            return card
-
-        except Exception as e:
-            logger.warning(f"Failed to load entity card {entity_id}: {e}")
-            return None
+        return self._get_card(ENTITY, entity_id)
 
     def set_entity_card(self, card: EntityCard) -> None:
         """Store an entity card in cache.
@@ -238,20 +536,7 @@ class CardCache:
         Args:
             card: EntityCard to store.
         """
-        filename = self._sanitize_filename(card.entity_id) + ".json"
-        file_path = self.entities_dir / filename
-
-        try:
-            # Update fetch time
-            card.fetched_at = datetime.now()
-
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(card.model_dump(mode="json"), f, ensure_ascii=False, indent=2)
-
-            logger.debug(f"Entity card cached: {card.entity_id}")
-
-        except Exception as e:
-            logger.error(f"Failed to cache entity card {card.entity_id}: {e}")
+        self._set_card(ENTITY, card.entity_id, card)
 
     def delete_entity_card(self, entity_id: str) -> bool:
         """Delete an entity card from cache.
@@ -262,14 +547,7 @@ class CardCache:
         Returns:
             True if deleted, False if not found.
         """
-        filename = self._sanitize_filename(entity_id) + ".json"
-        file_path = self.entities_dir / filename
-
-        if file_path.exists():
-            file_path.unlink()
-            logger.debug(f"Entity card deleted: {entity_id}")
-            return True
-        return False
+        return self._delete_card(ENTITY, entity_id)
 
     # ============ Idiom Cards ============
 
@@ -282,29 +560,7 @@ class CardCache:
         Returns:
             IdiomCard if found and not expired, None otherwise.
         """
-        filename = self._sanitize_filename(idiom_text) + ".json"
-        file_path = self.idioms_dir / filename
-
-        if not file_path.exists():
-            return None
-
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            card = IdiomCard.model_validate(data)
-
-            # Check expiration
-            if self._is_expired(card.fetched_at):
-                logger.debug(f"Idiom card expired: {idiom_text}")
-                return None
-
-            logger.debug(f"Idiom card cache hit: {idiom_text}")
-            return card
-
-        except Exception as e:
-            logger.warning(f"Failed to load idiom card {idiom_text}: {e}")
-            return None
+        return self._get_card(IDIOM, idiom_text)
 
     def set_idiom_card(self, card: IdiomCard) -> None:
         """Store an idiom card in cache.
@@ -312,20 +568,7 @@ class CardCache:
         Args:
             card: IdiomCard to store.
         """
-        filename = self._sanitize_filename(card.text) + ".json"
-        file_path = self.idioms_dir / filename
-
-        try:
-            # Update fetch time
-            card.fetched_at = datetime.now()
-
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(card.model_dump(mode="json"), f, ensure_ascii=False, indent=2)
-
-            logger.debug(f"Idiom card cached: {card.text}")
-
-        except Exception as e:
-            logger.error(f"Failed to cache idiom card {card.text}: {e}")
+        self._set_card(IDIOM, card.text, card)
 
     def delete_idiom_card(self, idiom_text: str) -> bool:
         """Delete an idiom card from cache.
@@ -336,14 +579,7 @@ class CardCache:
         Returns:
             True if deleted, False if not found.
         """
-        filename = self._sanitize_filename(idiom_text) + ".json"
-        file_path = self.idioms_dir / filename
-
-        if file_path.exists():
-            file_path.unlink()
-            logger.debug(f"Idiom card deleted: {idiom_text}")
-            return True
-        return False
+        return self._delete_card(IDIOM, idiom_text)
 
     # ============ Utilities ============
 
@@ -353,9 +589,9 @@ class CardCache:
         Returns:
             Dict with cache statistics.
         """
-        word_count = len(list(self.words_dir.glob("*.json")))
-        entity_count = len(list(self.entities_dir.glob("*.json")))
-        idiom_count = len(list(self.idioms_dir.glob("*.json")))
+        word_count = self.store.count(WORD)
+        entity_count = self.store.count(ENTITY)
+        idiom_count = self.store.count(IDIOM)
 
         return {
             "words_cached": word_count,
@@ -363,6 +599,8 @@ class CardCache:
             "idioms_cached": idiom_count,
             "total_cached": word_count + entity_count + idiom_count,
             "cache_dir": str(self.cards_dir),
+            "backend": self.store.name,
+            "memory_cached": len(self._memory),
         }
 
     def clear_expired(self) -> dict:
@@ -371,45 +609,16 @@ class CardCache:
         Returns:
             Dict with counts of cleared entries.
         """
-        words_cleared = 0
-        entities_cleared = 0
-
-        # Clear expired word cards
-        for file_path in self.words_dir.glob("*.json"):
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                fetched_at = datetime.fromisoformat(data.get("fetched_at", "2000-01-01"))
-                if self._is_expired(fetched_at):
-                    file_path.unlink()
-                    words_cleared += 1
-            except Exception:
-                pass
-
-        # Clear expired entity cards
-        for file_path in self.entities_dir.glob("*.json"):
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                fetched_at = datetime.fromisoformat(data.get("fetched_at", "2000-01-01"))
-                if self._is_expired(fetched_at):
-                    file_path.unlink()
-                    entities_cleared += 1
-            except Exception:
-                pass
-
-        # Clear expired idiom cards
-        idioms_cleared = 0
-        for file_path in self.idioms_dir.glob("*.json"):
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                fetched_at = datetime.fromisoformat(data.get("fetched_at", "2000-01-01"))
-                if self._is_expired(fetched_at):
-                    file_path.unlink()
-                    idioms_cleared += 1
-            except Exception:
-                pass
+        cutoff = (datetime.now() - self.ttl).timestamp()
+        words_cleared = self.store.delete_older_than(WORD, cutoff)
+        entities_cleared = self.store.delete_older_than(ENTITY, cutoff)
+        idioms_cleared = self.store.delete_older_than(IDIOM, cutoff)
+        negatives_cleared = self.store.delete_older_than(
+            NOT_FOUND, (datetime.now() - self.negative_ttl).timestamp()
+        )
+        with self._lock:
+            for key in [k for k, card in self._memory.items() if self._is_expired(card.fetched_at)]:
+                del self._memory[key]
 
         logger.info(f"Cleared {words_cleared} word cards, {entities_cleared} entity cards, {idioms_cleared} idiom cards")
 
@@ -417,4 +626,18 @@ class CardCache:
             "words_cleared": words_cleared,
             "entities_cleared": entities_cleared,
             "idioms_cleared": idioms_cleared,
+            "negatives_cleared": negatives_cleared,
         }
+
+
+_cache: Optional[CardCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_card_cache() -> CardCache:
+    """The process-wide card cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = CardCache()
+        return _cache
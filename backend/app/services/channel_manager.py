@@ -20,10 +20,26 @@ from app.models.channel import (
     PublicationSummary,
     PublicationUpdate,
 )
+from app.services.metadata_store import METADATA_DB_FILENAME, open_metadata_store
+from app.services.summary_index import DocumentCache
+
+# Publication fields kept in the summary index (PublicationSummary minus
+# channel_name, which is resolved at list time)
+_PUBLICATION_SUMMARY_FIELDS = {
+    "publication_id", "timeline_id", "channel_id", "title", "status",
+    "platform_url", "platform_views", "created_at", "published_at",
+}
+
+# Publication summary fields that can be filtered on (indexed by the SQLite backend)
+_PUBLICATION_INDEXED_FIELDS = ("timeline_id", "channel_id", "status", "created_at")
 
 
 class ChannelManager:
-    """Manages publishing channels and publications."""
+    """Manages publishing channels and publications.
+
+    Channels are few and live in one file; publications are kept in the
+    configured metadata store and loaded on demand into a bounded LRU.
+    """
 
     def __init__(self, data_dir: Path):
         self.data_dir = Path(data_dir)
@@ -32,7 +48,15 @@ class ChannelManager:
 
         # In-memory cache
         self._channels: Dict[str, Channel] = {}
-        self._publications: Dict[str, Publication] = {}
+        self._publication_store = open_metadata_store(
+            "publications",
+            self.publications_dir,
+            lambda publication_id, summary: self._get_publication_file(publication_id),
+            _PUBLICATION_INDEXED_FIELDS,
+            order_column="created_at",
+            db_path=self.data_dir / METADATA_DB_FILENAME,
+        )
+        self._publications: DocumentCache[Publication] = DocumentCache()
 
         # Ensure directories exist
         self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -167,31 +191,51 @@ class ChannelManager:
         """Get path to publication JSON file."""
         return self.publications_dir / f"{publication_id}.json"
 
+    @staticmethod
+    def _summarize_publication(publication: Publication) -> dict:
+        return publication.model_dump(mode="json", include=_PUBLICATION_SUMMARY_FIELDS)
+
     def _load_publications(self) -> None:
-        """Load all publications from disk."""
-        for path in self.publications_dir.glob("*.json"):
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                pub = Publication(**data)
-                self._publications[pub.publication_id] = pub
-            except Exception as e:
-                logger.error(f"Failed to load publication {path}: {e}")
-
-        logger.info(f"Loaded {len(self._publications)} publications")
+        """Index all publications on disk (only new/changed ones are read)."""
+        def scan() -> Dict[str, List[Path]]:
+            return {path.stem: [path] for path in self.publications_dir.glob("*.json")}
+
+        def summarize(publication_id: str, raw: bytes) -> Optional[dict]:
+            pub = self._parse_publication(publication_id, raw)
+            return self._summarize_publication(pub) if pub else None
+
+        rebuilt = self._publication_store.load(scan, summarize)
+        logger.info(
+            f"Loaded {len(self._publication_store)} publications ({rebuilt} re-indexed)"
+        )
+
+    def _parse_publication(self, publication_id: str, raw: bytes) -> Optional[Publication]:
+        """Validate a stored publication, caching it."""
+        try:
+            pub = Publication.model_validate_json(raw)
+        except Exception as e:
+            logger.error(f"Failed to load publication {publication_id}: {e}")
+            return None
+        self._publications.put(publication_id, pub, len(raw))
+        return pub
 
     def _save_publication(self, publication: Publication) -> None:
-        """Save a publication to disk."""
+        """Save a publication to the metadata store."""
         try:
-            path = self._get_publication_file(publication.publication_id)
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(
-                    publication.model_dump(mode="json"),
-                    f,
-                    ensure_ascii=False,
-                    indent=2,
-                    default=str,
-                )
+            text = json.dumps(
+                publication.model_dump(mode="json"),
+                ensure_ascii=False,
+                indent=2,
+                default=str,
+            )
+            self._publication_store.write(
+                publication.publication_id,
+                text,
+                self._summarize_publication(publication),
+            )
+            self._publications.put(
+                publication.publication_id, publication, len(text.encode("utf-8"))
+            )
         except Exception as e:
             logger.error(f"Failed to save publication {publication.publication_id}: {e}")
 
@@ -203,45 +247,38 @@ class ChannelManager:
         limit: int = 100,
     ) -> List[PublicationSummary]:
         """List publications with optional filters."""
-        result = []
-
-        for pub in self._publications.values():
-            # Filter by timeline
-            if timeline_id and pub.timeline_id != timeline_id:
-                continue
-            # Filter by channel
-            if channel_id and pub.channel_id != channel_id:
-                continue
-            # Filter by status
-            if status and pub.status != status:
-                continue
+        where = {}
+        # Filter by timeline
+        if timeline_id:
+            where["timeline_id"] = timeline_id
+        # Filter by channel
+        if channel_id:
+            where["channel_id"] = channel_id
+        # Filter by status
+        if status:
+            where["status"] = status.value
 
+        result = []
+        # Sort by created_at descending
+        for summary in self._publication_store.query(
+            where, order_by="created_at", descending=True, limit=limit
+        ):
             # Get channel name
-            channel = self.get_channel(pub.channel_id)
+            channel = self.get_channel(summary["channel_id"])
             channel_name = channel.name if channel else "Unknown"
 
-            result.append(
-                PublicationSummary(
-                    publication_id=pub.publication_id,
-                    timeline_id=pub.timeline_id,
-                    channel_id=pub.channel_id,
-                    channel_name=channel_name,
-                    title=pub.title,
-                    status=pub.status,
-                    platform_url=pub.platform_url,
-                    platform_views=pub.platform_views,
-                    created_at=pub.created_at,
-                    published_at=pub.published_at,
-                )
-            )
+            result.append(PublicationSummary(**summary, channel_name=channel_name))
 
-        # Sort by created_at descending
-        result.sort(key=lambda x: x.created_at, reverse=True)
-        return result[:limit]
+        return result
 
     def get_publication(self, publication_id: str) -> Optional[Publication]:
         """Get a publication by ID."""
-        return self._publications.get(publication_id)
+        pub = self._publications.get(publication_id)
+        if pub is None:
+            raw = self._publication_store.read(publication_id)
+            if raw is not None:
+                pub = self._parse_publication(publication_id, raw)
+        return pub
 
     def create_publication(self, create: PublicationCreate) -> Publication:
         """Create a new publication (draft)."""
@@ -257,7 +294,6 @@ class ChannelManager:
             status=PublicationStatus.DRAFT,
         )
 
-        self._publications[publication.publication_id] = publication
         self._save_publication(publication)
 
         logger.info(
@@ -334,15 +370,11 @@ class ChannelManager:
 
     def delete_publication(self, publication_id: str) -> bool:
         """Delete a publication."""
-        if publication_id not in self._publications:
+        if publication_id not in self._publication_store:
             return False
 
-        # Remove file
-        path = self._get_publication_file(publication_id)
-        if path.exists():
-            path.unlink()
-
-        del self._publications[publication_id]
+        self._publication_store.delete(publication_id)
+        self._publications.pop(publication_id)
 
         logger.info(f"Deleted publication: {publication_id}")
         return True
@@ -0,0 +1,164 @@
+"""In-memory export progress channel.
+
+Remotion/FFmpeg report progress many times per second. Persisting every
+tick would rewrite the timeline on disk and flood the logs, so progress
+lives here in memory and is pushed to WebSocket subscribers at a bounded
+rate. Only status transitions (e.g. EXPORTING → COMPLETED/FAILED) are
+written through to the TimelineManager.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+from loguru import logger
+
+from app.models.timeline import ExportStatus
+from app.services.timeline_manager import TimelineManager
+
+# Statuses a late progress tick must not overwrite
+_TERMINAL_STATUSES = (ExportStatus.CANCELLING, ExportStatus.COMPLETED, ExportStatus.FAILED)
+
+
+class ExportProgressRegistry:
+    """Tracks live export progress and fans it out to subscribers."""
+
+    def __init__(
+        self,
+        timeline_manager: TimelineManager,
+        broadcast_callback: Optional[Callable[[str, dict], Awaitable[None]]] = None,
+        min_interval: float = 0.5,
+    ):
+        """Initialize the registry.
+
+        Args:
+            timeline_manager: Manager that persists status transitions
+            broadcast_callback: Async callback(timeline_id, data) for pushes
+            min_interval: Minimum seconds between pushes of the same status
+        """
+        self.timeline_manager = timeline_manager
+        self.broadcast_callback = broadcast_callback
+        self.min_interval = min_interval
+        self._progress: Dict[str, dict] = {}
+        self._last_push: Dict[str, float] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def begin(self, timeline_id: str, message: Optional[str] = None) -> bool:
+        """Start tracking a new export run (persisted as EXPORTING at 0%).
+
+        Unlike update(), this always transitions, even out of a terminal
+        status left over from a previous run.
+
+        Args:
+            timeline_id: Timeline ID
+            message: Initial step description
+
+        Returns:
+            True if successful, False if timeline not found
+        """
+        self.clear(timeline_id)
+        if not self.timeline_manager.update_export_status(
+            timeline_id, ExportStatus.EXPORTING, progress=0.0, message=message
+        ):
+            return False
+        return self.update(timeline_id, ExportStatus.EXPORTING, 0.0, message)
+
+    def update(
+        self,
+        timeline_id: str,
+        status: ExportStatus,
+        progress: float = 0.0,
+        message: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> bool:
+        """Record export progress.
+
+        A status change is persisted through the timeline manager; a
+        progress tick within the same status only updates memory.
+
+        Args:
+            timeline_id: Timeline ID
+            status: Export status
+            progress: Export progress percentage (0-100)
+            message: Current step description
+            error: Error message if failed
+
+        Returns:
+            True if recorded, False if the timeline was not found or the
+            tick was dropped because the export is already finishing
+        """
+        timeline = self.timeline_manager.get_timeline(timeline_id)
+        if not timeline:
+            return False
+
+        current = timeline.export_status
+        transition = status != current
+        if (
+            transition
+            and current in _TERMINAL_STATUSES
+            and status in (ExportStatus.EXPORTING, ExportStatus.UPLOADING)
+        ):
+            # Late tick after cancel/finish: don't resurrect the export
+            logger.debug(
+                f"Dropping {status.value} tick for timeline {timeline_id} "
+                f"(status is {current.value})"
+            )
+            return False
+
+        if transition:
+            self.timeline_manager.update_export_status(
+                timeline_id, status, progress=progress, message=message, error=error
+            )
+        else:
+            self.timeline_manager.set_export_progress(
+                timeline_id, progress=progress, message=message
+            )
+
+        state = {
+            "status": status.value,
+            "progress": progress,
+            "message": message,
+            "error": error,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._progress[timeline_id] = state
+
+        now = time.monotonic()
+        last = self._last_push.get(timeline_id)
+        if transition or last is None or now - last >= self.min_interval:
+            self._last_push[timeline_id] = now
+            self._push(timeline_id, state)
+
+        if status in (ExportStatus.COMPLETED, ExportStatus.FAILED, ExportStatus.IDLE):
+            self._last_push.pop(timeline_id, None)
+
+        return True
+
+    def get(self, timeline_id: str) -> Optional[dict]:
+        """Get the latest in-memory progress for a timeline."""
+        return self._progress.get(timeline_id)
+
+    def clear(self, timeline_id: str) -> None:
+        """Forget progress for a timeline."""
+        self._progress.pop(timeline_id, None)
+        self._last_push.pop(timeline_id, None)
+
+    def _push(self, timeline_id: str, state: dict) -> None:
+        """Schedule a broadcast on the running event loop, if any."""
+        if not self.broadcast_callback:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        task = loop.create_task(self._broadcast(timeline_id, dict(state)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _broadcast(self, timeline_id: str, state: dict) -> None:
+        try:
+            await self.broadcast_callback(timeline_id, state)
+        except Exception as e:
+            logger.warning(f"Export progress broadcast failed for {timeline_id}: {e}")
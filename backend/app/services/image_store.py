@@ -0,0 +1,453 @@
+"""Card image store: pooled downloads, a bounded disk cache and a decoded LRU.
+
+Card images (word illustrations, entity photos) are downloaded once and
+shared by the export (Remotion loads them as file:// URLs) and by
+CardRenderer (which pastes them into card PNGs).
+
+- Downloads share one pooled HTTP client (an AsyncClient per event loop for
+  prefetch, a thread-safe Client for CardRenderer's sync path) and are
+  rate limited per host by token buckets, so a slow or strict host does
+  not hold up the others.
+- Images are stored on disk as WebP (PNG when Pillow lacks WebP; PNGs
+  cached by earlier versions are still read). The directory is bounded by
+  ``card_image_cache_mb``; the least recently used files are evicted.
+- Decoded RGBA images, and resized variants, are kept in an in-memory LRU
+  bounded by ``card_image_memory_mb``.
+
+Counters (hits, misses, bytes) are reported by ``stats()``.
+"""
+
+import asyncio
+import hashlib
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from loguru import logger
+
+from app.config import settings
+
+try:
+    from PIL import Image, features
+    PILLOW_AVAILABLE = True
+    WEBP_AVAILABLE = features.check("webp")
+except ImportError:
+    PILLOW_AVAILABLE = False
+    WEBP_AVAILABLE = False
+
+
+# Domain-specific headers — Wikimedia requires bot UA; Pixabay wants browser UA
+_WIKIMEDIA_HEADERS = {
+    "User-Agent": "SceneMindBot/1.0 (https://github.com/FreeAdam2023/BamianjingTV; scenemind@proton.me) python-httpx/0.27",
+}
+_BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+}
+
+
+def headers_for_url(url: str) -> dict:
+    """Pick headers based on the image host."""
+    host = urlparse(url).hostname or ""
+    if "wikimedia" in host or "wikipedia" in host:
+        return _WIKIMEDIA_HEADERS
+    return _BROWSER_HEADERS
+
+
+def card_image_urls(card_data: Optional[dict], card_type: str) -> List[str]:
+    """Image URLs a card displays."""
+    if not card_data:
+        return []
+    if card_type == "entity" and card_data.get("image_url"):
+        return [card_data["image_url"]]
+    if card_type == "word":
+        return list(card_data.get("images", [])[:3])
+    return []
+
+
+class TokenBucket:
+    """Request budget for one host: ``rate`` requests/s, bursts of ``burst``.
+
+    Tokens may go negative: each caller reserves the next slot and waits
+    for it, so concurrent callers queue in order instead of polling.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token; returns the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+
+
+class ImageStore:
+    """Downloaded card images on disk, with decoded images in memory."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_disk_mb: int,
+        max_memory_mb: int,
+        host_rate: float = 2.0,
+        host_burst: int = 4,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_disk_bytes = max_disk_mb * 1024 * 1024
+        self.max_memory_bytes = max_memory_mb * 1024 * 1024
+        self.host_rate = host_rate
+        self.host_burst = host_burst
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes: Optional[int] = None  # Scanned on first use
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._client = None
+        self._async_client = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight: Dict[str, "asyncio.Future[Optional[Path]]"] = {}
+        self._counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "downloads": 0,
+            "download_failures": 0,
+            "bytes_downloaded": 0,
+            "disk_evictions": 0,
+            "memory_evictions": 0,
+        }
+
+    # ── Disk ──
+
+    def _stem(self, url: str) -> Path:
+        return self.cache_dir / hashlib.md5(url.encode()).hexdigest()
+
+    def cached_path(self, url: str) -> Optional[Path]:
+        """Path of the cached image for ``url``, or None if not downloaded.
+
+        A hit marks the file as recently used.
+        """
+        stem = self._stem(url)
+        for suffix in (".webp", ".png"):
+            path = stem.with_suffix(suffix)
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                continue
+            return path
+        return None
+
+    def _write(self, url: str, content: bytes) -> Tuple[Path, "Image.Image"]:
+        """Decode downloaded bytes and store them; returns (path, RGBA image)."""
+        img = Image.open(io.BytesIO(content)).convert("RGBA")
+        path = self._stem(url).with_suffix(".webp" if WEBP_AVAILABLE else ".png")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            if WEBP_AVAILABLE:
+                img.save(tmp_path, "WEBP", quality=90, method=4)
+            else:
+                img.save(tmp_path, "PNG")
+            tmp_path.replace(path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        self._add_disk_bytes(path.stat().st_size)
+        return path, img
+
+    def _scan_disk(self) -> List[Tuple[float, int, Path]]:
+        entries = []
+        for path in self.cache_dir.glob("*.*"):
+            if path.suffix not in (".webp", ".png"):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _add_disk_bytes(self, size: int) -> None:
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size, _ in self._scan_disk())
+            else:
+                self._disk_bytes += size
+            over = self._disk_bytes > self.max_disk_bytes
+        if over:
+            self.evict()
+
+    def evict(self) -> int:
+        """Delete least recently used images until the disk cache fits its quota.
+
+        Returns:
+            Number of files deleted
+        """
+        entries = sorted(self._scan_disk())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        with self._lock:
+            self._disk_bytes = total
+            self._counters["disk_evictions"] += removed
+        if removed:
+            logger.info(f"Image store: evicted {removed} images ({total / 1024 / 1024:.0f} MB kept)")
+        return removed
+
+    # ── Memory ──
+
+    def _remember(self, key: tuple, img: "Image.Image") -> None:
+        size = img.width * img.height * len(img.getbands())
+        if size > self.max_memory_bytes:
+            return
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_bytes -= old.width * old.height * len(old.getbands())
+            self._memory[key] = img
+            self._memory_bytes += size
+            while self._memory_bytes > self.max_memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= evicted.width * evicted.height * len(evicted.getbands())
+                self._counters["memory_evictions"] += 1
+
+    def _recall(self, key: tuple) -> Optional["Image.Image"]:
+        with self._lock:
+            img = self._memory.get(key)
+            if img is not None:
+                self._memory.move_to_end(key)
+            return img
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    # ── Downloads ──
+
+    def _bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).hostname or ""
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.host_rate, self.host_burst)
+            return bucket
+
+    def _get_client(self):
+        import httpx
+
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    timeout=15.0,
+                    follow_redirects=True,
+                    limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+                )
+            return self._client
+
+    def _get_async_client(self):
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client.is_closed or self._async_loop is not loop:
+            self._async_client = httpx.AsyncClient(
+                timeout=15.0,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+            )
+            self._async_loop = loop
+        return self._async_client
+
+    def _stored(self, url: str, content: bytes) -> Tuple[Path, "Image.Image"]:
+        path, img = self._write(url, content)
+        self._count("downloads")
+        self._count("bytes_downloaded", len(content))
+        logger.debug(f"Cached image: {url} -> {path}")
+        return path, img
+
+    async def _download(self, url: str) -> Optional[Path]:
+        client = self._get_async_client()
+        bucket = self._bucket(url)
+        headers = headers_for_url(url)
+        try:
+            await asyncio.sleep(bucket.reserve())
+            response = await client.get(url, headers=headers)
+
+            # Handle rate limiting with retry
+            if response.status_code == 429:
+                retry_after = int(response.headers.get("Retry-After", 5))
+                logger.info(f"Rate limited, waiting {retry_after}s: {url}")
+                await asyncio.sleep(retry_after + bucket.reserve())
+                response = await client.get(url, headers=headers)
+
+            response.raise_for_status()
+            path, img = await asyncio.to_thread(self._stored, url, response.content)
+            self._remember((url, None), img)
+            return path
+        except Exception as e:
+            self._count("download_failures")
+            logger.warning(f"Failed to download image {url}: {e}")
+            return None
+
+    async def fetch(self, url: str) -> Optional[Path]:
+        """Make sure ``url`` is on disk, downloading it if needed.
+
+        Concurrent requests for the same URL share one download.
+
+        Returns:
+            Path of the cached image, or None on failure
+        """
+        if not url:
+            return None
+        path = self.cached_path(url)
+        if path is not None:
+            self._count("disk_hits")
+            return path
+        if not PILLOW_AVAILABLE:
+            logger.warning(f"Pillow not installed, cannot cache image {url}")
+            return None
+        task = self._inflight.get(url)
+        if task is None:
+            self._count("misses")
+            task = asyncio.ensure_future(self._download(url))
+            self._inflight[url] = task
+            task.add_done_callback(lambda _: self._inflight.pop(url, None))
+        return await asyncio.shield(task)
+
+    def _download_sync(self, url: str) -> Optional["Image.Image"]:
+        client = self._get_client()
+        bucket = self._bucket(url)
+        headers = headers_for_url(url)
+        try:
+            time.sleep(bucket.reserve())
+            response = client.get(url, headers=headers)
+            if response.status_code == 429:
+                retry_after = int(response.headers.get("Retry-After", 5))
+                logger.info(f"Rate limited, waiting {retry_after}s: {url}")
+                time.sleep(retry_after + bucket.reserve())
+                response = client.get(url, headers=headers)
+            response.raise_for_status()
+            _, img = self._stored(url, response.content)
+            return img
+        except Exception as e:
+            self._count("download_failures")
+            logger.warning(f"Failed to download image {url}: {e}")
+            return None
+
+    # ── Decoded images ──
+
+    def get_image(
+        self,
+        url: str,
+        cover: Optional[Tuple[int, int]] = None,
+        download: bool = True,
+    ) -> Optional["Image.Image"]:
+        """Decoded RGBA image for ``url``: memory, then disk, then the network.
+
+        Args:
+            url: Image URL
+            cover: (width, height) to scale and center-crop the image to fill
+            download: Download the image on a cache miss
+
+        Returns:
+            The image (shared; copy before modifying it) or None
+        """
+        if not url or not PILLOW_AVAILABLE:
+            return None
+        key = (url, tuple(cover) if cover else None)
+        img = self._recall(key)
+        if img is not None:
+            self._count("memory_hits")
+            return img
+
+        img = self._recall((url, None))
+        if img is not None:
+            self._count("memory_hits")
+        else:
+            path = self.cached_path(url)
+            if path is not None:
+                try:
+                    img = Image.open(path).convert("RGBA")
+                    self._count("disk_hits")
+                except Exception as e:
+                    logger.warning(f"Unreadable cached image {path}: {e}")
+            if img is None:
+                if not download:
+                    return None
+                self._count("misses")
+                img = self._download_sync(url)
+                if img is None:
+                    return None
+            self._remember((url, None), img)
+
+        if cover:
+            img = cover_image(img, *cover)
+            self._remember(key, img)
+        return img
+
+    def stats(self) -> dict:
+        """Cache counters, hit rate and sizes."""
+        with self._lock:
+            counters = dict(self._counters)
+            memory_items = len(self._memory)
+            memory_bytes = self._memory_bytes
+        entries = self._scan_disk() if self.cache_dir.exists() else []
+        lookups = counters["memory_hits"] + counters["disk_hits"] + counters["misses"]
+        hits = counters["memory_hits"] + counters["disk_hits"]
+        return {
+            **counters,
+            "hit_rate": round(hits / lookups, 4) if lookups else None,
+            "memory_items": memory_items,
+            "memory_bytes": memory_bytes,
+            "memory_limit_bytes": self.max_memory_bytes,
+            "disk_files": len(entries),
+            "disk_bytes": sum(size for _, size, _ in entries),
+            "disk_limit_bytes": self.max_disk_bytes,
+        }
+
+
+def cover_image(img: "Image.Image", width: int, height: int) -> "Image.Image":
+    """Scale ``img`` to fill width x height, keeping aspect ratio, and center-crop."""
+    aspect = img.width / img.height
+    if aspect >= width / height:
+        new_w, new_h = int(height * aspect), height
+    else:
+        new_w, new_h = width, int(width / aspect)
+    img = img.resize((max(new_w, width), max(new_h, height)), Image.LANCZOS)
+    x_off = (img.width - width) // 2
+    y_off = (img.height - height) // 2
+    return img.crop((x_off, y_off, x_off + width, y_off + height))
+
+
+_store: Optional[ImageStore] = None
+_store_lock = threading.Lock()
+
+
+def get_image_store() -> ImageStore:
+    """The process-wide image store."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ImageStore(
+                settings.data_dir / "cards" / "images",
+                max_disk_mb=settings.card_image_cache_mb,
+                max_memory_mb=settings.card_image_memory_mb,
+                host_rate=settings.card_image_host_rate,
+            )
+        return _store
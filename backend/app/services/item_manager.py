@@ -3,22 +3,75 @@
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 import uuid
 from loguru import logger
 
 from app.config import settings
 from app.models.source import SourceType
 from app.models.item import Item, ItemStatus, ItemCreate, PipelineStatus
+from app.services.metadata_store import open_metadata_store
+from app.services.summary_index import DocumentCache
+
+# Item fields kept in the summary index
+_SUMMARY_FIELDS = {
+    "item_id", "source_type", "source_id", "original_url",
+    "status", "created_at", "updated_at",
+}
+
+# Summary fields that can be filtered on (indexed by the SQLite backend)
+_INDEXED_FIELDS = ("source_type", "source_id", "original_url", "status", "created_at")
 
 
 class ItemManager:
-    """Manages item lifecycle with directory-based storage."""
+    """Manages item lifecycle with directory-based storage.
+
+    Item summaries live in the configured metadata store for listing and
+    stats; full ``Item`` objects are read on demand and held in a bounded
+    LRU.
+    """
 
     def __init__(self):
-        self.items: Dict[str, Item] = {}
+        items_dir = settings.items_dir
+        self._store = open_metadata_store(
+            "items",
+            items_dir,
+            lambda item_id, summary: self._get_item_path(
+                SourceType(summary["source_type"]), summary["source_id"], item_id
+            ),
+            _INDEXED_FIELDS,
+            order_column="created_at",
+        )
+        self._documents: DocumentCache[Item] = DocumentCache()
         self._load_items()
 
+    @staticmethod
+    def _summarize(item: Item) -> dict:
+        summary = item.model_dump(mode="json", include=_SUMMARY_FIELDS)
+        summary["active_pipelines"] = sum(
+            1 for ps in item.pipelines.values() if ps.status == "processing"
+        )
+        return summary
+
+    def _parse_item(self, item_id: str, raw: bytes) -> Optional[Item]:
+        """Validate a stored item, caching it."""
+        try:
+            item = Item.model_validate_json(raw)
+        except Exception as e:
+            logger.error(f"Failed to load item {item_id}: {e}")
+            return None
+        self._documents.put(item.item_id, item, len(raw))
+        return item
+
+    def _hydrate(self, summaries: Iterable[dict]) -> List[Item]:
+        """Get full items for summaries, skipping unreadable ones."""
+        items = []
+        for summary in summaries:
+            item = self.get_item(summary["item_id"])
+            if item:
+                items.append(item)
+        return items
+
     def _get_item_path(self, source_type: SourceType, source_id: str, item_id: str) -> Path:
         """Get the file path for an item."""
         return settings.items_dir / source_type.value / source_id / f"{item_id}.json"
@@ -28,40 +81,42 @@ class ItemManager:
         return settings.items_dir / source_type.value / source_id
 
     def _load_items(self) -> None:
-        """Load all items from disk on startup."""
+        """Index items on startup (only new/changed files are read)."""
         items_dir = settings.items_dir
         if not items_dir.exists():
             logger.info("No existing items directory found")
             return
 
-        loaded = 0
-        for type_dir in items_dir.iterdir():
-            if not type_dir.is_dir():
-                continue
-
-            for source_dir in type_dir.iterdir():
-                if not source_dir.is_dir():
+        def scan() -> Dict[str, List[Path]]:
+            documents: Dict[str, List[Path]] = {}
+            for type_dir in items_dir.iterdir():
+                if not type_dir.is_dir():
                     continue
 
-                for item_file in source_dir.glob("*.json"):
-                    try:
-                        with open(item_file, "r", encoding="utf-8") as f:
-                            data = json.load(f)
-                        item = Item(**data)
-                        self.items[item.item_id] = item
-                        loaded += 1
-                    except Exception as e:
-                        logger.error(f"Failed to load item from {item_file}: {e}")
+                for source_dir in type_dir.iterdir():
+                    if not source_dir.is_dir():
+                        continue
+
+                    for item_file in source_dir.glob("*.json"):
+                        documents[item_file.stem] = [item_file]
+            return documents
+
+        def summarize(item_id: str, raw: bytes) -> Optional[dict]:
+            item = self._parse_item(item_id, raw)
+            return self._summarize(item) if item else None
 
-        logger.info(f"Loaded {loaded} items")
+        rebuilt = self._store.load(scan, summarize)
+        logger.info(f"Loaded {len(self._store)} items ({rebuilt} re-indexed)")
 
     def _save_item(self, item: Item) -> None:
-        """Save an item to disk."""
-        item_path = self._get_item_path(item.source_type, item.source_id, item.item_id)
-        item_path.parent.mkdir(parents=True, exist_ok=True)
+        """Save an item to the metadata store."""
+        text = json.dumps(item.model_dump(mode="json"), indent=2, ensure_ascii=False, default=str)
+        self._store.write(item.item_id, text, self._summarize(item))
+        self._documents.put(item.item_id, item, len(text.encode("utf-8")))
 
-        with open(item_path, "w", encoding="utf-8") as f:
-            json.dump(item.model_dump(mode="json"), f, indent=2, ensure_ascii=False, default=str)
+    def flush_index(self) -> None:
+        """Persist the item summary index (e.g. on shutdown)."""
+        self._store.flush()
 
     def create_item(self, item_create: ItemCreate) -> Item:
         """Create a new item."""
@@ -89,20 +144,25 @@ class ItemManager:
             updated_at=datetime.now(),
         )
 
-        self.items[item.item_id] = item
         self._save_item(item)
         logger.info(f"Created item: {item.item_id} ({item.original_title[:50]}...)")
         return item
 
     def get_item(self, item_id: str) -> Optional[Item]:
         """Get an item by ID."""
-        return self.items.get(item_id)
+        item = self._documents.get(item_id)
+        if item is None:
+            raw = self._store.read(item_id)
+            if raw is not None:
+                item = self._parse_item(item_id, raw)
+        return item
 
     def get_item_by_url(self, source_id: str, url: str) -> Optional[Item]:
         """Get an item by source ID and URL."""
-        for item in self.items.values():
-            if item.source_id == source_id and item.original_url == url:
-                return item
+        for summary in self._store.query(
+            {"source_id": source_id, "original_url": url}, limit=1
+        ):
+            return self.get_item(summary["item_id"])
         return None
 
     def list_items(
@@ -113,33 +173,29 @@ class ItemManager:
         limit: int = 100,
         offset: int = 0,
     ) -> List[Item]:
-        """List items with optional filtering."""
-        items = list(self.items.values())
+        """List items with optional filtering (only the page is hydrated)."""
+        where = {}
 
         if source_type:
-            items = [i for i in items if i.source_type == source_type]
+            where["source_type"] = source_type.value
 
         if source_id:
-            items = [i for i in items if i.source_id == source_id]
+            where["source_id"] = source_id
 
         if status:
-            items = [i for i in items if i.status == status]
+            where["status"] = status.value
 
         # Sort by creation time, newest first
-        items.sort(key=lambda i: i.created_at, reverse=True)
-
-        return items[offset:offset + limit]
+        return self._hydrate(self._store.query(
+            where, order_by="created_at", descending=True, limit=limit, offset=offset
+        ))
 
     def delete_item(self, item_id: str) -> bool:
         """Delete an item."""
-        item = self.items.pop(item_id, None)
-        if not item:
+        if item_id not in self._store:
             return False
-
-        # Delete file
-        item_path = self._get_item_path(item.source_type, item.source_id, item_id)
-        if item_path.exists():
-            item_path.unlink()
+        self._store.delete(item_id)
+        self._documents.pop(item_id)
 
         logger.info(f"Deleted item: {item_id}")
         return True
@@ -154,7 +210,7 @@ class ItemManager:
         error: str = None,
     ) -> Optional[Item]:
         """Update pipeline status for an item."""
-        item = self.items.get(item_id)
+        item = self.get_item(item_id)
         if not item:
             return None
 
@@ -171,11 +227,11 @@ class ItemManager:
 
     def get_items_by_source(self, source_id: str) -> List[Item]:
         """Get all items for a source."""
-        return [i for i in self.items.values() if i.source_id == source_id]
+        return self._hydrate(self._store.query({"source_id": source_id}))
 
     def update_item_status(self, item_id: str, status: ItemStatus) -> Optional[Item]:
         """Update item status."""
-        item = self.items.get(item_id)
+        item = self.get_item(item_id)
         if not item:
             return None
 
@@ -188,13 +244,13 @@ class ItemManager:
     def get_recent_items(self, hours: int = 24) -> List[Item]:
         """Get items created within the last N hours."""
         cutoff = datetime.now() - timedelta(hours=hours)
-        items = [i for i in self.items.values() if i.created_at >= cutoff]
-        items.sort(key=lambda i: i.created_at, reverse=True)
-        return items
+        return self._hydrate(self._store.query(
+            order_by="created_at", descending=True, since=("created_at", cutoff.isoformat())
+        ))
 
     def get_fanout_status(self, item_id: str) -> Optional[Dict]:
         """Get fan-out status for an item (all pipeline statuses)."""
-        item = self.items.get(item_id)
+        item = self.get_item(item_id)
         if not item:
             return None
 
@@ -216,19 +272,21 @@ class ItemManager:
 
     def get_stats(self) -> Dict:
         """Get item statistics."""
+        status_counts = self._store.count_by("status")
+        type_counts = self._store.count_by("source_type")
         stats = {
-            "total": len(self.items),
+            "total": sum(status_counts.values()),
             "by_status": {},
             "by_source_type": {},
         }
 
         for status in ItemStatus:
-            count = sum(1 for i in self.items.values() if i.status == status)
+            count = status_counts.get(status.value, 0)
             if count > 0:
                 stats["by_status"][status.value] = count
 
         for source_type in SourceType:
-            count = sum(1 for i in self.items.values() if i.source_type == source_type)
+            count = type_counts.get(source_type.value, 0)
             if count > 0:
                 stats["by_source_type"][source_type.value] = count
 
@@ -241,24 +299,21 @@ class ItemManager:
         last_24h = now - timedelta(hours=24)
 
         for source_type in SourceType:
-            type_items = [i for i in self.items.values() if i.source_type == source_type]
+            type_items = self._store.query({"source_type": source_type.value})
 
             if not type_items:
                 continue
 
             # Count items created in last 24 hours
-            new_items_24h = sum(1 for i in type_items if i.created_at >= last_24h)
+            new_items_24h = sum(
+                1 for s in type_items if datetime.fromisoformat(s["created_at"]) >= last_24h
+            )
 
             # Count active pipelines (processing)
-            active_pipelines = 0
-            for item in type_items:
-                active_pipelines += sum(
-                    1 for ps in item.pipelines.values()
-                    if ps.status == "processing"
-                )
+            active_pipelines = sum(s["active_pipelines"] for s in type_items)
 
             # Get unique sources
-            sources = set(i.source_id for i in type_items)
+            sources = set(s["source_id"] for s in type_items)
 
             result[source_type.value] = {
                 "source_count": len(sources),
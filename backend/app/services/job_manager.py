@@ -2,21 +2,51 @@
 
 import asyncio
 import json
+import os
+import shutil
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Optional, Callable, Awaitable, TYPE_CHECKING
+from typing import Dict, Iterable, List, Optional, Callable, Awaitable, TYPE_CHECKING
 from loguru import logger
 
 from app.config import settings
 from app.models.job import Job, JobStatus
 from app.models.source import SourceType
+from app.services.metadata_store import open_metadata_store
+from app.services.summary_index import DocumentCache
 
 if TYPE_CHECKING:
     from app.services.item_manager import ItemManager
 
 
+# Job fields kept in the summary index (enough for list filters and stats)
+_SUMMARY_FIELDS = {
+    "id", "url", "status", "created_at", "updated_at",
+    "source_type", "source_id", "item_id", "pipeline_id",
+}
+
+# Summary fields that can be filtered on (indexed by the SQLite backend)
+_INDEXED_FIELDS = (
+    "url", "status", "created_at", "source_type", "source_id", "item_id", "pipeline_id",
+)
+
+_INCOMPLETE_STATUSES = {
+    JobStatus.PENDING,
+    JobStatus.DOWNLOADING,
+    JobStatus.TRANSCRIBING,
+    JobStatus.DIARIZING,
+    JobStatus.TRANSLATING,
+    JobStatus.EXPORTING,
+}
+_INCOMPLETE_STATUS_VALUES = [status.value for status in _INCOMPLETE_STATUSES]
+
+
 class JobManager:
-    """Manages job lifecycle with error recovery and retry support."""
+    """Manages job lifecycle with error recovery and retry support.
+
+    Only job summaries (see ``_SUMMARY_FIELDS``) are kept for every job,
+    in the configured metadata store; full ``Job`` objects are read on
+    demand (from ``meta.json`` or the database) and held in a bounded LRU.
+    """
 
     def __init__(
         self,
@@ -26,90 +56,116 @@ class JobManager:
         item_manager: Optional["ItemManager"] = None,
         ws_broadcast_callback: Optional[Callable[[str, dict], Awaitable[None]]] = None,
     ):
-        self.jobs: Dict[str, Job] = {}
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.webhook_callback = webhook_callback
         self.item_manager = item_manager  # v2: For updating item pipeline status
         self.ws_broadcast_callback = ws_broadcast_callback  # v2: WebSocket broadcast
         self._retry_counts: Dict[str, int] = {}
+        jobs_dir = settings.jobs_dir
+        self._store = open_metadata_store(
+            "jobs",
+            jobs_dir,
+            lambda job_id, summary: jobs_dir / job_id / "meta.json",
+            _INDEXED_FIELDS,
+            order_column="created_at",
+        )
+        self._documents: DocumentCache[Job] = DocumentCache()
         self._load_existing_jobs()
 
+    @staticmethod
+    def _summarize(job: Job) -> dict:
+        return job.model_dump(mode="json", include=_SUMMARY_FIELDS)
+
+    def _parse_job(self, job_id: str, raw: bytes) -> Optional[Job]:
+        """Validate a stored job, caching it."""
+        try:
+            job = Job.model_validate_json(raw)
+        except Exception as e:
+            logger.error(f"Failed to load job {job_id}: {e}")
+            return None
+        self._documents.put(job_id, job, len(raw))
+        return job
+
+    def _read_job(self, job_id: str) -> Optional[Job]:
+        """Read a job from the store, caching it."""
+        raw = self._store.read(job_id)
+        if raw is None:
+            logger.error(f"Failed to load job {job_id}: document missing")
+            return None
+        return self._parse_job(job_id, raw)
+
+    def _summarize_stored(self, job_id: str, raw: bytes) -> Optional[dict]:
+        job = self._parse_job(job_id, raw)
+        return self._summarize(job) if job else None
+
+    def _hydrate(self, summaries: Iterable[dict]) -> List[Job]:
+        """Get full jobs for summaries, skipping unreadable ones."""
+        jobs = []
+        for summary in summaries:
+            job = self.get_job(summary["id"])
+            if job:
+                jobs.append(job)
+        return jobs
+
     def _load_existing_jobs(self) -> None:
-        """Load existing jobs from disk on startup."""
+        """Index existing jobs on startup (only new/changed meta.json are read)."""
         jobs_dir = settings.jobs_dir
         if not jobs_dir.exists():
             return
 
-        # First pass: load all jobs and track duplicates
-        url_to_job: Dict[str, Job] = {}
-        duplicate_job_ids: set = set()
-        duplicate_job_dirs = []
-
-        for job_dir in jobs_dir.iterdir():
-            if not job_dir.is_dir():
-                continue
-
-            meta_path = job_dir / "meta.json"
-            if not meta_path.exists():
-                continue
-
-            try:
-                with open(meta_path) as f:
-                    data = json.load(f)
-                job = Job(**data)
-
-                # Check for duplicate URLs - keep the newer job
-                if job.url in url_to_job:
-                    existing_job = url_to_job[job.url]
-                    if job.created_at > existing_job.created_at:
-                        # New job is newer, mark old one for deletion
-                        duplicate_job_dirs.append(existing_job.get_job_dir(jobs_dir))
-                        duplicate_job_ids.add(existing_job.id)
-                        url_to_job[job.url] = job
-                        logger.warning(f"Found duplicate URL job, keeping newer: {job.id}, deleting: {existing_job.id}")
-                    else:
-                        # Existing job is newer, mark new one for deletion
-                        duplicate_job_dirs.append(job_dir)
-                        duplicate_job_ids.add(job.id)
-                        logger.warning(f"Found duplicate URL job, keeping newer: {existing_job.id}, deleting: {job.id}")
-                else:
-                    url_to_job[job.url] = job
-
-            except Exception as e:
-                logger.error(f"Failed to load job from {meta_path}: {e}")
+        def scan() -> Dict[str, List[str]]:
+            return {
+                entry.name: [os.path.join(entry.path, "meta.json")]
+                for entry in os.scandir(jobs_dir)
+                if entry.is_dir()
+            }
 
-        # Second pass: add only non-duplicate jobs
-        for job in url_to_job.values():
-            if job.id not in duplicate_job_ids:
-                self.jobs[job.id] = job
+        rebuilt = self._store.load(scan, self._summarize_stored)
 
-                # Check for incomplete jobs that need recovery
-                if job.status not in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED, JobStatus.AWAITING_REVIEW):
-                    logger.warning(
-                        f"Found incomplete job {job.id} in status {job.status}"
-                    )
+        # Check for duplicate URLs - keep the newer job
+        duplicate_job_ids = []
+        for group in self._store.duplicates("url"):
+            newest = max(group, key=lambda s: s["created_at"])
+            for summary in group:
+                if summary is not newest:
+                    duplicate_job_ids.append(summary["id"])
+                    logger.warning(f"Found duplicate URL job, keeping newer: {newest['id']}, deleting: {summary['id']}")
 
         # Clean up duplicate job directories
-        import shutil
-        for dup_dir in duplicate_job_dirs:
+        for job_id in duplicate_job_ids:
+            self._store.delete(job_id)
+            self._documents.pop(job_id)
+            dup_dir = jobs_dir / job_id
             if dup_dir.exists():
                 try:
                     shutil.rmtree(dup_dir)
                     logger.info(f"Deleted duplicate job directory: {dup_dir}")
                 except Exception as e:
                     logger.error(f"Failed to delete duplicate job directory: {dup_dir}, {e}")
+        self._store.flush()
 
-        logger.info(f"Loaded {len(self.jobs)} existing jobs")
+        # Check for incomplete jobs that need recovery
+        for summary in self._store.query({"status": _INCOMPLETE_STATUS_VALUES}):
+            logger.warning(
+                f"Found incomplete job {summary['id']} in status {JobStatus(summary['status'])}"
+            )
+
+        logger.info(f"Loaded {len(self._store)} existing jobs ({rebuilt} re-indexed)")
 
     def save_job(self, job: Job) -> None:
         """Save job state to disk."""
+        # The job directory also holds the job's media files
         job_dir = job.get_job_dir(settings.jobs_dir)
         job_dir.mkdir(parents=True, exist_ok=True)
-        meta_path = job_dir / "meta.json"
 
-        with open(meta_path, "w") as f:
-            json.dump(job.model_dump(mode="json"), f, indent=2, default=str)
+        text = json.dumps(job.model_dump(mode="json"), indent=2, default=str)
+        self._store.write(job.id, text, self._summarize(job))
+        self._documents.put(job.id, job, len(text))
+
+    def flush_index(self) -> None:
+        """Persist the job summary index (e.g. on shutdown)."""
+        self._store.flush()
 
     def create_job(
         self,
@@ -138,7 +194,6 @@ class JobManager:
             item_id=item_id,
             pipeline_id=pipeline_id,
         )
-        self.jobs[job.id] = job
         self._retry_counts[job.id] = 0
         self.save_job(job)
         logger.info(f"Created job {job.id} for URL: {url}")
@@ -146,13 +201,15 @@ class JobManager:
 
     def get_job(self, job_id: str) -> Optional[Job]:
         """Get a job by ID."""
-        return self.jobs.get(job_id)
+        job = self._documents.get(job_id)
+        if job is None and job_id in self._store:
+            job = self._read_job(job_id)
+        return job
 
     def get_job_by_url(self, url: str) -> Optional[Job]:
         """Get a job by URL (for duplicate detection)."""
-        for job in self.jobs.values():
-            if job.url == url:
-                return job
+        for summary in self._store.query({"url": url}, limit=1):
+            return self.get_job(summary["id"])
         return None
 
     def list_jobs(
@@ -164,40 +221,44 @@ class JobManager:
         pipeline_id: Optional[str] = None,
         limit: int = 100,
     ) -> List[Job]:
-        """List jobs, optionally filtered by status and v2 fields."""
-        jobs = list(self.jobs.values())
+        """List jobs, optionally filtered by status and v2 fields.
+
+        Filtering and sorting run on the metadata store; only the returned
+        page of jobs is hydrated.
+        """
+        where = {}
 
         if status:
-            jobs = [j for j in jobs if j.status == status]
+            where["status"] = status.value
 
         # v2 filters
         if source_type:
-            jobs = [j for j in jobs if j.source_type == source_type]
+            where["source_type"] = source_type.value
 
         if source_id:
-            jobs = [j for j in jobs if j.source_id == source_id]
+            where["source_id"] = source_id
 
         if item_id:
-            jobs = [j for j in jobs if j.item_id == item_id]
+            where["item_id"] = item_id
 
         if pipeline_id:
-            jobs = [j for j in jobs if j.pipeline_id == pipeline_id]
+            where["pipeline_id"] = pipeline_id
 
         # Sort by creation time, newest first
-        jobs.sort(key=lambda j: j.created_at, reverse=True)
-
-        return jobs[:limit]
+        return self._hydrate(
+            self._store.query(where, order_by="created_at", descending=True, limit=limit)
+        )
 
     def delete_job(self, job_id: str, delete_files: bool = True) -> bool:
         """Delete a job."""
-        job = self.jobs.pop(job_id, None)
-        if not job:
+        if job_id not in self._store:
             return False
+        self._store.delete(job_id)
+        self._documents.pop(job_id)
 
         if delete_files:
-            job_dir = job.get_job_dir(settings.jobs_dir)
+            job_dir = settings.jobs_dir / job_id
             if job_dir.exists():
-                import shutil
                 shutil.rmtree(job_dir)
 
         self._retry_counts.pop(job_id, None)
@@ -315,18 +376,11 @@ class JobManager:
         Returns:
             Number of jobs recovered
         """
-        incomplete_statuses = {
-            JobStatus.PENDING,
-            JobStatus.DOWNLOADING,
-            JobStatus.TRANSCRIBING,
-            JobStatus.DIARIZING,
-            JobStatus.TRANSLATING,
-            JobStatus.EXPORTING,
-        }
+        incomplete = self._store.query({"status": _INCOMPLETE_STATUS_VALUES})
 
         recovered = 0
-        for job in self.jobs.values():
-            if job.status in incomplete_statuses:
+        for job in self._hydrate(incomplete):
+            if job.status in _INCOMPLETE_STATUSES:
                 logger.info(f"Recovering job {job.id} from status {job.status}")
 
                 # Reset to pending and reprocess
@@ -338,13 +392,14 @@ class JobManager:
 
     def get_stats(self) -> Dict:
         """Get job statistics."""
+        counts = self._store.count_by("status")
         stats = {
-            "total": len(self.jobs),
+            "total": sum(counts.values()),
             "by_status": {},
         }
 
         for status in JobStatus:
-            count = sum(1 for j in self.jobs.values() if j.status == status)
+            count = counts.get(status.value, 0)
             if count > 0:
                 stats["by_status"][status.value] = count
 
@@ -365,43 +420,43 @@ class JobManager:
 
     def get_jobs_by_item(self, item_id: str) -> List[Job]:
         """Get all jobs for a specific item."""
-        return [j for j in self.jobs.values() if j.item_id == item_id]
+        return self._hydrate(self._store.query({"item_id": item_id}))
 
     def get_jobs_by_source(self, source_id: str) -> List[Job]:
         """Get all jobs for a specific source."""
-        return [j for j in self.jobs.values() if j.source_id == source_id]
+        return self._hydrate(self._store.query({"source_id": source_id}))
 
     def get_jobs_by_pipeline(self, pipeline_id: str) -> List[Job]:
         """Get all jobs for a specific pipeline configuration."""
-        return [j for j in self.jobs.values() if j.pipeline_id == pipeline_id]
+        return self._hydrate(self._store.query({"pipeline_id": pipeline_id}))
 
     def get_active_jobs_count(self) -> int:
         """Get count of jobs that are currently processing."""
-        active_statuses = {
-            JobStatus.DOWNLOADING,
-            JobStatus.TRANSCRIBING,
-            JobStatus.DIARIZING,
-            JobStatus.TRANSLATING,
-            JobStatus.EXPORTING,
-        }
-        return sum(1 for j in self.jobs.values() if j.status in active_statuses)
+        active_statuses = [
+            JobStatus.DOWNLOADING.value,
+            JobStatus.TRANSCRIBING.value,
+            JobStatus.DIARIZING.value,
+            JobStatus.TRANSLATING.value,
+            JobStatus.EXPORTING.value,
+        ]
+        return sum(self._store.count_by("status", {"status": active_statuses}).values())
 
     def get_stats_by_source_type(self) -> Dict[str, Dict]:
         """Get job statistics grouped by source type (v2)."""
         result: Dict[str, Dict] = {}
 
         for source_type in SourceType:
-            type_jobs = [j for j in self.jobs.values() if j.source_type == source_type]
-            if not type_jobs:
+            counts = self._store.count_by("status", {"source_type": source_type.value})
+            if not counts:
                 continue
 
             result[source_type.value] = {
-                "total": len(type_jobs),
+                "total": sum(counts.values()),
                 "by_status": {},
             }
 
             for status in JobStatus:
-                count = sum(1 for j in type_jobs if j.status == status)
+                count = counts.get(status.value, 0)
                 if count > 0:
                     result[source_type.value]["by_status"][status.value] = count
 
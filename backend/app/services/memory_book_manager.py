@@ -4,7 +4,7 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import List, Optional
 
 from app.config import get_config
 from app.models.memory_book import (
@@ -14,46 +14,76 @@ from app.models.memory_book import (
     MemoryItem,
     MemoryItemCreate,
 )
+from app.services.summary_index import INDEX_FILENAME, DocumentCache, SummaryIndex
 
 logger = logging.getLogger(__name__)
 
 
 class MemoryBookManager:
-    """Manages memory books with JSON file persistence."""
+    """Manages memory books with JSON file persistence.
+
+    Book summaries are indexed for listing; full books (with their items)
+    are loaded on demand and held in a bounded LRU.
+    """
 
     def __init__(self):
         self._config = get_config()
-        self._books: Dict[str, MemoryBook] = {}
         self._storage_dir = self._config.data_dir / "memory_books"
         self._storage_dir.mkdir(parents=True, exist_ok=True)
+        self._index = SummaryIndex(self._storage_dir / INDEX_FILENAME)
+        self._books: DocumentCache[MemoryBook] = DocumentCache()
         self._load_all()
 
+    def _book_path(self, book_id: str) -> Path:
+        return self._storage_dir / f"{book_id}.json"
+
+    @staticmethod
+    def _summarize(book: MemoryBook) -> dict:
+        return MemoryBookSummary.from_book(book).model_dump(mode="json")
+
     def _load_all(self) -> None:
-        """Load all memory books from disk."""
-        count = 0
-        for path in self._storage_dir.glob("*.json"):
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                book = MemoryBook(**data)
-                self._books[book.book_id] = book
-                count += 1
-            except Exception as e:
-                logger.error(f"Failed to load memory book from {path}: {e}")
-        logger.info(f"Loaded {count} memory books")
+        """Index all memory books on disk (only new/changed ones are read)."""
+        documents = {path.stem: [path] for path in self._storage_dir.glob("*.json")}
+
+        def summarize(book_id: str) -> Optional[dict]:
+            book = self._read_book(book_id)
+            return self._summarize(book) if book else None
+
+        rebuilt = self._index.refresh(documents, summarize)
+        logger.info(f"Loaded {len(self._index)} memory books ({rebuilt} re-indexed)")
+
+    def _read_book(self, book_id: str) -> Optional[MemoryBook]:
+        """Read and validate a memory book from disk, caching it."""
+        path = self._book_path(book_id)
+        try:
+            raw = path.read_bytes()
+            book = MemoryBook.model_validate_json(raw)
+        except Exception as e:
+            logger.error(f"Failed to load memory book from {path}: {e}")
+            return None
+        self._books.put(book_id, book, len(raw))
+        return book
 
     def _save_book(self, book: MemoryBook) -> None:
         """Save a memory book to disk."""
-        path = self._storage_dir / f"{book.book_id}.json"
+        path = self._book_path(book.book_id)
+        text = json.dumps(book.model_dump(mode="json"), indent=2, default=str)
         with open(path, "w", encoding="utf-8") as f:
-            json.dump(book.model_dump(mode="json"), f, indent=2, default=str)
+            f.write(text)
+
+        self._index.put(book.book_id, self._summarize(book), [path])
+        self._books.put(book.book_id, book, len(text))
 
     def _delete_book_file(self, book_id: str) -> None:
         """Delete a memory book file from disk."""
-        path = self._storage_dir / f"{book_id}.json"
+        path = self._book_path(book_id)
         if path.exists():
             path.unlink()
 
+    def flush_index(self) -> None:
+        """Persist the memory book summary index (e.g. on shutdown)."""
+        self._index.flush()
+
     # --- Memory Book CRUD ---
 
     def create_book(self, data: MemoryBookCreate) -> MemoryBook:
@@ -62,22 +92,24 @@ class MemoryBookManager:
             name=data.name,
             description=data.description,
         )
-        self._books[book.book_id] = book
         self._save_book(book)
         logger.info(f"Created memory book: {book.book_id} - {book.name}")
         return book
 
     def get_book(self, book_id: str) -> Optional[MemoryBook]:
         """Get a memory book by ID."""
-        return self._books.get(book_id)
+        book = self._books.get(book_id)
+        if book is None and book_id in self._index:
+            book = self._read_book(book_id)
+        return book
 
     def list_books(self) -> List[MemoryBookSummary]:
         """List all memory books (summary only)."""
         return [
-            MemoryBookSummary.from_book(book)
-            for book in sorted(
-                self._books.values(),
-                key=lambda b: b.updated_at,
+            MemoryBookSummary.model_validate(summary)
+            for summary in sorted(
+                self._index.summaries(),
+                key=lambda s: s["updated_at"],
                 reverse=True,
             )
         ]
@@ -86,7 +118,7 @@ class MemoryBookManager:
         self, book_id: str, name: Optional[str] = None, description: Optional[str] = None
     ) -> Optional[MemoryBook]:
         """Update a memory book's metadata."""
-        book = self._books.get(book_id)
+        book = self.get_book(book_id)
         if not book:
             return None
         if name is not None:
@@ -99,9 +131,10 @@ class MemoryBookManager:
 
     def delete_book(self, book_id: str) -> bool:
         """Delete a memory book."""
-        if book_id not in self._books:
+        if book_id not in self._index:
             return False
-        del self._books[book_id]
+        self._index.remove(book_id)
+        self._books.pop(book_id)
         self._delete_book_file(book_id)
         logger.info(f"Deleted memory book: {book_id}")
         return True
@@ -110,7 +143,7 @@ class MemoryBookManager:
 
     def add_item(self, book_id: str, data: MemoryItemCreate) -> Optional[MemoryItem]:
         """Add an item to a memory book."""
-        book = self._books.get(book_id)
+        book = self.get_book(book_id)
         if not book:
             return None
 
@@ -132,14 +165,14 @@ class MemoryBookManager:
 
     def get_items(self, book_id: str) -> Optional[List[MemoryItem]]:
         """Get all items in a memory book."""
-        book = self._books.get(book_id)
+        book = self.get_book(book_id)
         if not book:
             return None
         return book.items
 
     def get_item(self, book_id: str, item_id: str) -> Optional[MemoryItem]:
         """Get a specific item from a memory book."""
-        book = self._books.get(book_id)
+        book = self.get_book(book_id)
         if not book:
             return None
         return book.get_item(item_id)
@@ -152,7 +185,7 @@ class MemoryBookManager:
         tags: Optional[List[str]] = None,
     ) -> Optional[MemoryItem]:
         """Update an item in a memory book."""
-        book = self._books.get(book_id)
+        book = self.get_book(book_id)
         if not book:
             return None
         item = book.get_item(item_id)
@@ -168,7 +201,7 @@ class MemoryBookManager:
 
     def remove_item(self, book_id: str, item_id: str) -> bool:
         """Remove an item from a memory book."""
-        book = self._books.get(book_id)
+        book = self.get_book(book_id)
         if not book:
             return False
         if book.remove_item(item_id):
@@ -182,9 +215,11 @@ class MemoryBookManager:
     def get_default_book(self) -> MemoryBook:
         """Get or create the default memory book."""
         default_name = "My Collection"
-        for book in self._books.values():
-            if book.name == default_name:
-                return book
+        for summary in self._index.summaries():
+            if summary["name"] == default_name:
+                book = self.get_book(summary["book_id"])
+                if book:
+                    return book
         # Create default book
         return self.create_book(MemoryBookCreate(
             name=default_name,
@@ -195,7 +230,7 @@ class MemoryBookManager:
         self, book_id: str, target_type: str, target_id: str
     ) -> Optional[MemoryItem]:
         """Find an item by its target (to check if already collected)."""
-        book = self._books.get(book_id)
+        book = self.get_book(book_id)
         if not book:
             return None
         for item in book.items:
@@ -0,0 +1,578 @@
+"""Pluggable metadata storage for document managers.
+
+Jobs, items, timelines and publications are stored as one JSON document
+each plus a small summary (status, foreign keys, timestamps) that list,
+filter and stats calls run on. Two backends implement ``MetadataStore``:
+
+- ``JsonFileStore``: one file per document plus a ``SummaryIndex`` next
+  to them (the default; filters scan the in-memory summaries)
+- ``SqliteMetadataStore``: one table per collection in an embedded
+  SQLite database (WAL). Summary fields listed as ``columns`` are stored
+  in indexed columns, so filters and pages cost O(result), and document
+  bodies are kept as JSON text.
+
+The backend is chosen with ``settings.metadata_backend``; existing data
+is moved over once with ``scripts/migrate_to_sqlite.py``.
+"""
+
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from app.config import settings
+from app.services.summary_index import INDEX_FILENAME, PathLike, SummaryIndex
+
+# Database file name inside a data directory
+METADATA_DB_FILENAME = "metadata.db"
+
+# Filter values: a scalar for equality, or a list/tuple/set for membership
+Where = Dict[str, Any]
+
+
+class MetadataStore(ABC):
+    """A collection of JSON documents with queryable summaries.
+
+    Summaries are plain JSON dicts; ``columns`` names the summary fields
+    that may be used in ``where`` filters and ``order_by``.
+    """
+
+    def __init__(
+        self,
+        collection: str,
+        columns: Sequence[str],
+        order_column: Optional[str] = None,
+        stores_documents: bool = True,
+    ):
+        """Initialize the store.
+
+        Args:
+            collection: Collection name (e.g. "jobs")
+            columns: Summary fields used for filtering and sorting
+            order_column: Column most queries sort by (indexed together
+                with every other column by the SQLite backend)
+            stores_documents: Whether the store holds document bodies;
+                False for collections that persist their documents
+                themselves and only keep summaries here (timelines)
+        """
+        self.collection = collection
+        self.columns = tuple(columns)
+        self.order_column = order_column
+        self.stores_documents = stores_documents
+
+    @abstractmethod
+    def load(
+        self,
+        scan: Callable[[], Dict[str, Sequence[PathLike]]],
+        summarize: Callable[[str, bytes], Optional[dict]],
+    ) -> int:
+        """Sync the store with documents in the JSON file layout on startup.
+
+        Args:
+            scan: Lists document ID -> files (primary file first)
+            summarize: Builds a summary from a document's primary file
+                contents, returning None if it cannot be loaded
+
+        Returns:
+            Number of documents that had to be re-read
+        """
+
+    @abstractmethod
+    def get(self, doc_id: str) -> Optional[dict]:
+        """Get a document's summary."""
+
+    @abstractmethod
+    def read(self, doc_id: str) -> Optional[bytes]:
+        """Read a document body (None if it does not exist)."""
+
+    @abstractmethod
+    def write(self, doc_id: str, body: str, summary: dict) -> None:
+        """Write a document body together with its summary."""
+
+    @abstractmethod
+    def put_summary(self, doc_id: str, summary: dict) -> None:
+        """Update a summary whose body is stored elsewhere or unchanged."""
+
+    @abstractmethod
+    def delete(self, doc_id: str) -> None:
+        """Delete a document and its summary."""
+
+    @abstractmethod
+    def query(
+        self,
+        where: Optional[Where] = None,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        since: Optional[Tuple[str, Any]] = None,
+    ) -> List[dict]:
+        """Get summaries matching filters.
+
+        Args:
+            where: Column -> value (equality) or list of values (membership)
+            order_by: Column to sort by
+            descending: Sort in descending order
+            limit: Maximum number of summaries
+            offset: Number of summaries to skip
+            since: (column, value) - only summaries with column >= value
+
+        Returns:
+            Matching summaries
+        """
+
+    @abstractmethod
+    def count_by(self, column: str, where: Optional[Where] = None) -> Dict[Any, int]:
+        """Count summaries matching filters, grouped by a column's value."""
+
+    @abstractmethod
+    def duplicates(self, column: str) -> List[List[dict]]:
+        """Get groups of summaries that share a (non-null) column value."""
+
+    @abstractmethod
+    def summaries(self) -> List[dict]:
+        """Get all summaries."""
+
+    @abstractmethod
+    def ids(self) -> List[str]:
+        """Get all document IDs."""
+
+    def flush(self) -> None:
+        """Persist pending changes (e.g. on shutdown)."""
+
+    @abstractmethod
+    def __contains__(self, doc_id: str) -> bool:
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    def _check_columns(self, names: Iterable[str]) -> None:
+        for name in names:
+            if name not in self.columns:
+                raise ValueError(f"'{name}' is not a column of {self.collection}")
+
+
+def _matches(summary: dict, where: Where) -> bool:
+    for column, value in where.items():
+        if isinstance(value, (list, tuple, set, frozenset)):
+            if summary.get(column) not in value:
+                return False
+        elif summary.get(column) != value:
+            return False
+    return True
+
+
+def _sort_key(value: Any) -> tuple:
+    # Nulls sort first ascending and last descending, as in SQLite
+    return (False, 0) if value is None else (True, value)
+
+
+class JsonFileStore(MetadataStore):
+    """One JSON file per document, summaries in a ``SummaryIndex``."""
+
+    def __init__(
+        self,
+        collection: str,
+        directory: Path,
+        path_for: Callable[[str, dict], Path],
+        columns: Sequence[str],
+        order_column: Optional[str] = None,
+        files_for: Optional[Callable[[str, dict], List[Path]]] = None,
+        stores_documents: bool = True,
+    ):
+        """Initialize the store.
+
+        Args:
+            collection: Collection name
+            directory: Storage directory (holds the summary index)
+            path_for: (doc ID, summary) -> primary JSON file
+            columns: Summary fields used for filtering and sorting
+            order_column: Default sort column
+            files_for: (doc ID, summary) -> all files fingerprinted for the
+                document (defaults to the primary file)
+            stores_documents: Whether write()/delete() manage the files
+        """
+        super().__init__(collection, columns, order_column, stores_documents)
+        self.path_for = path_for
+        self.files_for = files_for or (lambda doc_id, summary: [path_for(doc_id, summary)])
+        self._index = SummaryIndex(directory / INDEX_FILENAME)
+
+    def load(self, scan, summarize) -> int:
+        documents = scan()
+
+        def summarize_file(doc_id: str) -> Optional[dict]:
+            with open(documents[doc_id][0], "rb") as f:
+                return summarize(doc_id, f.read())
+
+        return self._index.refresh(documents, summarize_file)
+
+    def get(self, doc_id: str) -> Optional[dict]:
+        return self._index.get(doc_id)
+
+    def read(self, doc_id: str) -> Optional[bytes]:
+        summary = self._index.get(doc_id)
+        if summary is None:
+            return None
+        try:
+            return self.path_for(doc_id, summary).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def write(self, doc_id: str, body: str, summary: dict) -> None:
+        path = self.path_for(doc_id, summary)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(body)
+        self._index.put(doc_id, summary, self.files_for(doc_id, summary))
+
+    def put_summary(self, doc_id: str, summary: dict) -> None:
+        self._index.put(doc_id, summary, self.files_for(doc_id, summary))
+
+    def delete(self, doc_id: str) -> None:
+        summary = self._index.get(doc_id)
+        if summary is None:
+            return
+        self._index.remove(doc_id)
+        if self.stores_documents:
+            self.path_for(doc_id, summary).unlink(missing_ok=True)
+
+    def query(
+        self,
+        where: Optional[Where] = None,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        since: Optional[Tuple[str, Any]] = None,
+    ) -> List[dict]:
+        summaries = self._index.summaries()
+        if where:
+            summaries = [s for s in summaries if _matches(s, where)]
+        if since:
+            column, value = since
+            summaries = [
+                s for s in summaries if s.get(column) is not None and s[column] >= value
+            ]
+        if order_by:
+            summaries.sort(key=lambda s: _sort_key(s.get(order_by)), reverse=descending)
+        end = None if limit is None else offset + limit
+        return summaries[offset:end]
+
+    def count_by(self, column: str, where: Optional[Where] = None) -> Dict[Any, int]:
+        summaries = self._index.summaries()
+        if where:
+            summaries = [s for s in summaries if _matches(s, where)]
+        return dict(Counter(s.get(column) for s in summaries))
+
+    def duplicates(self, column: str) -> List[List[dict]]:
+        groups: Dict[Any, List[dict]] = {}
+        for summary in self._index.summaries():
+            value = summary.get(column)
+            if value is not None:
+                groups.setdefault(value, []).append(summary)
+        return [group for group in groups.values() if len(group) > 1]
+
+    def summaries(self) -> List[dict]:
+        return self._index.summaries()
+
+    def ids(self) -> List[str]:
+        return self._index.ids()
+
+    def flush(self) -> None:
+        self._index.flush()
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+# Shared connections (one per database file) and their locks
+_connections: Dict[str, Tuple[sqlite3.Connection, threading.Lock]] = {}
+_connections_lock = threading.Lock()
+
+
+def _connect(db_path: Path) -> Tuple[sqlite3.Connection, threading.Lock]:
+    """Open (or reuse) a WAL-mode connection to a metadata database."""
+    key = str(Path(db_path).resolve())
+    with _connections_lock:
+        if key not in _connections:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            # Autocommit: every statement is its own transaction
+            conn = sqlite3.connect(key, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            _connections[key] = (conn, threading.Lock())
+        return _connections[key]
+
+
+def close_databases() -> None:
+    """Close all open metadata database connections (e.g. on shutdown)."""
+    with _connections_lock:
+        for conn, lock in _connections.values():
+            with lock:
+                conn.close()
+        _connections.clear()
+
+
+class SqliteMetadataStore(MetadataStore):
+    """One table per collection in an embedded SQLite database.
+
+    Table layout: ``id`` (primary key), ``summary`` (JSON text), ``body``
+    (JSON text, NULL when ``stores_documents`` is False) and one indexed
+    column per summary field in ``columns``.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        collection: str,
+        columns: Sequence[str],
+        order_column: Optional[str] = None,
+        stores_documents: bool = True,
+    ):
+        """Initialize the store, creating its table and indexes.
+
+        Args:
+            db_path: SQLite database file
+            collection: Collection (table) name
+            columns: Summary fields stored in indexed columns
+            order_column: Default sort column; every other column gets a
+                composite (column, order_column) index so filtered pages
+                are read in order without sorting
+            stores_documents: Whether document bodies are stored
+        """
+        super().__init__(collection, columns, order_column, stores_documents)
+        self.db_path = Path(db_path)
+        self._conn, self._lock = _connect(self.db_path)
+        self._create_table()
+
+    def _create_table(self) -> None:
+        table = self.collection
+        column_defs = "".join(f", {column}" for column in self.columns)
+        statements = [
+            f"CREATE TABLE IF NOT EXISTS {table} "
+            f"(id TEXT PRIMARY KEY, summary TEXT NOT NULL, body TEXT{column_defs})"
+        ]
+        for column in self.columns:
+            indexed = column
+            if self.order_column and column != self.order_column:
+                indexed = f"{column}, {self.order_column}"
+            statements.append(
+                f"CREATE INDEX IF NOT EXISTS {table}_{column} ON {table} ({indexed})"
+            )
+        with self._lock:
+            for statement in statements:
+                self._conn.execute(statement)
+
+    def _execute(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _where_clause(
+        self, where: Optional[Where], since: Optional[Tuple[str, Any]] = None
+    ) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        for column, value in (where or {}).items():
+            self._check_columns([column])
+            if isinstance(value, (list, tuple, set, frozenset)):
+                values = list(value)
+                clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+            elif value is None:
+                clauses.append(f"{column} IS NULL")
+            else:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since:
+            column, value = since
+            self._check_columns([column])
+            clauses.append(f"{column} >= ?")
+            params.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def load(self, scan, summarize) -> int:
+        # Documents live in the database; only warn if the JSON layout has
+        # data that was never migrated
+        if not len(self):
+            pending = len(scan())
+            if pending:
+                logger.warning(
+                    f"{pending} {self.collection} found in the JSON layout but not in "
+                    f"{self.db_path}; run scripts/migrate_to_sqlite.py to import them"
+                )
+        return 0
+
+    def get(self, doc_id: str) -> Optional[dict]:
+        rows = self._execute(
+            f"SELECT summary FROM {self.collection} WHERE id = ?", (doc_id,)
+        )
+        return json.loads(rows[0][0]) if rows else None
+
+    def read(self, doc_id: str) -> Optional[bytes]:
+        rows = self._execute(f"SELECT body FROM {self.collection} WHERE id = ?", (doc_id,))
+        if not rows or rows[0][0] is None:
+            return None
+        return rows[0][0].encode("utf-8")
+
+    def _upsert(self, doc_id: str, summary: dict, body: Optional[str]) -> None:
+        names = ["id", "summary", "body", *self.columns]
+        values = [
+            doc_id,
+            json.dumps(summary, ensure_ascii=False, separators=(",", ":")),
+            body,
+            *(summary.get(column) for column in self.columns),
+        ]
+        self._execute(
+            f"INSERT OR REPLACE INTO {self.collection} ({', '.join(names)}) "
+            f"VALUES ({', '.join('?' * len(names))})",
+            values,
+        )
+
+    def write(self, doc_id: str, body: str, summary: dict) -> None:
+        self._upsert(doc_id, summary, body if self.stores_documents else None)
+
+    def put_summary(self, doc_id: str, summary: dict) -> None:
+        if self.stores_documents:
+            assignments = ", ".join(f"{column} = ?" for column in ("summary", *self.columns))
+            self._execute(
+                f"UPDATE {self.collection} SET {assignments} WHERE id = ?",
+                [
+                    json.dumps(summary, ensure_ascii=False, separators=(",", ":")),
+                    *(summary.get(column) for column in self.columns),
+                    doc_id,
+                ],
+            )
+        else:
+            self._upsert(doc_id, summary, None)
+
+    def delete(self, doc_id: str) -> None:
+        self._execute(f"DELETE FROM {self.collection} WHERE id = ?", (doc_id,))
+
+    def query(
+        self,
+        where: Optional[Where] = None,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        since: Optional[Tuple[str, Any]] = None,
+    ) -> List[dict]:
+        clause, params = self._where_clause(where, since)
+        sql = f"SELECT summary FROM {self.collection}{clause}"
+        if order_by:
+            self._check_columns([order_by])
+            sql += f" ORDER BY {order_by} {'DESC' if descending else 'ASC'}"
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params += [-1 if limit is None else limit, offset]
+        return [json.loads(row[0]) for row in self._execute(sql, params)]
+
+    def count_by(self, column: str, where: Optional[Where] = None) -> Dict[Any, int]:
+        self._check_columns([column])
+        clause, params = self._where_clause(where)
+        rows = self._execute(
+            f"SELECT {column}, COUNT(*) FROM {self.collection}{clause} GROUP BY {column}",
+            params,
+        )
+        return {value: count for value, count in rows}
+
+    def duplicates(self, column: str) -> List[List[dict]]:
+        self._check_columns([column])
+        rows = self._execute(
+            f"SELECT {column}, summary FROM {self.collection} WHERE {column} IN "
+            f"(SELECT {column} FROM {self.collection} WHERE {column} IS NOT NULL "
+            f"GROUP BY {column} HAVING COUNT(*) > 1) ORDER BY {column}"
+        )
+        groups: Dict[Any, List[dict]] = {}
+        for value, summary in rows:
+            groups.setdefault(value, []).append(json.loads(summary))
+        return list(groups.values())
+
+    def summaries(self) -> List[dict]:
+        return self.query()
+
+    def ids(self) -> List[str]:
+        return [row[0] for row in self._execute(f"SELECT id FROM {self.collection}")]
+
+    def __contains__(self, doc_id: str) -> bool:
+        return bool(self._execute(f"SELECT 1 FROM {self.collection} WHERE id = ?", (doc_id,)))
+
+    def __len__(self) -> int:
+        return self._execute(f"SELECT COUNT(*) FROM {self.collection}")[0][0]
+
+
+def open_metadata_store(
+    collection: str,
+    directory: Path,
+    path_for: Callable[[str, dict], Path],
+    columns: Sequence[str],
+    order_column: Optional[str] = None,
+    files_for: Optional[Callable[[str, dict], List[Path]]] = None,
+    stores_documents: bool = True,
+    db_path: Optional[Path] = None,
+) -> MetadataStore:
+    """Open a collection with the configured metadata backend.
+
+    Args:
+        collection: Collection name
+        directory: Storage directory of the JSON layout
+        path_for: (doc ID, summary) -> primary JSON file in that layout
+        columns: Summary fields used for filtering and sorting
+        order_column: Default sort column
+        files_for: (doc ID, summary) -> all files of a document
+        stores_documents: Whether the store holds document bodies
+        db_path: SQLite database (defaults to data_dir/metadata.db)
+
+    Returns:
+        A JsonFileStore or SqliteMetadataStore
+    """
+    backend = settings.metadata_backend
+    if backend == "sqlite":
+        return SqliteMetadataStore(
+            db_path or settings.data_dir / METADATA_DB_FILENAME,
+            collection,
+            columns,
+            order_column,
+            stores_documents,
+        )
+    if backend != "json":
+        raise ValueError(f"Unknown metadata backend: {backend}")
+    return JsonFileStore(
+        collection, directory, path_for, columns, order_column, files_for, stores_documents
+    )
+
+
+def migrate_store(source: MetadataStore, target: MetadataStore) -> int:
+    """Copy every document and summary from one store into another.
+
+    Args:
+        source: Store to read (typically a loaded JsonFileStore)
+        target: Store to write (typically a SqliteMetadataStore)
+
+    Returns:
+        Number of documents copied
+    """
+    copied = 0
+    for doc_id in source.ids():
+        summary = source.get(doc_id)
+        if target.stores_documents:
+            body = source.read(doc_id)
+            if body is None:
+                logger.warning(f"Skipping {source.collection} {doc_id}: document missing")
+                continue
+            target.write(doc_id, body.decode("utf-8"), summary)
+        else:
+            target.put_summary(doc_id, summary)
+        copied += 1
+    target.flush()
+    return copied
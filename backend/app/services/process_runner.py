@@ -0,0 +1,300 @@
+"""Shared non-blocking runner for external tools (yt-dlp, ffmpeg, ffprobe, ...).
+
+``run_process`` runs a command on the event loop without blocking it:
+
+- per-tool concurrency limits (``settings.*_max_concurrency``), so a burst
+  of downloads or encodes queues instead of oversubscribing the machine
+- timeouts and cancellation: the process is terminated (then killed) when
+  the timeout expires or the awaiting task is cancelled
+- stderr kept in a ring buffer of the last lines, so chatty tools cannot
+  grow memory without bound
+- line callbacks for progress parsing (``ffmpeg_progress``,
+  ``ytdlp_progress``); ffmpeg's ``\\r``-terminated status lines are split
+  like ordinary lines
+
+The result mirrors ``subprocess.CompletedProcess`` (``returncode``,
+``stdout``, ``stderr``), so call sites keep their existing checks.
+"""
+
+import asyncio
+import os
+import re
+import time
+import weakref
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Callable, Deque, Dict, List, Mapping, Optional, Sequence, Union
+
+from loguru import logger
+
+from app.config import settings
+
+LineCallback = Callable[[str], None]
+
+# Seconds to wait after SIGTERM before SIGKILL
+_TERMINATE_GRACE = 5.0
+
+_READ_CHUNK = 64 * 1024
+
+# Per event loop: tool name -> semaphore
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _tool_limit(tool: str) -> Optional[int]:
+    """Maximum concurrent processes for a tool (None = unlimited)."""
+    limits = {
+        "yt-dlp": settings.ytdlp_max_concurrency,
+        "ffmpeg": settings.ffmpeg_max_concurrency,
+        "ffprobe": settings.ffprobe_max_concurrency,
+    }
+    return limits.get(tool) or None
+
+
+@asynccontextmanager
+async def _tool_slot(tool: str) -> AsyncIterator[None]:
+    limit = _tool_limit(tool)
+    if limit is None:
+        yield
+        return
+    per_loop = _semaphores.setdefault(asyncio.get_running_loop(), {})
+    semaphore = per_loop.get(tool)
+    if semaphore is None:
+        semaphore = per_loop[tool] = asyncio.Semaphore(limit)
+    async with semaphore:
+        yield
+
+
+@dataclass
+class ProcessResult:
+    """Outcome of a finished process."""
+
+    args: List[str]
+    returncode: int
+    stdout: Union[str, bytes]
+    stderr: str  # last ``stderr_lines`` lines of stderr
+    elapsed: float
+
+
+class ProcessError(RuntimeError):
+    """A process failed or was stopped."""
+
+    def __init__(self, message: str, args: Sequence[str], stderr: str = ""):
+        super().__init__(message)
+        self.cmd = list(args)
+        self.stderr = stderr
+
+
+class ProcessTimeoutError(ProcessError):
+    """A process exceeded its timeout and was terminated."""
+
+
+def _split_lines(buffer: bytearray, split_cr: bool) -> List[bytes]:
+    """Pop complete lines off the front of a buffer."""
+    lines = []
+    while True:
+        end = buffer.find(b"\n")
+        if split_cr:
+            cr = buffer.find(b"\r")
+            if cr != -1 and (end == -1 or cr < end):
+                end = cr
+        if end == -1:
+            return lines
+        lines.append(bytes(buffer[:end]))
+        del buffer[:end + 1]
+
+
+async def _pump(
+    stream: asyncio.StreamReader,
+    sink: Optional[bytearray],
+    on_line: Optional[LineCallback],
+    split_cr: bool,
+) -> None:
+    """Drain a pipe into a buffer and/or a line callback."""
+    pending = bytearray()
+    while True:
+        chunk = await stream.read(_READ_CHUNK)
+        if not chunk:
+            break
+        if sink is not None:
+            sink.extend(chunk)
+        if on_line is not None:
+            pending.extend(chunk)
+            for raw in _split_lines(pending, split_cr):
+                line = raw.decode("utf-8", errors="replace").strip()
+                if line:
+                    on_line(line)
+    if on_line is not None and pending:
+        line = pending.decode("utf-8", errors="replace").strip()
+        if line:
+            on_line(line)
+
+
+async def _terminate(proc: asyncio.subprocess.Process) -> None:
+    """Stop a process: SIGTERM, then SIGKILL after a grace period."""
+    if proc.returncode is not None:
+        return
+    try:
+        proc.terminate()
+        await asyncio.wait_for(proc.wait(), _TERMINATE_GRACE)
+    except ProcessLookupError:
+        pass
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+
+
+async def run_process(
+    cmd: Sequence[Union[str, Path]],
+    *,
+    timeout: Optional[float] = None,
+    tool: Optional[str] = None,
+    cwd: Optional[Union[str, Path]] = None,
+    env: Optional[Mapping[str, str]] = None,
+    text: bool = True,
+    capture_stdout: bool = True,
+    on_stdout_line: Optional[LineCallback] = None,
+    on_stderr_line: Optional[LineCallback] = None,
+    stderr_lines: int = 200,
+    on_start: Optional[Callable[[asyncio.subprocess.Process], None]] = None,
+) -> ProcessResult:
+    """Run an external command without blocking the event loop.
+
+    Args:
+        cmd: Command and arguments
+        timeout: Seconds before the process is terminated (None = no limit)
+        tool: Concurrency-limit key (defaults to the executable's name)
+        cwd: Working directory
+        env: Environment (defaults to the current one)
+        text: Decode stdout as UTF-8 (otherwise return bytes)
+        capture_stdout: Keep stdout in the result
+        on_stdout_line: Called with each non-empty stdout line
+        on_stderr_line: Called with each non-empty stderr line (split on
+            ``\\r`` as well as ``\\n``)
+        stderr_lines: Number of trailing stderr lines kept in the result
+        on_start: Called with the process once it started (e.g. to register
+            it for external cancellation)
+
+    Returns:
+        ProcessResult (a non-zero return code is not an error)
+
+    Raises:
+        ProcessTimeoutError: If the timeout expired
+        FileNotFoundError: If the executable does not exist
+    """
+    args = [str(arg) for arg in cmd]
+    tool = tool or os.path.basename(args[0])
+    stderr_tail: Deque[str] = deque(maxlen=stderr_lines)
+
+    def on_stderr(line: str) -> None:
+        stderr_tail.append(line)
+        if on_stderr_line is not None:
+            on_stderr_line(line)
+
+    async with _tool_slot(tool):
+        started = time.monotonic()
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            env=dict(env) if env is not None else None,
+        )
+        if on_start is not None:
+            on_start(proc)
+
+        stdout = bytearray() if capture_stdout else None
+        pumps = asyncio.gather(
+            _pump(proc.stdout, stdout, on_stdout_line, split_cr=False),
+            _pump(proc.stderr, None, on_stderr, split_cr=True),
+        )
+
+        async def finish() -> None:
+            await pumps
+            await proc.wait()
+
+        try:
+            await asyncio.wait_for(finish(), timeout)
+        except asyncio.TimeoutError:
+            await _terminate(proc)
+            raise ProcessTimeoutError(
+                f"{tool} timed out after {timeout}s", args, "\n".join(stderr_tail)
+            )
+        except BaseException:
+            # Cancelled (or a callback raised): never leave the process behind
+            pumps.cancel()
+            await asyncio.shield(_terminate(proc))
+            raise
+
+    elapsed = time.monotonic() - started
+    logger.debug(f"{tool} exited {proc.returncode} after {elapsed:.2f}s")
+    out = bytes(stdout) if stdout is not None else b""
+    return ProcessResult(
+        args=args,
+        returncode=proc.returncode,
+        stdout=out.decode("utf-8", errors="replace") if text else out,
+        stderr="\n".join(stderr_tail),
+        elapsed=elapsed,
+    )
+
+
+async def check_process(cmd: Sequence[Union[str, Path]], **kwargs) -> ProcessResult:
+    """Run a command like run_process, raising ProcessError on a non-zero exit."""
+    result = await run_process(cmd, **kwargs)
+    if result.returncode != 0:
+        tool = kwargs.get("tool") or os.path.basename(result.args[0])
+        raise ProcessError(
+            f"{tool} failed (exit {result.returncode}): {result.stderr[-500:]}",
+            result.args,
+            result.stderr,
+        )
+    return result
+
+
+# ============ Progress parsing ============
+
+# ffmpeg "-progress pipe:1" (out_time=00:01:02.500000) and stats (time=00:01:02.50)
+_FFMPEG_TIME = re.compile(r"(?:^out_time=|\btime=)(\d+):(\d{2}):(\d{2}(?:\.\d+)?)")
+# yt-dlp "--newline" progress lines: [download]  42.3% of ...
+_YTDLP_PERCENT = re.compile(r"^\[download\]\s+(\d+(?:\.\d+)?)%")
+
+
+def parse_ffmpeg_time(line: str) -> Optional[float]:
+    """Extract the encoded position (seconds) from an ffmpeg progress line."""
+    match = _FFMPEG_TIME.search(line)
+    if not match:
+        return None
+    hours, minutes, seconds = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def parse_ytdlp_percent(line: str) -> Optional[float]:
+    """Extract the download percentage (0-100) from a yt-dlp progress line."""
+    match = _YTDLP_PERCENT.match(line)
+    return float(match.group(1)) if match else None
+
+
+def ffmpeg_progress(duration: float, callback: Callable[[float], None]) -> LineCallback:
+    """Line handler reporting ffmpeg progress as a 0-1 fraction of ``duration``."""
+
+    def on_line(line: str) -> None:
+        position = parse_ffmpeg_time(line)
+        if position is not None and duration > 0:
+            callback(min(position / duration, 1.0))
+
+    return on_line
+
+
+def ytdlp_progress(callback: Callable[[float], None]) -> LineCallback:
+    """Line handler reporting yt-dlp download progress as a 0-1 fraction."""
+
+    def on_line(line: str) -> None:
+        percent = parse_ytdlp_percent(line)
+        if percent is not None:
+            callback(percent / 100)
+
+    return on_line
@@ -6,6 +6,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from loguru import logger
 
+from app.services.scheduler import ResourcePools
+
 
 @dataclass
 class QueueItem:
@@ -23,16 +25,21 @@ class JobQueue:
     """
     Async job queue with concurrency control.
 
-    Manages batch processing with configurable concurrent workers.
+    Manages batch processing with configurable concurrent workers. When
+    resource pools are given, ``max_concurrent`` is the number of jobs in
+    flight and each pipeline stage is bounded by its resource pool instead,
+    so jobs overlap stage by stage.
     """
 
     def __init__(
         self,
         max_concurrent: int = 2,
         process_func: Optional[Callable[[str], Awaitable[None]]] = None,
+        resources: Optional[ResourcePools] = None,
     ):
         self.max_concurrent = max_concurrent
         self.process_func = process_func
+        self.resources = resources
         self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
         self._active_jobs: set[str] = set()
         self._workers: list[asyncio.Task] = []
@@ -157,6 +164,7 @@ class JobQueue:
             "active_jobs": list(self._active_jobs),
             "processed": self._processed_count,
             "failed": self._failed_count,
+            "resources": self.resources.get_stats() if self.resources else None,
         }
 
 
@@ -3,7 +3,7 @@
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from loguru import logger
 
 from app.config import settings
@@ -16,10 +16,15 @@ from app.models.scenemind import (
     ObservationCreate,
     ObservationType,
 )
+from app.services.summary_index import INDEX_FILENAME, DocumentCache, SummaryIndex
 
 
 class SceneMindSessionManager:
-    """Manager for SceneMind session CRUD operations."""
+    """Manager for SceneMind session CRUD operations.
+
+    Session summaries are indexed for listing and stats; a session and its
+    observations are loaded together on demand and held in a bounded LRU.
+    """
 
     def __init__(
         self,
@@ -36,23 +41,60 @@ class SceneMindSessionManager:
         self.frames_dir = frames_dir or settings.scenemind_frames_dir
         self.sessions_dir.mkdir(parents=True, exist_ok=True)
         self.frames_dir.mkdir(parents=True, exist_ok=True)
-        self._cache: dict[str, Session] = {}
-        self._observations_cache: dict[str, List[Observation]] = {}
+        self._index = SummaryIndex(self.sessions_dir / INDEX_FILENAME)
+        self._documents: DocumentCache[Tuple[Session, List[Observation]]] = DocumentCache()
         self._load_all()
 
     def _load_all(self) -> None:
-        """Load all sessions from disk."""
-        self._cache.clear()
-        self._observations_cache.clear()
-        for file_path in self.sessions_dir.glob("*.json"):
-            try:
-                session, observations = self._load_session(file_path)
-                self._cache[session.session_id] = session
-                self._observations_cache[session.session_id] = observations
-            except Exception as e:
-                logger.warning(f"Failed to load session {file_path}: {e}")
-
-        logger.info(f"Loaded {len(self._cache)} SceneMind sessions")
+        """Index all sessions on disk (only new/changed ones are read)."""
+        self._documents.clear()
+        documents = {
+            file_path.stem: [file_path]
+            for file_path in self.sessions_dir.glob("*.json")
+        }
+
+        def summarize(session_id: str) -> Optional[dict]:
+            document = self._read_session(session_id)
+            return self._summarize(document[0]) if document else None
+
+        rebuilt = self._index.refresh(documents, summarize)
+        logger.info(f"Loaded {len(self._index)} SceneMind sessions ({rebuilt} re-indexed)")
+
+    def _session_path(self, session_id: str) -> Path:
+        return self.sessions_dir / f"{session_id}.json"
+
+    @staticmethod
+    def _summarize(session: Session) -> dict:
+        return SessionSummary(
+            session_id=session.session_id,
+            show_name=session.show_name,
+            season=session.season,
+            episode=session.episode,
+            title=session.title,
+            duration=session.duration,
+            status=session.status,
+            current_time=session.current_time,
+            observation_count=session.observation_count,
+            created_at=session.created_at,
+            updated_at=session.updated_at,
+        ).model_dump(mode="json")
+
+    def _read_session(self, session_id: str) -> Optional[Tuple[Session, List[Observation]]]:
+        """Hydrate a session and its observations into the document cache."""
+        file_path = self._session_path(session_id)
+        try:
+            document = self._load_session(file_path)
+        except Exception as e:
+            logger.warning(f"Failed to load session {file_path}: {e}")
+            return None
+        self._documents.put(session_id, document, file_path.stat().st_size)
+        return document
+
+    def _get_document(self, session_id: str) -> Optional[Tuple[Session, List[Observation]]]:
+        document = self._documents.get(session_id)
+        if document is None and session_id in self._index:
+            document = self._read_session(session_id)
+        return document
 
     def _load_session(self, file_path: Path) -> tuple[Session, List[Observation]]:
         """Load a session and its observations from a JSON file."""
@@ -65,16 +107,29 @@ class SceneMindSessionManager:
 
         return session, observations
 
-    def _save_session(self, session: Session) -> None:
+    def _save_session(
+        self, session: Session, observations: Optional[List[Observation]] = None
+    ) -> None:
         """Save a session and its observations to disk."""
-        file_path = self.sessions_dir / f"{session.session_id}.json"
-        observations = self._observations_cache.get(session.session_id, [])
+        file_path = self._session_path(session.session_id)
+        if observations is None:
+            observations = self.get_observations(session.session_id)
 
         data = session.model_dump(mode="json")
         data["observations"] = [obs.model_dump(mode="json") for obs in observations]
 
+        text = json.dumps(data, ensure_ascii=False, indent=2)
         with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.write(text)
+
+        self._index.put(session.session_id, self._summarize(session), [file_path])
+        self._documents.put(
+            session.session_id, (session, observations), len(text.encode("utf-8"))
+        )
+
+    def flush_index(self) -> None:
+        """Persist the session summary index (e.g. on shutdown)."""
+        self._index.flush()
 
     def create_session(self, create: SessionCreate) -> Session:
         """Create a new watching session.
@@ -94,21 +149,19 @@ class SceneMindSessionManager:
             duration=create.duration,
         )
 
-        self._cache[session.session_id] = session
-        self._observations_cache[session.session_id] = []
-
         # Create frames directory for this session
         session_frames_dir = self.frames_dir / session.session_id
         session_frames_dir.mkdir(parents=True, exist_ok=True)
 
-        self._save_session(session)
+        self._save_session(session, [])
         logger.info(f"Created SceneMind session {session.session_id}: {session.display_name}")
 
         return session
 
     def get_session(self, session_id: str) -> Optional[Session]:
         """Get a session by ID."""
-        return self._cache.get(session_id)
+        document = self._get_document(session_id)
+        return document[0] if document else None
 
     def list_sessions(
         self,
@@ -127,31 +180,17 @@ class SceneMindSessionManager:
             List of SessionSummary objects
         """
         result = []
-        for session in sorted(
-            self._cache.values(),
-            key=lambda s: s.updated_at,
+        for summary in sorted(
+            self._index.summaries(),
+            key=lambda s: s["updated_at"],
             reverse=True,
         ):
-            if status and session.status != status:
+            if status and summary["status"] != status.value:
                 continue
-            if show_name and session.show_name != show_name:
+            if show_name and summary["show_name"] != show_name:
                 continue
 
-            result.append(
-                SessionSummary(
-                    session_id=session.session_id,
-                    show_name=session.show_name,
-                    season=session.season,
-                    episode=session.episode,
-                    title=session.title,
-                    duration=session.duration,
-                    status=session.status,
-                    current_time=session.current_time,
-                    observation_count=session.observation_count,
-                    created_at=session.created_at,
-                    updated_at=session.updated_at,
-                )
-            )
+            result.append(SessionSummary.model_validate(summary))
 
             if len(result) >= limit:
                 break
@@ -221,11 +260,11 @@ class SceneMindSessionManager:
         Returns:
             True if deleted, False if not found
         """
-        if session_id not in self._cache:
+        if session_id not in self._index:
             return False
 
         # Delete session file
-        file_path = self.sessions_dir / f"{session_id}.json"
+        file_path = self._session_path(session_id)
         if file_path.exists():
             file_path.unlink()
 
@@ -235,10 +274,9 @@ class SceneMindSessionManager:
             import shutil
             shutil.rmtree(session_frames_dir)
 
-        # Remove from caches
-        del self._cache[session_id]
-        if session_id in self._observations_cache:
-            del self._observations_cache[session_id]
+        # Remove from index and cache
+        self._index.remove(session_id)
+        self._documents.pop(session_id)
 
         logger.info(f"Deleted SceneMind session {session_id}")
         return True
@@ -277,16 +315,14 @@ class SceneMindSessionManager:
             tag=create.tag,
         )
 
-        if session_id not in self._observations_cache:
-            self._observations_cache[session_id] = []
-
-        self._observations_cache[session_id].append(observation)
+        observations = self.get_observations(session_id)
+        observations.append(observation)
 
         # Update observation count
-        session.observation_count = len(self._observations_cache[session_id])
+        session.observation_count = len(observations)
         session.updated_at = datetime.now()
 
-        self._save_session(session)
+        self._save_session(session, observations)
         logger.info(
             f"Added observation {observation.id} to session {session_id} "
             f"at {observation.timecode_str}"
@@ -303,7 +339,8 @@ class SceneMindSessionManager:
         Returns:
             List of Observation objects
         """
-        return self._observations_cache.get(session_id, [])
+        document = self._get_document(session_id)
+        return document[1] if document else []
 
     def get_observation(self, session_id: str, observation_id: str) -> Optional[Observation]:
         """Get a specific observation.
@@ -335,7 +372,7 @@ class SceneMindSessionManager:
         if not session:
             return False
 
-        observations = self._observations_cache.get(session_id, [])
+        observations = self.get_observations(session_id)
         for i, obs in enumerate(observations):
             if obs.id == observation_id:
                 # Delete frame files
@@ -350,7 +387,7 @@ class SceneMindSessionManager:
                 # Update session
                 session.observation_count = len(observations)
                 session.updated_at = datetime.now()
-                self._save_session(session)
+                self._save_session(session, observations)
 
                 logger.info(f"Deleted observation {observation_id} from session {session_id}")
                 return True
@@ -363,10 +400,11 @@ class SceneMindSessionManager:
         Returns:
             Statistics dict
         """
-        total = len(self._cache)
-        watching = sum(1 for s in self._cache.values() if s.status == SessionStatus.WATCHING)
-        completed = sum(1 for s in self._cache.values() if s.status == SessionStatus.COMPLETED)
-        total_observations = sum(len(obs) for obs in self._observations_cache.values())
+        summaries = self._index.summaries()
+        total = len(summaries)
+        watching = sum(1 for s in summaries if s["status"] == SessionStatus.WATCHING.value)
+        completed = sum(1 for s in summaries if s["status"] == SessionStatus.COMPLETED.value)
+        total_observations = sum(s["observation_count"] for s in summaries)
 
         return {
             "total": total,
@@ -0,0 +1,136 @@
+"""Resource-aware stage scheduling for the job pipeline.
+
+Instead of N identical workers that each drive a job end-to-end, the queue
+admits many jobs at once and every pipeline stage waits for a slot in the
+pool of the resource it actually uses:
+
+- network: downloads and uploads
+- gpu: Whisper, diarization (and other model inference)
+- llm: disfluency cleanup and translation
+- cpu: ffmpeg-heavy rendering
+
+Jobs therefore advance stage by stage through the pipeline DAG: job B
+downloads while job A transcribes, and two Whisper runs never share the GPU.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import AsyncIterator, Dict, List, Mapping, Optional, Tuple
+
+from loguru import logger
+
+from app.config import settings
+
+
+class Resource(str, Enum):
+    """Resources a pipeline stage can occupy."""
+
+    NETWORK = "network"
+    GPU = "gpu"
+    LLM = "llm"
+    CPU = "cpu"
+
+
+class ResourcePool:
+    """Bounded pool of slots for one resource (capacity 0 = unlimited)."""
+
+    def __init__(self, name: str, capacity: int):
+        self.name = name
+        self.capacity = capacity
+        self._semaphore = asyncio.Semaphore(capacity) if capacity > 0 else None
+        self._active: List[Tuple[str, str]] = []  # (job_id, stage)
+        self._waiting = 0
+        self._completed = 0
+        self._busy_seconds = 0.0
+
+    @asynccontextmanager
+    async def slot(self, job_id: str = "", stage: str = "") -> AsyncIterator[None]:
+        """Hold one slot for the duration of a stage."""
+        if self._semaphore is not None:
+            self._waiting += 1
+            try:
+                await self._semaphore.acquire()
+            finally:
+                self._waiting -= 1
+
+        entry = (job_id, stage)
+        self._active.append(entry)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self._active.remove(entry)
+            self._busy_seconds += time.monotonic() - started
+            self._completed += 1
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    def get_stats(self) -> dict:
+        """Get pool statistics."""
+        return {
+            "capacity": self.capacity,
+            "active": len(self._active),
+            "waiting": self._waiting,
+            "completed": self._completed,
+            "busy_seconds": round(self._busy_seconds, 1),
+            "stages": [f"{job_id}:{stage}" for job_id, stage in self._active],
+        }
+
+
+class ResourcePools:
+    """One pool per Resource; stages acquire the pool they run on."""
+
+    def __init__(self, capacities: Mapping[Resource, int]):
+        self._pools: Dict[Resource, ResourcePool] = {
+            resource: ResourcePool(resource.value, capacities.get(resource, 0))
+            for resource in Resource
+        }
+
+    @classmethod
+    def from_settings(cls) -> "ResourcePools":
+        """Create pools sized by the *_pool_size settings."""
+        return cls({
+            Resource.NETWORK: settings.network_pool_size,
+            Resource.GPU: settings.gpu_pool_size,
+            Resource.LLM: settings.llm_pool_size,
+            Resource.CPU: settings.cpu_pool_size,
+        })
+
+    @asynccontextmanager
+    async def acquire(
+        self,
+        resource: Resource,
+        job_id: str = "",
+        stage: str = "",
+    ) -> AsyncIterator[None]:
+        """Run a stage while holding a slot of the given resource.
+
+        Args:
+            resource: Resource the stage occupies
+            job_id: Job (or timeline) the stage belongs to, for stats
+            stage: Stage name, for stats and logs
+        """
+        pool = self._pools[resource]
+        queued = time.monotonic()
+        async with pool.slot(job_id, stage):
+            waited = time.monotonic() - queued
+            if waited >= 1.0:
+                logger.debug(f"{job_id} {stage} waited {waited:.1f}s for {resource.value}")
+            yield
+
+    def get_stats(self) -> Dict[str, dict]:
+        """Get statistics for every pool."""
+        return {resource.value: pool.get_stats() for resource, pool in self._pools.items()}
+
+
+_resource_pools: Optional[ResourcePools] = None
+
+
+def get_resource_pools() -> ResourcePools:
+    """Get the process-wide resource pools (created from settings on first use)."""
+    global _resource_pools
+    if _resource_pools is None:
+        _resource_pools = ResourcePools.from_settings()
+    return _resource_pools
@@ -0,0 +1,303 @@
+"""Summary index and bounded document cache for JSON-backed managers.
+
+Managers that persist one JSON document per entity (jobs, items,
+timelines, ...) keep only a small summary of each document resident -
+id, status, timestamps and foreign keys - and hydrate the full Pydantic
+model on demand.
+
+Summaries are persisted to an index file next to the documents and
+fingerprinted by each file's mtime/size, so a restart only re-reads the
+documents that changed since the index was last written.
+"""
+
+import json
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from loguru import logger
+
+from app.config import settings
+
+# Index file name inside a manager's storage directory (no .json suffix so
+# it never matches the managers' "*.json" globs)
+INDEX_FILENAME = ".index"
+
+T = TypeVar("T")
+
+Stamp = List[Optional[List[int]]]
+PathLike = Union[str, Path]
+
+
+def file_stamp(paths: Sequence[PathLike]) -> Stamp:
+    """Fingerprint a document's files as [mtime_ns, size] (None if missing)."""
+    stamp: Stamp = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            stamp.append(None)
+        else:
+            stamp.append([st.st_mtime_ns, st.st_size])
+    return stamp
+
+
+class SummaryIndex:
+    """Persistent id -> summary map for a directory of JSON documents.
+
+    The in-memory summaries are authoritative while the process runs; the
+    index file is a cache validated against file fingerprints on startup,
+    so a stale or missing index only costs re-reading the affected files.
+    Runtime changes are written back at most every ``flush_interval``
+    seconds (and on an explicit flush()).
+    """
+
+    def __init__(self, index_path: Path, version: int = 1, flush_interval: float = 30.0):
+        """Initialize the index.
+
+        Args:
+            index_path: File the index is persisted to
+            version: Summary schema version; bump to force a rebuild
+            flush_interval: Minimum seconds between automatic writes
+        """
+        self.index_path = index_path
+        self.version = version
+        self.flush_interval = flush_interval
+        self._summaries: Dict[str, dict] = {}
+        self._stamps: Dict[str, Stamp] = {}
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _read(self) -> Tuple[Dict[str, dict], Dict[str, Stamp]]:
+        """Read the persisted index, ignoring it if missing or outdated."""
+        if not self.index_path.exists():
+            return {}, {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable index {self.index_path}: {e}")
+            return {}, {}
+        if data.get("version") != self.version:
+            return {}, {}
+
+        summaries = {}
+        stamps = {}
+        for doc_id, entry in data.get("documents", {}).items():
+            summaries[doc_id] = entry["summary"]
+            stamps[doc_id] = entry["stamp"]
+        return summaries, stamps
+
+    def refresh(
+        self,
+        documents: Dict[str, Sequence[PathLike]],
+        summarize: Callable[[str], Optional[dict]],
+    ) -> int:
+        """Sync the index with the documents currently on disk.
+
+        Args:
+            documents: Document ID -> files it is stored in (primary file
+                first; documents whose primary file is missing are dropped)
+            summarize: Builds the summary of a new or changed document,
+                returning None if it cannot be loaded
+
+        Returns:
+            Number of documents that had to be re-read
+        """
+        stored_summaries, stored_stamps = self._read()
+        summaries: Dict[str, dict] = {}
+        stamps: Dict[str, Stamp] = {}
+        rebuilt = 0
+
+        for doc_id, paths in documents.items():
+            stamp = file_stamp(paths)
+            if stamp[0] is None:
+                continue
+            if stored_stamps.get(doc_id) == stamp:
+                summaries[doc_id] = stored_summaries[doc_id]
+                stamps[doc_id] = stamp
+                continue
+
+            rebuilt += 1
+            try:
+                summary = summarize(doc_id)
+            except Exception as e:
+                logger.warning(f"Failed to summarize {doc_id}: {e}")
+                continue
+            if summary is not None:
+                summaries[doc_id] = summary
+                stamps[doc_id] = stamp
+
+        with self._lock:
+            self._summaries = summaries
+            self._stamps = stamps
+            self._dirty = rebuilt > 0 or summaries.keys() != stored_summaries.keys()
+        self.flush()
+        return rebuilt
+
+    def flush(self) -> None:
+        """Persist the index if it changed (atomic temp file + rename)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "version": self.version,
+                "documents": {
+                    doc_id: {"summary": summary, "stamp": self._stamps.get(doc_id)}
+                    for doc_id, summary in self._summaries.items()
+                },
+            }
+            self._dirty = False
+            self._last_flush = time.monotonic()
+
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+            text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Failed to write index {self.index_path}: {e}")
+
+    def get(self, doc_id: str) -> Optional[dict]:
+        """Get a document's summary (do not mutate the returned dict)."""
+        return self._summaries.get(doc_id)
+
+    def put(self, doc_id: str, summary: dict, paths: Sequence[PathLike]) -> None:
+        """Record a document's summary after it was written to disk.
+
+        Args:
+            doc_id: Document ID
+            summary: JSON-safe summary dict
+            paths: Files the document is stored in, for fingerprinting
+        """
+        stamp = file_stamp(paths)
+        with self._lock:
+            self._summaries[doc_id] = summary
+            self._stamps[doc_id] = stamp
+            self._dirty = True
+        self._maybe_flush()
+
+    def remove(self, doc_id: str) -> None:
+        """Forget a deleted document."""
+        with self._lock:
+            if self._summaries.pop(doc_id, None) is not None:
+                self._stamps.pop(doc_id, None)
+                self._dirty = True
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def summaries(self) -> List[dict]:
+        """Get all summaries."""
+        return list(self._summaries.values())
+
+    def ids(self) -> List[str]:
+        """Get all document IDs."""
+        return list(self._summaries)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._summaries
+
+    def __len__(self) -> int:
+        return len(self._summaries)
+
+
+class DocumentCache(Generic[T]):
+    """LRU of hydrated documents bounded by an approximate byte budget.
+
+    Sizes are the documents' serialized sizes, a cheap proxy for their
+    in-memory footprint. A document evicted while still referenced
+    elsewhere (e.g. a job being processed) stays reachable through a weak
+    reference, so lookups keep returning that instance instead of
+    hydrating a second, diverging copy.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Budget for resident documents; the most recently
+                used document is always kept, whatever its size.
+                Defaults to settings.document_cache_mb.
+        """
+        if max_bytes is None:
+            max_bytes = settings.document_cache_mb * 1024 * 1024
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[T, int]]" = OrderedDict()
+        self._live: "weakref.WeakValueDictionary[str, T]" = weakref.WeakValueDictionary()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[T]:
+        """Get a resident document, marking it most recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            doc = self._live.get(key)
+            if doc is not None:
+                self.hits += 1
+                return doc
+            self.misses += 1
+            return None
+
+    def put(self, key: str, doc: T, size: int) -> None:
+        """Add or replace a document, evicting least recently used ones."""
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (doc, size)
+            self._bytes += size
+            try:
+                self._live[key] = doc
+            except TypeError:
+                pass  # Not weak-referenceable; LRU residency only
+
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def pop(self, key: str) -> None:
+        """Drop a document (e.g. after it was deleted)."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+            self._live.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all documents."""
+        with self._lock:
+            self._entries.clear()
+            self._live.clear()
+            self._bytes = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries or key in self._live
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -1,6 +1,9 @@
 """Timeline manager service for review UI."""
 
 import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
@@ -23,40 +26,156 @@ from app.models.timeline import (
     TimelineSummary,
 )
 from app.models.transcript import TranslatedTranscript
+from app.services.metadata_store import open_metadata_store
+from app.services.summary_index import DocumentCache, file_stamp
 
+# Single background thread folds operation logs back into snapshots
+_compaction_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="timeline-compact")
 
-class TimelineManager:
-    """Manager for timeline CRUD operations."""
 
-    def __init__(self, timelines_dir: Optional[Path] = None):
+class TimelineManager:
+    """Manager for timeline CRUD operations.
+
+    Each timeline is persisted as a JSON snapshot (``{id}.json``) plus an
+    append-only operation log (``{id}.log``, one JSON op per line). Small
+    edits (segment patches, card ops, export status) append a line instead
+    of rewriting the snapshot; the log is replayed on load and compacted
+    into the snapshot in the background once it grows past
+    ``compact_after`` operations.
+
+    Only ``TimelineSummary`` data is kept for every timeline (persisted in
+    the configured metadata store); full timelines are hydrated on demand
+    and held in a bounded LRU. Summaries of timelines edited through the
+    log are recomputed lazily, when a list or stats call needs them.
+    """
+
+    def __init__(
+        self,
+        timelines_dir: Optional[Path] = None,
+        compact_after: int = 500,
+    ):
         """Initialize timeline manager.
 
         Args:
             timelines_dir: Directory for timeline storage.
                           Defaults to data_dir/timelines.
+            compact_after: Number of logged operations after which a
+                          timeline's log is compacted into its snapshot.
         """
         self.timelines_dir = timelines_dir or settings.data_dir / "timelines"
         self.timelines_dir.mkdir(parents=True, exist_ok=True)
-        self._cache: dict[str, Timeline] = {}
+        self.compact_after = compact_after
+        # Snapshots and logs stay files (the log is the edit path); the
+        # store only holds summaries
+        self._store = open_metadata_store(
+            "timelines",
+            self.timelines_dir,
+            lambda timeline_id, summary: self._snapshot_path(timeline_id),
+            ("job_id", "is_reviewed", "updated_at"),
+            order_column="updated_at",
+            files_for=lambda timeline_id, summary: self._files(timeline_id),
+            stores_documents=False,
+        )
+        self._documents: DocumentCache[Timeline] = DocumentCache()
+        # Op log bookkeeping, guarded by _lock (compaction runs in another thread)
+        self._lock = threading.RLock()
+        self._log_seq: dict[str, int] = {}  # last seq appended per timeline
+        self._snapshot_seq: dict[str, int] = {}  # seq covered by snapshot on disk
+        self._compacting: set[str] = set()
+        self._stale_summaries: set[str] = set()  # edited via the log since last summary
         self._load_all()
 
     def _load_all(self) -> None:
-        """Load all timelines from disk."""
-        self._cache.clear()
-        for file_path in self.timelines_dir.glob("*.json"):
+        """Index all timelines on disk (only new/changed ones are read)."""
+        self._documents.clear()
+
+        def scan() -> dict:
+            return {
+                file_path.stem: self._files(file_path.stem)
+                for file_path in self.timelines_dir.glob("*.json")
+            }
+
+        def summarize(timeline_id: str, raw: bytes) -> Optional[dict]:
+            timeline = self._read_timeline(timeline_id, raw)
+            return self._summarize(timeline) if timeline else None
+
+        rebuilt = self._store.load(scan, summarize)
+        logger.info(f"Loaded {len(self._store)} timelines ({rebuilt} re-indexed)")
+
+    def _read_timeline(self, timeline_id: str, raw: Optional[bytes] = None) -> Optional[Timeline]:
+        """Hydrate a timeline from disk into the document cache.
+
+        Args:
+            timeline_id: Timeline ID
+            raw: Snapshot file contents, if already read
+        """
+        file_path = self._snapshot_path(timeline_id)
+        with self._lock:
             try:
-                timeline = self._load_timeline(file_path)
-                self._cache[timeline.timeline_id] = timeline
+                timeline = self._load_timeline(file_path, raw)
             except Exception as e:
                 logger.warning(f"Failed to load timeline {file_path}: {e}")
+                return None
+            size = sum(s[1] for s in file_stamp(self._files(timeline_id)) if s)
+            self._documents.put(timeline_id, timeline, size)
+        return timeline
 
-        logger.info(f"Loaded {len(self._cache)} timelines")
+    @staticmethod
+    def _build_summary(timeline: Timeline) -> TimelineSummary:
+        return TimelineSummary(
+            timeline_id=timeline.timeline_id,
+            job_id=timeline.job_id,
+            mode=timeline.mode,
+            source_title=timeline.source_title,
+            source_duration=timeline.source_duration,
+            total_segments=timeline.total_segments,
+            keep_count=timeline.keep_count,
+            drop_count=timeline.drop_count,
+            undecided_count=timeline.undecided_count,
+            review_progress=timeline.review_progress,
+            is_reviewed=timeline.is_reviewed,
+            observation_count=timeline.observation_count,
+            export_status=timeline.export_status,
+            export_progress=timeline.export_progress,
+            export_message=timeline.export_message,
+            created_at=timeline.created_at,
+            updated_at=timeline.updated_at,
+        )
 
-    def _load_timeline(self, file_path: Path) -> Timeline:
-        """Load a timeline from a JSON file."""
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+    def _summarize(self, timeline: Timeline) -> dict:
+        return self._build_summary(timeline).model_dump(mode="json")
+
+    def _sync_summaries(self) -> None:
+        """Recompute summaries of timelines edited through the op log."""
+        with self._lock:
+            stale, self._stale_summaries = self._stale_summaries, set()
+            for timeline_id in stale:
+                timeline = self.get_timeline(timeline_id)
+                if timeline:
+                    self._store.put_summary(timeline_id, self._summarize(timeline))
+
+    def _load_timeline(self, file_path: Path, raw: Optional[bytes] = None) -> Timeline:
+        """Load a timeline from a JSON snapshot and replay its operation log."""
+        if raw is None:
+            with open(file_path, "rb") as f:
+                raw = f.read()
+        data = json.loads(raw)
+        snapshot_seq = data.pop("log_seq", 0)
         timeline = Timeline.model_validate(data)
+
+        last_seq = snapshot_seq
+        replayed = 0
+        for entry in self._read_log(timeline.timeline_id):
+            if entry["seq"] <= snapshot_seq:
+                continue
+            self._apply_op(timeline, entry)
+            last_seq = entry["seq"]
+            replayed += 1
+        self._snapshot_seq[timeline.timeline_id] = snapshot_seq
+        self._log_seq[timeline.timeline_id] = last_seq
+        if replayed:
+            logger.debug(f"Replayed {replayed} ops for timeline {timeline.timeline_id}")
+
         # Migration: watching mode should use HALF_SCREEN, not FLOATING
         if (
             timeline.mode == "watching"
@@ -70,11 +189,202 @@ class TimelineManager:
             self._save_timeline(timeline)
         return timeline
 
+    def flush_index(self) -> None:
+        """Persist the timeline summary index (e.g. on shutdown)."""
+        self._sync_summaries()
+        self._store.flush()
+
+    def _snapshot_path(self, timeline_id: str) -> Path:
+        return self.timelines_dir / f"{timeline_id}.json"
+
+    def _log_path(self, timeline_id: str) -> Path:
+        return self.timelines_dir / f"{timeline_id}.log"
+
+    def _files(self, timeline_id: str) -> List[Path]:
+        return [self._snapshot_path(timeline_id), self._log_path(timeline_id)]
+
+    def _write_snapshot(self, path: Path, data: dict) -> None:
+        """Atomically write a snapshot (temp file + rename)."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
     def _save_timeline(self, timeline: Timeline) -> None:
-        """Save a timeline to disk."""
-        file_path = self.timelines_dir / f"{timeline.timeline_id}.json"
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(timeline.model_dump(mode="json"), f, ensure_ascii=False, indent=2)
+        """Save a full snapshot of a timeline to disk and truncate its log."""
+        timeline_id = timeline.timeline_id
+        with self._lock:
+            seq = self._log_seq.get(timeline_id, 0)
+            data = timeline.model_dump(mode="json")
+            data["log_seq"] = seq
+            snapshot_path = self._snapshot_path(timeline_id)
+            self._write_snapshot(snapshot_path, data)
+            self._snapshot_seq[timeline_id] = seq
+            self._log_seq[timeline_id] = seq
+            self._log_path(timeline_id).unlink(missing_ok=True)
+
+            self._store.put_summary(timeline_id, self._summarize(timeline))
+            self._stale_summaries.discard(timeline_id)
+            self._documents.put(timeline_id, timeline, snapshot_path.stat().st_size)
+
+    # ============ Operation Log ============
+
+    def _read_log(self, timeline_id: str) -> List[dict]:
+        """Read a timeline's operation log, skipping a torn trailing line."""
+        log_path = self._log_path(timeline_id)
+        if not log_path.exists():
+            return []
+        entries = []
+        with open(log_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt op in {log_path}")
+        return entries
+
+    def _append_ops(self, timeline: Timeline, ops: List[dict]) -> None:
+        """Append operations for an already-mutated timeline to its log.
+
+        Args:
+            timeline: Timeline the operations were applied to
+            ops: Operation dicts (``op`` plus op-specific keys, JSON-safe)
+        """
+        timeline_id = timeline.timeline_id
+        updated_at = timeline.updated_at.isoformat()
+        with self._lock:
+            seq = self._log_seq.get(timeline_id, 0)
+            lines = []
+            for op in ops:
+                seq += 1
+                entry = {"seq": seq, **op, "updated_at": updated_at}
+                lines.append(json.dumps(entry, ensure_ascii=False))
+            with open(self._log_path(timeline_id), "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            self._log_seq[timeline_id] = seq
+            self._stale_summaries.add(timeline_id)
+            pending = seq - self._snapshot_seq.get(timeline_id, 0)
+            if pending >= self.compact_after and timeline_id not in self._compacting:
+                self._compacting.add(timeline_id)
+                _compaction_executor.submit(self._compact_in_background, timeline_id)
+
+    @staticmethod
+    def _apply_op(timeline: Timeline, entry: dict) -> None:
+        """Apply a logged operation to a timeline (idempotent)."""
+        op = entry["op"]
+
+        def assign(model, fields: dict) -> None:
+            validator = type(model).__pydantic_validator__
+            for name, value in fields.items():
+                validator.validate_assignment(model, name, value)
+
+        if op == "set":
+            assign(timeline, entry["fields"])
+        elif op == "segment":
+            segment = timeline.get_segment(entry["id"])
+            if segment:
+                assign(segment, entry["fields"])
+        elif op == "segments":
+            ids = set(entry["ids"])
+            for segment in timeline.segments:
+                if segment.id in ids:
+                    assign(segment, entry["fields"])
+        elif op == "card_add":
+            card = PinnedCard.model_validate(entry["card"])
+            if not timeline.get_pinned_card(card.id):
+                timeline.pinned_cards.append(card)
+        elif op == "card":
+            card = timeline.get_pinned_card(entry["id"])
+            if card:
+                assign(card, entry["fields"])
+        elif op == "card_remove":
+            timeline.pinned_cards = [
+                c for c in timeline.pinned_cards if c.id != entry["id"]
+            ]
+        elif op == "observation_add":
+            observation = Observation.model_validate(entry["observation"])
+            if not timeline.get_observation(observation.id):
+                timeline.observations.append(observation)
+        elif op == "observation_remove":
+            timeline.observations = [
+                o for o in timeline.observations if o.id != entry["id"]
+            ]
+        else:
+            logger.warning(f"Unknown timeline op '{op}' for {timeline.timeline_id}")
+            return
+
+        if entry.get("updated_at"):
+            assign(timeline, {"updated_at": entry["updated_at"]})
+
+    def compact(self, timeline_id: str) -> bool:
+        """Fold a timeline's operation log into its snapshot.
+
+        Safe to call while edits continue: operations appended during the
+        snapshot write are kept in the log and replayed on top of it.
+
+        Args:
+            timeline_id: Timeline ID
+
+        Returns:
+            True if a new snapshot was written
+        """
+        with self._lock:
+            timeline = self.get_timeline(timeline_id)
+            if not timeline:
+                return False
+            seq = self._log_seq.get(timeline_id, 0)
+            if seq <= self._snapshot_seq.get(timeline_id, 0):
+                return False
+            data = timeline.model_dump(mode="json")
+
+        # Serialize and write outside the lock; edits keep appending meanwhile
+        data["log_seq"] = seq
+        snapshot_path = self._snapshot_path(timeline_id)
+        tmp_path = snapshot_path.with_name(snapshot_path.name + f".{seq}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+        with self._lock:
+            # A full save or delete may have superseded this snapshot
+            if (
+                timeline_id not in self._store
+                or self._snapshot_seq.get(timeline_id, 0) >= seq
+            ):
+                tmp_path.unlink(missing_ok=True)
+                return False
+            os.replace(tmp_path, snapshot_path)
+            self._snapshot_seq[timeline_id] = seq
+
+            tail = [e for e in self._read_log(timeline_id) if e["seq"] > seq]
+            log_path = self._log_path(timeline_id)
+            if tail:
+                tmp_log = log_path.with_name(log_path.name + ".tmp")
+                with open(tmp_log, "w", encoding="utf-8") as f:
+                    for entry in tail:
+                        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                os.replace(tmp_log, log_path)
+            else:
+                log_path.unlink(missing_ok=True)
+
+            # Content is unchanged; refresh the fingerprint only
+            summary = self._store.get(timeline_id)
+            if summary:
+                self._store.put_summary(timeline_id, summary)
+
+        logger.debug(f"Compacted timeline {timeline_id} log up to seq {seq}")
+        return True
+
+    def _compact_in_background(self, timeline_id: str) -> None:
+        try:
+            self.compact(timeline_id)
+        except Exception as e:
+            logger.warning(f"Failed to compact timeline {timeline_id}: {e}")
+        finally:
+            with self._lock:
+                self._compacting.discard(timeline_id)
 
     def create_from_transcript(
         self,
@@ -129,7 +439,6 @@ class TimelineManager:
             subtitle_style_mode=subtitle_style,
         )
 
-        self._cache[timeline.timeline_id] = timeline
         self._save_timeline(timeline)
         logger.info(
             f"Created timeline {timeline.timeline_id} for job {job_id} "
@@ -139,14 +448,16 @@ class TimelineManager:
         return timeline
 
     def get_timeline(self, timeline_id: str) -> Optional[Timeline]:
-        """Get a timeline by ID."""
-        return self._cache.get(timeline_id)
+        """Get a timeline by ID (hydrated from disk if not resident)."""
+        timeline = self._documents.get(timeline_id)
+        if timeline is None and timeline_id in self._store:
+            timeline = self._read_timeline(timeline_id)
+        return timeline
 
     def get_timeline_by_job(self, job_id: str) -> Optional[Timeline]:
         """Get a timeline by job ID."""
-        for timeline in self._cache.values():
-            if timeline.job_id == job_id:
-                return timeline
+        for summary in self._store.query({"job_id": job_id}, limit=1):
+            return self.get_timeline(summary["timeline_id"])
         return None
 
     def list_timelines(
@@ -165,43 +476,21 @@ class TimelineManager:
         Returns:
             List of TimelineSummary objects
         """
-        result = []
-        for timeline in sorted(
-            self._cache.values(),
-            key=lambda t: t.updated_at,
-            reverse=True,
-        ):
-            if reviewed_only and not timeline.is_reviewed:
-                continue
-            if unreviewed_only and timeline.is_reviewed:
-                continue
-
-            result.append(
-                TimelineSummary(
-                    timeline_id=timeline.timeline_id,
-                    job_id=timeline.job_id,
-                    mode=timeline.mode,
-                    source_title=timeline.source_title,
-                    source_duration=timeline.source_duration,
-                    total_segments=timeline.total_segments,
-                    keep_count=timeline.keep_count,
-                    drop_count=timeline.drop_count,
-                    undecided_count=timeline.undecided_count,
-                    review_progress=timeline.review_progress,
-                    is_reviewed=timeline.is_reviewed,
-                    observation_count=timeline.observation_count,
-                    export_status=timeline.export_status,
-                    export_progress=timeline.export_progress,
-                    export_message=timeline.export_message,
-                    created_at=timeline.created_at,
-                    updated_at=timeline.updated_at,
-                )
+        self._sync_summaries()
+        if reviewed_only and unreviewed_only:
+            return []
+        where = {}
+        if reviewed_only:
+            where["is_reviewed"] = True
+        if unreviewed_only:
+            where["is_reviewed"] = False
+
+        return [
+            TimelineSummary.model_validate(summary)
+            for summary in self._store.query(
+                where, order_by="updated_at", descending=True, limit=limit
             )
-
-            if len(result) >= limit:
-                break
-
-        return result
+        ]
 
     def update_segment(
         self,
@@ -225,7 +514,11 @@ class TimelineManager:
 
         segment = timeline.update_segment(segment_id, update)
         if segment:
-            self._save_timeline(timeline)
+            self._append_ops(timeline, [{
+                "op": "segment",
+                "id": segment_id,
+                "fields": update.model_dump(mode="json", exclude_none=True),
+            }])
             logger.debug(f"Updated segment {segment_id} in timeline {timeline_id}")
 
         return segment
@@ -252,7 +545,11 @@ class TimelineManager:
 
         updated = timeline.batch_update_segments(segment_ids, state)
         if updated > 0:
-            self._save_timeline(timeline)
+            self._append_ops(timeline, [{
+                "op": "segments",
+                "ids": list(segment_ids),
+                "fields": {"state": state.value},
+            }])
             logger.info(
                 f"Batch updated {updated} segments to {state.value} "
                 f"in timeline {timeline_id}"
@@ -274,7 +571,7 @@ class TimelineManager:
             return False
 
         timeline.mark_reviewed()
-        self._save_timeline(timeline)
+        self._append_ops(timeline, [{"op": "set", "fields": {"is_reviewed": True}}])
         logger.info(f"Marked timeline {timeline_id} as reviewed")
 
         return True
@@ -301,7 +598,13 @@ class TimelineManager:
 
         timeline.export_profile = profile
         timeline.use_traditional_chinese = use_traditional
-        self._save_timeline(timeline)
+        self._append_ops(timeline, [{
+            "op": "set",
+            "fields": {
+                "export_profile": profile.value,
+                "use_traditional_chinese": use_traditional,
+            },
+        }])
 
         return True
 
@@ -326,7 +629,10 @@ class TimelineManager:
 
         # Update speaker names (merge with existing)
         timeline.speaker_names.update(speaker_names)
-        self._save_timeline(timeline)
+        self._append_ops(timeline, [{
+            "op": "set",
+            "fields": {"speaker_names": dict(timeline.speaker_names)},
+        }])
         logger.info(f"Updated speaker names for timeline {timeline_id}: {speaker_names}")
 
         return True
@@ -351,11 +657,15 @@ class TimelineManager:
         if not timeline:
             return False
 
+        fields = {}
         if full_path:
             timeline.output_full_path = full_path
+            fields["output_full_path"] = full_path
         if essence_path:
             timeline.output_essence_path = essence_path
-        self._save_timeline(timeline)
+            fields["output_essence_path"] = essence_path
+        if fields:
+            self._append_ops(timeline, [{"op": "set", "fields": fields}])
 
         return True
 
@@ -381,7 +691,10 @@ class TimelineManager:
 
         timeline.youtube_video_id = video_id
         timeline.youtube_url = url
-        self._save_timeline(timeline)
+        self._append_ops(timeline, [{
+            "op": "set",
+            "fields": {"youtube_video_id": video_id, "youtube_url": url},
+        }])
         logger.info(f"Set YouTube info for timeline {timeline_id}: {url}")
 
         return True
@@ -423,7 +736,19 @@ class TimelineManager:
         if status in (ExportStatus.COMPLETED, ExportStatus.FAILED, ExportStatus.IDLE):
             timeline.export_started_at = None
 
-        self._save_timeline(timeline)
+        self._append_ops(timeline, [{
+            "op": "set",
+            "fields": {
+                "export_status": status.value,
+                "export_progress": progress,
+                "export_message": message,
+                "export_error": error,
+                "export_started_at": (
+                    timeline.export_started_at.isoformat()
+                    if timeline.export_started_at else None
+                ),
+            },
+        }])
         logger.info(
             f"Export status for timeline {timeline_id}: "
             f"{status.value} ({progress:.0f}%) - {message or 'N/A'}"
@@ -431,6 +756,35 @@ class TimelineManager:
 
         return True
 
+    def set_export_progress(
+        self,
+        timeline_id: str,
+        progress: float,
+        message: Optional[str] = None,
+    ) -> bool:
+        """Update export progress in memory only (not persisted).
+
+        Used for high-frequency progress ticks within one export status;
+        status transitions go through update_export_status.
+
+        Args:
+            timeline_id: Timeline ID
+            progress: Export progress percentage (0-100)
+            message: Current step description
+
+        Returns:
+            True if successful, False if timeline not found
+        """
+        timeline = self.get_timeline(timeline_id)
+        if not timeline:
+            return False
+
+        timeline.export_progress = progress
+        timeline.export_message = message
+        with self._lock:
+            self._stale_summaries.add(timeline_id)
+        return True
+
     def reset_export_status(self, timeline_id: str) -> bool:
         """Reset export status to idle.
 
@@ -458,7 +812,6 @@ class TimelineManager:
         (e.g., converting Chinese subtitles) and need to persist changes.
         """
         timeline.updated_at = datetime.utcnow()
-        self._cache[timeline.timeline_id] = timeline
         self._save_timeline(timeline)
         logger.info(f"Saved timeline {timeline.timeline_id}")
 
@@ -471,14 +824,17 @@ class TimelineManager:
         Returns:
             True if deleted, False if not found
         """
-        if timeline_id not in self._cache:
+        if timeline_id not in self._store:
             return False
 
-        file_path = self.timelines_dir / f"{timeline_id}.json"
-        if file_path.exists():
-            file_path.unlink()
-
-        del self._cache[timeline_id]
+        with self._lock:
+            self._snapshot_path(timeline_id).unlink(missing_ok=True)
+            self._log_path(timeline_id).unlink(missing_ok=True)
+            self._store.delete(timeline_id)
+            self._documents.pop(timeline_id)
+            self._stale_summaries.discard(timeline_id)
+            self._log_seq.pop(timeline_id, None)
+            self._snapshot_seq.pop(timeline_id, None)
         logger.info(f"Deleted timeline {timeline_id}")
 
         return True
@@ -489,8 +845,10 @@ class TimelineManager:
         Returns:
             Statistics dict
         """
-        total = len(self._cache)
-        reviewed = sum(1 for t in self._cache.values() if t.is_reviewed)
+        self._sync_summaries()
+        counts = self._store.count_by("is_reviewed")
+        total = sum(counts.values())
+        reviewed = counts.get(True, 0)
         pending = total - reviewed
 
         return {
@@ -533,7 +891,10 @@ class TimelineManager:
         )
 
         timeline.add_observation(observation)
-        self._save_timeline(timeline)
+        self._append_ops(timeline, [{
+            "op": "observation_add",
+            "observation": observation.model_dump(mode="json"),
+        }])
         logger.info(
             f"Added observation {observation.id} to timeline {timeline_id} "
             f"at {create.timecode}s"
@@ -593,7 +954,7 @@ class TimelineManager:
             return False
 
         if timeline.delete_observation(observation_id):
-            self._save_timeline(timeline)
+            self._append_ops(timeline, [{"op": "observation_remove", "id": observation_id}])
             logger.info(
                 f"Deleted observation {observation_id} from timeline {timeline_id}"
             )
@@ -666,7 +1027,21 @@ class TimelineManager:
         )
 
         timeline.add_pinned_card(pinned_card)
-        self._save_timeline(timeline)
+        # Siblings on the same segment were re-slotted by calculate_card_timing
+        ops = [
+            {
+                "op": "card",
+                "id": card.id,
+                "fields": {
+                    "display_start": card.display_start,
+                    "display_end": card.display_end,
+                },
+            }
+            for card in timeline.pinned_cards
+            if card.segment_id == pinned_card.segment_id and card.id != pinned_card.id
+        ]
+        ops.append({"op": "card_add", "card": pinned_card.model_dump(mode="json")})
+        self._append_ops(timeline, ops)
         logger.info(
             f"Pinned {create.card_type.value} card '{create.card_id}' "
             f"to timeline {timeline_id} at {create.timestamp}s "
@@ -694,7 +1069,7 @@ class TimelineManager:
             return False
 
         if timeline.remove_pinned_card(card_id):
-            self._save_timeline(timeline)
+            self._append_ops(timeline, [{"op": "card_remove", "id": card_id}])
             logger.info(
                 f"Removed pinned card {card_id} from timeline {timeline_id}"
             )
@@ -758,7 +1133,22 @@ class TimelineManager:
         # Recalculate timings for all pinned cards with new duration
         self._recalculate_card_timings(timeline)
 
-        self._save_timeline(timeline)
+        ops = [{
+            "op": "set",
+            "fields": {"card_display_duration": timeline.card_display_duration},
+        }]
+        ops.extend(
+            {
+                "op": "card",
+                "id": card.id,
+                "fields": {
+                    "display_start": card.display_start,
+                    "display_end": card.display_end,
+                },
+            }
+            for card in timeline.pinned_cards
+        )
+        self._append_ops(timeline, ops)
         logger.info(
             f"Set card display duration for timeline {timeline_id}: "
             f"{timeline.card_display_duration}s (recalculated {len(timeline.pinned_cards)} cards)"
@@ -830,7 +1220,11 @@ class TimelineManager:
 
         pinned_card.note = note if note else None
         timeline.updated_at = datetime.utcnow()
-        self._save_timeline(timeline)
+        self._append_ops(timeline, [{
+            "op": "card",
+            "id": card_id,
+            "fields": {"note": pinned_card.note},
+        }])
         logger.info(
             f"Updated note for pinned card {card_id} in timeline {timeline_id}"
         )
@@ -863,7 +1257,11 @@ class TimelineManager:
 
         pinned_card.card_data = card_data
         timeline.updated_at = datetime.utcnow()
-        self._save_timeline(timeline)
+        self._append_ops(timeline, [{
+            "op": "card",
+            "id": card_id,
+            "fields": {"card_data": card_data},
+        }])
         logger.info(
             f"Updated card_data for pinned card {card_id} in timeline {timeline_id}"
         )
@@ -0,0 +1,72 @@
+"""Character-offset index over a timeline's concatenated transcript.
+
+Full-text analyses (entity recognition over the whole transcript) send the
+segments' English texts joined by single spaces and get back character
+offsets into that string. The index maps an offset, or a span, back to
+segments by bisecting the sorted segment start offsets, so m mentions map
+in O(m log n) instead of testing every mention against every segment.
+"""
+
+import bisect
+from typing import List, Optional, Sequence, Tuple
+
+from app.models.timeline import EditableSegment
+
+
+class TranscriptIndex:
+    """Segments' English texts joined by spaces, with a char offset → segment lookup.
+
+    Segments with empty text are left out. Positions returned by the lookups
+    index ``texts``, ``segment_ids`` and ``starts``.
+    """
+
+    def __init__(self, segments: Sequence[EditableSegment]):
+        self.texts: List[str] = []
+        self.segment_ids: List[int] = []
+        self.starts: List[int] = []
+        pos = 0
+        for segment in segments:
+            text = segment.en.strip()
+            if not text:
+                continue
+            self.texts.append(text)
+            self.segment_ids.append(segment.id)
+            self.starts.append(pos)
+            pos += len(text) + 1  # +1 for the separator
+        self.text = " ".join(self.texts)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def locate(self, offset: int) -> Optional[int]:
+        """Position of the segment containing char ``offset``.
+
+        Returns:
+            Segment position, or None for a separator or an offset out of range
+        """
+        i = bisect.bisect_right(self.starts, offset) - 1
+        if i < 0 or offset >= self.starts[i] + len(self.texts[i]):
+            return None
+        return i
+
+    def split(self, start: int, end: int) -> List[Tuple[int, int, int]]:
+        """The parts of span [start, end) in each segment it covers.
+
+        A span straddling segment boundaries yields one part per segment,
+        clipped to that segment; separators are skipped.
+
+        Returns:
+            (segment position, local start, local end) tuples in order
+        """
+        if end <= start:
+            return []
+        first = max(0, bisect.bisect_right(self.starts, start) - 1)
+        last = bisect.bisect_left(self.starts, end)
+        parts = []
+        for i in range(first, last):
+            seg_start = self.starts[i]
+            lo = max(start, seg_start)
+            hi = min(end, seg_start + len(self.texts[i]))
+            if lo < hi:
+                parts.append((i, lo - seg_start, hi - seg_start))
+        return parts
@@ -1,18 +1,201 @@
-"""Audio Mixer Worker - Mix dubbed audio with BGM and SFX."""
+"""Audio Mixer Worker - Mix dubbed audio with BGM and SFX.
+
+The dubbed vocal track is assembled in-process: each segment WAV is
+decoded, fitted to its slot (time-stretched a little, then clipped) and
+added at its sample offset into a memory-mapped float32 buffer. A single
+streaming pass then writes the vocal track and the final mix, with the
+BGM and SFX ducked under the dubbed speech, so the work grows linearly
+with the audio length and the number of segments costs no processes.
+"""
 
 import asyncio
+import bisect
 import logging
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.workers.audio_separation import _StereoReader
+from app.workers.waveform import _pcm_to_float
 
 logger = logging.getLogger(__name__)
 
+# Output format of the mixed audio
+SAMPLE_RATE = 44100
+CHANNELS = 2
+
+# Frames per block of the streaming mix pass
+_BLOCK_FRAMES = 1 << 20
+
+# WSOLA time stretch: frame length (50% overlap) and alignment search range
+_STRETCH_FRAME = 1024
+_STRETCH_TOLERANCE = 256
+
+# Fade applied where a segment is cut at the end of its slot
+_CLIP_FADE_SECONDS = 0.01
+
+# Mixing is numpy-bound; one mix at a time
+_mixer_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio-mixer")
+
+
+def _read_segment(path: Path) -> np.ndarray:
+    """Decode a segment to (frames, 2) float32 at SAMPLE_RATE."""
+    try:
+        wav = wave.open(str(path), "rb")
+    except (wave.Error, EOFError):
+        # Not integer PCM WAV; decode through ffmpeg
+        reader = _StereoReader(path)
+        chunks = [np.zeros((CHANNELS, 0), dtype=np.float32)]
+        try:
+            while True:
+                block = reader.read(_BLOCK_FRAMES)
+                if block.shape[1] == 0:
+                    break
+                chunks.append(block)
+        finally:
+            reader.close()
+        return np.concatenate(chunks, axis=1).T
+
+    with wav:
+        rate, channels, width = wav.getframerate(), wav.getnchannels(), wav.getsampwidth()
+        samples = _pcm_to_float(wav.readframes(wav.getnframes()), width).reshape(-1, channels)
+
+    if channels == 1:
+        samples = np.repeat(samples, CHANNELS, axis=1)
+    samples = samples[:, :CHANNELS]
+    if rate != SAMPLE_RATE and len(samples):
+        # Linear resampling; dubbed speech is band-limited well below both rates
+        frames = int(round(len(samples) * SAMPLE_RATE / rate))
+        positions = np.arange(frames) * (rate / SAMPLE_RATE)
+        source = np.arange(len(samples))
+        samples = np.stack(
+            [np.interp(positions, source, samples[:, c]) for c in range(CHANNELS)], axis=1
+        ).astype(np.float32)
+    return samples
+
+
+def _time_stretch(samples: np.ndarray, frames: int) -> np.ndarray:
+    """Shorten (or lengthen) audio to ``frames`` frames keeping its pitch.
+
+    WSOLA: frames are taken at the scaled input position, shifted within
+    a small tolerance to best continue the previous frame's waveform, and
+    overlap-added.
+    """
+    channels = samples.shape[1]
+    if frames <= 0:
+        return np.zeros((0, channels), dtype=np.float32)
+    length, hop, tolerance = _STRETCH_FRAME, _STRETCH_FRAME // 2, _STRETCH_TOLERANCE
+    ratio = len(samples) / frames
+    window = np.hanning(length).astype(np.float32)
+
+    padded = np.concatenate([
+        np.zeros((tolerance, channels), np.float32),
+        samples,
+        np.zeros((2 * (length + tolerance), channels), np.float32),
+    ])
+    mono = padded.mean(axis=1)
+    out = np.zeros((frames + length, channels), dtype=np.float32)
+    weight = np.zeros(frames + length, dtype=np.float32)
+
+    previous = None
+    for position in range(0, frames, hop):
+        source = int(round(position * ratio)) + tolerance
+        if previous is not None:
+            natural = mono[previous + hop:previous + hop + length]
+            region = mono[source - tolerance:source + tolerance + length]
+            source += int(np.argmax(np.correlate(region, natural, mode="valid"))) - tolerance
+        out[position:position + length] += padded[source:source + length] * window[:, None]
+        weight[position:position + length] += window
+        previous = source
+    return out[:frames] / np.maximum(weight[:frames], 1e-3)[:, None]
+
+
+def _fit_to_slot(samples: np.ndarray, slot: int, max_stretch: float) -> np.ndarray:
+    """Fit a segment into ``slot`` frames: compress up to max_stretch, then clip."""
+    if len(samples) <= slot:
+        return samples
+    stretched = _time_stretch(samples, max(slot, int(len(samples) / max_stretch)))
+    if len(stretched) > slot:
+        stretched = stretched[:slot]
+        fade = min(slot, int(_CLIP_FADE_SECONDS * SAMPLE_RATE))
+        stretched[slot - fade:] *= np.linspace(1.0, 0.0, fade, dtype=np.float32)[:, None]
+    return stretched
+
+
+def _duck_gain(
+    intervals: Sequence[Tuple[int, int]],
+    starts: Sequence[int],
+    block_start: int,
+    block_end: int,
+    duck_volume: float,
+    ramp: int,
+) -> Optional[np.ndarray]:
+    """Gain for BGM/SFX over a block: duck_volume under speech, 1 elsewhere.
+
+    The gain ramps linearly over ``ramp`` frames before each interval
+    starts and after it ends. Returns None when nothing overlaps the block.
+    """
+    first = max(0, bisect.bisect_right(starts, block_start - ramp) - 1)
+    last = bisect.bisect_left(starts, block_end + ramp)
+    activity = None
+    for start, end in intervals[first:last]:
+        low, high = max(block_start, start - ramp), min(block_end, end + ramp)
+        if low >= high:
+            continue
+        if activity is None:
+            activity = np.zeros(block_end - block_start, dtype=np.float32)
+        # Frames relative to the interval start keep float32 exact
+        t = np.arange(low - start, high - start, dtype=np.float32)
+        ramp_in = (t + ramp) / ramp
+        ramp_out = ((end - start + ramp) - t) / ramp
+        window = activity[low - block_start:high - block_start]
+        np.maximum(window, np.clip(np.minimum(ramp_in, ramp_out), 0.0, 1.0), out=window)
+    if activity is None:
+        return None
+    return 1.0 - (1.0 - duck_volume) * activity
+
+
+def _open_wav_writer(path: Path) -> wave.Wave_write:
+    wav = wave.open(str(path), "wb")
+    wav.setnchannels(CHANNELS)
+    wav.setsampwidth(2)
+    wav.setframerate(SAMPLE_RATE)
+    return wav
+
+
+def _to_pcm(samples: np.ndarray) -> bytes:
+    return (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+
+
+class _TrackReader:
+    """Reads a BGM/SFX track block by block; silence past its end."""
+
+    def __init__(self, path: Optional[Path]):
+        self._reader = _StereoReader(path) if path is not None and path.exists() else None
+
+    def read(self, frames: int) -> Optional[np.ndarray]:
+        """Read (frames, 2) samples, or None if there is no track."""
+        if self._reader is None:
+            return None
+        block = self._reader.read(frames).T
+        if len(block) < frames:
+            block = np.concatenate([block, np.zeros((frames - len(block), CHANNELS), np.float32)])
+        return block
+
+    def close(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+
 
 class AudioMixerWorker:
     """
     Worker to mix dubbed vocals with background music and sound effects.
 
-    Uses FFmpeg for audio processing and mixing.
+    Builds the vocal track and the mix in-process with NumPy; FFmpeg is
+    used for the video remux and the small file utilities.
     """
 
     def __init__(
@@ -21,6 +204,9 @@ class AudioMixerWorker:
         default_sfx_volume: float = 0.5,
         default_vocal_volume: float = 1.0,
         crossfade_duration: float = 0.1,
+        default_duck_volume: float = 1.0,
+        duck_ramp: float = 0.2,
+        max_stretch: float = 1.15,
     ):
         """
         Initialize the audio mixer worker.
@@ -30,101 +216,68 @@ class AudioMixerWorker:
             default_sfx_volume: Default volume for sound effects (0-1)
             default_vocal_volume: Default volume for vocals (0-1)
             crossfade_duration: Duration for crossfades between segments (seconds)
+            default_duck_volume: Default BGM/SFX gain under dubbed speech (1 = no ducking)
+            duck_ramp: Duration of the ducking fade in and out (seconds)
+            max_stretch: Largest speed-up applied to fit a segment into its slot
         """
         self.default_bgm_volume = default_bgm_volume
         self.default_sfx_volume = default_sfx_volume
         self.default_vocal_volume = default_vocal_volume
         self.crossfade_duration = crossfade_duration
+        self.default_duck_volume = default_duck_volume
+        self.duck_ramp = duck_ramp
+        self.max_stretch = max_stretch
 
     async def mix_dubbed_audio(
         self,
         dubbed_segments: List[Dict],
-        bgm_path: Path,
+        bgm_path: Optional[Path],
         sfx_path: Optional[Path],
         output_path: Path,
         total_duration: float,
         bgm_volume: Optional[float] = None,
         sfx_volume: Optional[float] = None,
         vocal_volume: Optional[float] = None,
+        duck_volume: Optional[float] = None,
     ) -> Path:
         """
         Mix dubbed segments with background music and sound effects.
 
+        Also writes the dubbed vocal track (``dubbed_vocals_track.wav``)
+        next to the output.
+
         Args:
             dubbed_segments: List of segment dicts with start, end, dubbed_path
-            bgm_path: Path to background music audio
+            bgm_path: Path to background music audio (optional)
             sfx_path: Path to sound effects audio (optional)
             output_path: Path for output mixed audio
             total_duration: Total duration of output (seconds)
             bgm_volume: Volume for BGM (0-1)
             sfx_volume: Volume for SFX (0-1)
             vocal_volume: Volume for vocals (0-1)
+            duck_volume: BGM/SFX gain while dubbed speech plays (0-1)
 
         Returns:
             Path to mixed audio file
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        bgm_vol = bgm_volume if bgm_volume is not None else self.default_bgm_volume
-        sfx_vol = sfx_volume if sfx_volume is not None else self.default_sfx_volume
-        vocal_vol = vocal_volume if vocal_volume is not None else self.default_vocal_volume
-
-        # First, create the dubbed vocal track by placing segments at correct times
+        volumes = {
+            "bgm": bgm_volume if bgm_volume is not None else self.default_bgm_volume,
+            "sfx": sfx_volume if sfx_volume is not None else self.default_sfx_volume,
+            "vocals": vocal_volume if vocal_volume is not None else self.default_vocal_volume,
+            "duck": duck_volume if duck_volume is not None else self.default_duck_volume,
+        }
         vocals_track = output_path.parent / "dubbed_vocals_track.wav"
-        await self._create_vocals_track(dubbed_segments, vocals_track, total_duration)
 
-        # Build FFmpeg filter for mixing
-        inputs = []
-        filter_parts = []
-
-        # Input 0: Dubbed vocals
-        inputs.extend(["-i", str(vocals_track)])
-        filter_parts.append(f"[0:a]volume={vocal_vol}[vocals]")
-
-        # Input 1: BGM
-        inputs.extend(["-i", str(bgm_path)])
-        filter_parts.append(f"[1:a]volume={bgm_vol}[bgm]")
-
-        # Input 2: SFX (optional)
-        if sfx_path and sfx_path.exists():
-            inputs.extend(["-i", str(sfx_path)])
-            filter_parts.append(f"[2:a]volume={sfx_vol}[sfx]")
-            mix_inputs = "[vocals][bgm][sfx]"
-            mix_count = 3
-        else:
-            mix_inputs = "[vocals][bgm]"
-            mix_count = 2
-
-        # Amix filter to combine all tracks
-        filter_parts.append(f"{mix_inputs}amix=inputs={mix_count}:duration=longest[out]")
-
-        filter_complex = ";".join(filter_parts)
-
-        cmd = [
-            "ffmpeg", "-y",
-            *inputs,
-            "-filter_complex", filter_complex,
-            "-map", "[out]",
-            "-t", str(total_duration),
-            "-acodec", "pcm_s16le",
-            "-ar", "44100",
-            "-ac", "2",
-            str(output_path)
-        ]
-
-        logger.info(f"Mixing audio tracks...")
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+        logger.info("Mixing audio tracks...")
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            _mixer_executor,
+            self._mix_sync,
+            dubbed_segments, bgm_path, sfx_path, vocals_track, output_path,
+            total_duration, volumes,
         )
-        _, stderr = await proc.communicate()
-
-        if proc.returncode != 0:
-            raise RuntimeError(f"FFmpeg mixing failed: {stderr.decode()}")
-
-        # Cleanup temp file
-        vocals_track.unlink(missing_ok=True)
 
         logger.info(f"Mixed audio saved to: {output_path}")
         return output_path
@@ -149,61 +302,126 @@ class AudioMixerWorker:
         Returns:
             Path to vocal track
         """
-        # Filter segments with valid dubbed audio
-        valid_segments = [
-            s for s in dubbed_segments
-            if s.get("dubbed_path") and Path(s["dubbed_path"]).exists()
-        ]
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            _mixer_executor,
+            self._mix_sync,
+            dubbed_segments, None, None, output_path, None, total_duration, None,
+        )
+        logger.info(f"Created vocals track: {output_path}")
+        return output_path
 
-        if not valid_segments:
-            # Create silent track if no dubbed audio
-            await self._create_silence(output_path, total_duration)
-            return output_path
-
-        # Build FFmpeg filter to place segments at correct times
-        inputs = []
-        filter_parts = []
-        adelay_parts = []
-
-        for i, seg in enumerate(valid_segments):
-            inputs.extend(["-i", str(seg["dubbed_path"])])
-            # Convert start time to milliseconds for adelay filter
-            delay_ms = int(seg["start"] * 1000)
-            adelay_parts.append(f"[{i}:a]adelay={delay_ms}|{delay_ms}[a{i}]")
-
-        # Build amix with all delayed segments
-        if len(valid_segments) == 1:
-            mix_filter = adelay_parts[0].replace(f"[a0]", "[out]")
-            filter_complex = mix_filter
-        else:
-            filter_complex = ";".join(adelay_parts)
-            mix_inputs = "".join(f"[a{i}]" for i in range(len(valid_segments)))
-            filter_complex += f";{mix_inputs}amix=inputs={len(valid_segments)}:duration=longest[out]"
+    def _place_segments(
+        self,
+        dubbed_segments: List[Dict],
+        buffer: np.ndarray,
+    ) -> List[Tuple[int, int]]:
+        """Add each segment's audio into the buffer at its start.
 
-        cmd = [
-            "ffmpeg", "-y",
-            *inputs,
-            "-filter_complex", filter_complex,
-            "-map", "[out]",
-            "-t", str(total_duration),
-            "-acodec", "pcm_s16le",
-            "-ar", "44100",
-            "-ac", "2",
-            str(output_path)
-        ]
+        A segment may run until the next segment starts (or its own end,
+        if later); longer audio is compressed by up to ``max_stretch`` and
+        then cut.
 
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+        Returns:
+            Sorted (start, end) frame ranges covered by dubbed speech
+        """
+        total = len(buffer)
+        valid = sorted(
+            (
+                s for s in dubbed_segments
+                if s.get("dubbed_path") and Path(s["dubbed_path"]).exists()
+            ),
+            key=lambda s: s["start"],
         )
-        _, stderr = await proc.communicate()
-
-        if proc.returncode != 0:
-            raise RuntimeError(f"Failed to create vocals track: {stderr.decode()}")
-
-        logger.info(f"Created vocals track: {output_path}")
-        return output_path
+        starts = [min(total, max(0, int(round(s["start"] * SAMPLE_RATE)))) for s in valid]
+
+        intervals = []
+        for i, seg in enumerate(valid):
+            start = starts[i]
+            next_start = starts[i + 1] if i + 1 < len(valid) else total
+            slot_end = min(total, max(next_start, int(round(seg["end"] * SAMPLE_RATE))))
+            try:
+                samples = _read_segment(Path(seg["dubbed_path"]))
+            except Exception as e:
+                logger.error(f"Failed to read dubbed segment {seg.get('id')}: {e}")
+                continue
+            samples = _fit_to_slot(samples, slot_end - start, self.max_stretch)
+            if len(samples) == 0:
+                continue
+            buffer[start:start + len(samples)] += samples
+            intervals.append((start, start + len(samples)))
+
+        logger.info(f"Placed {len(intervals)}/{len(dubbed_segments)} dubbed segments")
+        return intervals
+
+    def _mix_sync(
+        self,
+        dubbed_segments: List[Dict],
+        bgm_path: Optional[Path],
+        sfx_path: Optional[Path],
+        vocals_path: Path,
+        output_path: Optional[Path],
+        total_duration: float,
+        volumes: Optional[Dict[str, float]],
+    ) -> None:
+        """Assemble the vocal track and (with output_path) the mix in one pass."""
+        total = max(1, int(round(total_duration * SAMPLE_RATE)))
+        scratch_path = vocals_path.with_suffix(".f32")
+        buffer = np.memmap(scratch_path, dtype=np.float32, mode="w+", shape=(total, CHANNELS))
+        tmp_paths = [vocals_path.with_name(vocals_path.name + ".tmp")]
+        if output_path is not None:
+            tmp_paths.append(output_path.with_name(output_path.name + ".tmp"))
+        writers = []
+        tracks: List[Tuple[_TrackReader, float]] = []
+        try:
+            intervals = self._place_segments(dubbed_segments, buffer)
+            starts = [start for start, _ in intervals]
+            writers = [_open_wav_writer(path) for path in tmp_paths]
+            if output_path is not None:
+                tracks = [
+                    (_TrackReader(bgm_path), volumes["bgm"]),
+                    (_TrackReader(sfx_path), volumes["sfx"]),
+                ]
+            ramp = max(1, int(self.duck_ramp * SAMPLE_RATE))
+
+            for block_start in range(0, total, _BLOCK_FRAMES):
+                block_end = min(total, block_start + _BLOCK_FRAMES)
+                vocals = np.asarray(buffer[block_start:block_end])
+                writers[0].writeframes(_to_pcm(vocals))
+                if output_path is None:
+                    continue
+
+                mix = vocals * volumes["vocals"]
+                gain = None
+                if volumes["duck"] < 1.0:
+                    gain = _duck_gain(
+                        intervals, starts, block_start, block_end, volumes["duck"], ramp
+                    )
+                for reader, volume in tracks:
+                    block = reader.read(block_end - block_start)
+                    if block is None:
+                        continue
+                    block *= volume
+                    if gain is not None:
+                        block *= gain[:, None]
+                    mix += block
+                writers[1].writeframes(_to_pcm(mix))
+
+            for writer in writers:
+                writer.close()
+            tmp_paths[0].replace(vocals_path)
+            if output_path is not None:
+                tmp_paths[1].replace(output_path)
+        finally:
+            for reader, _ in tracks:
+                reader.close()
+            for writer in writers:
+                writer.close()
+            for path in tmp_paths:
+                path.unlink(missing_ok=True)
+            del buffer
+            scratch_path.unlink(missing_ok=True)
 
     async def _create_silence(self, output_path: Path, duration: float) -> Path:
         """Create a silent audio file."""
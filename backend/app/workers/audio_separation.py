@@ -1,13 +1,43 @@
-"""Audio Separation Worker - Separate vocals, BGM, and SFX using Demucs."""
+"""Audio Separation Worker - Separate vocals, BGM, and SFX using Demucs.
+
+Long tracks are separated in overlapping windows sized from a memory
+budget. Each window's stems are crossfaded with the previous window over
+the overlap and appended to the output WAVs, so peak memory depends on
+the window length, not on the track duration.
+"""
 
 import asyncio
 import logging
 import shutil
+import subprocess
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Demucs models work on 44.1 kHz stereo
+SAMPLE_RATE = 44100
+CHANNELS = 2
+
+# Shortest separation window; Demucs needs context around each note
+MIN_WINDOW_SECONDS = 30.0
+
+# Model weights and the activations of one Demucs segment (split=True)
+_MODEL_OVERHEAD_MB = 512
+
+# Float32 stereo buffers per window frame: the input, its tensor copy,
+# four model sources, apply_model's accumulators and the three stems
+_BYTES_PER_FRAME = CHANNELS * 4 * (1 + 1 + 4 + 4 + 3)
+
+# Separation runs one window at a time; the model uses its own threads
+_separation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="separation")
+
 # Check if demucs is available
 try:
     import torch
@@ -18,6 +48,189 @@ except ImportError:
     logger.warning("Demucs dependencies not installed. Audio separation will use FFmpeg fallback.")
 
 
+def plan_window(memory_mb: float, crossfade_seconds: float) -> Tuple[int, int]:
+    """Size the separation windows for a peak memory budget.
+
+    Args:
+        memory_mb: Peak memory budget in MB, including the model
+        crossfade_seconds: Overlap between consecutive windows
+
+    Returns:
+        (window frames, crossfade frames) at SAMPLE_RATE
+    """
+    crossfade = max(0, int(crossfade_seconds * SAMPLE_RATE))
+    available = (memory_mb - _MODEL_OVERHEAD_MB) * 2**20
+    window = int(available // _BYTES_PER_FRAME)
+    minimum = max(int(MIN_WINDOW_SECONDS * SAMPLE_RATE), 2 * crossfade)
+    if window < minimum:
+        logger.warning(
+            f"Separation memory budget of {memory_mb} MB is too small, "
+            f"using {minimum / SAMPLE_RATE:.0f}s windows"
+        )
+        window = minimum
+    return window, crossfade
+
+
+class _StereoReader:
+    """Reads audio as 44.1 kHz stereo float32 blocks.
+
+    44.1 kHz PCM WAV (what extract_audio writes) is read directly; other
+    files are decoded through an ffmpeg pipe.
+    """
+
+    def __init__(self, audio_path: Path):
+        self._wav = None
+        self._proc = None
+        try:
+            wav = wave.open(str(audio_path), "rb")
+        except (wave.Error, EOFError):
+            wav = None
+        if wav is not None and wav.getframerate() == SAMPLE_RATE:
+            self._wav = wav
+            self._channels = wav.getnchannels()
+            self._width = wav.getsampwidth()
+            return
+        if wav is not None:
+            wav.close()
+        self._proc = subprocess.Popen(
+            [
+                "ffmpeg", "-nostdin", "-v", "error", "-i", str(audio_path),
+                "-ac", str(CHANNELS), "-ar", str(SAMPLE_RATE), "-f", "f32le", "-",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+    def read(self, frames: int) -> np.ndarray:
+        """Read up to ``frames`` frames as a (2, n) array; empty at the end."""
+        from app.workers.waveform import _pcm_to_float
+
+        if self._wav is not None:
+            samples = _pcm_to_float(self._wav.readframes(frames), self._width)
+            samples = samples.reshape(-1, self._channels)
+            if self._channels == 1:
+                samples = np.repeat(samples, CHANNELS, axis=1)
+            return np.ascontiguousarray(samples[:, :CHANNELS].T)
+
+        data = self._proc.stdout.read(frames * CHANNELS * 4)
+        if not data:
+            if self._proc.wait() != 0:
+                raise RuntimeError(f"Failed to decode audio: {self._proc.stderr.read().decode()}")
+        return np.frombuffer(data, dtype="<f4").reshape(-1, CHANNELS).T.copy()
+
+    def close(self) -> None:
+        if self._wav is not None:
+            self._wav.close()
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.wait()
+
+
+def _iter_windows(reader: _StereoReader, window: int, crossfade: int) -> Iterator[np.ndarray]:
+    """Yield (2, n) windows; each starts with the last ``crossfade`` frames of the previous."""
+    overlap = np.zeros((CHANNELS, 0), dtype=np.float32)
+    while True:
+        new = reader.read(window - overlap.shape[1])
+        if new.shape[1] == 0:
+            return
+        mix = np.concatenate([overlap, new], axis=1) if overlap.shape[1] else new
+        yield mix
+        overlap = mix[:, mix.shape[1] - min(crossfade, mix.shape[1]):]
+
+
+class _StemWriter:
+    """Crossfades stem windows and appends them to 16-bit WAV files."""
+
+    def __init__(self, paths: Sequence[Path], crossfade: int):
+        self._paths = list(paths)
+        self._tmp_paths = [path.with_name(path.name + ".tmp") for path in self._paths]
+        self._crossfade = crossfade
+        self._tail: Optional[np.ndarray] = None
+        self.frames = 0
+        self._files = []
+        for tmp_path in self._tmp_paths:
+            f = wave.open(str(tmp_path), "wb")
+            f.setnchannels(CHANNELS)
+            f.setsampwidth(2)
+            f.setframerate(SAMPLE_RATE)
+            self._files.append(f)
+
+    def push(self, stems: np.ndarray) -> None:
+        """Add the (stems, 2, n) output of the next window."""
+        if self._tail is not None:
+            # The window starts with the previous window's last frames
+            overlap = self._tail.shape[-1]
+            fade_in = ((np.arange(overlap, dtype=np.float32) + 0.5) / overlap)
+            stems = stems.copy()
+            stems[..., :overlap] = (
+                self._tail * (1.0 - fade_in) + stems[..., :overlap] * fade_in
+            )
+        keep = min(self._crossfade, stems.shape[-1])
+        self._write(stems[..., :stems.shape[-1] - keep])
+        self._tail = stems[..., stems.shape[-1] - keep:]
+
+    def close(self) -> None:
+        """Write the last window's tail and move the files into place."""
+        if self._tail is not None:
+            self._write(self._tail)
+            self._tail = None
+        for f in self._files:
+            f.close()
+        for tmp_path, path in zip(self._tmp_paths, self._paths):
+            tmp_path.replace(path)
+
+    def abort(self) -> None:
+        for f in self._files:
+            f.close()
+        for tmp_path in self._tmp_paths:
+            tmp_path.unlink(missing_ok=True)
+
+    def _write(self, stems: np.ndarray) -> None:
+        if stems.shape[-1] == 0:
+            return
+        pcm = np.clip(stems, -1.0, 1.0) * 32767
+        for f, stem in zip(self._files, pcm):
+            f.writeframes(stem.T.astype("<i2").tobytes())
+        self.frames += stems.shape[-1]
+
+
+def separate_streaming(
+    audio_path: Path,
+    output_paths: Sequence[Path],
+    separate_window: Callable[[np.ndarray], np.ndarray],
+    window_frames: int,
+    crossfade_frames: int,
+) -> int:
+    """Separate an audio file window by window into stem WAV files.
+
+    Args:
+        audio_path: Input audio file
+        output_paths: One output WAV per stem
+        separate_window: Maps a (2, n) float32 mix to (stems, 2, n)
+        window_frames: Frames per window, including the overlap
+        crossfade_frames: Frames shared by consecutive windows
+
+    Returns:
+        Number of frames written per stem
+    """
+    reader = _StereoReader(audio_path)
+    writer = _StemWriter(output_paths, crossfade_frames)
+    try:
+        for index, mix in enumerate(_iter_windows(reader, window_frames, crossfade_frames)):
+            logger.info(
+                f"Separating window {index + 1} at {writer.frames / SAMPLE_RATE:.0f}s "
+                f"({mix.shape[1] / SAMPLE_RATE:.0f}s)"
+            )
+            writer.push(separate_window(mix))
+        writer.close()
+    except BaseException:
+        writer.abort()
+        raise
+    finally:
+        reader.close()
+    return writer.frames
+
+
 class AudioSeparationWorker:
     """
     Worker to separate audio into vocals, background music, and sound effects.
@@ -26,16 +239,23 @@ class AudioSeparationWorker:
     Falls back to basic FFmpeg filtering if Demucs is not available.
     """
 
-    def __init__(self, model_name: str = "htdemucs", device: Optional[str] = None):
+    def __init__(
+        self,
+        model_name: str = "htdemucs",
+        device: Optional[str] = None,
+        memory_mb: Optional[int] = None,
+    ):
         """
         Initialize the audio separation worker.
 
         Args:
             model_name: Demucs model to use (htdemucs, htdemucs_ft, mdx_extra)
             device: Device to run on (cuda, cpu, or None for auto)
+            memory_mb: Peak memory budget for separation (default: settings)
         """
         self.model_name = model_name
         self.model = None
+        self.memory_mb = memory_mb or settings.separation_memory_mb
 
         if device is None:
             self.device = "cuda" if DEMUCS_AVAILABLE and torch.cuda.is_available() else "cpu"
@@ -109,71 +329,54 @@ class AudioSeparationWorker:
         shifts: int,
         overlap: float,
     ):
-        """Separate audio using Demucs model."""
+        """Separate audio using Demucs model, one memory-bounded window at a time."""
         self._load_model()
 
         from demucs.apply import apply_model
         import torch
-        import torchaudio
-
-        # Load audio
-        logger.info(f"Loading audio: {audio_path}")
-        waveform, sample_rate = torchaudio.load(audio_path)
 
-        # Resample to model's sample rate if needed (Demucs uses 44100)
-        if sample_rate != 44100:
-            logger.info(f"Resampling from {sample_rate} to 44100")
-            resampler = torchaudio.transforms.Resample(sample_rate, 44100)
-            waveform = resampler(waveform)
-            sample_rate = 44100
+        sources = list(self.model.sources)
+        vocals = sources.index("vocals")
+        drums = sources.index("drums")
+        bgm = [i for i, name in enumerate(sources) if name not in ("vocals", "drums")]
 
-        # Ensure stereo
-        if waveform.shape[0] == 1:
-            waveform = waveform.repeat(2, 1)
-        elif waveform.shape[0] > 2:
-            waveform = waveform[:2]
-
-        # Add batch dimension
-        waveform = waveform.unsqueeze(0).to(self.device)
-
-        # Apply model
-        logger.info("Separating audio with Demucs...")
-
-        def _apply():
+        def separate_window(mix: np.ndarray) -> np.ndarray:
+            waveform = torch.from_numpy(mix).unsqueeze(0).to(self.device)
             with torch.no_grad():
-                return apply_model(
+                out = apply_model(
                     self.model,
                     waveform,
                     shifts=shifts,
                     overlap=overlap,
-                    progress=True,
+                    progress=False,
                 )
+            # Sources shape: [batch, sources, channels, samples]
+            out = out.squeeze(0).cpu().numpy()
+            # Vocals, BGM (bass + other), SFX (drums)
+            return np.stack([out[vocals], out[bgm].sum(axis=0), out[drums]])
+
+        window, crossfade = plan_window(self.memory_mb, settings.separation_crossfade_seconds)
+        logger.info(
+            f"Separating {audio_path} with Demucs in {window / SAMPLE_RATE:.0f}s windows "
+            f"({self.memory_mb} MB budget)"
+        )
 
-        # Run in thread pool to not block event loop
-        loop = asyncio.get_event_loop()
-        sources = await loop.run_in_executor(None, _apply)
-
-        # Sources shape: [batch, sources, channels, samples]
-        # htdemucs sources: drums, bass, other, vocals
-        sources = sources.squeeze(0).cpu()
-
-        # Get source indices (htdemucs order: drums, bass, other, vocals)
-        vocals = sources[3]  # vocals
-        drums = sources[0]   # drums (part of SFX)
-        bass = sources[1]    # bass (part of BGM)
-        other = sources[2]   # other (part of BGM)
-
-        # Combine for BGM (bass + other) and SFX (drums)
-        bgm = bass + other
-        sfx = drums
-
-        # Save separated audio
-        logger.info("Saving separated audio...")
-        torchaudio.save(str(vocals_path), vocals, sample_rate)
-        torchaudio.save(str(bgm_path), bgm, sample_rate)
-        torchaudio.save(str(sfx_path), sfx, sample_rate)
+        # Run in a worker thread to not block the event loop
+        loop = asyncio.get_running_loop()
+        frames = await loop.run_in_executor(
+            _separation_executor,
+            separate_streaming,
+            audio_path,
+            (vocals_path, bgm_path, sfx_path),
+            separate_window,
+            window,
+            crossfade,
+        )
 
-        logger.info(f"Audio separation complete: {vocals_path}, {bgm_path}, {sfx_path}")
+        logger.info(
+            f"Audio separation complete ({frames / SAMPLE_RATE:.0f}s): "
+            f"{vocals_path}, {bgm_path}, {sfx_path}"
+        )
 
     async def _separate_with_ffmpeg(
         self,
@@ -269,6 +472,7 @@ class AudioSeparationWorker:
             "demucs_available": DEMUCS_AVAILABLE,
             "device": self.device,
             "model_name": self.model_name,
+            "memory_mb": self.memory_mb,
         }
 
         if DEMUCS_AVAILABLE:
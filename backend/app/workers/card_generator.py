@@ -2,10 +2,16 @@
 
 Uses TomTrove's dictionary and entity services for high-quality card data.
 Auto-translates entity descriptions when Chinese localization is missing.
+
+Identical lookups in flight at the same time (several reviewers opening the
+same video, an export prefetching the same words) share one fetch, and
+results are kept in memory for ``settings.card_lookup_ttl_seconds``.
 """
 
 import asyncio
-from typing import List, Optional
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, List, Optional, Tuple
 import httpx
 from loguru import logger
 
@@ -19,7 +25,7 @@ from app.models.card import (
     WordSense,
     EntityLocalization,
 )
-from app.services.card_cache import CardCache
+from app.services.card_cache import CardCache, get_card_cache
 from app.services.azure_translator import azure_translator
 
 
@@ -35,15 +41,21 @@ class CardGeneratorWorker:
         """Initialize card generator.
 
         Args:
-            card_cache: Optional card cache for storing results.
+            card_cache: Card cache for storing results (default: the shared cache).
         """
-        self.cache = card_cache or CardCache()
+        self.cache = card_cache or get_card_cache()
         self.http_client: Optional[httpx.AsyncClient] = None
 
         # TomTrove API settings
         self.tomtrove_url = settings.tomtrove_api_url
         self.tomtrove_key = settings.tomtrove_api_key
 
+        # Single-flight lookups: (type, id, lang, use_cache) -> shared fetch task
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        # Recent results: (type, id, lang) -> (expires_at, card or None)
+        self._recent: "OrderedDict[tuple, Tuple[float, object]]" = OrderedDict()
+        self.lookup_stats = {"hits": 0, "misses": 0, "coalesced": 0}
+
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client with TomTrove auth headers."""
         if self.http_client is None or self.http_client.is_closed:
@@ -97,6 +109,97 @@ class CardGeneratorWorker:
         """Check if TomTrove API is configured."""
         return bool(self.tomtrove_url and self.tomtrove_key)
 
+    # ============ Lookup Coalescing ============
+
+    async def _single_flight(
+        self,
+        key: tuple,
+        use_cache: bool,
+        fetch: Callable[[], Awaitable[Optional[object]]],
+    ):
+        """Run ``fetch`` once for all concurrent callers with the same key.
+
+        Args:
+            key: (card type, id, lang) of the lookup, lang normalized by
+                ``_normalize_lang_for_tomtrove`` as in the card cache keys.
+            use_cache: Whether recent results may answer the lookup. Forced
+                refreshes only coalesce with other forced refreshes.
+            fetch: Coroutine function doing the actual lookup.
+
+        Returns:
+            A copy of the card (callers may modify it), or None.
+        """
+        if use_cache:
+            entry = self._recent.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._recent.move_to_end(key)
+                self.lookup_stats["hits"] += 1
+                return self._copy(entry[1])
+
+        flight = (*key, use_cache)
+        task = self._inflight.get(flight)
+        if task is None:
+            self.lookup_stats["misses"] += 1
+            task = asyncio.ensure_future(fetch())
+            self._inflight[flight] = task
+            task.add_done_callback(lambda done: self._land(flight, done))
+        else:
+            self.lookup_stats["coalesced"] += 1
+
+        # Shielded so a cancelled caller does not cancel the others' fetch
+        return self._copy(await asyncio.shield(task))
+
+    def _land(self, flight: tuple, task: asyncio.Task) -> None:
+        """Retire a finished fetch and remember its result."""
+        self._inflight.pop(flight, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        use_cache = flight[-1]
+        if not use_cache and task.result() is None:
+            # A failed forced refresh says nothing about the card on disk
+            return
+        key = flight[:-1]
+        self._recent[key] = (time.monotonic() + settings.card_lookup_ttl_seconds, task.result())
+        self._recent.move_to_end(key)
+        while len(self._recent) > settings.card_lookup_cache_items:
+            self._recent.popitem(last=False)
+
+    @staticmethod
+    def _copy(card):
+        return card.model_copy(deep=True) if card is not None else None
+
+    @staticmethod
+    def _lookup_id(card_type: str, card_id: str) -> str:
+        """Normalize a card ID the way lookups of ``card_type`` key it."""
+        if card_type == "word":
+            return card_id.lower().strip()
+        if card_type == "entity":
+            return card_id.upper().strip()
+        return card_id.strip()
+
+    def forget(self, card_type: str, card_id: str) -> None:
+        """Drop recent results for a card after it was changed or deleted elsewhere.
+
+        Args:
+            card_type: "word", "entity" or "idiom".
+            card_id: The word, entity ID or idiom text, normalized like lookups.
+        """
+        card_id = self._lookup_id(card_type, card_id)
+        for key in [k for k in self._recent if k[0] == card_type and k[1] == card_id]:
+            del self._recent[key]
+
+    def get_lookup_stats(self) -> dict:
+        """Get lookup coalescing statistics.
+
+        Returns:
+            Dict with hit/miss/coalesced counts and in-flight/recent sizes.
+        """
+        return {
+            **self.lookup_stats,
+            "in_flight": len(self._inflight),
+            "recent": len(self._recent),
+        }
+
     # ============ Word Card Generation ============
 
     # Common English suffixes and their base form transformations
@@ -175,7 +278,19 @@ class CardGeneratorWorker:
         Returns:
             WordCard or None if not found.
         """
-        word = word.lower().strip()
+        word = self._lookup_id("word", word)
+        key = ("word", word, self._normalize_lang_for_tomtrove(target_lang))
+        return await self._single_flight(
+            key, use_cache, lambda: self._lookup_word_card(word, use_cache, target_lang)
+        )
+
+    async def _lookup_word_card(
+        self,
+        word: str,
+        use_cache: bool,
+        target_lang: Optional[str],
+    ) -> Optional[WordCard]:
+        """Look up a word card in the card cache, then TomTrove (see get_word_card)."""
         force_refresh = not use_cache
 
         # Normalize language code for TomTrove
@@ -540,7 +655,20 @@ class CardGeneratorWorker:
         Returns:
             EntityCard or None.
         """
-        entity_id = entity_id.upper().strip()
+        entity_id = self._lookup_id("entity", entity_id)
+        return await self._single_flight(
+            ("entity", entity_id, self._normalize_lang_for_tomtrove(target_lang)),
+            use_cache,
+            lambda: self._lookup_entity_card(entity_id, use_cache, target_lang),
+        )
+
+    async def _lookup_entity_card(
+        self,
+        entity_id: str,
+        use_cache: bool,
+        target_lang: Optional[str],
+    ) -> Optional[EntityCard]:
+        """Look up an entity card in the card cache, then TomTrove (see get_entity_card)."""
         force_refresh = not use_cache
 
         # Check cache first
@@ -755,6 +883,7 @@ Return ONLY the JSON, no other text."""
 
             # Cache the generated card
             self.cache.set_entity_card(card)
+            self.forget("entity", entity_id)
 
             logger.info(f"Generated LLM entity card for '{text}' -> {entity_id}")
             return card
@@ -1134,8 +1263,20 @@ Return ONLY the JSON, no other text."""
         Returns:
             IdiomCard or None if not found.
         """
-        idiom_text = idiom_text.strip()
-
+        idiom_text = self._lookup_id("idiom", idiom_text)
+        return await self._single_flight(
+            ("idiom", idiom_text, self._normalize_lang_for_tomtrove(lang)),
+            use_cache,
+            lambda: self._lookup_idiom_card(idiom_text, use_cache, lang),
+        )
+
+    async def _lookup_idiom_card(
+        self,
+        idiom_text: str,
+        use_cache: bool,
+        lang: Optional[str],
+    ) -> Optional[IdiomCard]:
+        """Look up an idiom card in the card cache, then TomTrove (see get_idiom_card)."""
         # Check cache first
         if use_cache:
             cached = self.cache.get_idiom_card(idiom_text)
@@ -0,0 +1,205 @@
+"""Concurrent prefetch of pinned-card data and images.
+
+Export used to resolve pinned cards one at a time (disk cache, then the
+card API on a miss) and then download their images one at a time, all on
+the export's critical path. Here every distinct (card type, card id) is
+resolved concurrently, bounded by ``card_prefetch_concurrency``, and the
+images are downloaded through the shared image store.
+
+Prefetch starts when a card is pinned and when an export is triggered, so
+by the time the export renders stills the data and images are on disk.
+Lookups and downloads already in flight are shared: a card requested by
+the export while its prefetch is still running is fetched once.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from app.config import settings
+from app.models.timeline import PinnedCard
+from app.services.image_store import card_image_urls, get_image_store
+
+CardKey = Tuple[str, str]  # (card type, card id)
+# (card_data, source) where source is "cache", "api", "missing" or "error"
+Resolved = Tuple[Optional[dict], str]
+
+_inflight_cards: Dict[CardKey, "asyncio.Future[Resolved]"] = {}
+_inflight_images: Dict[str, "asyncio.Future[bool]"] = {}
+_card_generator = None
+
+
+def card_key(card: PinnedCard) -> CardKey:
+    card_type = card.card_type.value if hasattr(card.card_type, "value") else card.card_type
+    return card_type, card.card_id
+
+
+def set_card_generator(generator) -> None:
+    """Set the card generator instance (the app's shared one)."""
+    global _card_generator
+    _card_generator = generator
+
+
+def _default_generator():
+    """The shared card generator, or one of our own outside the app (scripts)."""
+    global _card_generator
+    if _card_generator is None:
+        from app.workers.card_generator import CardGeneratorWorker
+
+        _card_generator = CardGeneratorWorker()
+    return _card_generator
+
+
+async def _load_card(key: CardKey, card_generator) -> Resolved:
+    """Card data for one key: disk cache first, then the card API."""
+    card_type, card_id = key
+    cache = card_generator.cache
+    lookups = {
+        "word": (cache.get_word_card, card_generator.get_word_card),
+        "entity": (cache.get_entity_card, card_generator.get_entity_card),
+        "idiom": (cache.get_idiom_card, card_generator.get_idiom_card),
+    }
+    if card_type not in lookups:
+        return None, "missing"
+    from_cache, from_api = lookups[card_type]
+
+    cached = await asyncio.to_thread(from_cache, card_id)
+    if cached:
+        return cached.model_dump(mode="json"), "cache"
+    try:
+        fetched = await from_api(card_id)
+    except Exception as e:
+        logger.warning(f"Card {card_type}:{card_id} API fetch failed: {e}")
+        return None, "error"
+    if fetched:
+        return fetched.model_dump(mode="json"), "api"
+    return None, "missing"
+
+
+async def _shared(inflight: dict, key, start: Callable[[], Awaitable]):
+    """Await the in-flight task for ``key``, starting it if there is none.
+
+    The task is shielded so a cancelled caller does not cancel it for the
+    others waiting on it.
+    """
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(start())
+        inflight[key] = task
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+    return await asyncio.shield(task)
+
+
+async def resolve_cards(
+    keys: Sequence[CardKey],
+    card_generator=None,
+    concurrency: Optional[int] = None,
+) -> Dict[CardKey, Resolved]:
+    """Resolve card data for ``keys`` concurrently, once per distinct key.
+
+    Args:
+        keys: (card type, card id) pairs; duplicates are looked up once
+        card_generator: CardGeneratorWorker (default: a shared instance)
+        concurrency: Lookups at once (default: card_prefetch_concurrency)
+
+    Returns:
+        Map of key -> (card_data or None, source)
+    """
+    card_generator = card_generator or _default_generator()
+    semaphore = asyncio.Semaphore(concurrency or settings.card_prefetch_concurrency)
+
+    async def load(key: CardKey) -> Resolved:
+        async with semaphore:
+            return await _load_card(key, card_generator)
+
+    unique = list(dict.fromkeys(keys))
+    results = await asyncio.gather(
+        *(_shared(_inflight_cards, key, lambda key=key: load(key)) for key in unique)
+    )
+    return dict(zip(unique, results))
+
+
+async def download_images(cards: Sequence[Tuple[str, Optional[dict]]], concurrency: Optional[int] = None) -> int:
+    """Download the images of (card type, card_data) pairs into the image cache.
+
+    Returns:
+        Number of images cached (including ones already on disk)
+    """
+    store = get_image_store()
+    urls = list(dict.fromkeys(
+        url for card_type, card_data in cards for url in card_image_urls(card_data, card_type)
+    ))
+    if not urls:
+        return 0
+    semaphore = asyncio.Semaphore(concurrency or settings.card_prefetch_concurrency)
+
+    async def download(url: str) -> bool:
+        async with semaphore:
+            return await store.fetch(url) is not None
+
+    results = await asyncio.gather(
+        *(_shared(_inflight_images, url, lambda url=url: download(url)) for url in urls)
+    )
+    cached = sum(results)
+    logger.info(f"Card images: {cached}/{len(urls)} cached")
+    return cached
+
+
+async def prefetch_cards(pinned_cards: Sequence[PinnedCard], card_generator=None) -> None:
+    """Warm the card cache and image cache for pinned cards.
+
+    Does not modify the cards; meant to run in the background at pin time
+    and when an export is triggered. Failures are logged, never raised.
+    """
+    if not pinned_cards:
+        return
+    try:
+        resolved = await resolve_cards([card_key(c) for c in pinned_cards], card_generator)
+        await download_images([
+            (card_key(c)[0], resolved[card_key(c)][0] or c.card_data) for c in pinned_cards
+        ])
+    except Exception as e:
+        logger.warning(f"Card prefetch failed: {e}")
+
+
+async def load_cards(
+    pinned_cards: List[PinnedCard],
+    card_generator=None,
+    images: bool = True,
+) -> int:
+    """Fill in card_data of pinned cards: cache → API → embedded card_data.
+
+    Pinned cards only store card type, card id and timing; the full card
+    content comes from the most reliable source available. Cards with no
+    data anywhere keep an empty card_data.
+
+    Args:
+        pinned_cards: Cards to fill in (modified in place)
+        card_generator: CardGeneratorWorker (default: a shared instance)
+        images: Also download the cards' images
+
+    Returns:
+        Number of cards with data
+    """
+    resolved = await resolve_cards([card_key(c) for c in pinned_cards], card_generator)
+    counts: Dict[str, int] = {}
+    for card in pinned_cards:
+        card_type, card_id = card_key(card)
+        data, source = resolved[(card_type, card_id)]
+        if data:
+            card.card_data = data
+        elif card.card_data and isinstance(card.card_data, dict):
+            source = "embedded"
+        else:
+            logger.warning(f"Card {card.id} ({card_type}:{card_id}): no data available, skipping")
+        counts[source] = counts.get(source, 0) + 1
+
+    with_data = [c for c in pinned_cards if c.card_data and len(c.card_data) > 0]
+    logger.info(
+        f"Card data: {len(with_data)}/{len(pinned_cards)} cards "
+        f"({len(resolved)} distinct; " + ", ".join(f"{k}={v}" for k, v in sorted(counts.items())) + ")"
+    )
+    if images:
+        await download_images([(card_key(c)[0], c.card_data) for c in with_data])
+    return len(with_data)
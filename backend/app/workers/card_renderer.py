@@ -6,14 +6,13 @@ Supports two rendering modes:
 """
 
 import base64
-import hashlib
 import io
-import time
 from pathlib import Path
 from typing import Optional, Tuple, List
-from urllib.parse import urlparse
 from loguru import logger
 
+from app.services.image_store import cover_image, get_image_store
+
 try:
     from PIL import Image, ImageDraw, ImageFont
     PILLOW_AVAILABLE = True
@@ -22,147 +21,18 @@ except ImportError:
     logger.warning("Pillow not installed. Card rendering will not be available.")
 
 
-# Image cache directory for downloaded images
-IMAGE_CACHE_DIR = Path("data/cards/images")
-
-
-# Domain-specific headers — Wikimedia requires bot UA; Pixabay wants browser UA
-_WIKIMEDIA_HEADERS = {
-    "User-Agent": "SceneMindBot/1.0 (https://github.com/FreeAdam2023/BamianjingTV; scenemind@proton.me) python-httpx/0.27",
-}
-_BROWSER_HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-}
-# Track last download time for throttling
-_last_download_time: float = 0.0
-_DOWNLOAD_INTERVAL = 0.5  # seconds between downloads (gentle rate)
-
-
-def _headers_for_url(url: str) -> dict:
-    """Pick headers based on the image host."""
-    host = urlparse(url).hostname or ""
-    if "wikimedia" in host or "wikipedia" in host:
-        return _WIKIMEDIA_HEADERS
-    return _BROWSER_HEADERS
-
-
-def _download_image(url: str, throttle: bool = False) -> Optional[Image.Image]:
-    """Download an image from URL with caching.
+def _download_image(url: str, cover: Optional[Tuple[int, int]] = None) -> Optional[Image.Image]:
+    """Get an image from the shared image store, downloading it on a miss.
 
     Args:
-        url: Image URL to download
-        throttle: If True, wait between requests to avoid rate limits
+        url: Image URL
+        cover: (width, height) to scale and center-crop to; the resized
+            image is cached too, so repeated cards skip the resize
 
     Returns:
-        PIL Image or None on failure
-    """
-    if not url:
-        return None
-
-    # Check cache first
-    url_hash = hashlib.md5(url.encode()).hexdigest()
-    cache_path = IMAGE_CACHE_DIR / f"{url_hash}.png"
-
-    if cache_path.exists():
-        try:
-            return Image.open(cache_path).convert("RGBA")
-        except Exception:
-            pass
-
-    # Throttle if requested (batch downloads)
-    global _last_download_time
-    if throttle:
-        elapsed = time.monotonic() - _last_download_time
-        if elapsed < _DOWNLOAD_INTERVAL:
-            time.sleep(_DOWNLOAD_INTERVAL - elapsed)
-
-    # Download image with domain-specific headers
-    try:
-        import httpx
-
-        headers = _headers_for_url(url)
-        with httpx.Client(
-            timeout=15.0,
-            follow_redirects=True,
-            headers=headers,
-        ) as client:
-            response = client.get(url)
-
-            # Handle rate limiting with retry
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", 5))
-                logger.info(f"Rate limited, waiting {retry_after}s: {url}")
-                time.sleep(retry_after)
-                response = client.get(url)
-
-            response.raise_for_status()
-            img = Image.open(io.BytesIO(response.content)).convert("RGBA")
-
-            # Cache it
-            IMAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
-            img.save(cache_path, "PNG")
-            logger.debug(f"Cached image: {url} -> {cache_path}")
-            _last_download_time = time.monotonic()
-            return img
-    except Exception as e:
-        logger.warning(f"Failed to download image {url}: {e}")
-        _last_download_time = time.monotonic()
-        return None
-
-
-def _extract_image_urls(card_data: Optional[dict], card_type: str) -> list[str]:
-    """Extract image URLs from card data."""
-    if not card_data:
-        return []
-    if card_type == "entity" and card_data.get("image_url"):
-        return [card_data["image_url"]]
-    if card_type == "word":
-        return list(card_data.get("images", [])[:3])
-    return []
-
-
-def precache_card_images(card_data: Optional[dict], card_type: str) -> int:
-    """Pre-download and cache images from card data.
-
-    Called when a card is pinned so images are already local during export.
-    Returns the number of images successfully cached.
-    """
-    urls = _extract_image_urls(card_data, card_type)
-    cached = 0
-    for url in urls:
-        if _download_image(url, throttle=True) is not None:
-            cached += 1
-    if urls:
-        logger.info(f"Pre-cached {cached}/{len(urls)} images for {card_type} card")
-    return cached
-
-
-def batch_precache_images(
-    pinned_cards: list[dict],
-) -> int:
-    """Pre-download all images for a list of pinned cards before export.
-
-    Throttles requests to avoid triggering rate limits. Cards whose images
-    are already cached will be skipped (fast path via cache_path.exists()).
+        PIL Image (shared; do not modify) or None on failure
     """
-    total = 0
-    skipped = 0
-    for card in pinned_cards:
-        card_type = card.get("card_type", "")
-        card_data = card.get("card_data")
-        urls = _extract_image_urls(card_data, card_type)
-        for url in urls:
-            url_hash = hashlib.md5(url.encode()).hexdigest()
-            cache_path = IMAGE_CACHE_DIR / f"{url_hash}.png"
-            if cache_path.exists():
-                skipped += 1
-                continue
-            if _download_image(url, throttle=True) is not None:
-                total += 1
-    logger.info(
-        f"Batch pre-cache complete: {total} downloaded, {skipped} already cached"
-    )
-    return total
+    return get_image_store().get_image(url, cover=cover)
 
 
 class CardRenderer:
@@ -367,22 +237,9 @@ class CardRenderer:
         header_height: int,
     ) -> None:
         """Paste and scale an image into the header area with gradient overlay."""
-        # Scale image to fill header width, maintaining aspect ratio
-        aspect = header_img.width / header_img.height
-        if aspect >= panel_width / header_height:
-            # Image is wider - fit to height
-            new_h = header_height
-            new_w = int(header_height * aspect)
-        else:
-            # Image is taller - fit to width
-            new_w = panel_width
-            new_h = int(panel_width / aspect)
-
-        header_img = header_img.resize((new_w, new_h), Image.LANCZOS)
-        # Center crop to panel_width x header_height
-        x_off = (new_w - panel_width) // 2
-        y_off = (new_h - header_height) // 2
-        header_img = header_img.crop((x_off, y_off, x_off + panel_width, y_off + header_height))
+        if header_img.size != (panel_width, header_height):
+            # Scale to fill the header, maintaining aspect ratio, and center crop
+            header_img = cover_image(header_img, panel_width, header_height)
 
         # Paste image
         img.paste(header_img, (0, 0))
@@ -645,7 +502,7 @@ class CardRenderer:
 
         # Image header (~40% of panel height)
         header_height = int(panel_height * 0.3)
-        header_img = _download_image(image_url)
+        header_img = _download_image(image_url, cover=(panel_width, header_height))
         if header_img:
             self._paste_image_header(img, header_img, panel_width, header_height)
             draw = ImageDraw.Draw(img)  # Refresh draw after paste
@@ -763,7 +620,7 @@ class CardRenderer:
         # Image header
         header_height = 0
         if images:
-            header_img = _download_image(images[0])
+            header_img = _download_image(images[0], cover=(panel_width, int(panel_height * 0.25)))
             if header_img:
                 header_height = int(panel_height * 0.25)
                 self._paste_image_header(img, header_img, panel_width, header_height)
@@ -0,0 +1,308 @@
+"""Parallel transcription of long audio split at silences.
+
+Whisper decodes one file sequentially, so a multi-hour source keeps a
+single model instance busy for most of the job. Here the audio is cut
+into chunks at silences (ffmpeg silencedetect), the chunks are
+transcribed concurrently by several model instances, and the word
+timestamps are shifted back onto the source timeline before sentence
+re-segmentation.
+
+On CUDA the chunks run on threads sharing one WhisperModel loaded with
+``num_workers`` (CTranslate2 runs the requests in parallel). On CPU each
+chunk runs in a worker process with its own int8 model.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import re
+import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from app.config import settings
+from app.models.transcript import Transcript
+from app.services.process_runner import check_process, parse_ffmpeg_time
+
+# faster-whisper works on 16 kHz audio
+_SAMPLE_RATE = 16000
+
+# Chunks shorter than this are not worth a separate model call
+MIN_CHUNK_SECONDS = 60.0
+
+# silencedetect: quieter than this for at least this long counts as silence
+_SILENCE_NOISE_DB = -35
+_SILENCE_MIN_SECONDS = 0.5
+
+_SILENCE_START = re.compile(r"silence_start: (-?\d+(?:\.\d+)?)")
+_SILENCE_END = re.compile(r"silence_end: (-?\d+(?:\.\d+)?)")
+
+# Thread pools for chunks on a shared CUDA model, by worker count
+_thread_pools: Dict[int, ThreadPoolExecutor] = {}
+
+# Process pools for CPU chunks, by (model, compute type, worker count). Pools
+# are kept alive: concurrent jobs may be using a pool for another model.
+_process_pools: Dict[tuple, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+# Model of a CPU worker process (set by the pool initializer)
+_process_model = None
+
+
+def parse_silences(lines: Sequence[str]) -> List[Tuple[float, float]]:
+    """Extract (start, end) silence intervals from ffmpeg silencedetect output."""
+    silences = []
+    start = None
+    for line in lines:
+        match = _SILENCE_START.search(line)
+        if match:
+            start = max(0.0, float(match.group(1)))
+            continue
+        match = _SILENCE_END.search(line)
+        if match and start is not None:
+            silences.append((start, float(match.group(1))))
+            start = None
+    return silences
+
+
+async def detect_silences(audio_path: Path) -> Tuple[List[Tuple[float, float]], float]:
+    """Find silences in an audio file.
+
+    Returns:
+        (silence intervals in seconds, audio duration in seconds)
+    """
+    lines: List[str] = []
+    duration = 0.0
+
+    def on_line(line: str) -> None:
+        nonlocal duration
+        position = parse_ffmpeg_time(line)
+        if position is not None:
+            duration = max(duration, position)
+        elif "silence_" in line:
+            lines.append(line)
+
+    await check_process(
+        [
+            "ffmpeg", "-hide_banner", "-nostdin", "-i", str(audio_path),
+            "-af", f"silencedetect=noise={_SILENCE_NOISE_DB}dB:d={_SILENCE_MIN_SECONDS}",
+            "-f", "null", "-",
+        ],
+        on_stderr_line=on_line,
+        capture_stdout=False,
+    )
+    return parse_silences(lines), duration
+
+
+def plan_chunks(
+    silences: Sequence[Tuple[float, float]],
+    duration: float,
+    num_chunks: int,
+) -> List[Tuple[float, float]]:
+    """Split [0, duration] into about num_chunks chunks cut inside silences.
+
+    Each cut goes to the middle of the silence closest to the even split
+    point (within half a chunk). Without a silence nearby the cut falls
+    on the split point itself.
+
+    Returns:
+        (start, end) of each chunk in order, covering the whole duration
+    """
+    if num_chunks <= 1 or duration <= 0:
+        return [(0.0, duration)]
+
+    chunk_length = duration / num_chunks
+    midpoints = [(start + end) / 2 for start, end in silences]
+    cuts: List[float] = []
+    for i in range(1, num_chunks):
+        target = chunk_length * i
+        previous = cuts[-1] if cuts else 0.0
+        candidates = [
+            mid for mid in midpoints
+            if abs(mid - target) <= chunk_length / 2 and previous < mid < duration
+        ]
+        if candidates:
+            cut = min(candidates, key=lambda mid: abs(mid - target))
+        else:
+            logger.warning(f"No silence near {target:.1f}s, cutting audio mid-speech")
+            cut = target
+        if cut > previous:
+            cuts.append(cut)
+
+    bounds = [0.0, *cuts, duration]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def stitch_chunks(chunks: Sequence[Tuple[float, list]]) -> list:
+    """Shift each chunk's Whisper segments by its start offset and join them."""
+    from app.workers.whisper import _offset_segment
+
+    stitched = []
+    for offset, segments in chunks:
+        stitched.extend(_offset_segment(segment, offset) for segment in segments)
+    return stitched
+
+
+def _decode_chunk(audio_path: str, start: float, end: float):
+    """Decode [start, end) of an audio file to 16 kHz mono float32 samples."""
+    import numpy as np
+
+    pcm = subprocess.run(
+        [
+            "ffmpeg", "-nostdin", "-v", "error",
+            "-ss", f"{start:.3f}", "-t", f"{end - start:.3f}", "-i", audio_path,
+            "-ac", "1", "-ar", str(_SAMPLE_RATE), "-f", "s16le", "-",
+        ],
+        capture_output=True,
+        check=True,
+    ).stdout
+    return np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+def _transcribe_chunk(
+    model, audio_path: str, start: float, end: float, language: Optional[str]
+) -> Tuple[str, list]:
+    """Transcribe one chunk; timestamps are relative to the chunk start."""
+    segments_iter, info = model.transcribe(
+        _decode_chunk(audio_path, start, end),
+        language=language,
+        word_timestamps=True,
+        vad_filter=True,
+    )
+    # Plain objects so results can be returned from worker processes
+    segments = [
+        SimpleNamespace(
+            start=seg.start,
+            end=seg.end,
+            text=seg.text,
+            words=[
+                SimpleNamespace(start=w.start, end=w.end, word=w.word) for w in seg.words
+            ] if seg.words else None,
+        )
+        for seg in segments_iter
+    ]
+    return info.language, segments
+
+
+def _init_process_model(model_name: str, compute_type: str, cpu_threads: int) -> None:
+    """Load the Whisper model of a CPU worker process."""
+    global _process_model
+    from faster_whisper import WhisperModel
+
+    _process_model = WhisperModel(
+        model_name, device="cpu", compute_type=compute_type, cpu_threads=cpu_threads
+    )
+
+
+def _transcribe_chunk_in_process(
+    audio_path: str, start: float, end: float, language: Optional[str]
+) -> Tuple[str, list]:
+    return _transcribe_chunk(_process_model, audio_path, start, end, language)
+
+
+def _get_thread_pool(workers: int) -> ThreadPoolExecutor:
+    """Get the thread pool with ``workers`` threads for chunks on a shared model."""
+    with _pools_lock:
+        pool = _thread_pools.get(workers)
+        if pool is None:
+            pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="whisper-chunk")
+            _thread_pools[workers] = pool
+        return pool
+
+
+def _get_process_pool(model_name: str, workers: int) -> ProcessPoolExecutor:
+    """Get the CPU worker pool for a model and worker count."""
+    # float16 is GPU-only; int8 is the fast CPU type
+    compute_type = "int8" if settings.whisper_compute_type == "float16" else settings.whisper_compute_type
+    key = (model_name, compute_type, workers)
+    with _pools_lock:
+        pool = _process_pools.get(key)
+        if pool is None:
+            cpu_threads = max(1, (os.cpu_count() or 1) // workers)
+            logger.info(
+                f"Starting {workers} Whisper CPU workers ({model_name}, {compute_type}, "
+                f"{cpu_threads} threads each)"
+            )
+            # spawn: forking the threaded server process can deadlock the child
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_process_model,
+                initargs=(model_name, compute_type, cpu_threads),
+            )
+            _process_pools[key] = pool
+        return pool
+
+
+async def transcribe_chunked(
+    audio_path: Path,
+    language: Optional[str],
+    model_name: str,
+    workers: int,
+    model=None,
+    num_chunks: Optional[int] = None,
+) -> Optional[Transcript]:
+    """Transcribe audio in chunks on several model instances.
+
+    Args:
+        audio_path: Path to audio file
+        language: Source language code (auto-detect if None)
+        model_name: Whisper model to use
+        workers: Chunks transcribed at the same time
+        model: Shared WhisperModel loaded with ``num_workers`` (chunks run on
+            threads); None runs them in CPU worker processes
+        num_chunks: Number of chunks (default: by ``whisper_chunk_seconds``,
+            at least one per worker)
+
+    Returns:
+        Transcript, or None if the audio is too short to split
+    """
+    from app.workers.resegment import resegment_words
+
+    silences, duration = await detect_silences(audio_path)
+    if num_chunks is None:
+        num_chunks = max(workers, round(duration / settings.whisper_chunk_seconds))
+        num_chunks = min(num_chunks, int(duration // MIN_CHUNK_SECONDS))
+    chunks = plan_chunks(silences, duration, num_chunks)
+    if len(chunks) < 2:
+        return None
+
+    logger.info(
+        f"Transcribing {audio_path} in {len(chunks)} chunks on {workers} workers "
+        f"({duration:.0f}s, {len(silences)} silences)"
+    )
+    loop = asyncio.get_running_loop()
+    limit = asyncio.Semaphore(workers)
+
+    async def run_chunk(start: float, end: float, chunk_language: Optional[str]):
+        async with limit:
+            if model is not None:
+                return await loop.run_in_executor(
+                    _get_thread_pool(workers), _transcribe_chunk,
+                    model, str(audio_path), start, end, chunk_language,
+                )
+            return await loop.run_in_executor(
+                _get_process_pool(model_name, workers), _transcribe_chunk_in_process,
+                str(audio_path), start, end, chunk_language,
+            )
+
+    if language is None:
+        # Detect on the first chunk so every chunk uses the same language
+        first = await run_chunk(*chunks[0], None)
+        language = first[0]
+        logger.info(f"Detected language: {language}")
+        rest = await asyncio.gather(*(run_chunk(start, end, language) for start, end in chunks[1:]))
+        results = [first, *rest]
+    else:
+        results = await asyncio.gather(*(run_chunk(start, end, language) for start, end in chunks))
+
+    segments = resegment_words(stitch_chunks([
+        (start, chunk_segments) for (start, _), (_, chunk_segments) in zip(chunks, results)
+    ]))
+    logger.info(f"Transcribed {len(segments)} segments")
+    return Transcript(language=language, segments=segments)
@@ -1,7 +1,9 @@
 """Speaker diarization worker using pyannote.audio."""
 
 import asyncio
+from bisect import bisect_left, bisect_right
 from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
 from pathlib import Path
 from typing import List, Optional
 from loguru import logger
@@ -17,6 +19,95 @@ from app.models.transcript import (
 # Dedicated thread pool for CPU-bound model operations
 _diarization_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="diarize")
 
+# A speaker change splits a segment only if each part has at least this many words
+MIN_SPLIT_WORDS = 3
+
+
+class SpeakerIndex:
+    """Diarization turns sorted by start time for fast overlap queries.
+
+    A query bisects the turns that start before its end and, using the
+    running maximum of turn ends, skips those that ended before its start,
+    so each lookup costs O(log m + overlapping turns).
+    """
+
+    def __init__(self, diarization_segments: List[dict]):
+        turns = sorted(diarization_segments, key=lambda d_seg: d_seg["start"])
+        self._starts = [d_seg["start"] for d_seg in turns]
+        self._ends = [d_seg["end"] for d_seg in turns]
+        self._speakers = [d_seg["speaker"] for d_seg in turns]
+        self._max_ends = list(accumulate(self._ends, max))
+
+    def speaker_for(self, start: float, end: float, default: Optional[str] = "SPEAKER_0"):
+        """Speaker of the turn overlapping [start, end] the most (default if none)."""
+        best_speaker = default
+        best_overlap = 0.0
+
+        first = bisect_right(self._max_ends, start)
+        last = bisect_left(self._starts, end)
+        for i in range(first, last):
+            overlap = min(end, self._ends[i]) - max(start, self._starts[i])
+            if overlap > best_overlap:
+                best_overlap = overlap
+                best_speaker = self._speakers[i]
+
+        return best_speaker
+
+
+def split_by_speaker(segment: Segment, index: SpeakerIndex, speaker: str) -> List[DiarizedSegment]:
+    """Attribute each word to a speaker and split the segment where it changes.
+
+    Words outside every turn keep the previous word's speaker. Runs shorter
+    than MIN_SPLIT_WORDS are absorbed by the preceding run (or the following
+    one at the start), so single misattributed words do not split sentences.
+
+    Args:
+        segment: Transcript segment with word timings
+        index: Speaker turns
+        speaker: Speaker of the whole segment (used when nothing is split)
+
+    Returns:
+        One diarized segment per speaker run
+    """
+    from app.workers.resegment import _clean_text
+
+    words = segment.words or []
+    runs: List[list] = []  # [speaker, words]
+    current = speaker
+    for word in words:
+        current = index.speaker_for(word.start, word.end, default=None) or current
+        if runs and runs[-1][0] == current:
+            runs[-1][1].append(word)
+        else:
+            runs.append([current, [word]])
+
+    merged: List[list] = []
+    for run in runs:
+        if merged and (len(run[1]) < MIN_SPLIT_WORDS or len(merged[-1][1]) < MIN_SPLIT_WORDS):
+            # Keep the speaker of the longer side
+            if len(run[1]) > len(merged[-1][1]):
+                merged[-1][0] = run[0]
+            merged[-1][1].extend(run[1])
+        elif merged and merged[-1][0] == run[0]:
+            merged[-1][1].extend(run[1])
+        else:
+            merged.append(run)
+
+    if len(merged) < 2:
+        return [DiarizedSegment(
+            start=segment.start, end=segment.end, text=segment.text, speaker=speaker,
+        )]
+
+    parts = []
+    for i, (run_speaker, run_words) in enumerate(merged):
+        parts.append(DiarizedSegment(
+            start=segment.start if i == 0 else round(run_words[0].start, 3),
+            end=segment.end if i == len(merged) - 1 else round(run_words[-1].end, 3),
+            text=_clean_text(" ".join(word.word for word in run_words)),
+            speaker=run_speaker,
+        ))
+    return parts
+
 
 class DiarizationWorker:
     """Worker for speaker diarization using pyannote.audio."""
@@ -143,6 +234,9 @@ class DiarizationWorker:
         """
         Merge transcript segments with speaker diarization.
 
+        With ``diarization_split_segments``, segments that carry word timings
+        are split where the speaker changes mid-sentence.
+
         Args:
             transcript: Transcript with text segments
             diarization_segments: Diarization output
@@ -151,14 +245,16 @@ class DiarizationWorker:
             DiarizedTranscript with speaker labels
         """
         diarized_segments: List[DiarizedSegment] = []
+        index = SpeakerIndex(diarization_segments)
+        split = settings.diarization_split_segments
 
         for segment in transcript.segments:
             # Find the speaker for this segment based on overlap
-            speaker = self._find_speaker(
-                segment.start,
-                segment.end,
-                diarization_segments,
-            )
+            speaker = index.speaker_for(segment.start, segment.end)
+
+            if split and segment.words:
+                diarized_segments.extend(split_by_speaker(segment, index, speaker))
+                continue
 
             diarized_segments.append(
                 DiarizedSegment(
@@ -178,28 +274,6 @@ class DiarizationWorker:
             segments=diarized_segments,
         )
 
-    def _find_speaker(
-        self,
-        start: float,
-        end: float,
-        diarization_segments: List[dict],
-    ) -> str:
-        """Find the most likely speaker for a time range."""
-        best_speaker = "SPEAKER_0"
-        best_overlap = 0.0
-
-        for d_seg in diarization_segments:
-            # Calculate overlap
-            overlap_start = max(start, d_seg["start"])
-            overlap_end = min(end, d_seg["end"])
-            overlap = max(0, overlap_end - overlap_start)
-
-            if overlap > best_overlap:
-                best_overlap = overlap
-                best_speaker = d_seg["speaker"]
-
-        return best_speaker
-
     async def save_diarized_transcript(
         self,
         transcript: DiarizedTranscript,
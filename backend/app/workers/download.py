@@ -1,13 +1,17 @@
 """Video download worker using yt-dlp."""
 
 import html
-import subprocess
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List
 from loguru import logger
 
 from app.config import settings
+from app.services.process_runner import run_process, ytdlp_progress
+
+# Timeouts (seconds) for metadata-only yt-dlp/ffprobe calls
+_INFO_TIMEOUT = 120
+_PROBE_TIMEOUT = 60
 
 
 class DownloadWorker:
@@ -24,6 +28,7 @@ class DownloadWorker:
         fetch_subtitles: bool = False,
         prefer_auto_subs: bool = False,
         subtitle_langs: List[str] = None,
+        progress_callback: Optional[Callable[[float], None]] = None,
     ) -> Dict[str, Any]:
         """
         Download video from URL or use local file.
@@ -34,6 +39,7 @@ class DownloadWorker:
             extract_audio: Whether to extract audio as WAV
             fetch_subtitles: Whether to download YouTube subtitles if available
             subtitle_langs: List of subtitle languages to try (default: ["en"])
+            progress_callback: Called with the video download fraction (0-1)
 
         Returns:
             Dict with video_path, audio_path, subtitle_path, and metadata
@@ -114,7 +120,7 @@ class DownloadWorker:
         else:
             # Download video
             logger.info(f"Downloading video: {info.get('title', 'Unknown')}")
-            await self._download_video(url, video_path)
+            await self._download_video(url, video_path, progress_callback)
 
         # Download subtitles if requested and available
         zh_subtitle_path = None
@@ -223,7 +229,7 @@ class DownloadWorker:
             "-of", "json",
             str(video_path),
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = await run_process(cmd, timeout=_PROBE_TIMEOUT)
         if result.returncode != 0:
             logger.warning(f"ffprobe failed: {result.stderr}")
             return {"duration": 0.0, "title": None}
@@ -252,7 +258,7 @@ class DownloadWorker:
                 "--no-download",
             ] + extra_args + [url]
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = await run_process(cmd, timeout=_INFO_TIMEOUT)
 
             if result.returncode == 0:
                 return json.loads(result.stdout)
@@ -264,7 +270,12 @@ class DownloadWorker:
         # If all clients fail, raise with last error
         raise RuntimeError(f"yt-dlp info extraction failed: {result.stderr}")
 
-    async def _download_video(self, url: str, output_path: Path) -> None:
+    async def _download_video(
+        self,
+        url: str,
+        output_path: Path,
+        progress_callback: Optional[Callable[[float], None]] = None,
+    ) -> None:
         """Download video to specified path."""
         # Base command with format selection
         # Using format that works better with YouTube's SABR streaming restrictions
@@ -274,7 +285,9 @@ class DownloadWorker:
             "--merge-output-format", "mp4",
             "-o", str(output_path),
             "--no-playlist",
+            "--newline",  # One progress line per update, parsed below
         ]
+        on_progress = ytdlp_progress(progress_callback) if progress_callback else None
 
         # Try different player clients if the default fails
         # iOS/Android clients often work when web clients fail due to SABR
@@ -288,7 +301,9 @@ class DownloadWorker:
         last_error = None
         for extra_args in client_options:
             cmd = base_cmd + extra_args + [url]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = await run_process(
+                cmd, capture_stdout=False, on_stdout_line=on_progress
+            )
 
             if result.returncode == 0 and output_path.exists():
                 return  # Success
@@ -322,7 +337,7 @@ class DownloadWorker:
             str(audio_path),
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = await run_process(cmd)
         if result.returncode != 0:
             raise RuntimeError(f"ffmpeg audio extraction failed: {result.stderr}")
 
@@ -373,7 +388,7 @@ class DownloadWorker:
 
             cmd.append(url)
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            await run_process(cmd, timeout=_INFO_TIMEOUT)
 
             # Check for downloaded subtitle file (yt-dlp adds language suffix)
             # Match exact lang and variants like en-US, en-GB, etc.
@@ -538,7 +553,7 @@ class DownloadWorker:
 
             cmd.append(url)
 
-            subprocess.run(cmd, capture_output=True, text=True)
+            await run_process(cmd, timeout=_INFO_TIMEOUT)
 
             # Check for downloaded file
             for lang in langs:
@@ -0,0 +1,354 @@
+"""Batched XTTS synthesis with cached speaker conditioning.
+
+XTTS conditions every utterance on GPT latents and a speaker embedding
+computed from the reference sample, and ``tts_to_file`` recomputes them
+on each call. Here they are computed once per sample, stored on disk
+keyed by a hash of the sample, and each speaker's segments are
+synthesized in batches on a thread pool.
+
+XTTS inference changes model state (``store_prefix_emb``), so calls on
+one model are serialized by a per-model lock; worker threads overlap
+everything else (latent loading, resampling, writing files).
+
+A segment's output file is named after a hash of everything that shapes
+it (text, voice sample, language, temperature, target duration), so an
+interrupted dub resumes by skipping files that already exist.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+# XTTS v2 output sample rate
+XTTS_SAMPLE_RATE = 24000
+
+# A first take within this ratio of the target duration is kept as is
+_SPEED_TOLERANCE = 0.05
+
+# Synthesis thread pools by worker count (never shut down: dubs in progress may use them)
+_synthesis_pools: Dict[int, ThreadPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+# One inference at a time per model (id(model) -> lock)
+_model_locks: Dict[int, threading.Lock] = {}
+
+
+@dataclass
+class DubItem:
+    """A segment to synthesize."""
+    id: Any
+    text: str
+    speaker: str
+    target_duration: Optional[float] = None  # None keeps the natural speed
+
+
+@dataclass
+class DubResult:
+    """Synthesized audio of a segment."""
+    id: Any
+    path: Optional[Path] = None
+    duration: Optional[float] = None
+    resumed: bool = False  # Output already existed
+    error: Optional[str] = None
+
+
+def file_hash(path: Path) -> str:
+    """Short content hash of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def _to_numpy(value) -> np.ndarray:
+    if hasattr(value, "detach"):
+        return value.detach().cpu().numpy()
+    return np.asarray(value)
+
+
+def _to_model(array: np.ndarray, model):
+    try:
+        import torch
+    except ImportError:
+        return array
+    return torch.from_numpy(array).to(getattr(model, "device", "cpu"))
+
+
+class SpeakerLatentCache:
+    """XTTS conditioning latents, computed once per voice sample.
+
+    Latents are kept in memory and in ``cache_dir`` as .npz files keyed
+    by the model name and the sample's content hash, so they survive
+    restarts and are shared between timelines using the same sample.
+    """
+
+    def __init__(self, cache_dir: Path, model_name: str):
+        self.cache_dir = Path(cache_dir)
+        self._model_key = hashlib.sha256(model_name.encode()).hexdigest()[:8]
+        self._latents: Dict[str, Tuple[Any, Any]] = {}
+        self._lock = threading.Lock()
+        self.computed = 0
+
+    def get(self, model, sample_path: Path, sample_key: str) -> Tuple[Any, Any]:
+        """Get (gpt_cond_latent, speaker_embedding) for a voice sample.
+
+        Args:
+            model: XTTS model (``get_conditioning_latents``)
+            sample_path: Voice sample audio
+            sample_key: ``file_hash`` of the sample
+        """
+        # One computation per sample even when several threads ask for it
+        with self._lock:
+            latents = self._latents.get(sample_key)
+            if latents is not None:
+                return latents
+
+            cache_path = self.cache_dir / f"{self._model_key}_{sample_key}.npz"
+            if cache_path.exists():
+                try:
+                    with np.load(cache_path) as data:
+                        latents = (
+                            _to_model(data["gpt_cond_latent"], model),
+                            _to_model(data["speaker_embedding"], model),
+                        )
+                except (OSError, KeyError, ValueError) as e:
+                    logger.warning(f"Ignoring unreadable speaker latents {cache_path}: {e}")
+
+            if latents is None:
+                logger.info(f"Computing speaker latents for {sample_path}")
+                with model_lock(model):
+                    latents = model.get_conditioning_latents(audio_path=[str(sample_path)])
+                self.computed += 1
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix(".tmp.npz")
+                np.savez(
+                    tmp_path,
+                    gpt_cond_latent=_to_numpy(latents[0]),
+                    speaker_embedding=_to_numpy(latents[1]),
+                )
+                tmp_path.replace(cache_path)
+
+            self._latents[sample_key] = latents
+            return latents
+
+
+def get_synthesis_pool(workers: int) -> ThreadPoolExecutor:
+    """Get the synthesis thread pool with ``workers`` threads."""
+    with _pools_lock:
+        pool = _synthesis_pools.get(workers)
+        if pool is None:
+            pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="xtts")
+            _synthesis_pools[workers] = pool
+        return pool
+
+
+def model_lock(model) -> threading.Lock:
+    """Lock serializing calls that use or change ``model``'s state."""
+    with _pools_lock:
+        return _model_locks.setdefault(id(model), threading.Lock())
+
+
+def _infer(
+    model, text: str, language: str, latents, temperature: Optional[float], speed: float
+) -> np.ndarray:
+    gpt_cond_latent, speaker_embedding = latents
+    options = {"speed": speed}
+    if temperature is not None:  # None keeps the model's default
+        options["temperature"] = temperature
+    # Long texts are split into sentences to stay under the XTTS token limit,
+    # as tts_to_file does
+    with model_lock(model):
+        out = model.inference(
+            text, language, gpt_cond_latent, speaker_embedding,
+            enable_text_splitting=True, **options,
+        )
+    return _to_numpy(out["wav"]).reshape(-1).astype(np.float32)
+
+
+def _write_wav(path: Path, samples: np.ndarray) -> None:
+    """Write mono 16-bit audio, renamed into place once complete."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with wave.open(str(tmp_path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(XTTS_SAMPLE_RATE)
+        wav.writeframes((np.clip(samples, -1.0, 1.0) * 32767).astype("<i2").tobytes())
+    tmp_path.replace(path)
+
+
+def _wav_duration(path: Path) -> float:
+    with wave.open(str(path), "rb") as wav:
+        return wav.getnframes() / wav.getframerate()
+
+
+def synthesize_item(
+    model,
+    latents,
+    item: DubItem,
+    output_path: Path,
+    language: str,
+    temperature: Optional[float],
+    max_speed: float = 1.5,
+    min_speed: float = 0.8,
+    speed: float = 1.0,
+) -> float:
+    """Synthesize one segment, refitting its speed to the target duration.
+
+    Args:
+        speed: Speed of the first take (segments without a target duration)
+
+    Returns:
+        Duration of the written audio in seconds
+    """
+    samples = _infer(model, item.text, language, latents, temperature, speed=speed)
+    duration = len(samples) / XTTS_SAMPLE_RATE
+
+    if item.target_duration and item.target_duration > 0:
+        speed = max(min_speed, min(max_speed, duration / item.target_duration))
+        if abs(speed - 1.0) > _SPEED_TOLERANCE:
+            samples = _infer(model, item.text, language, latents, temperature, speed=speed)
+            logger.debug(
+                f"Segment {item.id}: {duration:.2f}s -> {len(samples) / XTTS_SAMPLE_RATE:.2f}s "
+                f"(target: {item.target_duration:.2f}s, speed: {speed:.2f})"
+            )
+            duration = len(samples) / XTTS_SAMPLE_RATE
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    _write_wav(output_path, samples)
+    return duration
+
+
+def _synthesize_batch(
+    model,
+    latents,
+    batch: Sequence[Tuple[DubItem, Path]],
+    language: str,
+    temperature: Optional[float],
+    max_speed: float,
+    min_speed: float,
+) -> List[DubResult]:
+    """Synthesize one speaker's segments back to back on the same latents."""
+    results = []
+    for item, path in batch:
+        try:
+            duration = synthesize_item(
+                model, latents, item, path, language, temperature, max_speed, min_speed
+            )
+            results.append(DubResult(id=item.id, path=path, duration=duration))
+        except Exception as e:
+            logger.error(f"Failed to synthesize segment {item.id}: {e}")
+            results.append(DubResult(id=item.id, error=str(e)))
+    return results
+
+
+def _output_path(output_dir: Path, item: DubItem, sample_key: str, language: str,
+                 temperature: Optional[float]) -> Path:
+    inputs = "\0".join([
+        item.text, sample_key, language, str(temperature),
+        f"{item.target_duration:.3f}" if item.target_duration else "",
+    ])
+    key = hashlib.sha256(inputs.encode()).hexdigest()[:12]
+    return output_dir / f"segment_{item.id}_{key}.wav"
+
+
+async def synthesize_batched(
+    model,
+    items: Sequence[DubItem],
+    speaker_samples: Dict[str, Path],
+    latent_cache: SpeakerLatentCache,
+    output_dir: Path,
+    language: str,
+    temperature: Optional[float] = 0.2,
+    workers: int = 1,
+    batch_size: int = 8,
+    max_speed: float = 1.5,
+    min_speed: float = 0.8,
+) -> List[DubResult]:
+    """Synthesize segments grouped by speaker on a pool of worker threads.
+
+    Args:
+        model: XTTS model (``get_conditioning_latents`` and ``inference``)
+        items: Segments to synthesize; every speaker needs a sample
+        speaker_samples: Map of speaker_id -> voice sample audio
+        latent_cache: Cache for the speakers' conditioning latents
+        output_dir: Directory for the segment audio files
+        language: Target language code
+        temperature: Generation temperature (None: model default)
+        workers: Synthesis threads (inference on ``model`` is still serialized)
+        batch_size: Segments of one speaker per batch
+        max_speed: Maximum speed when fitting a target duration
+        min_speed: Minimum speed when fitting a target duration
+
+    Returns:
+        One result per item, in order
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    loop = asyncio.get_running_loop()
+    pool = get_synthesis_pool(workers)
+    started = time.perf_counter()
+
+    sample_keys = {
+        speaker: file_hash(speaker_samples[speaker])
+        for speaker in {item.speaker for item in items}
+    }
+
+    results: Dict[int, DubResult] = {}
+    by_speaker: Dict[str, List[Tuple[int, DubItem, Path]]] = {}
+    for index, item in enumerate(items):
+        path = _output_path(output_dir, item, sample_keys[item.speaker], language, temperature)
+        if path.exists():
+            results[index] = DubResult(
+                id=item.id, path=path, duration=_wav_duration(path), resumed=True
+            )
+            continue
+        # Earlier takes of this segment (text or voice changed)
+        for stale in output_dir.glob(f"segment_{item.id}_*.wav"):
+            stale.unlink(missing_ok=True)
+        by_speaker.setdefault(item.speaker, []).append((index, item, path))
+
+    if results:
+        logger.info(f"Resuming dub: {len(results)}/{len(items)} segments already synthesized")
+
+    async def run_speaker(speaker: str, pending: List[Tuple[int, DubItem, Path]]) -> None:
+        try:
+            latents = await loop.run_in_executor(
+                pool, latent_cache.get, model, speaker_samples[speaker], sample_keys[speaker]
+            )
+        except Exception as e:
+            # Only this speaker's segments fail, as when each segment was cloned alone
+            logger.error(f"Failed to condition on the voice sample of speaker {speaker}: {e}")
+            for index, item, _ in pending:
+                results[index] = DubResult(id=item.id, error=str(e))
+            return
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        batch_results = await asyncio.gather(*(
+            loop.run_in_executor(
+                pool, _synthesize_batch, model, latents,
+                [(item, path) for _, item, path in batch],
+                language, temperature, max_speed, min_speed,
+            )
+            for batch in batches
+        ))
+        for batch, batch_result in zip(batches, batch_results):
+            for (index, _, _), result in zip(batch, batch_result):
+                results[index] = result
+
+    await asyncio.gather(*(run_speaker(s, pending) for s, pending in by_speaker.items()))
+
+    synthesized = sum(len(pending) for pending in by_speaker.values())
+    elapsed = time.perf_counter() - started
+    logger.info(
+        f"Synthesized {synthesized} segments for {len(by_speaker)} speakers in {elapsed:.1f}s "
+        f"({synthesized / elapsed * 60 if elapsed else 0:.1f} segments/min, {workers} workers)"
+    )
+    return [results[index] for index in range(len(items))]
@@ -4,15 +4,19 @@ import asyncio
 import hashlib
 import json
 import math
-import subprocess
-import tempfile
 import time
+from fractions import Fraction
 from pathlib import Path
 from typing import Callable, List, Optional, Tuple
 from loguru import logger
 
 from app.config import settings
 from app.models.timeline import EditableSegment, ExportProfile, PinnedCard, SegmentState, SubtitleLanguageMode, SubtitleStyleMode, Timeline
+from app.services.process_runner import ffmpeg_progress, run_process
+from app.services.image_store import get_image_store
+from app.workers import export_chunks
+from app.workers.card_prefetch import load_cards
+from app.workers.still_cache import StillCache, cache_rendered_stills, renderer_version, stills_to_render
 from app.workers.subtitle_styles import (
     SubtitleStyleConfig,
     SubtitleStyleMode as StyleMode,
@@ -32,6 +36,7 @@ OUTPUT_HEIGHT = 1080
 VIDEO_AREA_RATIO = 0.70  # Left 70% for video
 CARD_PANEL_RATIO = 0.30  # Right 30% for card panel
 SUBTITLE_AREA_RATIO = 0.25  # Bottom 25% for subtitles
+SUBTITLE_STILL_SIZE = (1920, 356)  # Subtitle still size, fixed in remotion/renderStills.mjs
 PANEL_BG_COLOR = "0x1a2744"
 
 
@@ -510,7 +515,7 @@ class ExportWorker:
 
         return filter_complex, input_args, final_label
 
-    def _render_gradient_overlay(self, output_dir: Path) -> Path:
+    async def _render_gradient_overlay(self, output_dir: Path) -> Path:
         """Generate a 1920x270 gradient PNG for the floating subtitle overlay.
 
         The gradient matches the review page CSS:
@@ -532,7 +537,7 @@ class ExportWorker:
                 "-i", f"color=c=black@0.6:s={OUTPUT_WIDTH}x{int(OUTPUT_HEIGHT * SUBTITLE_AREA_RATIO)}:d=0.04:r=25",
                 "-frames:v", "1", "-y", str(gradient_path),
             ]
-            subprocess.run(cmd, capture_output=True, text=True)
+            await run_process(cmd)
             return gradient_path
 
         grad_h = int(OUTPUT_HEIGHT * SUBTITLE_AREA_RATIO)  # 270
@@ -754,65 +759,6 @@ class ExportWorker:
 
         return filter_complex, input_args, final_label
 
-    def _retime_pinned_cards(
-        self,
-        pinned_cards: List[PinnedCard],
-        keep_segments: List[EditableSegment],
-    ) -> List[PinnedCard]:
-        """Retime pinned cards to match concatenated KEEP-segment video.
-
-        Uses the same cumulative-offset approach as _retime_segments().
-
-        Args:
-            pinned_cards: Original pinned cards
-            keep_segments: KEEP segments in order
-
-        Returns:
-            New PinnedCard list with adjusted display_start/display_end
-        """
-        # Build time mapping: original time -> retimed time
-        # Each keep segment maps to a contiguous block in the output
-        retimed_cards = []
-        cumulative_time = 0.0
-
-        # Build segment time ranges
-        segment_offsets = []
-        for seg in keep_segments:
-            seg_start = seg.effective_start
-            seg_end = seg.effective_end
-            seg_duration = seg.effective_duration
-            # offset = retimed_start - original_start
-            offset = cumulative_time - seg_start
-            segment_offsets.append((seg_start, seg_end, offset))
-            cumulative_time += seg_duration
-
-        for card in pinned_cards:
-            if not card.card_data:
-                continue
-
-            # Find which segment this card belongs to
-            new_start = None
-            new_end = None
-            for seg_start, seg_end, offset in segment_offsets:
-                # Card display window overlaps with this segment
-                if card.display_start < seg_end and card.display_end > seg_start:
-                    # Clamp card timing to segment boundaries, then apply offset
-                    clamped_start = max(card.display_start, seg_start)
-                    clamped_end = min(card.display_end, seg_end)
-                    new_start = clamped_start + offset
-                    new_end = clamped_end + offset
-                    break
-
-            if new_start is not None and new_end is not None and new_end > new_start:
-                # Create a copy with new timing
-                retimed_card = card.model_copy(
-                    update={"display_start": new_start, "display_end": new_end}
-                )
-                retimed_cards.append(retimed_card)
-
-        logger.info(f"Retimed {len(retimed_cards)}/{len(pinned_cards)} pinned cards for essence export")
-        return retimed_cards
-
     def _compute_keep_regions(
         self,
         trim_start: float,
@@ -862,6 +808,7 @@ class ExportWorker:
         self,
         segments: List[EditableSegment],
         keep_regions: List[Tuple[float, float]],
+        tolerance: float = 0.0,
     ) -> List[Tuple[float, float, str, str]]:
         """Retime subtitle segments to match concatenated keep regions.
 
@@ -871,6 +818,8 @@ class ExportWorker:
         Args:
             segments: Subtitle segments (already filtered for exclusions)
             keep_regions: Non-excluded time regions
+            tolerance: Seconds a segment may extend past its region (e.g.
+                when regions are snapped to frames); it is clamped to it
 
         Returns:
             List of (start, end, en, zh) tuples with retimed timing
@@ -890,9 +839,9 @@ class ExportWorker:
 
             # Find which region contains this segment
             for region_start, region_end, offset in region_offsets:
-                if seg_start >= region_start and seg_end <= region_end:
-                    new_start = seg_start + offset
-                    new_end = seg_end + offset
+                if seg_start >= region_start - tolerance and seg_end <= region_end + tolerance:
+                    new_start = max(seg_start, region_start) + offset
+                    new_end = min(seg_end, region_end) + offset
                     if seg.subtitle_hidden:
                         retimed.append((new_start, new_end, "", ""))
                     else:
@@ -909,8 +858,8 @@ class ExportWorker:
     ) -> List[PinnedCard]:
         """Retime pinned cards to match concatenated keep regions.
 
-        Same approach as _retime_pinned_cards() but uses keep regions
-        instead of keep segments.
+        Each card is clamped to the first region its display window
+        overlaps, then shifted with that region.
 
         Args:
             pinned_cards: Original pinned cards
@@ -1125,7 +1074,7 @@ class ExportWorker:
         logger.info(f"Generated ASS subtitle (language_mode={subtitle_language_mode.value}): {output_path}")
         return output_path
 
-    def _get_video_dimensions(self, video_path: Path) -> Tuple[int, int]:
+    async def _get_video_dimensions(self, video_path: Path) -> Tuple[int, int]:
         """Get video width and height using ffprobe."""
         cmd = [
             "ffprobe", "-v", "error",
@@ -1134,7 +1083,7 @@ class ExportWorker:
             "-of", "csv=s=x:p=0",
             str(video_path)
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = await run_process(cmd)
         if result.returncode != 0:
             logger.warning(f"ffprobe failed, using default 1920x1080: {result.stderr}")
             return 1920, 1080
@@ -1144,7 +1093,7 @@ class ExportWorker:
         except Exception:
             return 1920, 1080
 
-    def _get_video_duration(self, video_path: Path) -> float:
+    async def _get_video_duration(self, video_path: Path) -> float:
         """Get video duration in seconds using ffprobe."""
         cmd = [
             "ffprobe", "-v", "error",
@@ -1153,7 +1102,7 @@ class ExportWorker:
             "-of", "csv=s=x:p=0",
             str(video_path)
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = await run_process(cmd)
         if result.returncode != 0:
             logger.warning(f"ffprobe duration failed: {result.stderr}")
             return 0.0
@@ -1162,6 +1111,39 @@ class ExportWorker:
         except (ValueError, TypeError):
             return 0.0
 
+    async def _get_video_frame_rate(self, video_path: Path) -> Fraction:
+        """Get the video frame rate using ffprobe (30 fps if unknown)."""
+        cmd = [
+            "ffprobe", "-v", "error",
+            "-select_streams", "v:0",
+            "-show_entries", "stream=r_frame_rate",
+            "-of", "csv=p=0",
+            str(video_path)
+        ]
+        result = await run_process(cmd)
+        if result.returncode != 0:
+            logger.warning(f"ffprobe frame rate failed, using 30 fps: {result.stderr}")
+            return Fraction(30)
+        return export_chunks.parse_frame_rate(result.stdout)
+
+    async def _has_audio_stream(self, video_path: Path) -> bool:
+        """Check whether the video has an audio stream using ffprobe."""
+        cmd = [
+            "ffprobe", "-v", "error",
+            "-select_streams", "a",
+            "-show_entries", "stream=index",
+            "-of", "csv=p=0",
+            str(video_path)
+        ]
+        result = await run_process(cmd)
+        return result.returncode == 0 and bool(result.stdout.strip())
+
+    def _video_codec_args(self) -> List[str]:
+        """Video encoder arguments for composed exports."""
+        if self.use_nvenc:
+            return ["-c:v", "h264_nvenc", "-preset", "p4"]
+        return ["-c:v", "libx264", "-preset", "medium", "-crf", "23"]
+
     def _hex_to_ass_color(self, hex_color: str, opacity: int = 0) -> str:
         """Convert hex color (#RRGGBB) to ASS format (&HAABBGGRR).
 
@@ -1280,18 +1262,16 @@ class ExportWorker:
         """Replace remote image URLs in card_data with local cached file:// paths.
 
         Remotion's browser can load file:// URLs during server-side render.
-        Images must already be pre-cached via batch_precache_images().
+        Images must already be pre-cached via card_prefetch.load_cards().
         URLs without a local cache (e.g. expired Pixabay links) are removed
         so the card renders gracefully without the image.
         """
-        from app.workers.card_renderer import IMAGE_CACHE_DIR
-
+        store = get_image_store()
         data = dict(card_data)  # shallow copy
         if card_type == "entity" and data.get("image_url"):
             url = data["image_url"]
-            url_hash = hashlib.md5(url.encode()).hexdigest()
-            local_path = IMAGE_CACHE_DIR / f"{url_hash}.png"
-            if local_path.exists():
+            local_path = store.cached_path(url)
+            if local_path:
                 data["image_url"] = local_path.resolve().as_uri()
             else:
                 logger.warning(f"Image not cached, removing expired URL: {url[:80]}...")
@@ -1299,16 +1279,15 @@ class ExportWorker:
         elif card_type == "word" and data.get("images"):
             new_images = []
             for url in data["images"]:
-                url_hash = hashlib.md5(url.encode()).hexdigest()
-                local_path = IMAGE_CACHE_DIR / f"{url_hash}.png"
-                if local_path.exists():
+                local_path = store.cached_path(url)
+                if local_path:
                     new_images.append(local_path.resolve().as_uri())
                 else:
                     logger.warning(f"Image not cached, skipping expired URL: {url[:80]}...")
             data["images"] = new_images
         return data
 
-    def _ensure_frontend_ready(self) -> Path:
+    async def _ensure_frontend_ready(self) -> Path:
         """Ensure frontend directory and node_modules are ready.
 
         Detects platform mismatch (e.g. macOS node_modules mounted into Linux
@@ -1357,10 +1336,9 @@ class ExportWorker:
 
         if needs_install:
             logger.info("Running pnpm install...")
-            install_result = subprocess.run(
+            install_result = await run_process(
                 ["pnpm", "install", "--frozen-lockfile"],
-                capture_output=True, text=True,
-                cwd=str(frontend_dir),
+                cwd=frontend_dir,
                 timeout=300,
             )
             if install_result.returncode != 0:
@@ -1502,7 +1480,7 @@ class ExportWorker:
             "-of", "csv=s=x:p=0",
             str(first_png),
         ]
-        probe_result = subprocess.run(probe_cmd, capture_output=True, text=True)
+        probe_result = await run_process(probe_cmd)
         try:
             sub_w, sub_h = probe_result.stdout.strip().split("x")
             sub_width, sub_height = int(sub_w), int(sub_h)
@@ -1519,7 +1497,7 @@ class ExportWorker:
             "-frames:v", "1",
             "-y", str(blank_png),
         ]
-        blank_result = subprocess.run(blank_cmd, capture_output=True, text=True)
+        blank_result = await run_process(blank_cmd)
         if blank_result.returncode != 0:
             logger.warning(f"Failed to create blank PNG: {blank_result.stderr}")
             return None
@@ -1595,169 +1573,67 @@ class ExportWorker:
         logger.info(f"Created subtitle video track: {subtitle_video_path}")
         return subtitle_video_path
 
-    async def _render_stills(
+    def _still_cache_keys(
         self,
-        pinned_cards: List[PinnedCard],
-        segments: List[EditableSegment],
+        cards_json: List[dict],
+        subtitles_data: Optional[dict],
+        panel_width: int,
+        panel_height: int,
+    ) -> dict:
+        """Still cache keys by Remotion output id (``<id>.png``).
+
+        Args:
+            cards_json: Card entries for Remotion
+            subtitles_data: Subtitle style and entries for Remotion, or None
+            panel_width: Card still width
+            panel_height: Card still height
+
+        Returns:
+            Map of id -> key, including the card placeholder
+        """
+        renderer = renderer_version(settings.frontend_dir.resolve())
+        keys = {
+            entry["id"]: StillCache.key(
+                "card", {"card_type": entry["card_type"], "card_data": entry["card_data"]},
+                panel_width, panel_height, renderer,
+            )
+            for entry in cards_json
+        }
+        keys["_placeholder"] = StillCache.key("placeholder", {}, panel_width, panel_height, renderer)
+        if subtitles_data:
+            sub_style = {k: subtitles_data[k] for k in ("style", "bgColor", "languageMode")}
+            for entry in subtitles_data["subtitles"]:
+                keys[entry["id"]] = StillCache.key(
+                    "subtitle", {"en": entry["en"], "zh": entry["zh"], **sub_style},
+                    *SUBTITLE_STILL_SIZE, renderer,
+                )
+        return keys
+
+    async def _run_render_stills(
+        self,
+        cards_json: List[dict],
+        subtitles_data: Optional[dict],
         output_dir: Path,
-        time_offset: float = 0.0,
-        subtitle_style=None,
-        subtitle_language_mode: SubtitleLanguageMode = SubtitleLanguageMode.BOTH,
-        use_traditional: bool = True,
-        retimed_segments: Optional[List[Tuple[float, float, str, str]]] = None,
+        panel_width: int,
+        panel_height: int,
         progress_callback: Optional[Callable[[float, str], None]] = None,
         timeline_id: Optional[str] = None,
-    ) -> Tuple[List[Tuple[Path, float, float]], List[Tuple[Path, float, float]]]:
-        """Render card + subtitle stills in a single Remotion invocation.
-
-        Bundles once, renders all card and subtitle PNGs.
+    ) -> None:
+        """Render card and subtitle stills into output_dir in one Remotion invocation.
 
         Args:
-            pinned_cards: Pinned cards with card_data
-            segments: Editable segments for subtitle text
+            cards_json: Card entries to render (``<id>.png``)
+            subtitles_data: Subtitle style and entries to render, or None
             output_dir: Directory to save PNGs
-            time_offset: Time offset for timing
-            subtitle_style: Subtitle style options
-            subtitle_language_mode: Which subtitles to include
-            use_traditional: Convert Chinese to Traditional
-            retimed_segments: Pre-retimed tuples for essence mode
+            panel_width: Card still width
+            panel_height: Card still height
             progress_callback: Optional progress callback (0-20% range)
             timeline_id: For cancellation tracking
-
-        Returns:
-            Tuple of (rendered_cards, rendered_subtitle_stills)
         """
-        from app.workers.card_renderer import batch_precache_images
-        from app.services.card_cache import CardCache
-        from app.workers.card_generator import CardGeneratorWorker
-
-        output_dir = Path(output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        # ── Load card data: cache → API → embedded card_data ──
-        # Pinned cards only store card_type + card_id + timing.
-        # Load the full card content from the most reliable source available.
-        logger.info(f"=== CARD DATA LOADING: {len(pinned_cards)} pinned cards ===")
-        card_cache = CardCache()
-        card_generator = CardGeneratorWorker()
-        for idx, card in enumerate(pinned_cards):
-            card_type_val = card.card_type.value if hasattr(card.card_type, 'value') else card.card_type
-
-            # Log what we have BEFORE loading
-            existing_keys = list(card.card_data.keys()) if isinstance(card.card_data, dict) else "NOT_DICT"
-            existing_size = len(card.card_data) if isinstance(card.card_data, dict) else 0
-            logger.info(
-                f"Card [{idx}] {card.id}: type={card_type_val}, card_id='{card.card_id}', "
-                f"existing card_data keys={existing_keys} ({existing_size} keys), "
-                f"timing={card.display_start:.1f}-{card.display_end:.1f}s"
-            )
-
-            # 1) Try disk cache first (fast, no network)
-            cached_card = None
-            if card_type_val == "word":
-                cached_card = card_cache.get_word_card(card.card_id)
-            elif card_type_val == "entity":
-                cached_card = card_cache.get_entity_card(card.card_id)
-            elif card_type_val == "idiom":
-                cached_card = card_cache.get_idiom_card(card.card_id)
-
-            if cached_card:
-                card.card_data = cached_card.model_dump(mode="json")
-                logger.info(f"Card {card.id} ({card_type_val}:{card.card_id}): loaded from cache")
-                continue
-
-            # 2) Cache miss — fetch from API
-            logger.info(f"Card {card.id} ({card_type_val}:{card.card_id}): not in cache, fetching from API...")
-            try:
-                fetched_card = None
-                if card_type_val == "word":
-                    fetched_card = await card_generator.get_word_card(card.card_id)
-                elif card_type_val == "entity":
-                    fetched_card = await card_generator.get_entity_card(card.card_id)
-                elif card_type_val == "idiom":
-                    fetched_card = await card_generator.get_idiom_card(card.card_id)
-
-                if fetched_card:
-                    card.card_data = fetched_card.model_dump(mode="json")
-                    logger.info(f"Card {card.id} ({card_type_val}:{card.card_id}): fetched from API")
-                    continue
-            except Exception as e:
-                logger.warning(f"Card {card.id} API fetch failed: {e}")
-
-            # 3) Last resort — use embedded card_data from timeline
-            if card.card_data and isinstance(card.card_data, dict) and len(card.card_data) > 0:
-                logger.info(f"Card {card.id}: using embedded card_data from timeline")
-            else:
-                logger.warning(f"Card {card.id} ({card_type_val}:{card.card_id}): no data available, skipping")
-
-        # Summary after loading
-        cards_with_data = sum(1 for c in pinned_cards if c.card_data and len(c.card_data) > 0)
-        cards_without = len(pinned_cards) - cards_with_data
-        logger.info(f"=== CARD DATA LOADING COMPLETE: {cards_with_data} with data, {cards_without} without data ===")
-
-        # ── Build cards JSON ──
-        card_dicts = [
-            {"card_type": c.card_type.value if hasattr(c.card_type, 'value') else c.card_type,
-             "card_data": c.card_data}
-            for c in pinned_cards if c.card_data and len(c.card_data) > 0
-        ]
-        batch_precache_images(card_dicts)
-
-        cards_json = []
-        card_timing = {}
-        for card in pinned_cards:
-            if not card.card_data or len(card.card_data) == 0:
-                logger.warning(f"Card {card.id} has no card_data, skipping")
-                continue
-            card_type = card.card_type.value if hasattr(card.card_type, 'value') else card.card_type
-            card_data = self._replace_image_urls_with_local(card.card_data, card_type)
-
-            display_start = max(0, card.display_start - time_offset)
-            display_end = max(0, card.display_end - time_offset)
-            if display_end <= display_start:
-                continue
-
-            cards_json.append({
-                "id": card.id,
-                "card_type": card_type,
-                "card_data": card_data,
-            })
-            card_position = getattr(card, 'position', 'right') or 'right'
-            card_timing[card.id] = (display_start, display_end, card_position)
-
-        # Diagnostic: log card data structure for debugging black card issue
-        if cards_json:
-            sample = cards_json[0]
-            data_keys = list(sample["card_data"].keys()) if isinstance(sample["card_data"], dict) else "NOT_DICT"
-            data_json = json.dumps(sample["card_data"], ensure_ascii=False, default=str)
-            logger.info(
-                f"Card sample: type={sample['card_type']}, "
-                f"data_keys={data_keys}, "
-                f"timing={card_timing.get(sample['id'])}"
-            )
-            logger.info(f"Card data (first 1000 chars): {data_json[:1000]}")
-            logger.info(f"Total cards to render: {len(cards_json)}")
-
-        # ── Build subtitles JSON ──
-        subtitles_json, subtitle_timing_map = self._build_subtitle_stills_input(
-            segments=segments,
-            time_offset=time_offset,
-            subtitle_style=subtitle_style,
-            subtitle_language_mode=subtitle_language_mode,
-            use_traditional=use_traditional,
-            retimed_segments=retimed_segments,
-        )
-
-        has_cards = len(cards_json) > 0
-        has_subtitles = len(subtitles_json) > 0
-
-        if not has_cards and not has_subtitles:
-            logger.info("No cards or subtitles to render as stills")
-            return [], []
+        subtitles_json = subtitles_data["subtitles"] if subtitles_data else []
 
-        # Write input files
         cards_file = None
-        if has_cards:
+        if cards_json:
             cards_file = output_dir / "cards_input.json"
             with open(cards_file, "w", encoding="utf-8") as f:
                 json.dump(cards_json, f, ensure_ascii=False)
@@ -1772,42 +1648,15 @@ class ExportWorker:
                 with open(debug_file, "w", encoding="utf-8") as f:
                     json.dump(first, f, ensure_ascii=False, indent=2)
                 logger.info(f"Debug card data written to: {debug_file}")
-        else:
-            logger.warning("No cards with data to render — cards_json is empty")
 
         subtitles_file = None
-        if has_subtitles:
-            # Build subtitle style config
-            style_config = {
-                "enColor": "#ffffff",
-                "zhColor": "#facc15",
-                "enFontSize": 58,
-                "zhFontSize": 58,
-            }
-            bg_color = "#1a2744"
-            if subtitle_style:
-                style_config["enColor"] = getattr(subtitle_style, 'en_color', "#ffffff") or "#ffffff"
-                style_config["zhColor"] = getattr(subtitle_style, 'zh_color', "#facc15") or "#facc15"
-                style_config["enFontSize"] = getattr(subtitle_style, 'en_font_size', 58) or 58
-                style_config["zhFontSize"] = getattr(subtitle_style, 'zh_font_size', 58) or 58
-                bg_color = getattr(subtitle_style, 'background_color', "#1a2744") or "#1a2744"
-
-            language_mode = subtitle_language_mode.value
-            if language_mode == "none":
-                language_mode = "both"  # fallback
-
-            subtitles_data = {
-                "style": style_config,
-                "bgColor": bg_color,
-                "languageMode": language_mode,
-                "subtitles": subtitles_json,
-            }
+        if subtitles_data:
             subtitles_file = output_dir / "subtitles_input.json"
             with open(subtitles_file, "w", encoding="utf-8") as f:
                 json.dump(subtitles_data, f, ensure_ascii=False)
 
         # Find the renderStills script
-        frontend_dir = self._ensure_frontend_ready()
+        frontend_dir = await self._ensure_frontend_ready()
         render_script = frontend_dir / "remotion" / "renderStills.mjs"
         if not render_script.exists():
             raise RuntimeError(
@@ -1815,10 +1664,6 @@ class ExportWorker:
                 f"Set FRONTEND_DIR env var to the frontend directory path."
             )
 
-        # Card panel dimensions (matches WYSIWYG 35% right panel)
-        panel_width = OUTPUT_WIDTH - int(OUTPUT_WIDTH * VIDEO_AREA_RATIO)  # 672
-        panel_height = int(OUTPUT_HEIGHT * (1 - SUBTITLE_AREA_RATIO))  # 723
-
         cmd = ["node", str(render_script)]
         if cards_file:
             cmd.extend(["--input", str(cards_file)])
@@ -1835,7 +1680,7 @@ class ExportWorker:
         logger.info(
             f"Rendering stills via Remotion: "
             f"{len(cards_json)} cards ({panel_width}x{panel_height}), "
-            f"{len(subtitles_json)} subtitle stills (1920x324)"
+            f"{len(subtitles_json)} subtitle stills ({SUBTITLE_STILL_SIZE[0]}x{SUBTITLE_STILL_SIZE[1]})"
         )
         logger.info(f"Remotion command: {' '.join(cmd)}")
         logger.info(f"Remotion cwd: {frontend_dir}")
@@ -1932,54 +1777,223 @@ class ExportWorker:
                 f"{stderr_text[-1000:]}"
             )
 
-        # ── Collect rendered card PNGs ──
-        logger.info(f"=== CARD PNG COLLECTION: checking {len(cards_json)} cards in {output_dir} ===")
-        # List all files in output_dir for debugging
-        all_files = list(output_dir.iterdir()) if output_dir.exists() else []
-        png_files = [f for f in all_files if f.suffix == '.png']
-        logger.info(f"Output dir has {len(all_files)} files total, {len(png_files)} PNGs")
-        if png_files:
-            card_pngs = [f.name for f in png_files if not f.name.startswith('sub_')]
-            logger.info(f"Card PNGs found: {card_pngs[:10]}")
 
-        rendered_cards = []
-        missing_cards = []
-        small_cards = []
-        for card_entry in cards_json:
-            card_id = card_entry["id"]
-            card_path = output_dir / f"{card_id}.png"
-            if card_path.exists() and card_id in card_timing:
-                display_start, display_end, card_pos = card_timing[card_id]
-                rendered_cards.append((card_path, display_start, display_end, card_pos))
-                # Log every card PNG with its size
-                file_size = card_path.stat().st_size
-                logger.info(f"Card PNG: {card_id}.png — {file_size} bytes, {display_start:.1f}-{display_end:.1f}s")
-                if file_size < 5000:  # <5KB is likely blank for 672x723 PNG
-                    small_cards.append((card_id, file_size))
-            else:
-                missing_cards.append(card_id)
-                exists = card_path.exists()
-                in_timing = card_id in card_timing
-                logger.warning(f"Card still not collected: {card_path} (exists={exists}, in_timing={in_timing})")
+    async def _render_stills(
+        self,
+        pinned_cards: List[PinnedCard],
+        segments: List[EditableSegment],
+        output_dir: Path,
+        time_offset: float = 0.0,
+        subtitle_style=None,
+        subtitle_language_mode: SubtitleLanguageMode = SubtitleLanguageMode.BOTH,
+        use_traditional: bool = True,
+        retimed_segments: Optional[List[Tuple[float, float, str, str]]] = None,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        timeline_id: Optional[str] = None,
+    ) -> Tuple[List[Tuple[Path, float, float]], List[Tuple[Path, float, float]]]:
+        """Render card + subtitle stills in a single Remotion invocation.
 
-        if small_cards:
-            logger.warning(
-                f"{len(small_cards)} card PNGs suspiciously small (possibly blank): "
-                f"{small_cards[:5]}"
-            )
+        Bundles once, renders all card and subtitle PNGs.
 
-        if missing_cards:
-            logger.warning(
-                f"{len(missing_cards)}/{len(cards_json)} card stills missing: "
-                f"{missing_cards[:5]}"
-            )
+        Args:
+            pinned_cards: Pinned cards with card_data
+            segments: Editable segments for subtitle text
+            output_dir: Directory to save PNGs
+            time_offset: Time offset for timing
+            subtitle_style: Subtitle style options
+            subtitle_language_mode: Which subtitles to include
+            use_traditional: Convert Chinese to Traditional
+            retimed_segments: Pre-retimed tuples for essence mode
+            progress_callback: Optional progress callback (0-20% range)
+            timeline_id: For cancellation tracking
 
-        # ── Collect rendered subtitle PNGs ──
-        rendered_subtitles: List[Tuple[Path, float, float]] = []
-        missing_subs = []
-        for sub_entry in subtitles_json:
-            sub_id = sub_entry["id"]
-            sub_path = output_dir / f"{sub_id}.png"
+        Returns:
+            Tuple of (rendered_cards, rendered_subtitle_stills)
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # ── Load card data (cache → API → embedded card_data) and images ──
+        # Usually already prefetched when the cards were pinned or the export
+        # was triggered; lookups still in flight are joined, not repeated
+        await load_cards(pinned_cards)
+
+        cards_json = []
+        card_timing = {}
+        for card in pinned_cards:
+            if not card.card_data or len(card.card_data) == 0:
+                logger.warning(f"Card {card.id} has no card_data, skipping")
+                continue
+            card_type = card.card_type.value if hasattr(card.card_type, 'value') else card.card_type
+            card_data = self._replace_image_urls_with_local(card.card_data, card_type)
+
+            display_start = max(0, card.display_start - time_offset)
+            display_end = max(0, card.display_end - time_offset)
+            if display_end <= display_start:
+                continue
+
+            cards_json.append({
+                "id": card.id,
+                "card_type": card_type,
+                "card_data": card_data,
+            })
+            card_position = getattr(card, 'position', 'right') or 'right'
+            card_timing[card.id] = (display_start, display_end, card_position)
+
+        # Diagnostic: log card data structure for debugging black card issue
+        if cards_json:
+            sample = cards_json[0]
+            data_keys = list(sample["card_data"].keys()) if isinstance(sample["card_data"], dict) else "NOT_DICT"
+            data_json = json.dumps(sample["card_data"], ensure_ascii=False, default=str)
+            logger.info(
+                f"Card sample: type={sample['card_type']}, "
+                f"data_keys={data_keys}, "
+                f"timing={card_timing.get(sample['id'])}"
+            )
+            logger.info(f"Card data (first 1000 chars): {data_json[:1000]}")
+            logger.info(f"Total cards to render: {len(cards_json)}")
+
+        # ── Build subtitles JSON ──
+        subtitles_json, subtitle_timing_map = self._build_subtitle_stills_input(
+            segments=segments,
+            time_offset=time_offset,
+            subtitle_style=subtitle_style,
+            subtitle_language_mode=subtitle_language_mode,
+            use_traditional=use_traditional,
+            retimed_segments=retimed_segments,
+        )
+
+        has_cards = len(cards_json) > 0
+        has_subtitles = len(subtitles_json) > 0
+
+        if not has_cards and not has_subtitles:
+            logger.info("No cards or subtitles to render as stills")
+            return [], []
+
+        # Card panel dimensions (matches WYSIWYG 35% right panel)
+        panel_width = OUTPUT_WIDTH - int(OUTPUT_WIDTH * VIDEO_AREA_RATIO)  # 672
+        panel_height = int(OUTPUT_HEIGHT * (1 - SUBTITLE_AREA_RATIO))  # 723
+
+        subtitles_data = None
+        if has_subtitles:
+            # Build subtitle style config
+            style_config = {
+                "enColor": "#ffffff",
+                "zhColor": "#facc15",
+                "enFontSize": 58,
+                "zhFontSize": 58,
+            }
+            bg_color = "#1a2744"
+            if subtitle_style:
+                style_config["enColor"] = getattr(subtitle_style, 'en_color', "#ffffff") or "#ffffff"
+                style_config["zhColor"] = getattr(subtitle_style, 'zh_color', "#facc15") or "#facc15"
+                style_config["enFontSize"] = getattr(subtitle_style, 'en_font_size', 58) or 58
+                style_config["zhFontSize"] = getattr(subtitle_style, 'zh_font_size', 58) or 58
+                bg_color = getattr(subtitle_style, 'background_color', "#1a2744") or "#1a2744"
+
+            language_mode = subtitle_language_mode.value
+            if language_mode == "none":
+                language_mode = "both"  # fallback
+
+            subtitles_data = {
+                "style": style_config,
+                "bgColor": bg_color,
+                "languageMode": language_mode,
+                "subtitles": subtitles_json,
+            }
+
+        # ── Reuse stills rendered by earlier exports ──
+        # Only stills whose content, style, size or renderer changed go to Remotion
+        still_cache = None
+        if settings.still_cache_mb > 0:
+            still_cache = StillCache(settings.still_cache_dir, settings.still_cache_mb)
+        still_keys = self._still_cache_keys(cards_json, subtitles_data, panel_width, panel_height)
+        pending_cards = stills_to_render(still_cache, cards_json, still_keys, output_dir)
+        pending_subs = stills_to_render(still_cache, subtitles_json, still_keys, output_dir)
+        if has_cards:
+            placeholder_missing = stills_to_render(
+                still_cache, [{"id": "_placeholder"}], still_keys, output_dir
+            )
+            if placeholder_missing and not pending_cards:
+                # Remotion only renders the placeholder alongside cards
+                pending_cards = stills_to_render(None, cards_json[:1], still_keys, output_dir)
+
+        reused = len(cards_json) + len(subtitles_json) - len(pending_cards) - len(pending_subs)
+        logger.info(
+            f"Still cache: reusing {reused} stills, rendering "
+            f"{len(pending_cards)} cards and {len(pending_subs)} subtitles"
+        )
+
+        if pending_cards or pending_subs:
+            if subtitles_data:
+                subtitles_data = {**subtitles_data, "subtitles": pending_subs}
+            await self._run_render_stills(
+                pending_cards,
+                subtitles_data if pending_subs else None,
+                output_dir,
+                panel_width,
+                panel_height,
+                progress_callback=progress_callback,
+                timeline_id=timeline_id,
+            )
+            if still_cache is not None:
+                rendered_ids = [entry["id"] for entry in pending_cards + pending_subs]
+                if pending_cards:
+                    rendered_ids.append("_placeholder")
+                await asyncio.to_thread(
+                    cache_rendered_stills, still_cache, rendered_ids, still_keys, output_dir
+                )
+        elif progress_callback:
+            progress_callback(20, "卡片和字幕已缓存")
+
+        # ── Collect rendered card PNGs ──
+        logger.info(f"=== CARD PNG COLLECTION: checking {len(cards_json)} cards in {output_dir} ===")
+        # List all files in output_dir for debugging
+        all_files = list(output_dir.iterdir()) if output_dir.exists() else []
+        png_files = [f for f in all_files if f.suffix == '.png']
+        logger.info(f"Output dir has {len(all_files)} files total, {len(png_files)} PNGs")
+        if png_files:
+            card_pngs = [f.name for f in png_files if not f.name.startswith('sub_')]
+            logger.info(f"Card PNGs found: {card_pngs[:10]}")
+
+        rendered_cards = []
+        missing_cards = []
+        small_cards = []
+        for card_entry in cards_json:
+            card_id = card_entry["id"]
+            card_path = output_dir / f"{card_id}.png"
+            if card_path.exists() and card_id in card_timing:
+                display_start, display_end, card_pos = card_timing[card_id]
+                rendered_cards.append((card_path, display_start, display_end, card_pos))
+                # Log every card PNG with its size
+                file_size = card_path.stat().st_size
+                logger.info(f"Card PNG: {card_id}.png — {file_size} bytes, {display_start:.1f}-{display_end:.1f}s")
+                if file_size < 5000:  # <5KB is likely blank for 672x723 PNG
+                    small_cards.append((card_id, file_size))
+            else:
+                missing_cards.append(card_id)
+                exists = card_path.exists()
+                in_timing = card_id in card_timing
+                logger.warning(f"Card still not collected: {card_path} (exists={exists}, in_timing={in_timing})")
+
+        if small_cards:
+            logger.warning(
+                f"{len(small_cards)} card PNGs suspiciously small (possibly blank): "
+                f"{small_cards[:5]}"
+            )
+
+        if missing_cards:
+            logger.warning(
+                f"{len(missing_cards)}/{len(cards_json)} card stills missing: "
+                f"{missing_cards[:5]}"
+            )
+
+        # ── Collect rendered subtitle PNGs ──
+        rendered_subtitles: List[Tuple[Path, float, float]] = []
+        missing_subs = []
+        for sub_entry in subtitles_json:
+            sub_id = sub_entry["id"]
+            sub_path = output_dir / f"{sub_id}.png"
             if sub_path.exists() and sub_id in subtitle_timing_map:
                 # One PNG may map to multiple time intervals (deduplication)
                 for start, end in subtitle_timing_map[sub_id]:
@@ -2016,6 +2030,10 @@ class ExportWorker:
         progress_callback: Optional[Callable[[float, str], None]] = None,
         timeline_id: Optional[str] = None,
         show_card_panel: bool = True,
+        source_offset: float = 0.0,
+        source_key: Optional[str] = None,
+        essence: Optional[Tuple[Path, List[Tuple[float, float]]]] = None,
+        regions: Optional[List[Tuple[float, float]]] = None,
     ) -> Path:
         """Hybrid Remotion renderStill + FFmpeg export pipeline.
 
@@ -2038,6 +2056,13 @@ class ExportWorker:
             use_traditional: Convert to Traditional Chinese
             subtitle_language_mode: Which subtitles to include
             progress_callback: Optional progress callback
+            source_offset: Seconds into video_path where the export starts
+            source_key: Identity of the source cut for chunked export (needed
+                when video_path is a temporary file)
+            essence: (essence output path, [(start, end), ...] in output time)
+                to encode alongside the video in chunked export
+            regions: Source (start, end) ranges to compose back to back,
+                cut inside the filter graph
 
         Returns:
             Path to rendered video
@@ -2106,7 +2131,7 @@ class ExportWorker:
                 subtitle_language_mode=subtitle_language_mode,
             )
 
-        gradient_path = self._render_gradient_overlay(stills_dir)
+        gradient_path = await self._render_gradient_overlay(stills_dir)
 
         # ── Cancellation check ──
         if timeline_id and self._check_cancelled(timeline_id):
@@ -2119,24 +2144,52 @@ class ExportWorker:
         # Check for placeholder image rendered by Remotion
         placeholder_image = stills_dir / "_placeholder.png" if stills_dir.exists() else None
 
-        filter_complex, overlay_input_args, final_label = self._build_floating_wysiwyg_filter(
-            cards=rendered_cards,
-            ass_path=ass_path,
-            video_duration=video_duration,
-            gradient_path=gradient_path,
-            placeholder_image=placeholder_image,
-            show_card_panel=show_card_panel,
+        def build_filter(cards, chunk_ass_path, duration):
+            return self._build_floating_wysiwyg_filter(
+                cards=cards,
+                ass_path=chunk_ass_path,
+                video_duration=duration,
+                gradient_path=gradient_path,
+                placeholder_image=placeholder_image,
+                show_card_panel=show_card_panel,
+            )
+
+        if settings.export_chunk_seconds > 0:
+            await self._encode_chunked(
+                video_path=video_path,
+                output_path=output_path,
+                video_duration=video_duration,
+                build_filter=build_filter,
+                cards=rendered_cards,
+                ass_path=ass_path,
+                source_offset=source_offset,
+                source_key=source_key,
+                progress_callback=progress_callback,
+                timeline_id=timeline_id,
+                essence=essence,
+                regions=regions,
+            )
+            if progress_callback:
+                progress_callback(95, "完成")
+            logger.info(f"Hybrid WYSIWYG video exported: {output_path}")
+            return output_path
+
+        filter_complex, overlay_input_args, final_label = build_filter(
+            rendered_cards, ass_path, video_duration
         )
 
-        cmd = ["ffmpeg", "-i", str(video_path)]
+        audio_map = ["-map", "0:a?"]
+        if regions:
+            filter_complex, audio_map = await self._cut_source_graph(video_path, regions, filter_complex)
+
+        cmd = ["ffmpeg"]
+        if source_offset > 0 and not regions:
+            cmd.extend(["-ss", str(source_offset), "-t", str(video_duration)])
+        cmd.extend(["-i", str(video_path)])
         cmd.extend(overlay_input_args)
         cmd.extend(["-filter_complex", filter_complex])
-        cmd.extend(["-map", f"[{final_label}]", "-map", "0:a?"])
-
-        if self.use_nvenc:
-            cmd.extend(["-c:v", "h264_nvenc", "-preset", "p4"])
-        else:
-            cmd.extend(["-c:v", "libx264", "-preset", "medium", "-crf", "23"])
+        cmd.extend(["-map", f"[{final_label}]", *audio_map])
+        cmd.extend(self._video_codec_args())
         cmd.extend(["-c:a", "aac", "-b:a", "192k", "-y", str(output_path)])
 
         logger.info(
@@ -2271,6 +2324,325 @@ class ExportWorker:
         logger.info(f"Hybrid WYSIWYG video exported: {output_path}")
         return output_path
 
+    async def _cut_source_graph(
+        self,
+        video_path: Path,
+        regions: List[Tuple[float, float]],
+        filter_complex: str,
+    ) -> Tuple[str, List[str]]:
+        """Restrict a single-pass graph to source ``regions``, played back to back.
+
+        Returns:
+            (filter_complex, audio map arguments)
+        """
+        fps = await self._get_video_frame_rate(video_path)
+        frames = export_chunks.frame_ranges(regions, fps)
+        filter_complex = export_chunks.cut_source(filter_complex, frames, fps)
+        if not await self._has_audio_stream(video_path):
+            return filter_complex, []
+        return (
+            f"{filter_complex};[0:a]{export_chunks.aselect_filter(frames, fps)}[aout]",
+            ["-map", "[aout]"],
+        )
+
+    async def _encode_audio_ranges(
+        self,
+        video_path: Path,
+        ranges: List[Tuple[float, float]],
+        output_path: Path,
+    ) -> None:
+        """Encode the source audio of (start, end) ranges back to back as AAC.
+
+        The source is opened once, bounded to the span of the ranges, and cut
+        by an aselect over the frame-snapped ranges like the single-pass
+        graph, so hundreds of ranges need one demuxer and one decoder.
+        """
+        seek, end = ranges[0][0], ranges[-1][1]
+        fps = await self._get_video_frame_rate(video_path)
+        frames = export_chunks.frame_ranges([(start - seek, stop - seek) for start, stop in ranges], fps)
+        cmd = ["ffmpeg", "-ss", f"{seek:.6f}", "-t", f"{end - seek:.6f}", "-i", str(video_path)]
+        if len(frames) > 1:
+            # aselect keeps whole audio frames; small frames keep the cuts tight
+            cmd.extend([
+                "-filter_complex",
+                f"[0:a:0]asetnsamples=n=64:p=0,{export_chunks.aselect_filter(frames, fps)}[aout]",
+                "-map", "[aout]",
+            ])
+        else:
+            cmd.extend(["-map", "0:a"])
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        cmd.extend(["-vn", "-c:a", "aac", "-b:a", "192k", "-f", "mp4", "-y", str(tmp_path)])
+        result = await run_process(cmd, capture_stdout=False)
+        if result.returncode != 0:
+            tmp_path.unlink(missing_ok=True)
+            raise RuntimeError(f"ffmpeg audio encode failed: {result.stderr[-1000:]}")
+        tmp_path.replace(output_path)
+
+    async def _concat_chunks(self, parts: List[Path], audio_path: Optional[Path], list_path: Path, output_path: Path) -> None:
+        """Join encoded video parts and an audio track without re-encoding."""
+        export_chunks.write_concat_list(list_path, parts)
+        cmd = ["ffmpeg", "-f", "concat", "-safe", "0", "-i", str(list_path)]
+        if audio_path:
+            cmd.extend(["-i", str(audio_path), "-map", "0:v", "-map", "1:a"])
+        cmd.extend(["-c", "copy", "-movflags", "+faststart", "-y", str(output_path)])
+        result = await run_process(cmd, capture_stdout=False)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg chunk concat failed: {result.stderr[-1000:]}")
+
+    async def _encode_chunked(
+        self,
+        video_path: Path,
+        output_path: Path,
+        video_duration: float,
+        build_filter: Callable[[list, Optional[Path], float], Tuple[str, List[str], str]],
+        cards: list,
+        ass_path: Optional[Path],
+        source_offset: float = 0.0,
+        source_key: Optional[str] = None,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        timeline_id: Optional[str] = None,
+        essence: Optional[Tuple[Path, List[Tuple[float, float]]]] = None,
+        regions: Optional[List[Tuple[float, float]]] = None,
+    ) -> Path:
+        """Encode a composition as cached time chunks, then stream-copy concat them.
+
+        Chunks whose inputs are unchanged since an earlier export of the same
+        output are reused from ``<output stem>_chunks/``; only dirty chunks are
+        encoded. Audio does not depend on cards or subtitles and is encoded
+        once per source cut.
+
+        With ``essence``, the same decode and composition also feed a second
+        output made of the given time ranges: each chunk's composed frames
+        are split, the frames inside the ranges are encoded as an essence
+        part, and the parts are joined like the chunks.
+
+        Args:
+            video_path: Source video
+            output_path: Path for output video
+            video_duration: Output duration in seconds (derived from regions
+                when given)
+            build_filter: (cards, ass_path, duration) -> (filter_complex,
+                input_args, final_label) for one chunk, in chunk-local time
+            cards: (image_path, start, end, ...) tuples in output time
+            ass_path: Subtitles burnt in by the filter graph, if any
+            source_offset: Seconds into video_path where the output starts
+            source_key: Identity of the source cut (default: video_path and
+                source_offset); pass one for temporary sources
+            progress_callback: Optional progress callback (25-90% range)
+            timeline_id: For cancellation tracking
+            essence: (essence output path, [(start, end), ...] in output time)
+            regions: Source (start, end) ranges to play back to back instead
+                of the source from source_offset; each chunk's graph is fed
+                only its kept frames
+
+        Returns:
+            Path to exported video
+        """
+        chunk_dir = output_path.parent / f"{output_path.stem}_chunks"
+        chunk_dir.mkdir(parents=True, exist_ok=True)
+        fps = await self._get_video_frame_rate(video_path)
+        source = source_key or export_chunks.source_key(video_path, offset=source_offset, regions=regions)
+        region_frames = export_chunks.frame_ranges(regions, fps) if regions else None
+        if region_frames is not None:
+            video_duration = float(sum(end - start for start, end in region_frames) / fps)
+        plan = export_chunks.plan_chunks(video_duration, fps, settings.export_chunk_seconds)
+        ass_text = ass_path.read_text(encoding="utf-8") if ass_path and ass_path.exists() else None
+        encode_args = self._video_codec_args()
+        digests: dict[str, str] = {}
+
+        def source_seconds(ranges: List[Tuple[int, int]]) -> List[Tuple[float, float]]:
+            """Source (start, end) seconds of output frame ranges."""
+            if region_frames is None:
+                return [(source_offset + float(start / fps), source_offset + float(end / fps)) for start, end in ranges]
+            return [
+                (float(source_start / fps), float(source_end / fps))
+                for start, end in ranges
+                for source_start, source_end in export_chunks.map_output_frames(region_frames, start, end - start)
+            ]
+
+        essence_path = None
+        essence_frames: List[Tuple[int, int]] = []
+        if essence is not None:
+            essence_path = Path(essence[0])
+            essence_frames = export_chunks.frame_ranges(essence[1], fps)
+
+        chunks = []  # (chunk, path, reused)
+        essence_parts: List[Path] = []
+        pending = []  # (chunk, path, essence_part, cmd)
+        for chunk in plan:
+            chunk_ass = None
+            chunk_ass_text = None
+            if ass_text is not None:
+                chunk_ass = chunk_dir / f"chunk_{chunk.index:05d}.ass"
+                chunk_ass_text = export_chunks.slice_ass(ass_text, chunk.start, chunk.end)
+            chunk_cards = export_chunks.shift_cards(cards, chunk.start, chunk.end)
+            filter_complex, input_args, final_label = build_filter(
+                chunk_cards, chunk_ass, chunk.end - chunk.start
+            )
+            seek, span = source_offset + chunk.start, chunk.frames
+            if region_frames is not None:
+                kept = export_chunks.map_output_frames(region_frames, chunk.start_frame, chunk.frames)
+                first = kept[0][0]
+                seek, span = float(first / fps), kept[-1][1] - first
+                filter_complex = export_chunks.cut_source(
+                    filter_complex, [(start - first, end - first) for start, end in kept], fps
+                )
+            key = export_chunks.chunk_key(
+                source, chunk, filter_complex, input_args, chunk_ass_text, encode_args, digests
+            )
+            path = chunk_dir / f"chunk_{chunk.index:05d}_{key[:16]}.mp4"
+
+            local_ranges = export_chunks.chunk_frame_ranges(essence_frames, chunk)
+            essence_part = None
+            if local_ranges:
+                part_key = hashlib.sha256(f"{key}|{local_ranges}".encode()).hexdigest()[:16]
+                essence_part = chunk_dir / f"essence_{chunk.index:05d}_{part_key}.mp4"
+                essence_parts.append(essence_part)
+
+            if path.exists() and (essence_part is None or essence_part.exists()):
+                chunks.append((chunk, path, True))
+                continue
+            chunks.append((chunk, path, False))
+            if chunk_ass is not None:
+                chunk_ass.write_text(chunk_ass_text, encoding="utf-8")
+
+            # Input seeking resets timestamps, so the graph sees chunk-local time;
+            # the input is bounded so an essence branch cannot outlive the chunk
+            cmd = [
+                "ffmpeg", "-ss", f"{seek:.6f}",
+                "-t", f"{float((span + 2) / fps):.6f}", "-i", str(video_path),
+            ]
+            cmd.extend(input_args)
+            chunk_label = final_label
+            if essence_part is not None:
+                filter_complex += (
+                    f";[{final_label}]split=2[chunk_out][essence_in];"
+                    f"[essence_in]{export_chunks.select_filter(local_ranges, fps)}[essence_out]"
+                )
+                chunk_label = "chunk_out"
+            cmd.extend(["-filter_complex", filter_complex])
+            cmd.extend(["-map", f"[{chunk_label}]", "-an", "-r", str(fps), "-frames:v", str(chunk.frames)])
+            cmd.extend(encode_args)
+            cmd.extend(["-f", "mp4", "-y", str(path.with_name(path.name + ".tmp"))])
+            if essence_part is not None:
+                cmd.extend(["-map", "[essence_out]", "-an", "-r", str(fps)])
+                cmd.extend(encode_args)
+                cmd.extend(["-f", "mp4", "-y", str(essence_part.with_name(essence_part.name + ".tmp"))])
+            pending.append((chunk, path, essence_part, cmd))
+
+        logger.info(
+            f"Chunked export: {len(chunks)} chunks of {settings.export_chunk_seconds:g}s at {fps} fps, "
+            f"reusing {len(chunks) - len(pending)}, encoding {len(pending)} → {output_path}"
+            + (f" + {essence_path} ({len(essence_parts)} parts)" if essence_path else "")
+        )
+
+        def register(proc: asyncio.subprocess.Process) -> None:
+            if timeline_id:
+                self._active_processes[timeline_id] = proc
+
+        pending_frames = sum(chunk.frames for chunk, _, _, _ in pending) or 1
+        done_frames = 0
+        render_start_time = time.monotonic()
+        for number, (chunk, path, essence_part, cmd) in enumerate(pending, start=1):
+            if timeline_id and self._check_cancelled(timeline_id):
+                raise ExportCancelledError(f"Export cancelled for timeline {timeline_id}")
+
+            def on_progress(fraction: float, base: int = done_frames, frames: int = chunk.frames,
+                            number: int = number) -> None:
+                if not progress_callback:
+                    return
+                pct = min((base + fraction * frames) / pending_frames, 1.0)
+                cb_msg = f"编码分段 {number}/{len(pending)} · {int(pct * 100)}%"
+                elapsed = time.monotonic() - render_start_time
+                if pct > 0.05 and elapsed > 3:
+                    remaining = elapsed / pct * (1 - pct)
+                    if remaining > 60:
+                        cb_msg += f" · 预计剩余 {int(remaining // 60)}m{int(remaining % 60):02d}s"
+                    else:
+                        cb_msg += f" · 预计剩余 {int(remaining)}s"
+                progress_callback(25 + pct * 65, cb_msg)
+
+            outputs = [path] + ([essence_part] if essence_part is not None else [])
+            try:
+                result = await run_process(
+                    cmd,
+                    timeout=max(600, int((chunk.end - chunk.start) * 6)),
+                    capture_stdout=False,
+                    on_stderr_line=ffmpeg_progress(chunk.end - chunk.start, on_progress),
+                    on_start=register,
+                )
+            finally:
+                if timeline_id:
+                    self._active_processes.pop(timeline_id, None)
+            if result.returncode != 0:
+                for output in outputs:
+                    output.with_name(output.name + ".tmp").unlink(missing_ok=True)
+                if timeline_id and self._check_cancelled(timeline_id):
+                    raise ExportCancelledError(f"Export cancelled for timeline {timeline_id}")
+                raise RuntimeError(
+                    f"FFmpeg chunk {chunk.index} encode failed (exit {result.returncode}): "
+                    f"{result.stderr[-1000:]}"
+                )
+            for output in outputs:
+                output.with_name(output.name + ".tmp").replace(output)
+            done_frames += chunk.frames
+
+        # ── Audio: encoded once per source cut ──
+        has_audio = await self._has_audio_stream(video_path)
+        audio_path = None
+        output_duration = plan[-1].end
+        if has_audio:
+            audio_ranges = source_seconds([(0, plan[-1].start_frame + plan[-1].frames)])
+            audio_key = hashlib.sha256(
+                f"{source}|{audio_ranges}|{output_duration:.6f}|aac-192k".encode()
+            ).hexdigest()[:16]
+            audio_path = chunk_dir / f"audio_{audio_key}.m4a"
+            if not audio_path.exists():
+                await self._encode_audio_ranges(video_path, audio_ranges, audio_path)
+
+        # ── Join: stream copy, no re-encode ──
+        if progress_callback:
+            progress_callback(90, "合并分段…")
+        await self._concat_chunks(
+            [path for _, path, _ in chunks], audio_path, chunk_dir / "concat.txt", output_path
+        )
+
+        essence_audio = None
+        if essence_path is not None and essence_parts:
+            essence_seconds = source_seconds(essence_frames)
+            if has_audio:
+                audio_key = hashlib.sha256(
+                    f"{source}|{essence_seconds}|aac-192k".encode()
+                ).hexdigest()[:16]
+                essence_audio = chunk_dir / f"audio_essence_{audio_key}.m4a"
+                if not essence_audio.exists():
+                    await self._encode_audio_ranges(video_path, essence_seconds, essence_audio)
+            await self._concat_chunks(
+                essence_parts, essence_audio, chunk_dir / "concat_essence.txt", essence_path
+            )
+
+        summary = export_chunks.manifest(source, chunks, audio_path)
+        if essence_path is not None:
+            summary["essence"] = {
+                "output": essence_path.name,
+                "frame_ranges": essence_frames,
+                "parts": [part.name for part in essence_parts],
+                "audio": essence_audio.name if essence_audio else None,
+            }
+        with open(chunk_dir / "manifest.json", "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        keep = [path for _, path, _ in chunks] + essence_parts
+        keep += [p for p in (audio_path, essence_audio) if p is not None]
+        removed = export_chunks.remove_unreferenced(chunk_dir, keep)
+        if removed:
+            logger.info(f"Removed {removed} chunk files of earlier exports")
+
+        logger.info(
+            f"Chunked export done in {time.monotonic() - render_start_time:.1f}s: "
+            f"{len(pending)}/{len(chunks)} chunks encoded → {output_path}"
+        )
+        return output_path
+
     async def export_full_video(
         self,
         timeline: Timeline,
@@ -2279,6 +2651,7 @@ class ExportWorker:
         subtitle_style=None,
         progress_callback: Optional[Callable[[float, str], None]] = None,
         timeline_id: Optional[str] = None,
+        essence_path: Optional[Path] = None,
     ) -> Path:
         """Export full video with subtitles and pinned cards.
 
@@ -2294,6 +2667,9 @@ class ExportWorker:
             video_path: Source video path
             output_path: Output video path
             subtitle_style: Optional subtitle style options
+            essence_path: Also cut the essence video from the same decode
+                and composition when the export path supports it; check
+                whether the file exists afterwards
 
         Returns:
             Path to exported video
@@ -2307,7 +2683,7 @@ class ExportWorker:
         trim_end = getattr(timeline, 'video_trim_end', None)
 
         # Get video dimensions
-        orig_width, orig_height = self._get_video_dimensions(video_path)
+        orig_width, orig_height = await self._get_video_dimensions(video_path)
 
         # Get subtitle style mode (default to HALF_SCREEN for backwards compatibility)
         subtitle_style_mode = getattr(timeline, 'subtitle_style_mode', SubtitleStyleMode.HALF_SCREEN)
@@ -2376,90 +2752,59 @@ class ExportWorker:
         # WYSIWYG mode: HALF_SCREEN uses Remotion for pixel-perfect React rendering
         if subtitle_style_mode == SubtitleStyleMode.HALF_SCREEN:
             if exclusion_ranges:
-                # Exclusion ranges: extract keep regions, concat, retime
-                video_duration = self._get_video_duration(video_path)
+                # Exclusion ranges: compose the keep regions back to back, retimed
+                video_duration = await self._get_video_duration(video_path)
                 effective_trim_end = trim_end if trim_end is not None else video_duration
                 keep_regions = self._compute_keep_regions(trim_start, effective_trim_end, exclusion_ranges)
 
                 if not keep_regions:
                     raise ValueError("No video regions remain after applying exclusion ranges")
 
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    temp_path = Path(temp_dir)
-
-                    # Extract each keep region as a clip
-                    segment_files = []
-                    for i, (region_start, region_end) in enumerate(keep_regions):
-                        segment_file = temp_path / f"region_{i:04d}.mp4"
-                        await self._extract_segment(
-                            video_path=video_path,
-                            start=region_start,
-                            duration=region_end - region_start,
-                            output_path=segment_file,
-                        )
-                        segment_files.append(segment_file)
-
-                    # Concatenate region clips
-                    concat_file = temp_path / "concat.txt"
-                    with open(concat_file, "w") as f:
-                        for sf in segment_files:
-                            f.write(f"file '{sf}'\n")
-                    concat_output = temp_path / "concat.mp4"
-                    await self._concat_segments(concat_file, concat_output)
-
-                    # Retime segments and cards for concatenated regions
-                    retimed_segments = self._retime_segments_for_regions(trimmed_segments, keep_regions)
-                    retimed_pinned = self._retime_pinned_cards_for_regions(pinned_cards, keep_regions)
-
-                    concat_duration = self._get_video_duration(concat_output)
+                # Retime segments and cards for concatenated regions
+                retimed_segments = self._retime_segments_for_regions(trimmed_segments, keep_regions)
+                retimed_pinned = self._retime_pinned_cards_for_regions(pinned_cards, keep_regions)
+                kept_duration = sum(end - start for start, end in keep_regions)
 
-                    logger.info(
-                        f"Full export with exclusions: {len(keep_regions)} keep regions, "
-                        f"{len(retimed_segments)} retimed segments, "
-                        f"{len(retimed_pinned)} retimed cards, "
-                        f"concat duration={concat_duration:.1f}s"
-                    )
+                logger.info(
+                    f"Full export with exclusions: {len(keep_regions)} keep regions, "
+                    f"{len(retimed_segments)} retimed segments, "
+                    f"{len(retimed_pinned)} retimed cards, "
+                    f"kept duration={kept_duration:.1f}s"
+                )
 
-                    return await self._render_with_remotion(
-                        segments=[],
-                        pinned_cards=retimed_pinned,
-                        video_path=concat_output,
-                        output_path=output_path,
-                        video_duration=concat_duration,
-                        subtitle_style=subtitle_style,
-                        retimed_segments=retimed_segments,
-                        use_traditional=timeline.use_traditional_chinese,
-                        subtitle_language_mode=subtitle_language_mode,
-                        progress_callback=progress_callback,
-                        timeline_id=timeline_id,
-                        show_card_panel=show_card_panel,
-                    )
+                # The filter graph cuts the regions from the source: no
+                # per-region clips, and cuts are frame-accurate
+                return await self._render_with_remotion(
+                    segments=[],
+                    pinned_cards=retimed_pinned,
+                    video_path=video_path,
+                    output_path=output_path,
+                    video_duration=kept_duration,
+                    subtitle_style=subtitle_style,
+                    retimed_segments=retimed_segments,
+                    use_traditional=timeline.use_traditional_chinese,
+                    subtitle_language_mode=subtitle_language_mode,
+                    progress_callback=progress_callback,
+                    timeline_id=timeline_id,
+                    show_card_panel=show_card_panel,
+                    regions=keep_regions,
+                    essence=self._combined_essence(essence_path, timeline, keep_regions),
+                )
             else:
                 # No exclusion ranges — existing trim-only flow
-                video_duration = self._get_video_duration(video_path)
+                video_duration = await self._get_video_duration(video_path) - trim_start
                 if trim_end is not None:
                     video_duration = min(video_duration, trim_end - trim_start)
 
-                # Determine source video: trim if needed
-                if trim_start > 0 or trim_end is not None:
-                    trimmed_video = output_path.parent / "trimmed_source.mp4"
-                    trim_cmd = ["ffmpeg", "-ss", str(trim_start), "-i", str(video_path)]
-                    if trim_end is not None:
-                        trim_cmd.extend(["-t", str(trim_end - trim_start)])
-                    trim_cmd.extend(["-c", "copy", "-y", str(trimmed_video)])
-                    trim_result = subprocess.run(trim_cmd, capture_output=True, text=True)
-                    if trim_result.returncode != 0:
-                        raise RuntimeError(f"ffmpeg trim failed: {trim_result.stderr}")
-                    source_video = trimmed_video
-                else:
-                    source_video = video_path
-
+                # Trimmed exports seek into the source (frame-accurate, no
+                # intermediate copy, stable identity for chunk reuse)
                 return await self._render_with_remotion(
                     segments=trimmed_segments,
                     pinned_cards=pinned_cards,
-                    video_path=source_video,
+                    video_path=video_path,
                     output_path=output_path,
                     video_duration=video_duration,
+                    source_offset=trim_start,
                     subtitle_style=subtitle_style,
                     time_offset=time_offset,
                     use_traditional=timeline.use_traditional_chinese,
@@ -2467,191 +2812,131 @@ class ExportWorker:
                     progress_callback=progress_callback,
                     timeline_id=timeline_id,
                     show_card_panel=show_card_panel,
+                    essence=self._combined_essence(
+                        essence_path, timeline, [(trim_start, trim_start + video_duration)]
+                    ),
                 )
         else:
             # FLOATING / NONE modes
+            video_duration = await self._get_video_duration(video_path)
+            keep_regions = None
             if exclusion_ranges:
-                # Exclusion ranges: extract keep regions, concat, retime
-                video_duration = self._get_video_duration(video_path)
                 effective_trim_end = trim_end if trim_end is not None else video_duration
                 keep_regions = self._compute_keep_regions(trim_start, effective_trim_end, exclusion_ranges)
-
                 if not keep_regions:
                     raise ValueError("No video regions remain after applying exclusion ranges")
-
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    temp_path = Path(temp_dir)
-
-                    # Extract each keep region as a clip
-                    segment_files = []
-                    for i, (region_start, region_end) in enumerate(keep_regions):
-                        segment_file = temp_path / f"region_{i:04d}.mp4"
-                        await self._extract_segment(
-                            video_path=video_path,
-                            start=region_start,
-                            duration=region_end - region_start,
-                            output_path=segment_file,
-                        )
-                        segment_files.append(segment_file)
-
-                    # Concatenate region clips
-                    concat_file = temp_path / "concat.txt"
-                    with open(concat_file, "w") as f:
-                        for sf in segment_files:
-                            f.write(f"file '{sf}'\n")
-                    concat_output = temp_path / "concat.mp4"
-                    await self._concat_segments(concat_file, concat_output)
-
-                    concat_width, concat_height = self._get_video_dimensions(concat_output)
-
-                    # Retime segments and cards for concatenated regions
-                    retimed_segments = self._retime_segments_for_regions(trimmed_segments, keep_regions)
-                    retimed_pinned = self._retime_pinned_cards_for_regions(pinned_cards, keep_regions)
-
-                    # Render cards with retimed timing
-                    rendered_cards = await self.render_pinned_cards(
-                        pinned_cards=retimed_pinned,
-                        output_dir=cards_dir,
-                        time_offset=0.0,
-                    )
-
-                    # Generate ASS from retimed segments
-                    ass_path = output_path.parent / "subtitles_full.ass"
-                    await self._generate_essence_ass(
-                        retimed_segments,
-                        ass_path,
-                        timeline.use_traditional_chinese,
-                        video_height=concat_height,
-                        subtitle_style=subtitle_style,
-                        subtitle_style_mode=subtitle_style_mode,
-                        subtitle_language_mode=subtitle_language_mode,
-                    )
-
-                    if subtitle_style_mode == SubtitleStyleMode.FLOATING:
-                        vf_filter = self._build_floating_filter(ass_path)
-                        mode_name = "floating (Watching)"
-                    else:
-                        vf_filter = None
-                        mode_name = "none (Dubbing)"
-
-                    cmd = ["ffmpeg", "-i", str(concat_output)]
-
-                    card_filter = ""
-                    card_inputs = []
-                    final_label = ""
-                    if rendered_cards:
-                        card_filter, card_inputs, final_label = self._build_card_overlay_filter(
-                            cards=rendered_cards,
-                            video_width=concat_width,
-                            video_height=concat_height,
-                        )
-                        cmd.extend(card_inputs)
-
-                    if card_filter and vf_filter:
-                        cmd.extend(["-filter_complex", f"{vf_filter}[subtitled];{card_filter.replace('[0:v]', '[subtitled]')}"])
-                        cmd.extend(["-map", f"[{final_label}]", "-map", "0:a?"])
-                    elif card_filter:
-                        cmd.extend(["-filter_complex", card_filter])
-                        cmd.extend(["-map", f"[{final_label}]", "-map", "0:a?"])
-                    elif vf_filter:
-                        cmd.extend(["-vf", vf_filter])
-                    else:
-                        # Normalize SAR even when no subtitles/cards
-                        cmd.extend(["-vf", "setsar=1"])
-
-                    if self.use_nvenc:
-                        cmd.extend(["-c:v", "h264_nvenc", "-preset", "p4"])
-                    else:
-                        cmd.extend(["-c:v", "libx264", "-preset", "medium", "-crf", "23"])
-                    cmd.extend(["-c:a", "aac", "-b:a", "192k", "-y", str(output_path)])
-
-                    cards_info = f", {len(rendered_cards)} cards" if rendered_cards else ""
-                    logger.info(
-                        f"Exporting full video (exclusions removed) with {mode_name} mode, "
-                        f"lang={subtitle_language_mode.value}{cards_info}: {output_path}"
-                    )
-                    result = subprocess.run(cmd, capture_output=True, text=True)
-
-                    if result.returncode != 0:
-                        raise RuntimeError(f"ffmpeg export failed: {result.stderr}")
-
-                logger.info(f"Full video exported (exclusions removed): {output_path}")
-                return output_path
-
-            # No exclusion ranges — existing behavior (full-width video)
-            rendered_cards = await self.render_pinned_cards(
-                pinned_cards=pinned_cards,
-                output_dir=cards_dir,
-                time_offset=time_offset,
-            )
+                video_duration = sum(end - start for start, end in keep_regions)
+            else:
+                video_duration -= trim_start
+                if trim_end is not None:
+                    video_duration = min(video_duration, trim_end - trim_start)
 
             ass_path = output_path.parent / "subtitles_full.ass"
-            await self.generate_ass_with_layout(
-                segments=trimmed_segments,
-                output_path=ass_path,
-                use_traditional=timeline.use_traditional_chinese,
-                time_offset=time_offset,
-                video_height=orig_height,
-                subtitle_style=subtitle_style,
-                subtitle_style_mode=subtitle_style_mode,
-                subtitle_language_mode=subtitle_language_mode,
-            )
+            if keep_regions:
+                # Exclusion ranges: retime segments and cards for the keep
+                # regions played back to back
+                retimed_segments = self._retime_segments_for_regions(trimmed_segments, keep_regions)
+                retimed_pinned = self._retime_pinned_cards_for_regions(pinned_cards, keep_regions)
+                rendered_cards = await self.render_pinned_cards(
+                    pinned_cards=retimed_pinned,
+                    output_dir=cards_dir,
+                    time_offset=0.0,
+                )
+                await self._generate_essence_ass(
+                    retimed_segments,
+                    ass_path,
+                    timeline.use_traditional_chinese,
+                    video_height=orig_height,
+                    subtitle_style=subtitle_style,
+                    subtitle_style_mode=subtitle_style_mode,
+                    subtitle_language_mode=subtitle_language_mode,
+                )
+            else:
+                rendered_cards = await self.render_pinned_cards(
+                    pinned_cards=pinned_cards,
+                    output_dir=cards_dir,
+                    time_offset=time_offset,
+                )
+                await self.generate_ass_with_layout(
+                    segments=trimmed_segments,
+                    output_path=ass_path,
+                    use_traditional=timeline.use_traditional_chinese,
+                    time_offset=time_offset,
+                    video_height=orig_height,
+                    subtitle_style=subtitle_style,
+                    subtitle_style_mode=subtitle_style_mode,
+                    subtitle_language_mode=subtitle_language_mode,
+                )
 
             if subtitle_style_mode == SubtitleStyleMode.FLOATING:
-                vf_filter = self._build_floating_filter(ass_path)
                 mode_name = "floating (Watching)"
             else:
-                vf_filter = None
+                ass_path = None
                 mode_name = "none (Dubbing)"
 
-            cmd = ["ffmpeg"]
-            if trim_start > 0:
-                cmd.extend(["-ss", str(trim_start)])
-            cmd.extend(["-i", str(video_path)])
-
-            card_filter = ""
-            card_inputs = []
-            final_label = ""
-            if rendered_cards:
+            def build_filter(cards, chunk_ass_path, duration):
+                vf = self._build_floating_filter(chunk_ass_path) if chunk_ass_path else "setsar=1"
+                if not cards:
+                    return f"[0:v]{vf}[vout]", [], "vout"
                 card_filter, card_inputs, final_label = self._build_card_overlay_filter(
-                    cards=rendered_cards,
+                    cards=cards,
                     video_width=orig_width,
                     video_height=orig_height,
                 )
-                cmd.extend(card_inputs)
-
-            if trim_end is not None:
-                cmd.extend(["-t", str(trim_end - trim_start)])
-
-            if card_filter and vf_filter:
-                cmd.extend(["-filter_complex", f"{vf_filter}[subtitled];{card_filter.replace('[0:v]', '[subtitled]')}"])
-                cmd.extend(["-map", f"[{final_label}]", "-map", "0:a?"])
-            elif card_filter:
-                cmd.extend(["-filter_complex", card_filter])
-                cmd.extend(["-map", f"[{final_label}]", "-map", "0:a?"])
-            elif vf_filter:
-                cmd.extend(["-vf", vf_filter])
-            else:
-                # Normalize SAR even when no subtitles/cards
-                cmd.extend(["-vf", "setsar=1"])
+                if chunk_ass_path:
+                    card_filter = f"[0:v]{vf}[subtitled];{card_filter.replace('[0:v]', '[subtitled]')}"
+                return card_filter, card_inputs, final_label
+
+            trim_info = ""
+            if trim_start > 0 or trim_end is not None:
+                trim_info = f", trim={trim_start:.1f}s-{trim_end or 'end'}"
+            if keep_regions:
+                trim_info += f", {len(keep_regions)} keep regions"
+            cards_info = f", {len(rendered_cards)} cards" if rendered_cards else ""
+            logger.info(
+                f"Exporting full video with {mode_name} mode, lang={subtitle_language_mode.value}"
+                f"{trim_info}{cards_info}: {output_path}"
+            )
 
-            if self.use_nvenc:
-                cmd.extend(["-c:v", "h264_nvenc", "-preset", "p4"])
+            if settings.export_chunk_seconds > 0:
+                await self._encode_chunked(
+                    video_path=video_path,
+                    output_path=output_path,
+                    video_duration=video_duration,
+                    build_filter=build_filter,
+                    cards=rendered_cards,
+                    ass_path=ass_path,
+                    source_offset=trim_start,
+                    progress_callback=progress_callback,
+                    timeline_id=timeline_id,
+                    essence=self._combined_essence(
+                        essence_path, timeline, keep_regions or [(trim_start, trim_start + video_duration)]
+                    ),
+                    regions=keep_regions,
+                )
+                logger.info(f"Full video exported ({mode_name}, chunked): {output_path}")
+                return output_path
+
+            # Single pass; exclusions are cut inside the filter graph
+            filter_complex, card_inputs, final_label = build_filter(rendered_cards, ass_path, video_duration)
+            audio_map = ["-map", "0:a?"]
+            cmd = ["ffmpeg"]
+            if keep_regions:
+                filter_complex, audio_map = await self._cut_source_graph(video_path, keep_regions, filter_complex)
             else:
-                cmd.extend(["-c:v", "libx264", "-preset", "medium", "-crf", "23"])
+                if trim_start > 0:
+                    cmd.extend(["-ss", str(trim_start)])
+                if trim_end is not None:
+                    cmd.extend(["-t", str(trim_end - trim_start)])
+            cmd.extend(["-i", str(video_path)])
+            cmd.extend(card_inputs)
+            cmd.extend(["-filter_complex", filter_complex, "-map", f"[{final_label}]", *audio_map])
+            cmd.extend(self._video_codec_args())
             cmd.extend(["-c:a", "aac", "-b:a", "192k", "-y", str(output_path)])
 
-            cards_info = f", {len(rendered_cards)} cards" if rendered_cards else ""
-
-        trim_info = ""
-        if trim_start > 0 or trim_end is not None:
-            trim_info = f", trim={trim_start:.1f}s-{trim_end or 'end'}"
-        lang_info = f", lang={subtitle_language_mode.value}"
-        logger.info(f"Exporting full video with {mode_name} mode{lang_info}{trim_info}{cards_info}: {output_path}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
-
-        if result.returncode != 0:
-            raise RuntimeError(f"ffmpeg export failed: {result.stderr}")
+            result = await run_process(cmd)
+            if result.returncode != 0:
+                raise RuntimeError(f"ffmpeg export failed: {result.stderr}")
 
         logger.info(f"Full video exported: {output_path}")
         return output_path
@@ -2725,6 +3010,73 @@ class ExportWorker:
         # setsar=1 normalizes pixel aspect ratio for YouTube compatibility
         return f"ass={ass_path_escaped},setsar=1"
 
+    def _essence_segments(self, timeline: Timeline) -> List[EditableSegment]:
+        """KEEP segments within the trim range and not excluded, in order."""
+        trim_start = getattr(timeline, 'video_trim_start', 0.0) or 0.0
+        trim_end = getattr(timeline, 'video_trim_end', None)
+        effective_trim_end = trim_end if trim_end is not None else float('inf')
+
+        # Helper: check if segment is excluded by any exclusion range (>=50% overlap)
+        exclusion_ranges = getattr(timeline, 'video_exclusion_ranges', []) or []
+
+        def _is_excluded(seg):
+            for ex_range in exclusion_ranges:
+                ex_start, ex_end = ex_range[0], ex_range[1]
+                overlap = min(seg.end, ex_end) - max(seg.start, ex_start)
+                if overlap > 0 and overlap >= (seg.end - seg.start) * 0.5:
+                    return True
+            return False
+
+        return [
+            seg for seg in timeline.segments
+            if seg.state == SegmentState.KEEP
+            and seg.start >= trim_start
+            and seg.end <= effective_trim_end
+            and not _is_excluded(seg)
+        ]
+
+    def _essence_regions(self, keep_segments: List[EditableSegment], fps: Fraction) -> List[Tuple[float, float]]:
+        """Source ranges of the essence: KEEP segments snapped to frames, overlaps merged."""
+        frames = export_chunks.frame_ranges(
+            [(seg.effective_start, seg.effective_end) for seg in keep_segments], fps
+        )
+        return [(float(start / fps), float(end / fps)) for start, end in frames]
+
+    def _combined_essence(
+        self,
+        essence_path: Optional[Path],
+        timeline: Timeline,
+        keep_regions: List[Tuple[float, float]],
+    ) -> Optional[Tuple[Path, List[Tuple[float, float]]]]:
+        """Essence ranges in the output time of a full export of ``keep_regions``.
+
+        The essence is the full export's composed frames at its KEEP
+        segments, so both can come from one decode. Only chunked export can
+        produce it, and only when every segment lies inside one keep region.
+
+        Returns:
+            (essence_path, [(start, end), ...]) for ``_encode_chunked``, or
+            None when the essence has to be exported on its own
+        """
+        if essence_path is None or settings.export_chunk_seconds <= 0:
+            return None
+        ranges = []
+        for seg in self._essence_segments(timeline):
+            offset = 0.0
+            for region_start, region_end in keep_regions:
+                if region_start - 1e-3 <= seg.effective_start and seg.effective_end <= region_end + 1e-3:
+                    start = offset + max(seg.effective_start - region_start, 0.0)
+                    end = offset + min(seg.effective_end, region_end) - region_start
+                    ranges.append((start, end))
+                    break
+                offset += region_end - region_start
+            else:
+                logger.info(f"Segment {seg.id} straddles an excluded range; essence exported separately")
+                return None
+        if not ranges:
+            return None
+        return Path(essence_path), ranges
+
     async def export_essence(
         self,
         timeline: Timeline,
@@ -2736,11 +3088,11 @@ class ExportWorker:
     ) -> Path:
         """Export essence video (only KEEP segments) with subtitles.
 
-        This method:
-        1. Extracts KEEP segments from source video
-        2. Concatenates them with ffmpeg
-        3. Generates re-timed ASS subtitles based on subtitle_style_mode
-        4. Burns subtitles into final video
+        The KEEP segments are cut from the source inside one filter graph
+        (a ``select`` over their frame ranges), so there are no per-segment
+        clips, every cut is frame-accurate and the source is decoded once.
+        With chunked export enabled the graph is split into time chunks,
+        each selecting only its own segments.
 
         Args:
             timeline: Timeline with segments (uses KEEP segments only)
@@ -2755,11 +3107,6 @@ class ExportWorker:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Get video-level trim settings
-        trim_start = getattr(timeline, 'video_trim_start', 0.0) or 0.0
-        trim_end = getattr(timeline, 'video_trim_end', None)
-        effective_trim_end = trim_end if trim_end is not None else float('inf')
-
         # Get subtitle style mode (default to HALF_SCREEN for backwards compatibility)
         subtitle_style_mode = getattr(timeline, 'subtitle_style_mode', SubtitleStyleMode.HALF_SCREEN)
         if subtitle_style_mode is None:
@@ -2770,132 +3117,101 @@ class ExportWorker:
         if subtitle_language_mode is None:
             subtitle_language_mode = SubtitleLanguageMode.BOTH
 
-        # Helper: check if segment is excluded by any exclusion range (>=50% overlap)
-        exclusion_ranges = getattr(timeline, 'video_exclusion_ranges', []) or []
-
-        def _is_excluded(seg):
-            for ex_range in exclusion_ranges:
-                ex_start, ex_end = ex_range[0], ex_range[1]
-                overlap = min(seg.end, ex_end) - max(seg.start, ex_start)
-                if overlap > 0 and overlap >= (seg.end - seg.start) * 0.5:
-                    return True
-            return False
-
-        # Get KEEP segments that are within the trim range and not excluded
-        keep_segments = [
-            seg for seg in timeline.segments
-            if seg.state == SegmentState.KEEP
-            and seg.start >= trim_start
-            and seg.end <= effective_trim_end
-            and not _is_excluded(seg)
-        ]
+        keep_segments = self._essence_segments(timeline)
 
         if not keep_segments:
             raise ValueError("No KEEP segments within trim range to export")
 
-        # Create temp directory for segment clips
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Extract each KEEP segment
-            segment_files = []
-            for i, seg in enumerate(keep_segments):
-                segment_file = temp_path / f"segment_{i:04d}.mp4"
-                await self._extract_segment(
-                    video_path=video_path,
-                    start=seg.effective_start,
-                    duration=seg.effective_duration,
-                    output_path=segment_file,
-                )
-                segment_files.append(segment_file)
-
-            # Create concat file
-            concat_file = temp_path / "concat.txt"
-            with open(concat_file, "w") as f:
-                for segment_file in segment_files:
-                    f.write(f"file '{segment_file}'\n")
-
-            # Concatenate segments
-            concat_output = temp_path / "concat.mp4"
-            await self._concat_segments(concat_file, concat_output)
-
-            # Get concatenated video dimensions for ASS header
-            concat_width, concat_height = self._get_video_dimensions(concat_output)
-
-            # Generate re-timed ASS subtitles for essence based on mode
-            retimed_segments = self._retime_segments(keep_segments)
-
-            # WYSIWYG mode: HALF_SCREEN uses Remotion for pixel-perfect rendering
-            if subtitle_style_mode == SubtitleStyleMode.HALF_SCREEN:
-                # Retime pinned cards to match concatenated segments
-                dropped_seg_ids = {seg.id for seg in timeline.segments if seg.state == SegmentState.DROP}
-                default_card_pos = getattr(timeline, 'card_position', 'right') or 'right'
-                pinned_cards = [
-                    c for c in (getattr(timeline, 'pinned_cards', []) or [])
-                    if c.segment_id not in dropped_seg_ids
-                ]
-                # Apply timeline default position to all cards
-                for card in pinned_cards:
-                    card.position = default_card_pos
-                retimed_pinned = self._retime_pinned_cards(pinned_cards, keep_segments)
-
-                concat_duration = self._get_video_duration(concat_output)
-
-                result_path = await self._render_with_remotion(
-                    segments=[],  # not used when retimed_segments is provided
-                    pinned_cards=retimed_pinned,
-                    video_path=concat_output,
-                    output_path=output_path,
-                    video_duration=concat_duration,
-                    subtitle_style=subtitle_style,
-                    retimed_segments=retimed_segments,
-                    use_traditional=timeline.use_traditional_chinese,
-                    subtitle_language_mode=subtitle_language_mode,
-                    progress_callback=progress_callback,
-                    timeline_id=timeline_id,
-                )
+        # Segments snapped to whole frames, so subtitles and cards are retimed
+        # by exactly the frames the graph keeps
+        fps = await self._get_video_frame_rate(video_path)
+        regions = self._essence_regions(keep_segments, fps)
+        duration = sum(end - start for start, end in regions)
+        retimed_segments = self._retime_segments_for_regions(
+            keep_segments, regions, tolerance=float(Fraction(1, 2) / fps)
+        )
+        width, height = await self._get_video_dimensions(video_path)
 
-                logger.info(
-                    f"Essence video exported: {output_path} "
-                    f"({len(keep_segments)} segments, {timeline.keep_duration:.1f}s)"
-                )
-                return result_path
-            else:
-                ass_path = output_path.parent / "subtitles_essence.ass"
-                await self._generate_essence_ass(
-                    retimed_segments,
-                    ass_path,
-                    timeline.use_traditional_chinese,
-                    video_height=concat_height,
-                    subtitle_style=subtitle_style,
-                    subtitle_style_mode=subtitle_style_mode,
-                    subtitle_language_mode=subtitle_language_mode,
-                )
+        # WYSIWYG mode: HALF_SCREEN uses Remotion for pixel-perfect rendering
+        if subtitle_style_mode == SubtitleStyleMode.HALF_SCREEN:
+            dropped_seg_ids = {seg.id for seg in timeline.segments if seg.state == SegmentState.DROP}
+            default_card_pos = getattr(timeline, 'card_position', 'right') or 'right'
+            pinned_cards = [
+                c for c in (getattr(timeline, 'pinned_cards', []) or [])
+                if c.segment_id not in dropped_seg_ids
+            ]
+            # Apply timeline default position to all cards
+            for card in pinned_cards:
+                card.position = default_card_pos
+            retimed_pinned = self._retime_pinned_cards_for_regions(pinned_cards, regions)
+
+            result_path = await self._render_with_remotion(
+                segments=[],  # not used when retimed_segments is provided
+                pinned_cards=retimed_pinned,
+                video_path=video_path,
+                output_path=output_path,
+                video_duration=duration,
+                subtitle_style=subtitle_style,
+                retimed_segments=retimed_segments,
+                use_traditional=timeline.use_traditional_chinese,
+                subtitle_language_mode=subtitle_language_mode,
+                progress_callback=progress_callback,
+                timeline_id=timeline_id,
+                regions=regions,
+            )
 
-                if subtitle_style_mode == SubtitleStyleMode.FLOATING:
-                    vf_filter = self._build_floating_filter(ass_path)
-                    mode_name = "floating"
-                else:
-                    vf_filter = None
-                    mode_name = "none"
+            logger.info(
+                f"Essence video exported: {output_path} "
+                f"({len(keep_segments)} segments, {timeline.keep_duration:.1f}s)"
+            )
+            return result_path
 
-                cmd = ["ffmpeg", "-i", str(concat_output)]
-                if vf_filter:
-                    cmd.extend(["-vf", vf_filter])
-                else:
-                    # Normalize SAR even when no subtitles
-                    cmd.extend(["-vf", "setsar=1"])
+        if subtitle_style_mode == SubtitleStyleMode.FLOATING:
+            ass_path = output_path.parent / "subtitles_essence.ass"
+            await self._generate_essence_ass(
+                retimed_segments,
+                ass_path,
+                timeline.use_traditional_chinese,
+                video_height=height,
+                subtitle_style=subtitle_style,
+                subtitle_style_mode=subtitle_style_mode,
+                subtitle_language_mode=subtitle_language_mode,
+            )
+            mode_name = "floating"
+        else:
+            ass_path = None
+            mode_name = "none"
 
-            if self.use_nvenc:
-                cmd.extend(["-c:v", "h264_nvenc", "-preset", "p4"])
-            else:
-                cmd.extend(["-c:v", "libx264", "-preset", "medium", "-crf", "23"])
+        def build_filter(cards, chunk_ass_path, chunk_duration):
+            # Normalize SAR even when no subtitles
+            vf = self._build_floating_filter(chunk_ass_path) if chunk_ass_path else "setsar=1"
+            return f"[0:v]{vf}[vout]", [], "vout"
 
+        logger.info(
+            f"Exporting essence video with {mode_name} mode, lang={subtitle_language_mode.value}, "
+            f"{len(regions)} regions: {output_path}"
+        )
+        if settings.export_chunk_seconds > 0:
+            await self._encode_chunked(
+                video_path=video_path,
+                output_path=output_path,
+                video_duration=duration,
+                build_filter=build_filter,
+                cards=[],
+                ass_path=ass_path,
+                progress_callback=progress_callback,
+                timeline_id=timeline_id,
+                regions=regions,
+            )
+        else:
+            filter_complex, _, final_label = build_filter([], ass_path, duration)
+            filter_complex, audio_map = await self._cut_source_graph(video_path, regions, filter_complex)
+            cmd = ["ffmpeg", "-i", str(video_path), "-filter_complex", filter_complex, "-map", f"[{final_label}]"]
+            cmd.extend(audio_map)
+            cmd.extend(self._video_codec_args())
             cmd.extend(["-c:a", "aac", "-b:a", "192k", "-y", str(output_path)])
 
-            logger.info(f"Exporting essence video with {mode_name} mode, lang={subtitle_language_mode.value}: {output_path}")
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
+            result = await run_process(cmd)
             if result.returncode != 0:
                 raise RuntimeError(f"ffmpeg essence export failed: {result.stderr}")
 
@@ -2934,80 +3250,28 @@ class ExportWorker:
 
         profile = timeline.export_profile
 
+        combined_essence = None
+        if profile == ExportProfile.BOTH:
+            # Let the full export cut the essence from its own decode; a stale
+            # file must not pass for that output
+            combined_essence = output_dir / "essence.mp4"
+            combined_essence.unlink(missing_ok=True)
+
         if profile in (ExportProfile.FULL, ExportProfile.BOTH):
             full_path = output_dir / "full_subtitled.mp4"
-            await self.export_full_video(timeline, video_path, full_path, subtitle_style, progress_callback, timeline_id=timeline_id)
+            await self.export_full_video(
+                timeline, video_path, full_path, subtitle_style, progress_callback,
+                timeline_id=timeline_id, essence_path=combined_essence,
+            )
 
         if profile in (ExportProfile.ESSENCE, ExportProfile.BOTH):
             essence_path = output_dir / "essence.mp4"
-            await self.export_essence(timeline, video_path, essence_path, subtitle_style, progress_callback, timeline_id=timeline_id)
-
-        return full_path, essence_path
-
-    async def _extract_segment(
-        self,
-        video_path: Path,
-        start: float,
-        duration: float,
-        output_path: Path,
-    ) -> None:
-        """Extract a segment from video using ffmpeg."""
-        cmd = [
-            "ffmpeg",
-            "-ss", str(start),
-            "-i", str(video_path),
-            "-t", str(duration),
-            "-c:v", "copy",
-            "-c:a", "copy",
-            "-avoid_negative_ts", "make_zero",
-            "-y", str(output_path),
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise RuntimeError(f"ffmpeg segment extraction failed: {result.stderr}")
-
-    async def _concat_segments(
-        self,
-        concat_file: Path,
-        output_path: Path,
-    ) -> None:
-        """Concatenate video segments using ffmpeg."""
-        cmd = [
-            "ffmpeg",
-            "-f", "concat",
-            "-safe", "0",
-            "-i", str(concat_file),
-            "-c:v", "copy",
-            "-c:a", "copy",
-            "-y", str(output_path),
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise RuntimeError(f"ffmpeg concat failed: {result.stderr}")
-
-    def _retime_segments(
-        self,
-        segments: List[EditableSegment],
-    ) -> List[Tuple[float, float, str, str]]:
-        """Retime segments for concatenated video.
-
-        Returns list of (start, end, en, zh) tuples with new timing.
-        """
-        retimed = []
-        current_time = 0.0
-
-        for seg in segments:
-            duration = seg.effective_duration
-            # Include timing for all segments, but clear text for subtitle-hidden ones
-            if seg.subtitle_hidden:
-                retimed.append((current_time, current_time + duration, "", ""))
+            if combined_essence is not None and combined_essence.exists():
+                logger.info(f"Essence video exported with the full video: {essence_path}")
             else:
-                retimed.append((current_time, current_time + duration, seg.en, seg.zh))
-            current_time += duration
+                await self.export_essence(timeline, video_path, essence_path, subtitle_style, progress_callback, timeline_id=timeline_id)
 
-        return retimed
+        return full_path, essence_path
 
     async def _generate_essence_ass(
         self,
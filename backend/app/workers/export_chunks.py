@@ -0,0 +1,285 @@
+"""Chunk planning for incremental re-export.
+
+A chunked export encodes the composed video as frame-aligned time chunks,
+each its own closed GOP sequence, and joins them with a stream-copy
+concat. Every chunk is named after a hash of everything that affects its
+pixels: the source frames it covers, the filter graph with card and
+subtitle timings shifted into the chunk, the content of every overlay
+image, the subtitle events inside the chunk and the encoder settings. A
+re-export after a small edit finds most chunk files already on disk and
+only encodes the chunks whose inputs changed.
+
+Cards and subtitles are passed to each chunk in chunk-local time (the
+chunk's source is seeked, so ffmpeg's ``t`` starts at 0 in every chunk).
+
+An export with excluded ranges feeds each chunk only the kept source
+frames: the chunk's input is seeked to its first kept frame and a
+``select`` filter drops the excluded ones, so no per-region clips are cut
+and every cut is frame-accurate.
+
+An essence export alongside the full one reuses each chunk's decode and
+composition: the frames inside the essence ranges are split off into a
+second output per chunk, and those parts are concatenated the same way.
+"""
+
+import hashlib
+import json
+import math
+from dataclasses import dataclass
+from fractions import Fraction
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Bump when the chunk encoding changes in a way the key does not capture
+CHUNK_FORMAT_VERSION = 1
+
+
+@dataclass
+class ChunkPlan:
+    """A frame-aligned slice of the output timeline."""
+    index: int
+    start_frame: int
+    frames: int
+    fps: Fraction
+
+    @property
+    def start(self) -> float:
+        return float(self.start_frame / self.fps)
+
+    @property
+    def end(self) -> float:
+        return float((self.start_frame + self.frames) / self.fps)
+
+
+def plan_chunks(duration: float, fps: Fraction, chunk_seconds: float) -> List[ChunkPlan]:
+    """Split ``duration`` seconds into chunks of about ``chunk_seconds``.
+
+    Chunk boundaries fall on frame boundaries of the (constant) output
+    frame rate, so the concatenated chunks have exactly the frames of a
+    single-pass encode.
+    """
+    total_frames = max(1, round(duration * fps))
+    chunk_frames = max(1, round(chunk_seconds * fps))
+    return [
+        ChunkPlan(index, start, min(chunk_frames, total_frames - start), fps)
+        for index, start in enumerate(range(0, total_frames, chunk_frames))
+    ]
+
+
+def source_key(path: Path, **extra) -> str:
+    """Identity of a source video (and how it is cut) for chunk keys."""
+    path = Path(path)
+    stat = path.stat()
+    identity = [str(path.resolve()), stat.st_size, stat.st_mtime_ns, sorted(extra.items())]
+    return hashlib.sha256(json.dumps(identity, default=str).encode()).hexdigest()[:16]
+
+
+def _parse_ass_time(value: str) -> float:
+    hours, minutes, seconds = value.strip().split(":")
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def _format_ass_time(seconds: float) -> str:
+    centiseconds = max(0, round(seconds * 100))
+    hours, rest = divmod(centiseconds, 360000)
+    minutes, rest = divmod(rest, 6000)
+    secs, cs = divmod(rest, 100)
+    return f"{hours}:{minutes:02d}:{secs:02d}.{cs:02d}"
+
+
+def slice_ass(ass_text: str, start: float, end: float) -> str:
+    """ASS script with only the events inside [start, end), shifted to start at 0.
+
+    Headers and styles are kept; events overlapping the chunk edges are
+    clipped to the chunk.
+    """
+    lines = []
+    for line in ass_text.splitlines():
+        if not line.startswith("Dialogue:"):
+            lines.append(line)
+            continue
+        kind, fields = line.split(":", 1)
+        parts = fields.split(",", 9)
+        if len(parts) < 10:
+            lines.append(line)
+            continue
+        event_start = _parse_ass_time(parts[1])
+        event_end = _parse_ass_time(parts[2])
+        if event_end <= start or event_start >= end:
+            continue
+        parts[1] = _format_ass_time(max(event_start, start) - start)
+        parts[2] = _format_ass_time(min(event_end, end) - start)
+        lines.append(f"{kind}:{','.join(parts)}")
+    return "\n".join(lines) + "\n"
+
+
+def shift_cards(cards: Sequence[tuple], start: float, end: float) -> List[tuple]:
+    """Cards visible in [start, end), with their times shifted to the chunk.
+
+    Cards are (image_path, start, end, ...) tuples; extra fields are kept.
+    Start times stay unclamped so a slide-in that began in an earlier chunk
+    continues where it left off.
+    """
+    return [
+        (card[0], round(card[1] - start, 6), round(card[2] - start, 6), *card[3:])
+        for card in cards
+        if card[2] > start and card[1] < end
+    ]
+
+
+def _input_files(input_args: Sequence[str]) -> List[str]:
+    return [input_args[i + 1] for i, arg in enumerate(input_args[:-1]) if arg == "-i"]
+
+
+def chunk_key(
+    source: str,
+    chunk: ChunkPlan,
+    filter_complex: str,
+    input_args: Sequence[str],
+    ass_text: Optional[str],
+    encode_args: Sequence[str],
+    digests: Dict[str, str],
+) -> str:
+    """Hash of everything that shapes a chunk's encoded video.
+
+    Args:
+        source: ``source_key`` of the video the chunk is cut from
+        chunk: The chunk
+        filter_complex: Chunk filter graph (chunk-local times)
+        input_args: Overlay input arguments; the files' contents are hashed
+        ass_text: Chunk subtitle events, if the graph burns in subtitles
+        encode_args: Video encoder arguments
+        digests: Memo of file path -> content hash, shared across chunks
+    """
+    files = []
+    for path in _input_files(input_args):
+        if path not in digests:
+            digests[path] = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        files.append(digests[path])
+    inputs = [
+        CHUNK_FORMAT_VERSION, source, chunk.start_frame, chunk.frames, str(chunk.fps),
+        filter_complex, list(input_args), files, ass_text, list(encode_args),
+    ]
+    return hashlib.sha256(json.dumps(inputs, ensure_ascii=False).encode()).hexdigest()
+
+
+def parse_frame_rate(value: str, default: Fraction = Fraction(30)) -> Fraction:
+    """Parse an ffprobe rate such as ``30000/1001``."""
+    try:
+        rate = Fraction(value.strip())
+    except (ValueError, ZeroDivisionError):
+        return default
+    return rate if rate > 0 and math.isfinite(rate) else default
+
+
+def write_concat_list(path: Path, files: Sequence[Path]) -> None:
+    """ffmpeg concat demuxer list of ``files``."""
+    with open(path, "w", encoding="utf-8") as f:
+        for file in files:
+            f.write(f"file '{Path(file).resolve()}'\n")
+
+
+def remove_unreferenced(chunk_dir: Path, keep: Sequence[Path]) -> int:
+    """Delete chunk and audio files of earlier exports that are no longer used."""
+    keep_names = {Path(p).name for p in keep}
+    removed = 0
+    for pattern in ("chunk_*.mp4", "essence_*.mp4", "audio_*.m4a"):
+        for path in chunk_dir.glob(pattern):
+            if path.name not in keep_names:
+                path.unlink(missing_ok=True)
+                removed += 1
+    return removed
+
+
+def manifest(source: str, chunks: Sequence[Tuple[ChunkPlan, Path, bool]], audio: Optional[Path]) -> dict:
+    """Manifest of a chunked export, written next to the chunks."""
+    return {
+        "source": source,
+        "chunks": [
+            {
+                "index": chunk.index,
+                "start": round(chunk.start, 6),
+                "frames": chunk.frames,
+                "fps": str(chunk.fps),
+                "file": path.name,
+                "reused": reused,
+            }
+            for chunk, path, reused in chunks
+        ],
+        "audio": audio.name if audio else None,
+    }
+
+
+def frame_ranges(ranges: Sequence[Tuple[float, float]], fps: Fraction) -> List[Tuple[int, int]]:
+    """Snap (start, end) second ranges to whole frames, merging overlaps.
+
+    Snapping keeps the selected video frames and the audio cut from the same
+    ranges exactly the same length.
+    """
+    snapped = sorted(
+        (round(start * fps), round(end * fps)) for start, end in ranges
+    )
+    merged: List[Tuple[int, int]] = []
+    for start, end in snapped:
+        if end <= start:
+            continue
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def chunk_frame_ranges(ranges: Sequence[Tuple[int, int]], chunk: ChunkPlan) -> List[Tuple[int, int]]:
+    """Frame ranges inside ``chunk``, relative to the chunk's first frame."""
+    chunk_end = chunk.start_frame + chunk.frames
+    return [
+        (max(start, chunk.start_frame) - chunk.start_frame, min(end, chunk_end) - chunk.start_frame)
+        for start, end in ranges
+        if end > chunk.start_frame and start < chunk_end
+    ]
+
+
+def select_filter(ranges: Sequence[Tuple[int, int]], fps: Fraction) -> str:
+    """Filter keeping the frames in ``ranges`` (chunk-local), retimed back to back."""
+    # Half-frame margins so rounding in frame timestamps cannot drop or add a frame
+    expr = "+".join(
+        f"gte(t,{float((start - Fraction(1, 2)) / fps):.6f})*lt(t,{float((end - Fraction(1, 2)) / fps):.6f})"
+        for start, end in ranges
+    )
+    return f"select='{expr}',setpts=N*{fps.denominator}/{fps.numerator}/TB"
+
+
+def map_output_frames(regions: Sequence[Tuple[int, int]], start: int, count: int) -> List[Tuple[int, int]]:
+    """Source frame ranges that make up output frames [start, start + count).
+
+    ``regions`` are the kept source frame ranges, played back to back.
+    """
+    end = start + count
+    mapped = []
+    offset = 0
+    for region_start, region_end in regions:
+        length = region_end - region_start
+        lo, hi = max(start, offset), min(end, offset + length)
+        if lo < hi:
+            mapped.append((region_start + lo - offset, region_start + hi - offset))
+        offset += length
+        if offset >= end:
+            break
+    return mapped
+
+
+def cut_source(filter_complex: str, ranges: Sequence[Tuple[int, int]], fps: Fraction) -> str:
+    """Feed ``filter_complex`` only the source frames in ``ranges``, back to back.
+
+    The graph's ``[0:v]`` input is replaced by the cut stream.
+    """
+    return f"[0:v]{select_filter(ranges, fps)}[cut];" + filter_complex.replace("[0:v]", "[cut]", 1)
+
+
+def aselect_filter(ranges: Sequence[Tuple[int, int]], fps: Fraction) -> str:
+    """Audio counterpart of ``select_filter``: keep samples in frame ``ranges``."""
+    expr = "+".join(
+        f"gte(t,{float(start / fps):.6f})*lt(t,{float(end / fps):.6f})" for start, end in ranges
+    )
+    return f"aselect='{expr}',asetpts=N/SR/TB"
@@ -6,7 +6,6 @@ Orchestrates the full pipeline: music generation → audio mixing → visual gen
 
 import asyncio
 import math
-import subprocess
 import time
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
@@ -25,6 +24,7 @@ from app.models.lofi import (
 from app.models.music import MusicModelSize
 from app.services.ambient_library import AmbientLibrary
 from app.services.lofi_manager import LofiSessionManager
+from app.services.process_runner import run_process
 from app.workers.music_generator import MusicGeneratorWorker, AUDIOCRAFT_AVAILABLE
 from app.workers.youtube import YouTubeWorker
 
@@ -674,12 +674,7 @@ class LofiPipelineWorker:
 
     async def _run_ffmpeg(self, cmd: list, timeout: int = 300) -> None:
         """Run an ffmpeg command asynchronously."""
-        loop = asyncio.get_event_loop()
-
-        def _run():
-            logger.debug(f"Running ffmpeg: {' '.join(cmd[:10])}...")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
-            if result.returncode != 0:
-                raise RuntimeError(f"ffmpeg failed (rc={result.returncode}): {result.stderr[-500:]}")
-
-        await loop.run_in_executor(_pipeline_executor, _run)
+        logger.debug(f"Running ffmpeg: {' '.join(cmd[:10])}...")
+        result = await run_process(cmd, timeout=timeout)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed (rc={result.returncode}): {result.stderr[-500:]}")
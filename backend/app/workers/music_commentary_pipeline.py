@@ -4,11 +4,8 @@ Orchestrates the full pipeline: download → transcribe → translate → annota
 → script → TTS → assemble audio → generate visual → thumbnail → metadata → review.
 """
 
-import asyncio
 import json
-import subprocess
 import time
-from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -20,15 +17,12 @@ from app.models.music_commentary import (
     MusicCommentaryStatus,
 )
 from app.services.music_commentary_manager import MusicCommentarySessionManager
+from app.services.process_runner import run_process
 from app.workers.download import DownloadWorker
 from app.workers.whisper import WhisperWorker
 from app.workers.translation import TranslationWorker
 from app.workers.youtube import YouTubeWorker
 
-_pipeline_executor = ThreadPoolExecutor(
-    max_workers=1, thread_name_prefix="mc-pipeline"
-)
-
 
 class MusicCommentaryPipelineWorker:
     """Orchestrates the full music commentary video generation pipeline."""
@@ -875,17 +869,7 @@ class MusicCommentaryPipelineWorker:
 
     async def _run_ffmpeg(self, cmd: list, timeout: int = 300) -> None:
         """Run an ffmpeg command asynchronously."""
-        loop = asyncio.get_event_loop()
-
-        def _run():
-            logger.debug(f"Running ffmpeg: {' '.join(cmd[:10])}...")
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=timeout
-            )
-            if result.returncode != 0:
-                raise RuntimeError(
-                    f"ffmpeg failed (rc={result.returncode}): "
-                    f"{result.stderr[-500:]}"
-                )
-
-        await loop.run_in_executor(_pipeline_executor, _run)
+        logger.debug(f"Running ffmpeg: {' '.join(cmd[:10])}...")
+        result = await run_process(cmd, timeout=timeout)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed (rc={result.returncode}): {result.stderr[-500:]}")
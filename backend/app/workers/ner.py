@@ -1,10 +1,25 @@
-"""NER (Named Entity Recognition) worker for extracting vocabulary and entities."""
-
+"""NER (Named Entity Recognition) worker for extracting vocabulary and entities.
+
+Timeline annotations are computed in one batch: the texts of all segments
+not seen before are parsed with a single ``nlp.pipe`` pass (spread over
+``ner_n_process`` processes for large timelines), and vocabulary and
+entities come from the same parse. Per-segment results are cached by a
+hash of the segment text, so editing a segment's English only re-parses
+that segment; whole-timeline results are cached by a hash of all segment
+texts, so an unchanged timeline is a cache read.
+"""
+
+import asyncio
+import hashlib
+import json
 import re
-from collections import Counter
-from typing import List, Optional, Set
+import threading
+from collections import Counter, OrderedDict
+from typing import List, Optional, Sequence, Set, Tuple
 from loguru import logger
 
+from app.config import settings
+
 from app.models.card import (
     EntityType,
     WordAnnotation,
@@ -52,6 +67,15 @@ STOP_WORDS = {
 # Based on Corpus of Contemporary American English (COCA) frequency rank
 FREQUENCY_THRESHOLD = 3000
 
+# Whole-timeline annotation results kept in memory
+TIMELINE_CACHE_SIZE = 64
+
+TextAnnotations = Tuple[List[WordAnnotation], List[EntityAnnotation]]
+
+
+def _digest(value) -> str:
+    return hashlib.sha256(json.dumps(value, ensure_ascii=False).encode()).hexdigest()
+
 
 class NERWorker:
     """Worker for Named Entity Recognition and vocabulary extraction.
@@ -69,6 +93,10 @@ class NERWorker:
         """
         self.use_spacy = use_spacy
         self.nlp = None
+        self._segment_cache: "OrderedDict[str, TextAnnotations]" = OrderedDict()
+        self._timeline_cache: "OrderedDict[str, TimelineAnnotations]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._pipe_lock = threading.Lock()  # One nlp.pipe batch at a time
 
         if use_spacy:
             try:
@@ -123,6 +151,9 @@ class NERWorker:
     ) -> TimelineAnnotations:
         """Process a timeline and extract vocabulary and entities.
 
+        Results are cached by the timeline's segment texts; after an edit only
+        the changed segments are parsed again.
+
         Args:
             timeline: Timeline to process.
             extract_vocabulary: Whether to extract vocabulary words.
@@ -133,24 +164,27 @@ class NERWorker:
         Returns:
             TimelineAnnotations with extracted data.
         """
-        all_text = ""
-        segment_annotations = []
-
-        # Process each segment
-        for segment in timeline.segments:
-            text = segment.en  # English text
-
-            # Extract from this segment
-            words = self._extract_vocabulary(text) if extract_vocabulary else []
-            entities = self._extract_entities(text) if extract_entities else []
-
-            annotation = SegmentAnnotations(
+        key = _digest([
+            timeline.timeline_id,
+            [(segment.id, segment.en) for segment in timeline.segments],
+            extract_vocabulary, extract_entities, vocabulary_limit, entity_limit,
+        ])
+        with self._cache_lock:
+            cached = self._timeline_cache.get(key)
+            if cached is not None:
+                self._timeline_cache.move_to_end(key)
+                return cached
+
+        # Parse every segment (uncached ones in one batch)
+        results = self.annotate_texts([segment.en for segment in timeline.segments])
+        segment_annotations = [
+            SegmentAnnotations(
                 segment_id=segment.id,
-                words=words,
-                entities=entities,
+                words=words if extract_vocabulary else [],
+                entities=entities if extract_entities else [],
             )
-            segment_annotations.append(annotation)
-            all_text += " " + text
+            for segment, (words, entities) in zip(timeline.segments, results)
+        ]
 
         # Aggregate unique words and entities
         word_counter = Counter()
@@ -182,15 +216,74 @@ class NERWorker:
             f"{len(unique_words)} words, {len(unique_entities)} entities"
         )
 
+        with self._cache_lock:
+            self._timeline_cache[key] = annotations
+            while len(self._timeline_cache) > TIMELINE_CACHE_SIZE:
+                self._timeline_cache.popitem(last=False)
         return annotations
 
-    def _extract_vocabulary(self, text: str) -> List[WordAnnotation]:
+    async def annotate_timeline(self, timeline: Timeline, **kwargs) -> TimelineAnnotations:
+        """``process_timeline`` off the event loop.
+
+        Args:
+            timeline: Timeline to process.
+            **kwargs: Options of ``process_timeline``.
+
+        Returns:
+            TimelineAnnotations with extracted data.
+        """
+        return await asyncio.to_thread(self.process_timeline, timeline, **kwargs)
+
+    def annotate_texts(self, texts: Sequence[str]) -> List[TextAnnotations]:
+        """Vocabulary and entities of each text.
+
+        Texts not in the cache are parsed together with one ``nlp.pipe``
+        batch; repeated texts are parsed once.
+
+        Args:
+            texts: English texts.
+
+        Returns:
+            (words, entities) for each text, in order.
+        """
+        keys = [hashlib.sha256(text.encode()).hexdigest() for text in texts]
+        results = {}
+        with self._cache_lock:
+            for key in keys:
+                if key in self._segment_cache:
+                    self._segment_cache.move_to_end(key)
+                    results[key] = self._segment_cache[key]
+        missing = {key: text for key, text in zip(keys, texts) if key not in results}
+
+        if missing:
+            missing_texts = list(missing.values())
+            if self.nlp:
+                n_process = settings.ner_n_process if len(missing_texts) > settings.ner_batch_size else 1
+                with self._pipe_lock:
+                    docs = list(self.nlp.pipe(
+                        missing_texts, batch_size=settings.ner_batch_size, n_process=n_process,
+                    ))
+            else:
+                docs = [None] * len(missing_texts)
+            for key, text, doc in zip(missing, missing_texts, docs):
+                results[key] = (self._extract_vocabulary(text, doc), self._extract_entities(text, doc))
+            with self._cache_lock:
+                for key in missing:
+                    self._segment_cache[key] = results[key]
+                while len(self._segment_cache) > settings.ner_cache_segments:
+                    self._segment_cache.popitem(last=False)
+            logger.debug(f"NER parsed {len(missing)} of {len(set(keys))} distinct texts")
+
+        return [results[key] for key in keys]
+
+    def _extract_vocabulary(self, text: str, doc=None) -> List[WordAnnotation]:
         """Extract vocabulary words from text.
 
         Uses tokenization and filters to extract learnable vocabulary.
 
         Args:
             text: Text to process.
+            doc: spaCy parse of ``text``, if already parsed.
 
         Returns:
             List of WordAnnotation.
@@ -199,7 +292,8 @@ class NERWorker:
 
         if self.nlp:
             # Use spaCy for better tokenization and lemmatization
-            doc = self.nlp(text)
+            if doc is None:
+                doc = self.nlp(text)
             for token in doc:
                 if self._is_vocabulary_word(token.text, token.lemma_, token.pos_):
                     words.append(WordAnnotation(
@@ -264,11 +358,12 @@ class NERWorker:
 
         return True
 
-    def _extract_entities(self, text: str) -> List[EntityAnnotation]:
+    def _extract_entities(self, text: str, doc=None) -> List[EntityAnnotation]:
         """Extract named entities from text.
 
         Args:
             text: Text to process.
+            doc: spaCy parse of ``text``, if already parsed.
 
         Returns:
             List of EntityAnnotation.
@@ -276,7 +371,8 @@ class NERWorker:
         entities = []
 
         if self.nlp:
-            doc = self.nlp(text)
+            if doc is None:
+                doc = self.nlp(text)
             for ent in doc.ents:
                 entity_type = self._map_spacy_label_to_type(ent.label_)
                 if entity_type:
@@ -3,9 +3,11 @@
 Handles the main processing pipeline for video jobs.
 """
 
+import asyncio
 import json
+from contextlib import AsyncExitStack, nullcontext
 from pathlib import Path
-from typing import Callable, TYPE_CHECKING
+from typing import Callable, Optional, TYPE_CHECKING
 
 from loguru import logger
 
@@ -19,11 +21,14 @@ from app.models.transcript import (
     TranslatedTranscript,
     TranslatedSegment,
 )
+from app.services.scheduler import Resource
+from app.workers.streaming_text import StreamingTextPipeline
 
 if TYPE_CHECKING:
     from app.services.job_manager import JobManager
     from app.services.timeline_manager import TimelineManager
     from app.services.queue import JobQueue
+    from app.services.scheduler import ResourcePools
     from app.workers.download import DownloadWorker
     from app.workers.whisper import WhisperWorker
     from app.workers.diarization import DiarizationWorker
@@ -36,6 +41,30 @@ def load_json_model(path: Path, model_class):
         return model_class(**json.load(f))
 
 
+def _stage(resources: Optional["ResourcePools"], resource: Resource, job_id: str, stage: str):
+    """Hold a slot of the stage's resource pool (no-op without pools)."""
+    if resources is None:
+        return nullcontext()
+    return resources.acquire(resource, job_id, stage)
+
+
+def _device_resource(device: str) -> Resource:
+    """Pool a model stage runs on, given its configured device."""
+    return Resource.GPU if device.startswith("cuda") else Resource.CPU
+
+
+async def _gather_or_cancel(*coros):
+    """Await coroutines concurrently; if one fails, cancel the others."""
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 async def process_job(
     job_id: str,
     job_manager: "JobManager",
@@ -45,18 +74,22 @@ async def process_job(
     whisper_worker: "WhisperWorker",
     diarization_worker: "DiarizationWorker",
     translation_worker: "TranslationWorker",
+    resources: Optional["ResourcePools"] = None,
 ) -> None:
     """Process a job through the pipeline.
 
     Simplified for SceneMind (learning video factory):
     1. Download video
     2. Transcribe with Whisper
-    3. Diarize speakers
+    3. Diarize speakers (concurrently with 2)
     4. Translate to Chinese
     5. Create Timeline and pause for UI review
 
     The export stage is triggered separately via /timelines/{id}/export.
     Supports resuming from any stage if files already exist.
+
+    With ``resources``, each stage waits for a slot of the pool it runs on
+    (network, GPU, LLM), so concurrent jobs overlap stage by stage.
     """
     job = job_manager.get_job(job_id)
     if not job:
@@ -75,7 +108,6 @@ async def process_job(
 
     try:
         # ============ Stage 1: Download (10%) ============
-        await job_manager.update_status(job, JobStatus.DOWNLOADING, 0.10)
         job.start_step("download")
 
         # Determine if we should fetch YouTube subtitles
@@ -86,13 +118,30 @@ async def process_job(
         src_lang = getattr(job, "source_language", "en") or "en"
         subtitle_langs = [src_lang] if src_lang != "auto" else ["en"]
 
-        download_result = await download_worker.download(
-            url=job.url,
-            output_dir=job_dir,
-            fetch_subtitles=use_youtube_subs,
-            prefer_auto_subs=prefer_auto,
-            subtitle_langs=subtitle_langs,
-        )
+        # Report download progress (10% -> 25%) in 3-point steps
+        progress_updates: list = []
+        reported_progress = 0.10
+
+        def on_download_progress(fraction: float) -> None:
+            nonlocal reported_progress
+            progress = round(0.10 + 0.15 * fraction, 2)
+            if progress - reported_progress >= 0.03:
+                reported_progress = progress
+                progress_updates.append(asyncio.create_task(
+                    job_manager.update_status(job, JobStatus.DOWNLOADING, progress)
+                ))
+
+        async with _stage(resources, Resource.NETWORK, job_id, "download"):
+            await job_manager.update_status(job, JobStatus.DOWNLOADING, 0.10)
+            download_result = await download_worker.download(
+                url=job.url,
+                output_dir=job_dir,
+                fetch_subtitles=use_youtube_subs,
+                prefer_auto_subs=prefer_auto,
+                subtitle_langs=subtitle_langs,
+                progress_callback=on_download_progress,
+            )
+            await asyncio.gather(*progress_updates)
 
         job.source_video = download_result["video_path"]
         job.source_audio = download_result["audio_path"]
@@ -172,29 +221,120 @@ async def process_job(
                 "falling back to Whisper"
             )
 
-        # ============ Stage 2: Transcribe (30%) ============
+        # Determine target language code
+        # zh-TW = Traditional Chinese (default), zh-CN = Simplified Chinese
+        if job.target_language == "zh":
+            target_lang_code = "zh-TW" if job.use_traditional_chinese else "zh-CN"
+        else:
+            target_lang_code = job.target_language
+
+        cleaned_path = transcript_dir / "diarized_clean.json"
+        translation_path = translation_dir / f"{target_lang_code}.json"
+
+        # ============ Stage 2+3: Transcribe (30%) and Diarize (50%) ============
+        # Both only read the source audio, so they run at the same time and
+        # only the speaker merge waits for both. With streaming, sentences are
+        # cleaned and translated while Whisper is still running.
+        early_text: Optional[StreamingTextPipeline] = None
         if not youtube_subs_used:
             raw_path = transcript_dir / "raw.json"
-            job.start_step("transcribe")
+            checkpoint_path = transcript_dir / "raw.partial.json"
+            run_transcription = not raw_path.exists()
+            run_diarization = not diarized_path.exists() and not job.skip_diarization
+            diarization_segments = None
+            # Parallel chunked transcription returns the transcript at once
+            stream_transcription = settings.whisper_streaming and settings.whisper_workers <= 1
+
+            if (
+                run_transcription
+                and stream_transcription
+                and not cleaned_path.exists()
+                and not translation_path.exists()
+            ):
+                from app.workers.defluff import DefluffWorker
+                early_text = StreamingTextPipeline(
+                    DefluffWorker(),
+                    translation_worker,
+                    target_lang_code,
+                    job=job,
+                    slot=lambda: _stage(resources, Resource.LLM, job_id, "defluff+translate"),
+                )
 
-            if raw_path.exists():
-                logger.info(f"Transcript already exists, skipping transcription: {job_id}")
-                transcript = load_json_model(raw_path, Transcript)
-            else:
-                await job_manager.update_status(job, JobStatus.TRANSCRIBING, 0.30)
-                # Use user-selected source language; auto-detect only if "auto"
-                whisper_lang = getattr(job, "source_language", "en") or "en"
-                if whisper_lang == "auto":
-                    whisper_lang = None  # Let Whisper auto-detect
-                transcript = await whisper_worker.transcribe(
+            async def transcribe_stage() -> Transcript:
+                job.start_step("transcribe")
+                if not run_transcription:
+                    logger.info(f"Transcript already exists, skipping transcription: {job_id}")
+                    result = load_json_model(raw_path, Transcript)
+                else:
+                    await job_manager.update_status(job, JobStatus.TRANSCRIBING, 0.30)
+                    # Use user-selected source language; auto-detect only if "auto"
+                    whisper_lang = getattr(job, "source_language", "en") or "en"
+                    if whisper_lang == "auto":
+                        whisper_lang = None  # Let Whisper auto-detect
+                    if stream_transcription:
+                        # Resumes from raw.partial.json if a previous run crashed
+                        stream = whisper_worker.transcribe_stream(
+                            audio_path=Path(job.source_audio),
+                            language=whisper_lang,
+                            model_name=getattr(job, "whisper_model", None),
+                            checkpoint_path=checkpoint_path,
+                        )
+                        async for segment in stream:
+                            if early_text is not None:
+                                early_text.add(segment)
+                        result = stream.transcript()
+                    else:
+                        result = await whisper_worker.transcribe(
+                            audio_path=Path(job.source_audio),
+                            language=whisper_lang,
+                            model_name=getattr(job, "whisper_model", None),
+                        )
+                    await whisper_worker.save_transcript(result, raw_path)
+                    checkpoint_path.unlink(missing_ok=True)
+                job.end_step("transcribe")
+                return result
+
+            async def diarize_stage() -> list:
+                job.start_step("diarize")
+                segments = await diarization_worker.diarize(
                     audio_path=Path(job.source_audio),
-                    language=whisper_lang,
-                    model_name=getattr(job, "whisper_model", None),
                 )
-                await whisper_worker.save_transcript(transcript, raw_path)
+                job.end_step("diarize")
+                return segments
+
+            analysis_resources = set()
+            if run_transcription:
+                analysis_resources.add(_device_resource(settings.whisper_device))
+            if run_diarization:
+                analysis_resources.add(_device_resource(settings.diarization_device))
+
+            try:
+                async with AsyncExitStack() as slots:
+                    # One slot per resource: on a shared GPU both models run in the
+                    # job's single GPU slot. Sorted acquisition avoids deadlocks.
+                    for resource in sorted(analysis_resources, key=lambda r: r.value):
+                        await slots.enter_async_context(
+                            _stage(resources, resource, job_id, "transcribe+diarize")
+                        )
+
+                    if run_diarization and settings.parallel_diarization:
+                        transcript, diarization_segments = await _gather_or_cancel(
+                            transcribe_stage(), diarize_stage()
+                        )
+                    else:
+                        transcript = await transcribe_stage()
+                        if run_diarization:
+                            await job_manager.update_status(job, JobStatus.DIARIZING, 0.50)
+                            diarization_segments = await diarize_stage()
+
+                if early_text is not None:
+                    await early_text.finish()
+            except BaseException:
+                if early_text is not None:
+                    early_text.cancel()
+                raise
 
             job.transcript_raw = str(raw_path)
-            job.end_step("transcribe")
             job_manager.save_job(job)
 
             if check_cancelled():
@@ -202,9 +342,6 @@ async def process_job(
                 logger.info(f"Job {job_id} cancelled after transcription stage")
                 return
 
-            # ============ Stage 3: Diarize (50%) ============
-            job.start_step("diarize")
-
             if diarized_path.exists():
                 logger.info(f"Diarization file already exists, skipping diarization: {job_id}")
                 diarized_transcript = load_json_model(diarized_path, DiarizedTranscript)
@@ -229,9 +366,6 @@ async def process_job(
                 )
             else:
                 await job_manager.update_status(job, JobStatus.DIARIZING, 0.50)
-                diarization_segments = await diarization_worker.diarize(
-                    audio_path=Path(job.source_audio),
-                )
                 diarized_transcript = await diarization_worker.merge_with_transcript(
                     transcript=transcript,
                     diarization_segments=diarization_segments,
@@ -241,7 +375,6 @@ async def process_job(
                 )
 
             job.transcript_diarized = str(diarized_path)
-            job.end_step("diarize")
             job_manager.save_job(job)
 
         if check_cancelled():
@@ -250,15 +383,21 @@ async def process_job(
             return
 
         # ============ Stage 3.5: Clean Disfluencies (55%) ============
-        cleaned_path = transcript_dir / "diarized_clean.json"
         if cleaned_path.exists():
             logger.info(f"Cleaned transcript exists, skipping defluff: {job_id}")
             diarized_transcript = load_json_model(cleaned_path, DiarizedTranscript)
+        elif early_text is not None:
+            # Most segments were cleaned during transcription
+            async with _stage(resources, Resource.LLM, job_id, "defluff"):
+                diarized_transcript = await early_text.clean(diarized_transcript)
+            with open(cleaned_path, "w", encoding="utf-8") as f:
+                f.write(diarized_transcript.model_dump_json(indent=2))
         else:
-            await job_manager.update_status(job, JobStatus.TRANSCRIBING, 0.55)
             from app.workers.defluff import DefluffWorker
             defluff_worker = DefluffWorker()
-            diarized_transcript = await defluff_worker.clean_transcript(diarized_transcript)
+            async with _stage(resources, Resource.LLM, job_id, "defluff"):
+                await job_manager.update_status(job, JobStatus.TRANSCRIBING, 0.55)
+                diarized_transcript = await defluff_worker.clean_transcript(diarized_transcript)
             # Save cleaned version (original diarized.json preserved)
             with open(cleaned_path, "w", encoding="utf-8") as f:
                 f.write(diarized_transcript.model_dump_json(indent=2))
@@ -269,14 +408,6 @@ async def process_job(
             return
 
         # ============ Stage 4: Translate (70%) ============
-        # Determine target language code
-        # zh-TW = Traditional Chinese (default), zh-CN = Simplified Chinese
-        if job.target_language == "zh":
-            target_lang_code = "zh-TW" if job.use_traditional_chinese else "zh-CN"
-        else:
-            target_lang_code = job.target_language
-
-        translation_path = translation_dir / f"{target_lang_code}.json"
         job.start_step("translate")
 
         if translation_path.exists():
@@ -325,13 +456,22 @@ async def process_job(
             logger.info(
                 f"Bilingual merge complete: {len(merged)} segments for job {job_id}"
             )
-        else:
-            await job_manager.update_status(job, JobStatus.TRANSLATING, 0.70)
-            translated_transcript = await translation_worker.translate_transcript(
-                transcript=diarized_transcript,
-                target_language=target_lang_code,
-                job=job,  # Pass job for cost tracking
+        elif early_text is not None:
+            # Most segments were translated during transcription
+            async with _stage(resources, Resource.LLM, job_id, "translate"):
+                await job_manager.update_status(job, JobStatus.TRANSLATING, 0.70)
+                translated_transcript = await early_text.translate(diarized_transcript)
+            await translation_worker.save_translation(
+                translated_transcript, translation_path
             )
+        else:
+            async with _stage(resources, Resource.LLM, job_id, "translate"):
+                await job_manager.update_status(job, JobStatus.TRANSLATING, 0.70)
+                translated_transcript = await translation_worker.translate_transcript(
+                    transcript=diarized_transcript,
+                    target_language=target_lang_code,
+                    job=job,  # Pass job for cost tracking
+                )
             await translation_worker.save_translation(
                 translated_transcript, translation_path
             )
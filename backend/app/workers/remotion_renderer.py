@@ -2,7 +2,6 @@
 
 import asyncio
 import json
-import subprocess
 import tempfile
 from dataclasses import dataclass, asdict
 from pathlib import Path
@@ -10,6 +9,7 @@ from typing import Any, Callable, Dict, List, Optional
 from loguru import logger
 
 from app.config import settings
+from app.services.process_runner import run_process
 
 
 @dataclass
@@ -246,7 +246,7 @@ class RemotionRenderer:
             duration_in_frames = 300  # Default 10 seconds at 30fps
 
         # Get video dimensions from source
-        width, height = self._get_video_dimensions(source_video_path)
+        width, height = await self._get_video_dimensions(source_video_path)
 
         options = RenderOptions(
             width=width,
@@ -269,7 +269,7 @@ class RemotionRenderer:
             progress_callback=progress_callback,
         )
 
-    def _get_video_dimensions(self, video_path: Path) -> tuple[int, int]:
+    async def _get_video_dimensions(self, video_path: Path) -> tuple[int, int]:
         """Get video width and height using ffprobe."""
         cmd = [
             "ffprobe", "-v", "error",
@@ -278,7 +278,7 @@ class RemotionRenderer:
             "-of", "csv=s=x:p=0",
             str(video_path)
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = await run_process(cmd)
         if result.returncode != 0:
             logger.warning(f"ffprobe failed, using default 1920x1080: {result.stderr}")
             return 1920, 1080
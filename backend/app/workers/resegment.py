@@ -13,7 +13,7 @@ import re
 from dataclasses import dataclass, field
 from typing import List, Optional
 
-from app.models.transcript import Segment
+from app.models.transcript import Segment, Word
 
 # Maximum segment duration before forced splitting (seconds)
 MAX_SEGMENT_DURATION = 15.0
@@ -142,6 +142,34 @@ def _has_clause_punctuation(word_text: str) -> bool:
     return bool(stripped) and stripped[-1] in _CLAUSE_PUNCTUATION
 
 
+def _segment_words(seg) -> List[_Word]:
+    """Extract the words of one Whisper segment.
+
+    If the segment has no .words, uses the segment itself as a pseudo-word.
+    """
+    words: List[_Word] = []
+    seg_words = getattr(seg, "words", None)
+    if seg_words:
+        for w in seg_words:
+            text = w.word.strip() if hasattr(w, "word") else str(w.word).strip()
+            if text:
+                words.append(_Word(
+                    start=w.start,
+                    end=w.end,
+                    word=text,
+                ))
+    else:
+        # Fallback: use entire segment as a pseudo-word
+        text = seg.text.strip() if hasattr(seg, "text") else ""
+        if text:
+            words.append(_Word(
+                start=seg.start,
+                end=seg.end,
+                word=text,
+            ))
+    return words
+
+
 def _flatten_words(segments_list) -> Optional[List[_Word]]:
     """Step 1: Extract all words from Whisper segments into a flat list.
 
@@ -152,26 +180,9 @@ def _flatten_words(segments_list) -> Optional[List[_Word]]:
     has_any_words = False
 
     for seg in segments_list:
-        seg_words = getattr(seg, "words", None)
-        if seg_words:
+        if getattr(seg, "words", None):
             has_any_words = True
-            for w in seg_words:
-                text = w.word.strip() if hasattr(w, "word") else str(w.word).strip()
-                if text:
-                    words.append(_Word(
-                        start=w.start,
-                        end=w.end,
-                        word=text,
-                    ))
-        else:
-            # Fallback: use entire segment as a pseudo-word
-            text = seg.text.strip() if hasattr(seg, "text") else ""
-            if text:
-                words.append(_Word(
-                    start=seg.start,
-                    end=seg.end,
-                    word=text,
-                ))
+        words.extend(_segment_words(seg))
 
     if not has_any_words:
         return None
@@ -242,6 +253,11 @@ def _split_long_segment(group: _WordGroup) -> List[_WordGroup]:
     return result
 
 
+def _is_short(g: _WordGroup) -> bool:
+    """Whether a segment is too short to stand on its own."""
+    return g.duration < MIN_SEGMENT_DURATION or len(g.words) < MIN_WORD_COUNT
+
+
 def _merge_short_segments(groups: List[_WordGroup]) -> List[_WordGroup]:
     """Step 5: Merge segments that are too short (<1s or <3 words).
 
@@ -251,9 +267,6 @@ def _merge_short_segments(groups: List[_WordGroup]) -> List[_WordGroup]:
     if len(groups) <= 1:
         return groups
 
-    def _is_short(g: _WordGroup) -> bool:
-        return g.duration < MIN_SEGMENT_DURATION or len(g.words) < MIN_WORD_COUNT
-
     merged: List[_WordGroup] = []
 
     for group in groups:
@@ -295,6 +308,7 @@ def _groups_to_segments(groups: List[_WordGroup]) -> List[Segment]:
                 start=round(group.start, 3),
                 end=round(group.end, 3),
                 text=text,
+                words=[Word(start=w.start, end=w.end, word=w.word) for w in group.words],
             ))
     return segments
 
@@ -346,3 +360,80 @@ def resegment_words(segments_list) -> List[Segment]:
 
     # Convert to Segment models
     return _groups_to_segments(final_groups)
+
+
+class StreamingResegmenter:
+    """Incremental resegment_words() for segments arriving one at a time.
+
+    Sentences are emitted as soon as later input can no longer change them
+    (a sentence can still absorb a following short one), so the emitted
+    segments concatenated with finish() equal resegment_words() over the
+    whole input.
+    """
+
+    def __init__(self):
+        self._raw: List = []  # kept for the no-word-timestamps fallback
+        self._has_word_segments = False
+        self._word_count = 0
+        self._ready = False  # word timestamps seen: sentences can be emitted
+        self._current = _WordGroup()
+        self._merged: List[_WordGroup] = []
+        self._first_checked = False
+
+    def feed(self, segment) -> List[Segment]:
+        """Add one Whisper segment; returns the sentences completed by it."""
+        words = _segment_words(segment)
+        if getattr(segment, "words", None):
+            self._has_word_segments = True
+        self._word_count += len(words)
+        if not self._ready:
+            self._raw.append(segment)
+            self._ready = self._has_word_segments and self._word_count > 0
+            if self._ready:
+                self._raw = []
+
+        for word in words:
+            self._current.words.append(word)
+            if _is_sentence_boundary(word.word):
+                self._close_sentence()
+
+        if not self._ready:
+            return []
+        return self._drain(final=False)
+
+    def finish(self) -> List[Segment]:
+        """Flush the remaining sentences at the end of the transcription."""
+        if not self._ready:
+            # No word-level data available — fall back to original segments
+            return _fallback_segments(self._raw)
+        if self._current.words:
+            self._close_sentence()
+        return self._drain(final=True)
+
+    def _close_sentence(self) -> None:
+        for group in _split_long_segment(self._current):
+            self._add_group(group)
+        self._current = _WordGroup()
+
+    def _add_group(self, group: _WordGroup) -> None:
+        if self._merged and _is_short(group):
+            # Merge into previous
+            self._merged[-1].words.extend(group.words)
+        else:
+            self._merged.append(group)
+
+        # A short first segment is merged into the next one
+        if not self._first_checked and len(self._merged) > 1:
+            self._first_checked = True
+            if _is_short(self._merged[0]):
+                self._merged[1].words = self._merged[0].words + self._merged[1].words
+                self._merged.pop(0)
+
+    def _drain(self, final: bool) -> List[Segment]:
+        if final:
+            done, self._merged = self._merged, []
+        elif self._first_checked and len(self._merged) > 1:
+            done, self._merged = self._merged[:-1], self._merged[-1:]
+        else:
+            return []
+        return _groups_to_segments(done)
@@ -0,0 +1,185 @@
+"""Content-addressed cache for Remotion-rendered card and subtitle stills.
+
+Every export renders each card and subtitle still through Remotion, even
+when the timeline barely changed since the last export. Stills are stored
+here under a hash of everything that shapes the image (text or card data,
+style options, resolution and the renderer source), so a re-export only
+sends stills whose inputs changed to Remotion.
+
+The cache is bounded by size; the least recently used stills are evicted
+first (a hit refreshes the file's mtime).
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+
+from loguru import logger
+
+# Bump to invalidate every cached still (e.g. after a Remotion upgrade that
+# changes output without touching the files hashed by renderer_version)
+STILL_CACHE_VERSION = 1
+
+# Frontend sources that shape the rendered stills, relative to frontend_dir
+_RENDERER_SOURCES = ("remotion", "src/components/Cards", "src/lib/types.ts", "package.json")
+
+_renderer_versions: dict[tuple, str] = {}
+_renderer_lock = threading.Lock()
+
+
+def _source_files(frontend_dir: Path) -> list[Path]:
+    files = []
+    for name in _RENDERER_SOURCES:
+        path = frontend_dir / name
+        if path.is_file():
+            files.append(path)
+        elif path.is_dir():
+            files.extend(p for p in path.rglob("*") if p.is_file() and "node_modules" not in p.parts)
+    return sorted(files)
+
+
+def renderer_version(frontend_dir: Path) -> str:
+    """Hash of the frontend sources that render stills.
+
+    Memoized on the files' sizes and mtimes, so the sources are only read
+    again after they change.
+    """
+    frontend_dir = Path(frontend_dir)
+    files = _source_files(frontend_dir)
+    signature = tuple((str(p), p.stat().st_size, p.stat().st_mtime_ns) for p in files)
+    with _renderer_lock:
+        version = _renderer_versions.get(signature)
+        if version is None:
+            digest = hashlib.sha256(f"v{STILL_CACHE_VERSION}".encode())
+            for path in files:
+                digest.update(str(path.relative_to(frontend_dir)).encode() + b"\0")
+                digest.update(path.read_bytes())
+            version = digest.hexdigest()[:16]
+            _renderer_versions.clear()
+            _renderer_versions[signature] = version
+    return version
+
+
+class StillCache:
+    """Rendered PNG stills keyed by a hash of their render inputs."""
+
+    def __init__(self, cache_dir: Path, max_mb: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_mb * 1024 * 1024
+
+    @staticmethod
+    def key(kind: str, payload: dict, width: int, height: int, renderer: str) -> str:
+        """Cache key of a still.
+
+        Args:
+            kind: "card", "subtitle" or "placeholder"
+            payload: Everything the still's content and style depend on
+            width: Still width in pixels
+            height: Still height in pixels
+            renderer: ``renderer_version`` of the frontend
+        """
+        inputs = json.dumps(
+            [kind, payload, width, height, renderer],
+            ensure_ascii=False, sort_keys=True, default=str,
+        )
+        return hashlib.sha256(inputs.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.png"
+
+    def fetch(self, key: str, dest: Path) -> bool:
+        """Place the cached still for ``key`` at ``dest``.
+
+        Returns:
+            True on a hit, False if the still has to be rendered
+        """
+        path = self._path(key)
+        try:
+            os.utime(path)  # LRU: mark as recently used
+            dest.unlink(missing_ok=True)
+            try:
+                os.link(path, dest)
+            except OSError:
+                shutil.copyfile(path, dest)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def store(self, key: str, src: Path) -> None:
+        """Add a freshly rendered still to the cache."""
+        path = self._path(key)
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            shutil.copyfile(src, tmp_path)
+            tmp_path.replace(path)
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning(f"Could not cache still {src}: {e}")
+
+    def evict(self) -> int:
+        """Delete least recently used stills until the cache fits its budget.
+
+        Returns:
+            Number of stills deleted
+        """
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*/*.png"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        if total <= self.max_bytes:
+            return 0
+
+        entries.sort()
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        logger.info(f"Still cache: evicted {removed} stills ({total / 1024 / 1024:.0f} MB kept)")
+        return removed
+
+
+def stills_to_render(
+    cache: Optional[StillCache], entries: Iterable[dict], keys: dict, output_dir: Path
+) -> list[dict]:
+    """Fetch cached stills into ``output_dir``; return the entries still to render.
+
+    Args:
+        cache: Still cache (None renders everything)
+        entries: Remotion input entries with an ``id`` (output is ``<id>.png``)
+        keys: Map of entry id -> cache key
+        output_dir: Remotion output directory
+    """
+    pending = []
+    for entry in entries:
+        dest = output_dir / f"{entry['id']}.png"
+        if cache is not None and cache.fetch(keys[entry["id"]], dest):
+            continue
+        # A stale PNG from an earlier export must not pass for a fresh render,
+        # and Remotion must not write through a hard link into the cache
+        dest.unlink(missing_ok=True)
+        pending.append(entry)
+    return pending
+
+
+def cache_rendered_stills(cache: StillCache, ids: Iterable[str], keys: dict, output_dir: Path) -> None:
+    """Store stills Remotion rendered into ``output_dir``, then evict to budget."""
+    for still_id in ids:
+        path = output_dir / f"{still_id}.png"
+        if path.exists():
+            cache.store(keys[still_id], path)
+    cache.evict()
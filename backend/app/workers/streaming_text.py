@@ -0,0 +1,188 @@
+"""Clean and translate transcript sentences while transcription is still running.
+
+Disfluency cleanup and translation only read the text of each segment;
+speaker labels come from diarization and are attached afterwards. So the
+sentences of a streaming transcription can be cleaned and translated in
+batches while Whisper works on the rest of the file. Once the diarized
+transcript exists, the results are matched to its segments by timing and
+text and reused; only segments without a result go to the LLM again.
+"""
+
+import asyncio
+from contextlib import nullcontext
+from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from loguru import logger
+
+from app.models.transcript import (
+    DiarizedSegment,
+    DiarizedTranscript,
+    Segment,
+    TranslatedSegment,
+    TranslatedTranscript,
+)
+
+if TYPE_CHECKING:
+    from app.models.job import Job
+    from app.workers.defluff import DefluffWorker
+    from app.workers.translation import TranslationWorker
+
+
+def _key(segment) -> Tuple[float, float, str]:
+    return segment.start, segment.end, segment.text
+
+
+class StreamingTextPipeline:
+    """Cleans and translates batches of sentences as they are transcribed."""
+
+    def __init__(
+        self,
+        defluff_worker: "DefluffWorker",
+        translation_worker: "TranslationWorker",
+        target_language: str,
+        job: Optional["Job"] = None,
+        batch_size: int = 50,
+        slot: Optional[Callable] = None,
+    ):
+        """
+        Args:
+            defluff_worker: Worker for disfluency cleanup
+            translation_worker: Worker for translation
+            target_language: Translation target language code
+            job: Optional job to track API costs
+            batch_size: Sentences per cleanup/translation batch
+            slot: Returns an async context manager held while a batch runs
+                (e.g. an LLM resource pool slot)
+        """
+        self._defluff = defluff_worker
+        self._translation = translation_worker
+        self._target_language = target_language
+        self._job = job
+        self._batch_size = batch_size
+        self._slot = slot or nullcontext
+        self._count = 0
+        # Streamed sentence -> cleaned text; cleaned sentence -> translation
+        self._cleaned: Dict[Tuple[float, float, str], str] = {}
+        self._translations: Dict[Tuple[float, float, str], str] = {}
+        self._pending: List[Segment] = []
+        self._tasks: List[asyncio.Task] = []
+
+    def add(self, segment: Segment) -> None:
+        """Queue a transcribed sentence; full batches start processing at once."""
+        self._count += 1
+        self._pending.append(segment)
+        if len(self._pending) >= self._batch_size:
+            self._start_batch()
+
+    async def finish(self) -> None:
+        """Process the last partial batch and wait for all batches."""
+        if self._pending:
+            self._start_batch()
+        await asyncio.gather(*self._tasks)
+        logger.info(
+            f"Streamed cleanup/translation of {len(self._translations)}/{self._count} segments"
+        )
+
+    def cancel(self) -> None:
+        """Stop batches still running (e.g. when the transcription failed)."""
+        for task in self._tasks:
+            task.cancel()
+
+    async def clean(self, transcript: DiarizedTranscript) -> DiarizedTranscript:
+        """Disfluency-clean a diarized transcript, reusing the streamed cleanup.
+
+        Segments that do not match a streamed sentence (e.g. sentences split
+        at a speaker change) or whose batch failed are cleaned now.
+        """
+        texts = [self._cleaned.get(_key(seg)) for seg in transcript.segments]
+        missing = [i for i, text in enumerate(texts) if text is None]
+        if missing:
+            logger.info(f"Cleaning {len(missing)}/{len(texts)} segments not streamed")
+            redone = await self._defluff.clean_texts(
+                [transcript.segments[i].text for i in missing]
+            )
+            for i, text in zip(missing, redone):
+                texts[i] = text
+
+        return DiarizedTranscript(
+            language=transcript.language,
+            num_speakers=transcript.num_speakers,
+            segments=[
+                DiarizedSegment(start=seg.start, end=seg.end, text=text, speaker=seg.speaker)
+                for seg, text in zip(transcript.segments, texts)
+            ],
+        )
+
+    async def translate(self, transcript: DiarizedTranscript) -> TranslatedTranscript:
+        """Translate a cleaned transcript, reusing the streamed translations.
+
+        Segments without a streamed translation are translated now.
+        """
+        translations = [self._translations.get(_key(seg)) for seg in transcript.segments]
+        missing = [i for i, translation in enumerate(translations) if translation is None]
+        if missing:
+            logger.info(f"Translating {len(missing)}/{len(translations)} segments not streamed")
+            redone = await self._translation.translate_transcript(
+                transcript=DiarizedTranscript(
+                    language=transcript.language,
+                    num_speakers=transcript.num_speakers,
+                    segments=[transcript.segments[i] for i in missing],
+                ),
+                target_language=self._target_language,
+                job=self._job,  # Pass job for cost tracking
+            )
+            for i, seg in zip(missing, redone.segments):
+                translations[i] = seg.translation
+
+        return TranslatedTranscript(
+            source_language=transcript.language,
+            target_language=self._target_language,
+            num_speakers=transcript.num_speakers,
+            segments=[
+                TranslatedSegment(
+                    start=seg.start,
+                    end=seg.end,
+                    text=seg.text,
+                    speaker=seg.speaker,
+                    translation=translation,
+                )
+                for seg, translation in zip(transcript.segments, translations)
+            ],
+        )
+
+    def _start_batch(self) -> None:
+        start = self._count - len(self._pending)
+        batch, self._pending = self._pending, []
+        self._tasks.append(asyncio.create_task(self._process(start, batch)))
+
+    async def _process(self, start: int, batch: List[Segment]) -> None:
+        end = start + len(batch)
+        try:
+            async with self._slot():
+                texts = await self._defluff.clean_texts([seg.text for seg in batch])
+                translated = await self._translation.translate_transcript(
+                    transcript=DiarizedTranscript(
+                        language="",
+                        num_speakers=1,
+                        segments=[
+                            DiarizedSegment(
+                                start=seg.start, end=seg.end, text=text, speaker="SPEAKER_0"
+                            )
+                            for seg, text in zip(batch, texts)
+                        ],
+                    ),
+                    target_language=self._target_language,
+                    job=self._job,  # Pass job for cost tracking
+                )
+        except Exception as e:
+            # The regular stages redo whatever is missing
+            logger.warning(f"Streamed cleanup/translation of segments {start}-{end} failed: {e}")
+            return
+
+        translations = [seg.translation for seg in translated.segments]
+        if len(texts) != len(batch) or len(translations) != len(batch):
+            logger.warning(f"Streamed cleanup/translation of segments {start}-{end} incomplete")
+            return
+        for seg, text, translation in zip(batch, texts, translations):
+            self._cleaned[_key(seg)] = text
+            self._translations[(seg.start, seg.end, text)] = translation
@@ -6,12 +6,12 @@ Uses video screenshots (not AI-generated images) for authenticity.
 import hashlib
 import httpx
 import io
-import subprocess
 from pathlib import Path
 from typing import Optional, Tuple, List
 from loguru import logger
 
 from app.config import settings
+from app.services.process_runner import ProcessTimeoutError, run_process
 
 # YouTube thumbnail dimensions
 YOUTUBE_WIDTH = 1280
@@ -747,7 +747,7 @@ class ThumbnailWorker:
                 {"index": 0, "main": "精彩内容", "sub": "不容错过", "style": "默认"},
             ]
 
-    def get_video_duration(self, video_path: Path) -> Optional[float]:
+    async def get_video_duration(self, video_path: Path) -> Optional[float]:
         """Get video duration in seconds using ffprobe.
 
         Args:
@@ -765,14 +765,14 @@ class ThumbnailWorker:
         ]
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+            result = await run_process(cmd, timeout=10)
             if result.returncode == 0:
                 return float(result.stdout.strip())
         except Exception as e:
             logger.error(f"Failed to get video duration: {e}")
         return None
 
-    def extract_candidate_frames(
+    async def extract_candidate_frames(
         self,
         video_path: Path,
         output_dir: Path,
@@ -795,7 +795,7 @@ class ThumbnailWorker:
         output_dir.mkdir(parents=True, exist_ok=True)
 
         if duration is None:
-            duration = self.get_video_duration(video_path)
+            duration = await self.get_video_duration(video_path)
             if duration is None:
                 logger.error("Could not determine video duration")
                 return []
@@ -810,7 +810,7 @@ class ThumbnailWorker:
             filename = f"candidate_{i+1}_{int(timestamp)}s.jpg"
             output_path = output_dir / filename
 
-            result = self.extract_frame(video_path, timestamp, output_path)
+            result = await self.extract_frame(video_path, timestamp, output_path)
             if result:
                 candidates.append({
                     "index": i + 1,
@@ -822,7 +822,7 @@ class ThumbnailWorker:
 
         return candidates
 
-    def extract_frame(
+    async def extract_frame(
         self,
         video_path: Path,
         timestamp: float,
@@ -852,7 +852,7 @@ class ThumbnailWorker:
         ]
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = await run_process(cmd, timeout=30)
             if result.returncode != 0:
                 logger.error(f"FFmpeg error: {result.stderr}")
                 return None
@@ -864,7 +864,7 @@ class ThumbnailWorker:
                 logger.error("Frame extraction completed but file not found")
                 return None
 
-        except subprocess.TimeoutExpired:
+        except ProcessTimeoutError:
             logger.error("FFmpeg timeout")
             return None
         except Exception as e:
@@ -1149,12 +1149,12 @@ class ThumbnailWorker:
         # Step 3: Extract frame from video
         logger.info(f"Extracting frame at {timestamp}s...")
         frame_path = output_dir / "temp_frame.jpg"
-        frame_result = self.extract_frame(video_path, timestamp, frame_path)
+        frame_result = await self.extract_frame(video_path, timestamp, frame_path)
 
         if not frame_result:
             # Fallback: try at 10 seconds
             logger.warning("Frame extraction failed, trying fallback at 10s...")
-            frame_result = self.extract_frame(video_path, 10.0, frame_path)
+            frame_result = await self.extract_frame(video_path, 10.0, frame_path)
 
         if not frame_result:
             logger.error("Failed to extract frame from video")
@@ -8,6 +8,7 @@ import numpy as np
 
 from app.config import settings
 from app.models.transcript import TranslatedTranscript, TranslatedSegment
+from app.workers.dubbing_engine import DubItem, SpeakerLatentCache, synthesize_batched
 
 
 class TTSWorker:
@@ -18,6 +19,9 @@ class TTSWorker:
         self.model_name = settings.tts_model
         self.device = settings.tts_device
         self.speaker_embeddings: Dict[str, any] = {}
+        self.latent_cache = SpeakerLatentCache(
+            settings.models_cache_dir / "xtts_latents", self.model_name
+        )
 
     def _load_model(self):
         """Lazy load the TTS model."""
@@ -160,6 +164,10 @@ class TTSWorker:
         """
         Synthesize all segments in a translated transcript.
 
+        Segments are synthesized in per-speaker batches on a worker pool,
+        with each reference clip's conditioning latents computed once.
+        Segments already synthesized by an interrupted run are reused.
+
         Args:
             transcript: Translated transcript
             output_dir: Directory to save audio files
@@ -173,43 +181,43 @@ class TTSWorker:
         tts_dir = output_dir / "tts"
         tts_dir.mkdir(parents=True, exist_ok=True)
 
-        results = []
-
+        results: List[Dict] = [
+            {
+                "index": i,
+                "start": segment.start,
+                "end": segment.end,
+                "speaker": segment.speaker,
+                "text": segment.translation,
+                "audio_path": None,
+            }
+            for i, segment in enumerate(transcript.segments)
+        ]
+
+        items = []
         for i, segment in enumerate(transcript.segments):
-            audio_path = tts_dir / f"segment_{i:04d}.wav"
-
-            try:
-                await self.synthesize_segment(
-                    text=segment.translation,
-                    speaker_id=segment.speaker,
-                    output_path=audio_path,
-                )
-
-                results.append({
-                    "index": i,
-                    "start": segment.start,
-                    "end": segment.end,
-                    "speaker": segment.speaker,
-                    "text": segment.translation,
-                    "audio_path": str(audio_path),
-                })
-
-                if (i + 1) % 10 == 0:
-                    logger.info(
-                        f"Synthesized {i + 1}/{len(transcript.segments)} segments"
-                    )
-
-            except Exception as e:
-                logger.error(f"Failed to synthesize segment {i}: {e}")
-                results.append({
-                    "index": i,
-                    "start": segment.start,
-                    "end": segment.end,
-                    "speaker": segment.speaker,
-                    "text": segment.translation,
-                    "audio_path": None,
-                    "error": str(e),
-                })
+            if segment.speaker not in self.speaker_embeddings:
+                results[i]["error"] = f"No reference audio for speaker: {segment.speaker}"
+                logger.error(f"Failed to synthesize segment {i}: {results[i]['error']}")
+                continue
+            items.append(DubItem(id=f"{i:04d}", text=segment.translation, speaker=segment.speaker))
+
+        synthesized = await synthesize_batched(
+            self.model.synthesizer.tts_model,
+            items,
+            {speaker: Path(path) for speaker, path in self.speaker_embeddings.items()},
+            self.latent_cache,
+            tts_dir,
+            language="zh-cn",
+            temperature=None,
+            workers=settings.tts_workers,
+            batch_size=settings.tts_batch_size,
+        )
+        for item, result in zip(items, synthesized):
+            entry = results[int(item.id)]
+            if result.path:
+                entry["audio_path"] = str(result.path)
+            else:
+                entry["error"] = result.error
 
         logger.info(f"Synthesized {len(results)} segments")
         return results
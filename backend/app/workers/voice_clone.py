@@ -2,10 +2,20 @@
 
 import asyncio
 import logging
-import tempfile
+from functools import partial
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from app.config import settings
+from app.workers.dubbing_engine import (
+    DubItem,
+    SpeakerLatentCache,
+    get_synthesis_pool,
+    file_hash,
+    synthesize_batched,
+    synthesize_item,
+)
+
 logger = logging.getLogger(__name__)
 
 # Check if TTS is available
@@ -24,13 +34,16 @@ class VoiceCloneWorker:
     Worker to clone voices and synthesize speech using XTTS v2.
 
     XTTS v2 can clone any voice from a short audio sample and
-    generate speech in that voice for any text.
+    generate speech in that voice for any text. Each sample's
+    conditioning latents are computed once and cached on disk.
     """
 
     def __init__(
         self,
         model_name: str = "tts_models/multilingual/multi-dataset/xtts_v2",
         device: Optional[str] = None,
+        workers: Optional[int] = None,
+        batch_size: Optional[int] = None,
     ):
         """
         Initialize the voice clone worker.
@@ -38,17 +51,23 @@ class VoiceCloneWorker:
         Args:
             model_name: TTS model to use
             device: Device to run on (cuda, cpu, or None for auto)
+            workers: Synthesis batches run at the same time (default: settings)
+            batch_size: Segments of one speaker per batch (default: settings)
         """
         self.model_name = model_name
         self.tts = None
+        self.workers = workers or settings.tts_workers
+        self.batch_size = batch_size or settings.tts_batch_size
 
         if device is None:
             self.device = "cuda" if TTS_AVAILABLE and torch.cuda.is_available() else "cpu"
         else:
             self.device = device
 
-        # Cache for speaker embeddings (speaker_id -> embedding)
-        self._speaker_cache: Dict[str, object] = {}
+        # Conditioning latents per voice sample (speaker embedding + GPT latents)
+        self.latent_cache = SpeakerLatentCache(
+            settings.models_cache_dir / "xtts_latents", model_name
+        )
 
     def _load_model(self):
         """Load the TTS model lazily."""
@@ -62,6 +81,21 @@ class VoiceCloneWorker:
         self.tts = TTS(self.model_name).to(self.device)
         logger.info("TTS model loaded successfully")
 
+    @property
+    def _xtts(self):
+        """The XTTS model behind the TTS API wrapper."""
+        return self.tts.synthesizer.tts_model
+
+    async def _get_latents(self, speaker_sample_path: Path):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_synthesis_pool(self.workers),
+            self.latent_cache.get,
+            self._xtts,
+            speaker_sample_path,
+            file_hash(speaker_sample_path),
+        )
+
     async def extract_speaker_sample(
         self,
         audio_path: Path,
@@ -173,23 +207,20 @@ class VoiceCloneWorker:
         """
         self._load_model()
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
         logger.info(f"Synthesizing: '{text[:50]}...' in voice from {speaker_sample_path}")
 
-        def _synthesize():
-            self.tts.tts_to_file(
-                text=text,
-                speaker_wav=str(speaker_sample_path),
-                language=language,
-                file_path=str(output_path),
-                speed=speed,
-                temperature=temperature,
-            )
+        latents = await self._get_latents(speaker_sample_path)
+        item = DubItem(id=output_path.stem, text=text, speaker="")
 
         # Run in thread pool to not block event loop
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, _synthesize)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            get_synthesis_pool(self.workers),
+            partial(
+                synthesize_item,
+                self._xtts, latents, item, output_path, language, temperature, speed=speed,
+            ),
+        )
 
         logger.info(f"Synthesized audio saved to: {output_path}")
         return output_path
@@ -221,43 +252,19 @@ class VoiceCloneWorker:
         Returns:
             Tuple of (output_path, actual_duration)
         """
-        import torchaudio
-
-        # First, synthesize at normal speed to measure duration
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            temp_path = Path(tmp.name)
-
-        await self.synthesize(text, speaker_sample_path, temp_path, language, speed=1.0, temperature=temperature)
-
-        # Measure duration
-        waveform, sample_rate = torchaudio.load(temp_path)
-        original_duration = waveform.shape[1] / sample_rate
-
-        # Calculate required speed adjustment
-        if target_duration > 0:
-            speed_ratio = original_duration / target_duration
-            speed = max(min_speed, min(max_speed, speed_ratio))
-        else:
-            speed = 1.0
-
-        # If speed is close to 1.0, use the original
-        if 0.95 <= speed <= 1.05:
-            temp_path.rename(output_path)
-            return output_path, original_duration
-
-        # Re-synthesize with adjusted speed
-        await self.synthesize(text, speaker_sample_path, output_path, language, speed=speed, temperature=temperature)
-        temp_path.unlink(missing_ok=True)
-
-        # Get actual duration
-        waveform, sample_rate = torchaudio.load(output_path)
-        actual_duration = waveform.shape[1] / sample_rate
+        self._load_model()
 
-        logger.info(
-            f"Adjusted duration: {original_duration:.2f}s -> {actual_duration:.2f}s "
-            f"(target: {target_duration:.2f}s, speed: {speed:.2f})"
+        latents = await self._get_latents(speaker_sample_path)
+        item = DubItem(
+            id=output_path.stem, text=text, speaker="", target_duration=target_duration
         )
 
+        loop = asyncio.get_running_loop()
+        actual_duration = await loop.run_in_executor(
+            get_synthesis_pool(self.workers),
+            synthesize_item,
+            self._xtts, latents, item, output_path, language, temperature, max_speed, min_speed,
+        )
         return output_path, actual_duration
 
     async def dub_segments(
@@ -271,6 +278,10 @@ class VoiceCloneWorker:
         """
         Dub multiple segments with cloned voices.
 
+        Segments are synthesized in per-speaker batches on the worker pool.
+        Segments whose audio already exists from an interrupted run with
+        the same inputs are not synthesized again.
+
         Args:
             segments: List of segment dicts with id, text, speaker, start, end
             speaker_samples: Map of speaker_id -> sample audio path
@@ -279,11 +290,14 @@ class VoiceCloneWorker:
             temperature: Generation temperature (lower = closer to reference voice)
 
         Returns:
-            List of segment dicts with added 'dubbed_path' and 'dubbed_duration'
+            List of segment dicts with added 'dubbed_path', 'dubbed_duration'
+            and 'resumed' (audio reused from an earlier run)
         """
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        results = []
+        results: List[Optional[Dict]] = []
+        items: List[DubItem] = []
+        positions: List[int] = []
         for seg in segments:
             speaker_id = seg.get("speaker", "unknown")
             sample_path = speaker_samples.get(speaker_id)
@@ -299,26 +313,39 @@ class VoiceCloneWorker:
                 results.append({**seg, "dubbed_path": None, "dubbed_duration": None})
                 continue
 
-            target_duration = seg["end"] - seg["start"]
-            output_path = output_dir / f"segment_{seg['id']}_dubbed.wav"
-
-            try:
-                dubbed_path, dubbed_duration = await self.synthesize_segment(
-                    text=text,
-                    speaker_sample_path=sample_path,
-                    target_duration=target_duration,
-                    output_path=output_path,
-                    language=language,
-                    temperature=temperature,
-                )
-                results.append({
+            positions.append(len(results))
+            results.append(None)
+            items.append(DubItem(
+                id=seg["id"],
+                text=text,
+                speaker=speaker_id,
+                target_duration=seg["end"] - seg["start"],
+            ))
+
+        if items:
+            self._load_model()
+            dubbed = await synthesize_batched(
+                self._xtts,
+                items,
+                speaker_samples,
+                self.latent_cache,
+                output_dir,
+                language,
+                temperature=temperature,
+                workers=self.workers,
+                batch_size=self.batch_size,
+            )
+            for position, result in zip(positions, dubbed):
+                seg = segments[position]
+                entry = {
                     **seg,
-                    "dubbed_path": str(dubbed_path),
-                    "dubbed_duration": dubbed_duration,
-                })
-            except Exception as e:
-                logger.error(f"Failed to dub segment {seg['id']}: {e}")
-                results.append({**seg, "dubbed_path": None, "dubbed_duration": None, "error": str(e)})
+                    "dubbed_path": str(result.path) if result.path else None,
+                    "dubbed_duration": result.duration,
+                    "resumed": result.resumed,
+                }
+                if result.error:
+                    entry["error"] = result.error
+                results[position] = entry
 
         return results
 
@@ -1,11 +1,159 @@
-"""Waveform generation worker for timeline visualization."""
+"""Waveform generation worker for timeline visualization.
 
+Peaks are stored as a min/max pyramid in a compact binary file
+(``<track>.peaks``): the finest level has ``samples_per_second`` windows
+per second, each further level is 10x coarser. Values are int16 pairs
+(min, max) per window, in full-scale units of the mono-mixed signal.
+
+File layout::
+
+    [level 0 int16 (count, 2)][level 1 ...]...[header JSON][u32 header length][magic]
+
+The header (at the end, so level 0 can be written while the audio is
+still being read) records duration, the global peak and each level's
+rate, window count and byte offset. Readers seek to the windows they
+need, so a visible range costs a few KB whatever the file length.
+"""
+
+import asyncio
 import json
-import numpy as np
+import math
+import os
+import struct
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
 from loguru import logger
 
+# Dedicated thread pool for peak computation (reads whole audio files)
+_waveform_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="waveform")
+
+# Each pyramid level has 1/LEVEL_FACTOR the windows of the previous one
+LEVEL_FACTOR = 10
+PYRAMID_LEVELS = 3
+
+_MAGIC = b"WFPK"
+_FOOTER = struct.Struct("<I4s")
+_FULL_SCALE = 32767
+
+# Audio frames read per block while streaming the file
+_BLOCK_FRAMES = 1 << 20
+
+
+def _read_wav_blocks(audio_path: Path) -> Tuple[int, int, Iterator[np.ndarray]]:
+    """Open an audio file for block-wise reading.
+
+    Returns:
+        (sample rate, number of frames, iterator of mono float32 blocks)
+    """
+    try:
+        wav = wave.open(str(audio_path), "rb")
+    except (wave.Error, EOFError) as e:
+        # Not integer PCM WAV (e.g. float WAV or compressed audio)
+        logger.warning(f"wave failed, trying soundfile: {e}")
+        return _read_soundfile_blocks(audio_path)
+
+    sample_rate = wav.getframerate()
+    channels = wav.getnchannels()
+    width = wav.getsampwidth()
+
+    def blocks() -> Iterator[np.ndarray]:
+        with wav:
+            while True:
+                frames = wav.readframes(_BLOCK_FRAMES)
+                if not frames:
+                    return
+                yield _mix_to_mono(_pcm_to_float(frames, width), channels)
+
+    return sample_rate, wav.getnframes(), blocks()
+
+
+def _read_soundfile_blocks(audio_path: Path) -> Tuple[int, int, Iterator[np.ndarray]]:
+    try:
+        import soundfile as sf
+    except ImportError:
+        raise RuntimeError(
+            "Audio is not PCM WAV and soundfile is not installed. "
+            "Install soundfile: pip install soundfile"
+        )
+
+    info = sf.info(str(audio_path))
+
+    def blocks() -> Iterator[np.ndarray]:
+        for block in sf.blocks(str(audio_path), blocksize=_BLOCK_FRAMES, dtype="float32",
+                               always_2d=True):
+            yield _mix_to_mono(block, info.channels)
+
+    return info.samplerate, info.frames, blocks()
+
+
+def _pcm_to_float(frames: bytes, width: int) -> np.ndarray:
+    """Convert interleaved integer PCM bytes to float32 in [-1, 1]."""
+    if width == 1:
+        return (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128) / 128.0
+    if width == 2:
+        return np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+    if width == 3:
+        raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3)
+        padded = np.zeros((len(raw), 4), dtype=np.uint8)
+        padded[:, 1:] = raw  # little-endian 24-bit into the top bytes of int32
+        return padded.view("<i4").ravel().astype(np.float32) / 2147483648.0
+    if width == 4:
+        return np.frombuffer(frames, dtype="<i4").astype(np.float32) / 2147483648.0
+    raise ValueError(f"Unsupported WAV sample width: {width} bytes")
+
+
+def _mix_to_mono(samples: np.ndarray, channels: int) -> np.ndarray:
+    if channels == 1:
+        return samples.reshape(-1)
+    return samples.reshape(-1, channels).mean(axis=1, dtype=np.float32)
+
+
+def _window_min_max(samples: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Min and max of each window of samples beginning at starts."""
+    return np.stack(
+        [np.minimum.reduceat(samples, starts), np.maximum.reduceat(samples, starts)], axis=1
+    )
+
+
+def _reduce_level(level: np.ndarray, factor: int, rows_per_chunk: int = 1 << 20) -> np.ndarray:
+    """Combine every factor windows of a (count, 2) min/max level into one."""
+    out = []
+    chunk = rows_per_chunk - rows_per_chunk % factor
+    for offset in range(0, len(level), chunk):
+        part = np.asarray(level[offset:offset + chunk])
+        starts = np.arange(0, len(part), factor)
+        out.append(np.stack(
+            [np.minimum.reduceat(part[:, 0], starts), np.maximum.reduceat(part[:, 1], starts)],
+            axis=1,
+        ))
+    return np.concatenate(out) if out else np.zeros((0, 2), dtype=np.int16)
+
+
+def _read_header(f) -> Dict[str, Any]:
+    f.seek(-_FOOTER.size, os.SEEK_END)
+    header_size, magic = _FOOTER.unpack(f.read(_FOOTER.size))
+    if magic != _MAGIC:
+        raise ValueError("Not a waveform peaks file")
+    f.seek(-_FOOTER.size - header_size, os.SEEK_END)
+    return json.loads(f.read(header_size))
+
+
+def _pick_level(levels: List[dict], rate: Optional[float]) -> dict:
+    """Coarsest level with at least the given rate (finest if none is enough)."""
+    if rate is None:
+        return levels[0]
+    enough = [level for level in levels if level["rate"] >= rate]
+    return enough[-1] if enough else levels[0]
+
+
+def _read_level(f, level: dict, first: int, last: int) -> np.ndarray:
+    f.seek(level["offset"] + first * 4)
+    return np.frombuffer(f.read((last - first) * 4), dtype="<i2").reshape(-1, 2)
+
 
 class WaveformWorker:
     """Worker for generating audio waveform peak data."""
@@ -15,133 +163,145 @@ class WaveformWorker:
         Initialize waveform worker.
 
         Args:
-            samples_per_second: Number of peak samples per second of audio.
-                Higher values = more detail but larger files.
+            samples_per_second: Number of peak samples per second of audio
+                at the finest pyramid level.
                 1000 = 1ms resolution (good default)
                 500 = 2ms resolution (smaller files)
                 100 = 10ms resolution (minimal detail)
         """
         self.samples_per_second = samples_per_second
 
+    def _generate_sync(self, audio_path: Path, output_path: Path) -> Dict[str, Any]:
+        """Stream the audio once and write the peak pyramid (runs in thread pool)."""
+        sample_rate, total_frames, blocks = _read_wav_blocks(audio_path)
+        duration = total_frames / sample_rate if sample_rate else 0.0
+        logger.info(f"Audio duration: {duration:.2f}s, sample rate: {sample_rate}Hz")
+
+        rate = min(self.samples_per_second, sample_rate)
+        count = max(1, total_frames * rate // sample_rate)
+
+        def bound(i: int) -> int:
+            # Sample index where window i starts; the last window takes the tail
+            return total_frames if i >= count else i * sample_rate // rate
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = output_path.with_suffix(".tmp")
+        peak = 0.0
+        written = 0
+        with open(tmp_path, "wb") as f:
+            pending = np.zeros(0, dtype=np.float32)
+            pending_start = 0  # sample index of pending[0]
+            for block in blocks:
+                buffer = np.concatenate([pending, block]) if len(pending) else block
+                buffer_end = pending_start + len(buffer)
+                # Windows that end inside the buffer are complete
+                if buffer_end >= total_frames:
+                    done = count
+                else:
+                    done = min(((buffer_end + 1) * rate - 1) // sample_rate, count - 1)
+                if done > written:
+                    starts = np.arange(written, done, dtype=np.int64) * sample_rate // rate
+                    starts -= pending_start
+                    used = bound(done) - pending_start
+                    window = _window_min_max(buffer[:used], starts)
+                    peak = max(peak, float(np.abs(window).max()))
+                    f.write(np.round(window * _FULL_SCALE).astype("<i2").tobytes())
+                    pending = buffer[used:]
+                    pending_start += used
+                    written = done
+                else:
+                    pending = buffer
+
+            if written < count:
+                # Too little audio for the remaining windows
+                rows = np.zeros((count - written, 2), dtype="<i2")
+                f.write(rows.tobytes())
+
+        # Coarser levels from the finest one, read back through a memory map
+        levels = [{"rate": rate, "count": count, "offset": 0}]
+        with open(tmp_path, "ab") as f:
+            source = np.memmap(tmp_path, dtype="<i2", mode="r", shape=(count, 2))
+            for _ in range(PYRAMID_LEVELS - 1):
+                if levels[-1]["rate"] % LEVEL_FACTOR:
+                    break
+                reduced = _reduce_level(source, LEVEL_FACTOR)
+                levels.append({
+                    "rate": levels[-1]["rate"] // LEVEL_FACTOR,
+                    "count": len(reduced),
+                    "offset": f.tell(),
+                })
+                f.write(reduced.astype("<i2").tobytes())
+                source = reduced
+            del source
+
+            header = json.dumps({
+                "duration": duration,
+                "original_sample_rate": sample_rate,
+                "peak": round(peak * _FULL_SCALE),
+                "levels": levels,
+            }).encode()
+            f.write(header)
+            f.write(_FOOTER.pack(len(header), _MAGIC))
+        tmp_path.replace(output_path)
+
+        return {
+            "sample_rate": rate,
+            "duration": duration,
+            "original_sample_rate": sample_rate,
+            "total_samples": count,
+            "levels": [level["rate"] for level in levels],
+        }
+
     async def generate_peaks(
         self,
         audio_path: Path,
-        output_path: Optional[Path] = None,
+        output_path: Path,
     ) -> Dict[str, Any]:
         """
-        Generate waveform peak data from an audio file.
+        Generate the waveform peak pyramid for an audio file.
+
+        The file is read in blocks, so memory use does not grow with its length.
 
         Args:
-            audio_path: Path to the audio file (WAV, MP3, etc.)
-            output_path: Optional path to save the peaks JSON file.
-                If not provided, peaks are returned but not saved.
+            audio_path: Path to the audio file (PCM WAV; other formats need soundfile)
+            output_path: Path of the binary peaks file to write
 
         Returns:
-            Dict with peaks, sample_rate, and duration
+            Dict with sample_rate, duration, total_samples, levels and file_size_kb
         """
         audio_path = Path(audio_path)
+        output_path = Path(output_path)
 
         if not audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
         logger.info(f"Generating waveform peaks for: {audio_path}")
-
-        # Read audio file using scipy (supports more formats) or soundfile
-        try:
-            # Try scipy first (handles more formats)
-            from scipy.io import wavfile
-            sample_rate, audio_data = wavfile.read(str(audio_path))
-
-            # Convert to float and normalize
-            if audio_data.dtype == np.int16:
-                audio_data = audio_data.astype(np.float32) / 32768.0
-            elif audio_data.dtype == np.int32:
-                audio_data = audio_data.astype(np.float32) / 2147483648.0
-            elif audio_data.dtype == np.float64:
-                audio_data = audio_data.astype(np.float32)
-
-        except Exception as e:
-            logger.warning(f"scipy failed, trying soundfile: {e}")
-            try:
-                import soundfile as sf
-                audio_data, sample_rate = sf.read(str(audio_path))
-                audio_data = audio_data.astype(np.float32)
-            except ImportError:
-                raise RuntimeError(
-                    "Neither scipy nor soundfile could read the audio. "
-                    "Install soundfile: pip install soundfile"
-                )
-
-        # Convert stereo to mono if needed
-        if len(audio_data.shape) > 1:
-            audio_data = np.mean(audio_data, axis=1)
-
-        # Calculate duration
-        duration = len(audio_data) / sample_rate
-        logger.info(f"Audio duration: {duration:.2f}s, sample rate: {sample_rate}Hz")
-
-        # Calculate number of peak samples
-        total_peaks = int(duration * self.samples_per_second)
-        if total_peaks < 1:
-            total_peaks = 1
-
-        samples_per_peak = len(audio_data) / total_peaks
-
-        # Generate peaks
-        peaks = []
-        for i in range(total_peaks):
-            start_idx = int(i * samples_per_peak)
-            end_idx = int((i + 1) * samples_per_peak)
-            end_idx = min(end_idx, len(audio_data))
-
-            if start_idx >= end_idx:
-                peaks.append(0.0)
-                continue
-
-            window = audio_data[start_idx:end_idx]
-            # Use max absolute value for peak
-            peak_value = float(np.max(np.abs(window)))
-            peaks.append(peak_value)
-
-        # Normalize peaks to 0-1 range
-        max_peak = max(peaks) if peaks else 1.0
-        if max_peak > 0:
-            peaks = [p / max_peak for p in peaks]
-
-        result = {
-            "peaks": peaks,
-            "sample_rate": self.samples_per_second,
-            "duration": duration,
-            "original_sample_rate": sample_rate,
-            "total_samples": len(peaks),
-        }
-
-        # Save to file if output path provided
-        if output_path:
-            output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(output_path, "w") as f:
-                json.dump(result, f)
-
-            logger.info(f"Saved waveform peaks to: {output_path}")
-
-            # Add file size info
-            file_size_kb = output_path.stat().st_size / 1024
-            result["file_size_kb"] = round(file_size_kb, 2)
-            logger.info(f"Waveform file size: {file_size_kb:.2f} KB")
-
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            _waveform_executor, self._generate_sync, audio_path, output_path
+        )
+
+        file_size_kb = output_path.stat().st_size / 1024
+        result["file_size_kb"] = round(file_size_kb, 2)
+        logger.info(f"Saved waveform peaks to: {output_path} ({file_size_kb:.2f} KB)")
         return result
 
-    async def load_peaks(self, peaks_path: Path) -> Optional[Dict[str, Any]]:
+    async def load_peaks(
+        self,
+        peaks_path: Path,
+        rate: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
         """
-        Load waveform peaks from a JSON file.
+        Load whole-file peaks (absolute values, normalized to 0-1).
 
         Args:
-            peaks_path: Path to the peaks JSON file
+            peaks_path: Path to the peaks file (binary pyramid or legacy JSON)
+            rate: Wanted peaks per second; the coarsest level with at least
+                this rate is used (None = finest level)
 
         Returns:
-            Dict with peaks data, or None if file doesn't exist
+            Dict with peaks, sample_rate and duration, or None if the file
+            doesn't exist
         """
         peaks_path = Path(peaks_path)
 
@@ -149,12 +309,81 @@ class WaveformWorker:
             return None
 
         try:
-            with open(peaks_path, "r") as f:
-                return json.load(f)
+            if peaks_path.suffix == ".json":
+                with open(peaks_path, "r") as f:
+                    return json.load(f)
+
+            with open(peaks_path, "rb") as f:
+                header = _read_header(f)
+                level = _pick_level(header["levels"], rate)
+                rows = _read_level(f, level, 0, level["count"])
+            scale = header["peak"] or 1
+            peaks = np.abs(rows.astype(np.int32)).max(axis=1) / scale
+            return {
+                "peaks": np.round(peaks, 4).tolist(),
+                "sample_rate": level["rate"],
+                "duration": header["duration"],
+                "original_sample_rate": header["original_sample_rate"],
+                "total_samples": level["count"],
+            }
         except Exception as e:
             logger.error(f"Failed to load peaks: {e}")
             return None
 
+    async def load_range(
+        self,
+        peaks_path: Path,
+        start: float,
+        end: float,
+        rate: Optional[float] = None,
+        width: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load min/max peaks for a time range at a zoom level.
+
+        Only the windows in the range are read from disk.
+
+        Args:
+            peaks_path: Path to the binary peaks file
+            start: Range start (seconds)
+            end: Range end (seconds)
+            rate: Wanted peaks per second
+            width: Pixels the range is drawn on (used when rate is None;
+                picks about one window per pixel)
+
+        Returns:
+            Dict with rate, start, end (snapped to windows), duration, scale
+            (value of a full-height peak), min and max lists, or None if the
+            file doesn't exist
+        """
+        peaks_path = Path(peaks_path)
+        if not peaks_path.exists():
+            return None
+
+        if rate is None and width:
+            rate = width / max(end - start, 1e-6)
+
+        with open(peaks_path, "rb") as f:
+            header = _read_header(f)
+            level = _pick_level(header["levels"], rate)
+            first = min(max(0, math.floor(start * level["rate"])), level["count"])
+            last = min(max(first, math.ceil(end * level["rate"])), level["count"])
+            rows = _read_level(f, level, first, last)
+
+        return {
+            "rate": level["rate"],
+            "start": first / level["rate"],
+            "end": last / level["rate"],
+            "duration": header["duration"],
+            "scale": header["peak"] or _FULL_SCALE,
+            "min": rows[:, 0].tolist(),
+            "max": rows[:, 1].tolist(),
+        }
+
+    def peaks_path(self, job_dir: Path, track_type: str) -> Path:
+        """Path of a job track's peaks file."""
+        return Path(job_dir) / "waveforms" / f"{track_type}.peaks"
+
     async def generate_for_job(
         self,
         job_dir: Path,
@@ -168,7 +397,7 @@ class WaveformWorker:
             track_type: Type of audio track ("original", "dubbing", "bgm")
 
         Returns:
-            Dict with peaks data and file paths
+            Dict with peaks file metadata and file paths
         """
         job_dir = Path(job_dir)
 
@@ -185,19 +414,25 @@ class WaveformWorker:
         if not audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-        # Create waveforms directory
-        waveforms_dir = job_dir / "waveforms"
-        waveforms_dir.mkdir(parents=True, exist_ok=True)
-
-        output_path = waveforms_dir / f"{track_type}.json"
+        output_path = self.peaks_path(job_dir, track_type)
 
         # Check cache
         if output_path.exists():
-            logger.info(f"Loading cached waveform: {output_path}")
-            cached = await self.load_peaks(output_path)
-            if cached:
-                cached["cached"] = True
-                return cached
+            logger.info(f"Using cached waveform: {output_path}")
+            with open(output_path, "rb") as f:
+                header = _read_header(f)
+            finest = header["levels"][0]
+            return {
+                "sample_rate": finest["rate"],
+                "duration": header["duration"],
+                "total_samples": finest["count"],
+                "levels": [level["rate"] for level in header["levels"]],
+                "file_size_kb": round(output_path.stat().st_size / 1024, 2),
+                "cached": True,
+                "track_type": track_type,
+                "audio_path": str(audio_path),
+                "peaks_path": str(output_path),
+            }
 
         # Generate new peaks
         result = await self.generate_peaks(audio_path, output_path)
@@ -1,17 +1,198 @@
 """Speech recognition worker using Whisper."""
 
 import asyncio
+import json
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from types import SimpleNamespace
+from typing import AsyncIterator, List, Optional
 from loguru import logger
 
 from app.config import settings
-from app.models.transcript import Transcript
+from app.models.transcript import Segment, Transcript
 
 # Dedicated thread pool for CPU-bound model operations
 _model_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="whisper")
 
+# Seconds between partial transcript checkpoints while streaming
+_CHECKPOINT_INTERVAL = 15.0
+
+# faster-whisper works on 16 kHz audio
+_SAMPLE_RATE = 16000
+
+
+def _offset_segment(segment, offset: float):
+    """Shift a Whisper segment (and its words) by offset seconds."""
+    if not offset:
+        return segment
+    words = getattr(segment, "words", None)
+    return SimpleNamespace(
+        start=segment.start + offset,
+        end=segment.end + offset,
+        text=segment.text,
+        words=[
+            SimpleNamespace(start=w.start + offset, end=w.end + offset, word=w.word)
+            for w in words
+        ] if words else words,
+    )
+
+
+def _decode_audio(audio_path: Path, offset: float):
+    """Decode audio to 16 kHz samples, starting offset seconds in."""
+    from faster_whisper import decode_audio
+
+    audio = decode_audio(str(audio_path), sampling_rate=_SAMPLE_RATE)
+    return audio[int(offset * _SAMPLE_RATE):]
+
+
+def _read_checkpoint(path: Optional[Path]) -> Optional[dict]:
+    """Load a partial transcript checkpoint, ignoring missing or corrupt files."""
+    if path is None or not path.exists():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        checkpoint["segments"] = [Segment(**seg) for seg in checkpoint["segments"]]
+        return checkpoint
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable transcription checkpoint {path}: {e}")
+        return None
+
+
+class TranscriptionStream:
+    """A running transcription that yields sentence segments as they are produced.
+
+    Iterate with ``async for``. ``language`` is set once Whisper detected it,
+    and ``transcript()`` returns the full result after iteration. With a
+    checkpoint path, the sentences emitted so far are saved periodically and
+    a later stream on the same path resumes after the last saved sentence.
+    """
+
+    def __init__(
+        self,
+        worker: "WhisperWorker",
+        audio_path: Path,
+        language: Optional[str],
+        model_name: Optional[str],
+        checkpoint_path: Optional[Path],
+    ):
+        self._worker = worker
+        self._audio_path = audio_path
+        self._requested_language = language
+        self._model_name = model_name
+        self._checkpoint_path = checkpoint_path
+        self._resume_from = 0.0
+        self.language: Optional[str] = None
+        self.segments: List[Segment] = []
+
+    def __aiter__(self) -> AsyncIterator[Segment]:
+        return self._run()
+
+    def transcript(self) -> Transcript:
+        """The transcript of all sentences emitted so far."""
+        return Transcript(language=self.language or "", segments=list(self.segments))
+
+    async def _run(self) -> AsyncIterator[Segment]:
+        from app.workers.resegment import StreamingResegmenter
+
+        await self._worker._ensure_model_loaded(self._model_name)
+        if not self._audio_path.exists():
+            raise FileNotFoundError(f"Audio file not found: {self._audio_path}")
+
+        language = self._requested_language
+        checkpoint = _read_checkpoint(self._checkpoint_path)
+        if checkpoint:
+            self.language = language = checkpoint["language"]
+            self.segments = list(checkpoint["segments"])
+            self._resume_from = checkpoint["resume_from"]
+            logger.info(
+                f"Resuming transcription of {self._audio_path} at {self._resume_from:.1f}s "
+                f"({len(self.segments)} segments from checkpoint)"
+            )
+            for segment in checkpoint["segments"]:
+                yield segment
+        else:
+            logger.info(f"Transcribing (streaming): {self._audio_path}")
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+        offset = self._resume_from
+        model = self._worker.model
+
+        def put(kind: str, value=None) -> None:
+            loop.call_soon_threadsafe(queue.put_nowait, (kind, value))
+
+        def produce() -> None:
+            try:
+                audio = _decode_audio(self._audio_path, offset) if offset > 0 else str(self._audio_path)
+                segments_iter, info = model.transcribe(
+                    audio,
+                    language=language,
+                    word_timestamps=True,
+                    vad_filter=True,
+                )
+                put("language", info.language)
+                for segment in segments_iter:
+                    if stop.is_set():
+                        return
+                    put("segment", _offset_segment(segment, offset))
+                put("done")
+            except BaseException as e:  # surfaced on the event loop
+                put("error", e)
+
+        loop.run_in_executor(_model_executor, produce)
+        resegmenter = StreamingResegmenter()
+        last_checkpoint = time.monotonic()
+        try:
+            while True:
+                kind, value = await queue.get()
+                if kind == "error":
+                    raise value
+                if kind == "done":
+                    break
+                if kind == "language":
+                    if self.language is None:
+                        self.language = value
+                        logger.info(f"Detected language: {value}")
+                    continue
+
+                for sentence in resegmenter.feed(value):
+                    self.segments.append(sentence)
+                    yield sentence
+                if (
+                    self._checkpoint_path is not None
+                    and time.monotonic() - last_checkpoint >= _CHECKPOINT_INTERVAL
+                ):
+                    self._write_checkpoint()
+                    last_checkpoint = time.monotonic()
+
+            for sentence in resegmenter.finish():
+                self.segments.append(sentence)
+                yield sentence
+            logger.info(f"Transcribed {len(self.segments)} segments")
+        finally:
+            stop.set()
+
+    def _write_checkpoint(self) -> None:
+        """Atomically save the sentences emitted so far."""
+        resume_from = max(self._resume_from, self.segments[-1].end if self.segments else 0.0)
+        tmp_path = self._checkpoint_path.with_suffix(".tmp")
+        self._checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "language": self.language,
+                    "resume_from": resume_from,
+                    "segments": [seg.model_dump() for seg in self.segments],
+                },
+                f,
+                ensure_ascii=False,
+            )
+        tmp_path.replace(self._checkpoint_path)
+
 
 class WhisperWorker:
     """Worker for speech recognition using faster-whisper."""
@@ -39,6 +220,8 @@ class WhisperWorker:
             self.model_name,
             device=self.device,
             compute_type=self.compute_type,
+            # Parallel chunk transcription shares this model across threads
+            num_workers=max(1, settings.whisper_workers),
         )
         logger.info("Whisper model loaded")
         return model
@@ -95,13 +278,18 @@ class WhisperWorker:
         Returns:
             Transcript with timestamped segments
         """
-        # Ensure model is loaded (with lock to prevent race conditions)
-        await self._ensure_model_loaded(model_name)
-
         audio_path = Path(audio_path)
         if not audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
+        if settings.whisper_workers > 1:
+            result = await self._transcribe_chunked(audio_path, language, model_name)
+            if result is not None:
+                return result
+
+        # Ensure model is loaded (with lock to prevent race conditions)
+        await self._ensure_model_loaded(model_name)
+
         logger.info(f"Transcribing: {audio_path}")
 
         # Run transcription in thread pool (non-blocking)
@@ -128,6 +316,56 @@ class WhisperWorker:
             segments=segments,
         )
 
+    async def _transcribe_chunked(
+        self,
+        audio_path: Path,
+        language: Optional[str],
+        model_name: Optional[str],
+    ) -> Optional[Transcript]:
+        """Transcribe in parallel chunks (None if the audio is too short to split)."""
+        from app.workers.chunked_transcription import transcribe_chunked
+
+        model = None
+        if self.device != "cpu":
+            # GPU chunks share this model; CPU chunks use worker processes
+            await self._ensure_model_loaded(model_name)
+            model = self.model
+        return await transcribe_chunked(
+            audio_path,
+            language,
+            model_name=model_name or self.model_name,
+            workers=settings.whisper_workers,
+            model=model,
+        )
+
+    def transcribe_stream(
+        self,
+        audio_path: Path,
+        language: Optional[str] = None,
+        model_name: Optional[str] = None,
+        checkpoint_path: Optional[Path] = None,
+    ) -> TranscriptionStream:
+        """
+        Transcribe audio file, yielding sentences as they are recognized.
+
+        Produces the same segments as transcribe(), but each sentence is
+        available as soon as faster-whisper has moved past it.
+
+        Args:
+            audio_path: Path to audio file (WAV recommended)
+            language: Source language code (auto-detect if None)
+            model_name: Whisper model to use (e.g. "small", "medium", "large-v3")
+            checkpoint_path: Partial transcript file to resume from and
+                update while transcribing (None = no checkpoints)
+
+        Returns:
+            TranscriptionStream to iterate with ``async for``
+        """
+        return TranscriptionStream(
+            self, Path(audio_path), language, model_name,
+            Path(checkpoint_path) if checkpoint_path else None,
+        )
+
     async def save_transcript(
         self,
         transcript: Transcript,
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Benchmark: dubbed audio mixing time and memory vs audio length.
+
+Builds synthetic dubbing timelines (a 24 kHz mono dubbed segment every
+3 s, some of them too long for their slot, plus full-length 44.1 kHz
+stereo BGM and SFX tracks) and runs AudioMixerWorker.mix_dubbed_audio
+on each in a fresh process, reporting wall time, time per audio minute
+and peak RSS.
+
+Usage:
+    cd backend && python scripts/bench_audio_mixer.py [--minutes 10,20,40] [--duck 0.5]
+"""
+
+import argparse
+import asyncio
+import logging
+import resource
+import sys
+import tempfile
+import time
+import wave
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+logging.disable(logging.WARNING)
+
+import numpy as np  # noqa: E402
+
+from app.workers.audio_mixer import SAMPLE_RATE, AudioMixerWorker  # noqa: E402
+
+SEGMENT_RATE = 24000
+SEGMENT_SPACING = 3.0
+
+
+def write_wav(path: Path, samples: np.ndarray, sample_rate: int, channels: int) -> None:
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(samples.astype("<i2").tobytes())
+
+
+def write_track(path: Path, minutes: float, rng) -> None:
+    """Write a stereo noise track one minute at a time."""
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        for _ in range(int(minutes)):
+            wav.writeframes(rng.integers(-4000, 4000, SAMPLE_RATE * 60 * 2, dtype=np.int16).tobytes())
+
+
+def build_timeline(directory: Path, minutes: float, rng) -> list:
+    """Segments every SEGMENT_SPACING seconds, drawn from 20 distinct takes."""
+    takes = []
+    for i in range(20):
+        # 2.0-3.4 s: the longer takes overflow their 3 s slot
+        seconds = 2.0 + 0.07 * i
+        t = np.arange(int(seconds * SEGMENT_RATE)) / SEGMENT_RATE
+        tone = np.sin(2 * np.pi * (150 + 10 * i) * t) * 12000
+        path = directory / f"take_{i}.wav"
+        write_wav(path, tone, SEGMENT_RATE, 1)
+        takes.append(path)
+
+    segments = []
+    count = int(minutes * 60 / SEGMENT_SPACING)
+    for i in range(count):
+        start = i * SEGMENT_SPACING
+        segments.append({
+            "id": i,
+            "start": start,
+            "end": start + 2.5,
+            "dubbed_path": str(takes[rng.integers(len(takes))]),
+        })
+    return segments
+
+
+def run_child(directory: str, minutes: float, duck: float):
+    """Mix one timeline in this (fresh) process; returns (segments, seconds, peak RSS MB)."""
+    directory = Path(directory)
+    rng = np.random.default_rng(0)
+    segments = build_timeline(directory, minutes, rng)
+    start = time.perf_counter()
+    asyncio.run(AudioMixerWorker().mix_dubbed_audio(
+        segments,
+        directory / "bgm.wav",
+        directory / "sfx.wav",
+        directory / "mixed.wav",
+        total_duration=minutes * 60,
+        duck_volume=duck,
+    ))
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is in KB on Linux
+    return len(segments), elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", default="10,20,40", help="Timeline lengths to compare")
+    parser.add_argument("--duck", type=float, default=0.5, help="BGM/SFX gain under speech")
+    args = parser.parse_args()
+
+    print(f"{'minutes':>7} {'segments':>8} {'seconds':>8} {'s/audio min':>11} {'peak RSS MB':>12}")
+    context = get_context("spawn")
+    for minutes in [float(m) for m in args.minutes.split(",")]:
+        with tempfile.TemporaryDirectory() as tmp:
+            rng = np.random.default_rng(1)
+            write_track(Path(tmp) / "bgm.wav", minutes, rng)
+            write_track(Path(tmp) / "sfx.wav", minutes, rng)
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                count, elapsed, rss = pool.submit(run_child, tmp, minutes, args.duck).result()
+        print(f"{minutes:>7g} {count:>8} {elapsed:>8.2f} {elapsed / minutes:>11.3f} {rss:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
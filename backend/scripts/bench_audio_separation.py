@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Benchmark: peak memory of windowed vs whole-track audio separation.
+
+Writes synthetic 44.1 kHz stereo WAVs of increasing duration and
+separates each one in a fresh process, reporting the process's peak RSS:
+
+- whole:     the full track decoded and separated in one call (previous
+             _separate_with_demucs)
+- windowed:  separate_streaming with windows sized by plan_window
+
+--separator passthrough splits the mix into fixed fractions and runs
+without torch; --separator demucs runs the real model (needs demucs).
+
+Usage:
+    cd backend && python scripts/bench_audio_separation.py \\
+        [--minutes 1,2,4,8] [--memory-mb 1024] [--separator passthrough]
+"""
+
+import argparse
+import logging
+import resource
+import sys
+import tempfile
+import time
+import wave
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+logging.disable(logging.WARNING)
+
+import numpy as np  # noqa: E402
+
+from app.workers.audio_separation import (  # noqa: E402
+    SAMPLE_RATE,
+    _StereoReader,
+    _StemWriter,
+    plan_window,
+    separate_streaming,
+)
+
+
+def write_noise(path: Path, minutes: float) -> None:
+    """Write stereo 16-bit noise, one second at a time."""
+    rng = np.random.default_rng(0)
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        for _ in range(int(minutes * 60)):
+            block = rng.integers(-8000, 8000, size=(SAMPLE_RATE, 2), dtype=np.int16)
+            wav.writeframes(block.tobytes())
+
+
+def passthrough(mix: np.ndarray) -> np.ndarray:
+    return np.stack([mix * 0.5, mix * 0.3, mix * 0.2])
+
+
+def demucs_separator():
+    import torch
+    from demucs.apply import apply_model
+    from demucs.pretrained import get_model
+
+    model = get_model("htdemucs")
+    model.eval()
+    sources = list(model.sources)
+    bgm = [i for i, name in enumerate(sources) if name not in ("vocals", "drums")]
+
+    def separate(mix: np.ndarray) -> np.ndarray:
+        with torch.no_grad():
+            out = apply_model(model, torch.from_numpy(mix)[None], progress=False)[0].numpy()
+        return np.stack([out[sources.index("vocals")], out[bgm].sum(axis=0),
+                         out[sources.index("drums")]])
+
+    return separate
+
+
+def run_child(mode: str, separator: str, audio_path: str, out_dir: str, memory_mb: int):
+    """Separate one file in this (fresh) process; returns (seconds, peak RSS MB)."""
+    separate = passthrough if separator == "passthrough" else demucs_separator()
+    paths = [Path(out_dir) / f"{name}.wav" for name in ("vocals", "bgm", "sfx")]
+    start = time.perf_counter()
+    if mode == "windowed":
+        window, crossfade = plan_window(memory_mb, 3.0)
+        separate_streaming(Path(audio_path), paths, separate, window, crossfade)
+    else:
+        reader = _StereoReader(Path(audio_path))
+        mix = reader.read(1 << 40)
+        reader.close()
+        writer = _StemWriter(paths, 0)
+        writer.push(separate(mix))
+        writer.close()
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is in KB on Linux
+    return elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", default="1,2,4,8", help="Track durations to compare")
+    parser.add_argument("--memory-mb", type=int, default=1024, help="Separation memory budget")
+    parser.add_argument("--separator", choices=["passthrough", "demucs"], default="passthrough")
+    parser.add_argument("--modes", default="whole,windowed")
+    args = parser.parse_args()
+
+    window, _ = plan_window(args.memory_mb, 3.0)
+    print(f"separator={args.separator}, budget={args.memory_mb} MB, "
+          f"window={window / SAMPLE_RATE:.0f}s")
+    print(f"{'minutes':>7} {'mode':>9} {'seconds':>8} {'peak RSS MB':>12}")
+    context = get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        for minutes in [float(m) for m in args.minutes.split(",")]:
+            audio_path = Path(tmp) / f"noise_{minutes:g}.wav"
+            write_noise(audio_path, minutes)
+            for mode in args.modes.split(","):
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                    elapsed, rss = pool.submit(
+                        run_child, mode, args.separator, str(audio_path), tmp, args.memory_mb
+                    ).result()
+                print(f"{minutes:>7g} {mode:>9} {elapsed:>8.2f} {rss:>12.0f}")
+            audio_path.unlink()
+
+
+if __name__ == "__main__":
+    main()
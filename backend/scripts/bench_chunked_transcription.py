@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark: wall-clock speedup of chunked Whisper transcription vs chunk count.
+
+Transcribes one real audio file (needs faster-whisper and ffmpeg):
+
+- 1 chunk: the whole file on one model instance (WhisperWorker.transcribe)
+- N chunks: split at silences, transcribed on min(N, --workers) model
+  instances (CPU worker processes, or threads on a shared CUDA model)
+
+Worker processes are started and their models loaded before timing.
+
+Usage:
+    cd backend && python scripts/bench_chunked_transcription.py AUDIO \\
+        [--model small] [--device cpu] [--workers 4] [--chunks 1,2,4,8]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger  # noqa: E402
+
+import app.workers.chunked_transcription as chunked  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.workers.whisper import WhisperWorker  # noqa: E402
+
+
+async def run(args) -> None:
+    audio_path = Path(args.audio)
+    chunk_counts = [int(c) for c in args.chunks.split(",")]
+    silences, duration = await chunked.detect_silences(audio_path)
+    print(f"{audio_path.name}: {duration:.0f}s audio, {len(silences)} silences, "
+          f"model={args.model}, device={args.device}")
+
+    settings.whisper_device = args.device
+    settings.whisper_workers = args.workers
+    if args.device == "cpu":
+        settings.whisper_compute_type = "int8"
+    worker = WhisperWorker()
+    model = None
+    if args.device == "cpu":
+        # Start the worker processes and load their models
+        pool = chunked._get_process_pool(args.model, args.workers)
+        for future in [pool.submit(time.sleep, 1.0) for _ in range(args.workers)]:
+            future.result()
+    else:
+        await worker._ensure_model_loaded(args.model)
+        model = worker.model
+
+    print(f"{'chunks':>6} {'workers':>7} {'wall s':>8} {'x realtime':>10} "
+          f"{'segments':>8} {'speedup':>8}")
+    baseline = None
+    for num_chunks in chunk_counts:
+        workers = min(num_chunks, args.workers)
+        start = time.perf_counter()
+        if num_chunks == 1:
+            settings.whisper_workers = 1
+            transcript = await worker.transcribe(audio_path, args.language, args.model)
+            settings.whisper_workers = args.workers
+        else:
+            transcript = await chunked.transcribe_chunked(
+                audio_path, args.language, args.model,
+                workers=workers, model=model, num_chunks=num_chunks,
+            )
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{num_chunks:>6} {workers:>7} {elapsed:>8.1f} {duration / elapsed:>10.1f} "
+              f"{len(transcript.segments):>8} {baseline / elapsed:>7.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("audio", help="Audio file (WAV recommended)")
+    parser.add_argument("--model", default="small", help="Whisper model")
+    parser.add_argument("--device", default="cpu", help="cpu or cuda")
+    parser.add_argument("--language", default="en", help="Source language")
+    parser.add_argument("--workers", type=int, default=4, help="Model instances")
+    parser.add_argument("--chunks", default="1,2,4,8", help="Chunk counts to compare")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Benchmark: essence export of many-segment timelines.
+
+Generates a synthetic source video (ffmpeg testsrc2 with a sine tone) and
+a timeline of N segments (300 by default), every other one kept and none
+starting on a keyframe, then times:
+
+- per-segment: the previous engine — one stream-copy ffmpeg cut per kept
+  segment into a temp file, a concat-demuxer join and a final encode
+- single-pass: ExportWorker.export_essence with chunking off (one ffmpeg
+  process, the segments cut by a ``select`` in the filter graph)
+- chunked: ExportWorker.export_essence with export_chunk_seconds chunks
+
+and reports each output's duration against the kept duration: stream-copy
+cuts start on the previous keyframe, so the per-segment output drifts.
+
+Requires ffmpeg with libx264.
+
+Usage:
+    cd backend && python scripts/bench_essence_export.py [--segments 300] [--height 480]
+"""
+
+import argparse
+import asyncio
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.models.timeline import (  # noqa: E402
+    EditableSegment,
+    ExportProfile,
+    SegmentState,
+    SubtitleStyleMode,
+    Timeline,
+)
+from app.workers.export import ExportWorker  # noqa: E402
+
+SEGMENT_SPACING = 2.0
+SEGMENT_LENGTH = 1.3
+
+
+def make_source(path: Path, duration: float, height: int) -> None:
+    width = height * 16 // 9
+    subprocess.run(
+        [
+            "ffmpeg", "-v", "error",
+            "-f", "lavfi", "-i", f"testsrc2=size={width}x{height}:rate=30",
+            "-f", "lavfi", "-i", "sine=frequency=440:sample_rate=44100",
+            "-t", str(duration), "-c:v", "libx264", "-preset", "veryfast", "-g", "60",
+            "-c:a", "aac", "-y", str(path),
+        ],
+        check=True,
+    )
+
+
+def make_timeline(count: int) -> Timeline:
+    segments = [
+        EditableSegment(
+            id=i,
+            start=i * SEGMENT_SPACING + 0.3,  # Off the 2 s GOP grid
+            end=i * SEGMENT_SPACING + 0.3 + SEGMENT_LENGTH,
+            en=f"Segment number {i} of the benchmark.",
+            zh=f"基准测试第 {i} 段。",
+            state=SegmentState.KEEP if i % 2 == 0 else SegmentState.DROP,
+        )
+        for i in range(count)
+    ]
+    return Timeline(
+        job_id="bench",
+        source_url="synthetic",
+        source_title="Essence benchmark",
+        source_duration=count * SEGMENT_SPACING,
+        segments=segments,
+        export_profile=ExportProfile.ESSENCE,
+        subtitle_style_mode=SubtitleStyleMode.NONE,
+    )
+
+
+def per_segment_essence(timeline: Timeline, source: Path, output: Path) -> None:
+    """The previous engine: stream-copy cut per segment, concat, encode."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        clips = []
+        for seg in timeline.segments:
+            if seg.state != SegmentState.KEEP:
+                continue
+            clip = tmp / f"segment_{seg.id:04d}.mp4"
+            subprocess.run(
+                [
+                    "ffmpeg", "-v", "error", "-ss", str(seg.start), "-i", str(source),
+                    "-t", str(seg.end - seg.start), "-c:v", "copy", "-c:a", "copy",
+                    "-avoid_negative_ts", "make_zero", "-y", str(clip),
+                ],
+                check=True,
+            )
+            clips.append(clip)
+        concat_list = tmp / "concat.txt"
+        concat_list.write_text("".join(f"file '{clip}'\n" for clip in clips))
+        concat = tmp / "concat.mp4"
+        subprocess.run(
+            ["ffmpeg", "-v", "error", "-f", "concat", "-safe", "0", "-i", str(concat_list),
+             "-c", "copy", "-y", str(concat)],
+            check=True,
+        )
+        subprocess.run(
+            ["ffmpeg", "-v", "error", "-i", str(concat), "-vf", "setsar=1",
+             "-c:v", "libx264", "-preset", "medium", "-crf", "23",
+             "-c:a", "aac", "-b:a", "192k", "-y", str(output)],
+            check=True,
+        )
+
+
+def duration_of(path: Path) -> float:
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", str(path)],
+        capture_output=True, text=True, check=True,
+    )
+    return float(result.stdout.strip())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--segments", type=int, default=300, help="Timeline segments (half are kept)")
+    parser.add_argument("--height", type=int, default=480, help="Source video height")
+    args = parser.parse_args()
+    logger.remove()
+
+    timeline = make_timeline(args.segments)
+    kept = sum(seg.effective_duration for seg in timeline.segments if seg.state == SegmentState.KEEP)
+    chunk_seconds = settings.export_chunk_seconds or 60.0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        source = tmp / "source.mp4"
+        make_source(source, args.segments * SEGMENT_SPACING, args.height)
+
+        def single_pass(output: Path) -> None:
+            settings.export_chunk_seconds = 0.0
+            asyncio.run(ExportWorker().export_essence(timeline, source, output))
+
+        def chunked(output: Path) -> None:
+            settings.export_chunk_seconds = chunk_seconds
+            asyncio.run(ExportWorker().export_essence(timeline, source, output))
+
+        engines = {
+            "per-segment": lambda output: per_segment_essence(timeline, source, output),
+            "single-pass": single_pass,
+            "chunked": chunked,
+        }
+        print(f"{args.segments} segments, {kept:.1f}s kept")
+        print(f"{'engine':>12} {'seconds':>8} {'duration':>9} {'drift':>7}")
+        for name, run in engines.items():
+            output = tmp / name / "essence.mp4"
+            output.parent.mkdir()
+            start = time.perf_counter()
+            run(output)
+            elapsed = time.perf_counter() - start
+            duration = duration_of(output)
+            print(f"{name:>12} {elapsed:>8.2f} {duration:>9.2f} {duration - kept:>+7.2f}")
+
+
+if __name__ == "__main__":
+    main()
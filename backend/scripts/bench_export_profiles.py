@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Benchmark: export time of the FULL, ESSENCE and BOTH export profiles.
+
+Generates a synthetic source video (ffmpeg testsrc2 with a sine tone) and
+a floating-subtitle timeline with a segment every 4 s, every other one
+kept, then times ExportWorker.export for each profile into a fresh output
+directory. BOTH cuts the essence from the full export's decode, so it
+should cost little more than FULL rather than FULL + ESSENCE.
+
+Requires ffmpeg with libx264 and libass.
+
+Usage:
+    cd backend && python scripts/bench_export_profiles.py [--minutes 2] [--height 720]
+"""
+
+import argparse
+import asyncio
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger  # noqa: E402
+
+from app.models.timeline import (  # noqa: E402
+    EditableSegment,
+    ExportProfile,
+    SegmentState,
+    SubtitleStyleMode,
+    Timeline,
+)
+from app.workers.export import ExportWorker  # noqa: E402
+
+SEGMENT_SPACING = 4.0
+
+
+def make_source(path: Path, minutes: float, height: int) -> None:
+    width = height * 16 // 9
+    subprocess.run(
+        [
+            "ffmpeg", "-v", "error",
+            "-f", "lavfi", "-i", f"testsrc2=size={width}x{height}:rate=30",
+            "-f", "lavfi", "-i", "sine=frequency=440:sample_rate=44100",
+            "-t", str(minutes * 60), "-c:v", "libx264", "-preset", "veryfast",
+            "-c:a", "aac", "-y", str(path),
+        ],
+        check=True,
+    )
+
+
+def make_timeline(minutes: float, profile: ExportProfile) -> Timeline:
+    segments = [
+        EditableSegment(
+            id=i,
+            start=i * SEGMENT_SPACING,
+            end=i * SEGMENT_SPACING + 3.5,
+            en=f"Segment number {i} of the benchmark.",
+            zh=f"基准测试第 {i} 段。",
+            state=SegmentState.KEEP if i % 2 == 0 else SegmentState.DROP,
+        )
+        for i in range(int(minutes * 60 / SEGMENT_SPACING))
+    ]
+    return Timeline(
+        job_id="bench",
+        source_url="synthetic",
+        source_title="Export benchmark",
+        source_duration=minutes * 60,
+        segments=segments,
+        export_profile=profile,
+        subtitle_style_mode=SubtitleStyleMode.FLOATING,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=float, default=2.0, help="Source video length")
+    parser.add_argument("--height", type=int, default=720, help="Source video height")
+    args = parser.parse_args()
+    logger.remove()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        source = tmp / "source.mp4"
+        make_source(source, args.minutes, args.height)
+
+        times = {}
+        print(f"{'profile':>8} {'seconds':>8}")
+        for profile in (ExportProfile.FULL, ExportProfile.ESSENCE, ExportProfile.BOTH):
+            output_dir = tmp / profile.value
+            start = time.perf_counter()
+            asyncio.run(ExportWorker().export(make_timeline(args.minutes, profile), source, output_dir))
+            times[profile] = time.perf_counter() - start
+            print(f"{profile.value:>8} {times[profile]:>8.2f}")
+
+        separate = times[ExportProfile.FULL] + times[ExportProfile.ESSENCE]
+        print(f"BOTH / (FULL + ESSENCE) = {times[ExportProfile.BOTH] / separate:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""Benchmark: batch throughput of the job queue with and without stage pools.
+
+Runs the real process_job pipeline (JobManager, TimelineManager, JobQueue)
+over a batch of URLs with simulated workers whose stages sleep for typical
+relative durations. The simulated GPU runs one kernel stream at a time, so
+two concurrent Whisper runs slow each other down as they do on one card.
+
+- baseline: JobQueue with N workers driving whole jobs (previous default)
+- pools:    jobs in flight advance stage by stage through network/GPU/LLM pools
+
+Usage:
+    cd backend && python scripts/bench_job_scheduler.py [--urls 20] [--scale 0.01]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger  # noqa: E402
+
+import app.workers.defluff as defluff_module  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.models.transcript import (  # noqa: E402
+    DiarizedSegment,
+    DiarizedTranscript,
+    Segment,
+    Transcript,
+    TranslatedSegment,
+    TranslatedTranscript,
+)
+from app.services.job_manager import JobManager  # noqa: E402
+from app.services.metadata_store import close_databases  # noqa: E402
+from app.services.queue import JobQueue  # noqa: E402
+from app.services.scheduler import Resource, ResourcePools  # noqa: E402
+from app.services.timeline_manager import TimelineManager  # noqa: E402
+from app.workers.processor import process_job  # noqa: E402
+
+# Relative stage durations (seconds of a ~10 minute video), scaled by --scale
+STAGE_SECONDS = {
+    "download": 30.0,
+    "transcribe": 60.0,
+    "diarize": 20.0,
+    "defluff": 15.0,
+    "translate": 45.0,
+}
+
+SCALE = 0.01
+_gpu_device: asyncio.Lock = None
+
+
+async def _work(stage: str) -> None:
+    await asyncio.sleep(STAGE_SECONDS[stage] * SCALE)
+
+
+async def _gpu_work(stage: str) -> None:
+    async with _gpu_device:
+        await _work(stage)
+
+
+def _write(path: Path, model) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(model.model_dump_json(), encoding="utf-8")
+
+
+class SimDownloadWorker:
+    async def download(self, url, output_dir, progress_callback=None, **kwargs):
+        await _work("download")
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return {
+            "video_path": str(output_dir / "source.mp4"),
+            "audio_path": str(output_dir / "audio.wav"),
+            "title": url,
+            "duration": 600.0,
+            "channel": "bench",
+        }
+
+
+class SimWhisperWorker:
+    async def transcribe(self, audio_path, language=None, model_name=None):
+        await _gpu_work("transcribe")
+        return Transcript(language="en", segments=[Segment(start=0, end=5, text="Hello there.")])
+
+    async def save_transcript(self, transcript, path):
+        _write(path, transcript)
+
+
+class SimDiarizationWorker:
+    async def diarize(self, audio_path):
+        await _gpu_work("diarize")
+        return []
+
+    async def merge_with_transcript(self, transcript, diarization_segments):
+        return DiarizedTranscript(
+            language=transcript.language,
+            num_speakers=1,
+            segments=[
+                DiarizedSegment(start=s.start, end=s.end, text=s.text, speaker="SPEAKER_0")
+                for s in transcript.segments
+            ],
+        )
+
+    async def save_diarized_transcript(self, transcript, path):
+        _write(path, transcript)
+
+
+class SimDefluffWorker:
+    async def clean_transcript(self, transcript):
+        await _work("defluff")
+        return transcript
+
+
+class SimTranslationWorker:
+    async def translate_transcript(self, transcript, target_language, job=None):
+        await _work("translate")
+        return TranslatedTranscript(
+            source_language=transcript.language,
+            target_language=target_language,
+            num_speakers=transcript.num_speakers,
+            segments=[
+                TranslatedSegment(**s.model_dump(), translation="你好") for s in transcript.segments
+            ],
+        )
+
+    async def save_translation(self, transcript, path):
+        _write(path, transcript)
+
+
+async def run_batch(num_urls: int, workers: int, resources) -> float:
+    """Process a batch of URLs; returns the wall time in seconds."""
+    global _gpu_device
+    _gpu_device = asyncio.Lock()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        settings.jobs_dir = Path(tmpdir) / "jobs"
+        settings.data_dir = Path(tmpdir) / "data"
+        settings.jobs_dir.mkdir()
+        job_manager = JobManager(max_retries=0)
+        timeline_manager = TimelineManager()
+        download_worker = SimDownloadWorker()
+        whisper_worker = SimWhisperWorker()
+        diarization_worker = SimDiarizationWorker()
+        translation_worker = SimTranslationWorker()
+
+        async def process(job_id: str) -> None:
+            await process_job(
+                job_id=job_id,
+                job_manager=job_manager,
+                job_queue=queue,
+                timeline_manager=timeline_manager,
+                download_worker=download_worker,
+                whisper_worker=whisper_worker,
+                diarization_worker=diarization_worker,
+                translation_worker=translation_worker,
+                resources=resources,
+            )
+
+        queue = JobQueue(max_concurrent=workers, process_func=process, resources=resources)
+        job_ids = [
+            job_manager.create_job(url=f"https://www.youtube.com/watch?v=bench{i:04d}").id
+            for i in range(num_urls)
+        ]
+
+        start = time.perf_counter()
+        await queue.start()
+        await queue.add_batch(job_ids)
+        await queue._queue.join()
+        elapsed = time.perf_counter() - start
+        await queue.stop()
+
+        statuses = {job_manager.get_job(job_id).status.value for job_id in job_ids}
+        assert statuses == {"awaiting_review"}, statuses
+        timeline_manager.flush_index()
+        close_databases()
+    return elapsed
+
+
+async def run(args) -> None:
+    baseline = await run_batch(args.urls, args.baseline_workers, None)
+    pools = ResourcePools({
+        Resource.NETWORK: args.network,
+        Resource.GPU: args.gpu,
+        Resource.LLM: args.llm,
+        Resource.CPU: 0,
+    })
+    pooled = await run_batch(args.urls, args.in_flight, pools)
+
+    per_job = sum(STAGE_SECONDS.values()) * SCALE
+    gpu_bound = (STAGE_SECONDS["transcribe"] + STAGE_SECONDS["diarize"]) * SCALE * args.urls
+    print(json.dumps(STAGE_SECONDS), f"x {SCALE} per job ({per_job:.2f}s serial)")
+    print(f"GPU lower bound for {args.urls} jobs: {gpu_bound:.2f}s")
+    print(f"{'mode':<44} {'wall s':>8} {'jobs/min':>9}")
+    for label, elapsed in [
+        (f"baseline ({args.baseline_workers} whole-job workers)", baseline),
+        (f"pools ({args.in_flight} in flight, gpu={args.gpu}, "
+         f"net={args.network}, llm={args.llm})", pooled),
+    ]:
+        print(f"{label:<44} {elapsed:>8.2f} {args.urls / elapsed * 60:>9.1f}")
+    print(f"speedup: {baseline / pooled:.2f}x")
+
+
+def main() -> None:
+    global SCALE
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--urls", type=int, default=20, help="Batch size")
+    parser.add_argument("--scale", type=float, default=0.01, help="Stage duration multiplier")
+    parser.add_argument("--baseline-workers", type=int, default=2)
+    parser.add_argument("--in-flight", type=int, default=settings.max_concurrent_jobs)
+    parser.add_argument("--network", type=int, default=settings.network_pool_size)
+    parser.add_argument("--gpu", type=int, default=settings.gpu_pool_size)
+    parser.add_argument("--llm", type=int, default=settings.llm_pool_size)
+    args = parser.parse_args()
+    SCALE = args.scale
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    defluff_module.DefluffWorker = SimDefluffWorker
+    settings.whisper_streaming = False  # Simulated Whisper transcribes in one call
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Benchmark: filtered list pages on the JSON vs SQLite metadata backends.
+
+Writes N synthetic job summaries into both stores and times the queries
+behind the list/filter endpoints:
+
+- page:   newest 100 jobs
+- filter: newest 100 jobs of one source (1% of the corpus)
+- lookup: job by URL (duplicate detection)
+- stats:  counts by status
+
+Usage:
+    cd backend && python scripts/bench_metadata_store.py [--jobs N ...]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger  # noqa: E402
+
+from app.services.metadata_store import (  # noqa: E402
+    JsonFileStore,
+    SqliteMetadataStore,
+    close_databases,
+)
+
+COLUMNS = ("url", "status", "created_at", "source_type", "source_id", "item_id", "pipeline_id")
+STATUSES = ["completed", "awaiting_review", "failed", "pending"]
+
+
+def fill(store, num_jobs: int) -> None:
+    base = datetime(2025, 1, 1)
+    for i in range(num_jobs):
+        summary = {
+            "id": f"job{i:07d}",
+            "url": f"https://www.youtube.com/watch?v=bench{i:07d}",
+            "status": STATUSES[i % len(STATUSES)],
+            "created_at": (base + timedelta(minutes=i)).isoformat(),
+            "updated_at": (base + timedelta(minutes=i + 30)).isoformat(),
+            "source_type": "youtube",
+            "source_id": f"src{i % 100:03d}",
+            "item_id": f"item_{i:07d}",
+            "pipeline_id": "zh_main",
+        }
+        store.write(summary["id"], json.dumps(summary), summary)
+
+
+def timed(func, repeat: int = 20) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def run(num_jobs: int) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        json_store = JsonFileStore(
+            "jobs", root, lambda job_id, summary: root / job_id / "meta.json", COLUMNS,
+            order_column="created_at",
+        )
+        sqlite_store = SqliteMetadataStore(root / "metadata.db", "jobs", COLUMNS, "created_at")
+        fill(json_store, num_jobs)
+        fill(sqlite_store, num_jobs)
+
+        url = f"https://www.youtube.com/watch?v=bench{num_jobs // 2:07d}"
+        queries = {
+            "page": lambda s: s.query(order_by="created_at", descending=True, limit=100),
+            "filter": lambda s: s.query(
+                {"source_id": "src042"}, order_by="created_at", descending=True, limit=100
+            ),
+            "lookup": lambda s: s.query({"url": url}, limit=1),
+            "stats": lambda s: s.count_by("status"),
+        }
+        print(f"{num_jobs} jobs")
+        for name, query in queries.items():
+            json_ms = timed(lambda: query(json_store))
+            sqlite_ms = timed(lambda: query(sqlite_store))
+            print(f"  {name:<7} json {json_ms:8.2f} ms   sqlite {sqlite_ms:8.2f} ms")
+        close_databases()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, nargs="+", default=[10000, 50000])
+    args = parser.parse_args()
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    for num_jobs in args.jobs:
+        run(num_jobs)
+
+
+if __name__ == "__main__":
+    main()
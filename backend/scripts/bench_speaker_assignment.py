@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark: speaker assignment with a linear scan vs SpeakerIndex.
+
+Builds a synthetic multi-speaker panel (sentence segments with word
+timings, diarization turns of 1-15 s) and times:
+
+- linear:   every turn scanned for every segment (previous _find_speaker)
+- index:    SpeakerIndex lookups per segment
+- words:    merge_with_transcript with word-level attribution and splitting
+
+Usage:
+    cd backend && python scripts/bench_speaker_assignment.py [--hours 3] [--speakers 5]
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.models.transcript import Segment, Transcript, Word  # noqa: E402
+from app.workers.diarization import DiarizationWorker, SpeakerIndex  # noqa: E402
+
+
+def build_panel(hours: float, speakers: int, seed: int = 0):
+    """Synthetic transcript segments and diarization turns."""
+    rng = random.Random(seed)
+    duration = hours * 3600
+    turns = []
+    t = 0.0
+    while t < duration:
+        end = t + rng.uniform(1.0, 15.0)
+        turns.append({"start": t, "end": end, "speaker": f"SPEAKER_{rng.randrange(speakers)}"})
+        t = end + rng.uniform(-0.3, 0.5)  # small overlaps and gaps
+
+    segments = []
+    t = 0.0
+    while t < duration:
+        words = []
+        for i in range(rng.randint(4, 20)):
+            words.append(Word(start=t, end=t + 0.3, word=f"w{i}"))
+            t += 0.35
+        segments.append(Segment(
+            start=words[0].start, end=words[-1].end,
+            text=" ".join(w.word for w in words), words=words,
+        ))
+        t += rng.uniform(0.1, 1.0)
+    return segments, turns
+
+
+def linear_speaker(start: float, end: float, turns) -> str:
+    best_speaker, best_overlap = "SPEAKER_0", 0.0
+    for turn in turns:
+        overlap = max(0, min(end, turn["end"]) - max(start, turn["start"]))
+        if overlap > best_overlap:
+            best_overlap, best_speaker = overlap, turn["speaker"]
+    return best_speaker
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=3.0, help="Panel length")
+    parser.add_argument("--speakers", type=int, default=5)
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    segments, turns = build_panel(args.hours, args.speakers)
+    print(f"{len(segments)} segments, {len(turns)} turns ({args.hours:g} h)")
+
+    linear, linear_s = timed(
+        lambda: [linear_speaker(s.start, s.end, turns) for s in segments]
+    )
+
+    def indexed_lookup():
+        index = SpeakerIndex(turns)
+        return [index.speaker_for(s.start, s.end) for s in segments]
+
+    indexed, index_s = timed(indexed_lookup)
+    assert indexed == linear, "SpeakerIndex disagrees with the linear scan"
+
+    worker = DiarizationWorker()
+    transcript = Transcript(language="en", segments=segments)
+    settings.diarization_split_segments = True
+    merged, words_s = timed(
+        lambda: asyncio.run(worker.merge_with_transcript(transcript, turns))
+    )
+
+    print(f"{'mode':<10} {'ms':>10} {'speedup':>8}")
+    print(f"{'linear':<10} {linear_s * 1000:>10.1f} {1:>7.2f}x")
+    print(f"{'index':<10} {index_s * 1000:>10.1f} {linear_s / index_s:>7.2f}x")
+    print(f"{'words':<10} {words_s * 1000:>10.1f} {linear_s / words_s:>7.2f}x "
+          f"({len(merged.segments) - len(segments)} segments split)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Benchmark: manager startup over a large data directory.
+
+Generates a synthetic data dir (default 10k jobs plus 200 timelines of
+500 segments) and times:
+
+- eager: the legacy startup, reading and validating every document
+- cold:  first start with the summary index (builds the index)
+- warm:  later starts, served from the index (stat per file only)
+
+and the cost of a first list_jobs(limit=100) page after a warm start.
+
+Usage:
+    cd backend && python scripts/bench_startup.py [--jobs N] [--timelines N] [--segments N]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.models.job import Job, JobStatus  # noqa: E402
+from app.models.timeline import EditableSegment, Timeline  # noqa: E402
+from app.services.job_manager import JobManager  # noqa: E402
+from app.services.summary_index import INDEX_FILENAME  # noqa: E402
+from app.services.timeline_manager import TimelineManager  # noqa: E402
+
+
+def generate(data_dir: Path, num_jobs: int, num_timelines: int, num_segments: int) -> None:
+    jobs_dir = data_dir / "jobs"
+    jobs_dir.mkdir(parents=True)
+    statuses = [JobStatus.COMPLETED, JobStatus.AWAITING_REVIEW, JobStatus.FAILED]
+    base = datetime(2025, 1, 1)
+    for i in range(num_jobs):
+        job = Job(
+            id=f"job{i:05d}",
+            url=f"https://www.youtube.com/watch?v=bench{i:05d}",
+            status=statuses[i % len(statuses)],
+            progress=1.0,
+            title=f"Synthetic video {i}",
+            duration=600.0 + i,
+            created_at=base + timedelta(minutes=i),
+            updated_at=base + timedelta(minutes=i + 30),
+            source_id="yt_bench",
+            item_id=f"item_{i:05d}",
+            pipeline_id="zh_main",
+        )
+        job_dir = jobs_dir / job.id
+        job_dir.mkdir()
+        with open(job_dir / "meta.json", "w") as f:
+            json.dump(job.model_dump(mode="json"), f, indent=2, default=str)
+
+    timelines_dir = data_dir / "timelines"
+    timelines_dir.mkdir()
+    for i in range(num_timelines):
+        timeline = Timeline(
+            job_id=f"job{i:05d}",
+            source_url=f"https://www.youtube.com/watch?v=bench{i:05d}",
+            source_title=f"Synthetic video {i}",
+            source_duration=num_segments * 3.5,
+            segments=[
+                EditableSegment(
+                    id=s,
+                    start=s * 3.5,
+                    end=s * 3.5 + 3.0,
+                    en=f"This is sentence number {s} of a long synthetic transcript.",
+                    zh=f"这是一段很长的合成字幕中的第 {s} 句话。",
+                    speaker="SPEAKER_00",
+                )
+                for s in range(num_segments)
+            ],
+        )
+        with open(timelines_dir / f"{timeline.timeline_id}.json", "w", encoding="utf-8") as f:
+            json.dump(timeline.model_dump(mode="json"), f, ensure_ascii=False, indent=2)
+
+
+def eager_load(data_dir: Path) -> int:
+    """The legacy startup path: validate every document."""
+    loaded = 0
+    for meta_path in (data_dir / "jobs").glob("*/meta.json"):
+        with open(meta_path) as f:
+            Job(**json.load(f))
+        loaded += 1
+    for path in (data_dir / "timelines").glob("*.json"):
+        with open(path, encoding="utf-8") as f:
+            Timeline.model_validate(json.load(f))
+        loaded += 1
+    return loaded
+
+
+def start_managers(data_dir: Path) -> JobManager:
+    job_manager = JobManager()
+    TimelineManager(timelines_dir=data_dir / "timelines")
+    return job_manager
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def run(num_jobs: int, num_timelines: int, num_segments: int) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_dir = Path(tmpdir)
+        _, gen_elapsed = timed(generate, data_dir, num_jobs, num_timelines, num_segments)
+        settings.jobs_dir = data_dir / "jobs"
+
+        _, eager_elapsed = timed(eager_load, data_dir)
+        _, cold_elapsed = timed(start_managers, data_dir)
+        job_manager, warm_elapsed = timed(start_managers, data_dir)
+        page, list_elapsed = timed(job_manager.list_jobs, None, None, None, None, None, 100)
+        _, list_cached_elapsed = timed(job_manager.list_jobs, None, None, None, None, None, 100)
+        index_bytes = (data_dir / "jobs" / INDEX_FILENAME).stat().st_size
+
+    print(f"Data dir: {num_jobs} jobs, {num_timelines} timelines x {num_segments} segments "
+          f"(generated in {gen_elapsed:.1f} s)")
+    print(f"eager:    {eager_elapsed * 1000:10.1f} ms (validate every document)")
+    print(f"cold:     {cold_elapsed * 1000:10.1f} ms (first start, builds index)")
+    print(f"warm:     {warm_elapsed * 1000:10.1f} ms ({eager_elapsed / warm_elapsed:.1f}x vs eager, "
+          f"job index {index_bytes / 1024:.0f} KiB)")
+    print(f"list:     {list_elapsed * 1000:10.1f} ms first page of {len(page)} jobs, "
+          f"{list_cached_elapsed * 1000:.1f} ms cached")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=10000)
+    parser.add_argument("--timelines", type=int, default=200)
+    parser.add_argument("--segments", type=int, default=500)
+    args = parser.parse_args()
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    run(args.jobs, args.timelines, args.segments)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark: timeline edits/second, full-snapshot rewrite vs. operation log.
+
+Builds a synthetic timeline (default 3000 segments, roughly a 3-hour
+interview) and times single-segment keep/drop edits through:
+
+- snapshot: the legacy path, rewriting the whole timeline JSON per edit
+- oplog:    TimelineManager.update_segment, appending one line per edit
+
+Usage:
+    cd backend && python scripts/bench_timeline_persistence.py [--segments N] [--edits N]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger  # noqa: E402
+
+from app.models.timeline import SegmentState, SegmentUpdate  # noqa: E402
+from app.models.transcript import TranslatedSegment, TranslatedTranscript  # noqa: E402
+from app.services.timeline_manager import TimelineManager  # noqa: E402
+
+
+def build_transcript(num_segments: int) -> TranslatedTranscript:
+    segments = [
+        TranslatedSegment(
+            start=i * 3.5,
+            end=i * 3.5 + 3.0,
+            text=f"This is sentence number {i} of a very long interview transcript.",
+            speaker=f"SPEAKER_0{i % 3}",
+            translation=f"这是一段很长的访谈记录中的第 {i} 句话。",
+        )
+        for i in range(num_segments)
+    ]
+    return TranslatedTranscript(
+        source_language="en",
+        target_language="zh",
+        num_speakers=3,
+        segments=segments,
+    )
+
+
+def run(num_segments: int, num_edits: int) -> None:
+    transcript = build_transcript(num_segments)
+    states = [SegmentState.KEEP, SegmentState.DROP]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Huge threshold so compaction never runs inside the timed loop
+        manager = TimelineManager(timelines_dir=Path(tmpdir), compact_after=10**9)
+        timeline = manager.create_from_transcript(
+            job_id="bench",
+            source_url="bench",
+            source_title="Benchmark",
+            source_duration=num_segments * 3.5,
+            translated_transcript=transcript,
+        )
+        tid = timeline.timeline_id
+        snapshot_bytes = (Path(tmpdir) / f"{tid}.json").stat().st_size
+
+        start = time.perf_counter()
+        for i in range(num_edits):
+            timeline.update_segment(i % num_segments, SegmentUpdate(state=states[i % 2]))
+            manager._save_timeline(timeline)
+        snapshot_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(num_edits):
+            manager.update_segment(tid, i % num_segments, SegmentUpdate(state=states[i % 2]))
+        oplog_elapsed = time.perf_counter() - start
+        log_bytes = (Path(tmpdir) / f"{tid}.log").stat().st_size
+
+        start = time.perf_counter()
+        TimelineManager(timelines_dir=Path(tmpdir))
+        replay_elapsed = time.perf_counter() - start
+
+    print(f"Timeline: {num_segments} segments, snapshot {snapshot_bytes / 1024:.0f} KiB")
+    print(f"Edits:    {num_edits}")
+    print(f"snapshot: {num_edits / snapshot_elapsed:10.1f} edits/s")
+    print(f"oplog:    {num_edits / oplog_elapsed:10.1f} edits/s "
+          f"({snapshot_elapsed / oplog_elapsed:.1f}x, {log_bytes / num_edits:.0f} B/edit)")
+    print(f"reload:   {replay_elapsed * 1000:10.1f} ms (snapshot + {num_edits} ops replayed)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--segments", type=int, default=3000)
+    parser.add_argument("--edits", type=int, default=200)
+    args = parser.parse_args()
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    run(args.segments, args.edits)
+
+
+if __name__ == "__main__":
+    main()
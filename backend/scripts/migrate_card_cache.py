@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""One-shot import of the JSON card cache into SQLite.
+
+Copies every word, entity and idiom card and every negative-cache marker
+from data/cards/{words,entities,idioms}/ into data/cards/cards.db. The
+JSON files are left in place, so switching back is just a matter of
+resetting CARD_CACHE_BACKEND.
+
+Usage:
+    cd backend && python scripts/migrate_card_cache.py [--db PATH] [--force]
+    # then start the server with CARD_CACHE_BACKEND=sqlite
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.services.card_cache import (  # noqa: E402
+    CARD_DB_FILENAME,
+    CARD_KINDS,
+    JsonCardStore,
+    SqliteCardStore,
+    migrate_cards,
+)
+from app.services.metadata_store import close_databases  # noqa: E402
+
+
+def migrate(cards_dir: Path, db_path: Path, force: bool) -> int:
+    """Copy all cards into the database; returns a process exit code."""
+    source = JsonCardStore(cards_dir)
+    target = SqliteCardStore(db_path)
+    if any(target.count(kind) for kind in CARD_KINDS) and not force:
+        print(f"{db_path} already has cards; use --force to overwrite")
+        return 1
+
+    for kind, copied in migrate_cards(source, target).items():
+        print(f"{kind:<9} {copied:>7} migrated")
+    close_databases()
+    print(f"Done. Start the server with CARD_CACHE_BACKEND=sqlite to use {db_path}")
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=settings.data_dir / "cards" / CARD_DB_FILENAME,
+        help="SQLite database to create (default: data_dir/cards/cards.db)",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Overwrite cards already in the database"
+    )
+    args = parser.parse_args()
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    sys.exit(migrate(settings.data_dir / "cards", args.db, args.force))
+
+
+if __name__ == "__main__":
+    main()
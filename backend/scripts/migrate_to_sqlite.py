@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""One-shot migration of jobs, items, timelines and publications to SQLite.
+
+Loads every collection from the JSON file layout (as the server does with
+METADATA_BACKEND=json) and copies documents and summaries into the SQLite
+metadata database. The JSON files are left in place, so switching back is
+just a matter of resetting METADATA_BACKEND.
+
+Timelines keep their snapshot and operation log files; only their
+summaries move into the database.
+
+Usage:
+    cd backend && python scripts/migrate_to_sqlite.py [--db PATH] [--force]
+    # then start the server with METADATA_BACKEND=sqlite
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.services.channel_manager import ChannelManager  # noqa: E402
+from app.services.item_manager import ItemManager  # noqa: E402
+from app.services.job_manager import JobManager  # noqa: E402
+from app.services.metadata_store import (  # noqa: E402
+    METADATA_DB_FILENAME,
+    SqliteMetadataStore,
+    close_databases,
+    migrate_store,
+)
+from app.services.timeline_manager import TimelineManager  # noqa: E402
+
+
+def migrate(db_path: Path, force: bool) -> int:
+    """Copy all collections into the database; returns a process exit code."""
+    settings.metadata_backend = "json"
+    timeline_manager = TimelineManager()
+    timeline_manager.flush_index()  # bring log-edited summaries up to date
+    sources = [
+        JobManager()._store,
+        ItemManager()._store,
+        timeline_manager._store,
+        ChannelManager(settings.data_dir)._publication_store,
+    ]
+
+    targets = [
+        SqliteMetadataStore(
+            db_path,
+            source.collection,
+            source.columns,
+            source.order_column,
+            source.stores_documents,
+        )
+        for source in sources
+    ]
+    populated = [target.collection for target in targets if len(target)]
+    if populated and not force:
+        print(f"{db_path} already has {', '.join(populated)}; use --force to overwrite")
+        return 1
+
+    for source, target in zip(sources, targets):
+        copied = migrate_store(source, target)
+        print(f"{source.collection:<13} {copied:>7} of {len(source)} migrated")
+    close_databases()
+    print(f"Done. Start the server with METADATA_BACKEND=sqlite to use {db_path}")
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=settings.data_dir / METADATA_DB_FILENAME,
+        help="SQLite database to create (default: data_dir/metadata.db)",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Overwrite documents already in the database"
+    )
+    args = parser.parse_args()
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    sys.exit(migrate(args.db, args.force))
+
+
+if __name__ == "__main__":
+    main()
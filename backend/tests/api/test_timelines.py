@@ -16,11 +16,13 @@ from app.models.timeline import (
 from app.models.transcript import TranslatedSegment, TranslatedTranscript
 from app.services.timeline_manager import TimelineManager
 from app.workers.export import ExportWorker
+from app.workers.waveform import WaveformWorker
 from app.api.timelines import (
     router,
     set_timeline_manager,
     set_export_worker,
     set_jobs_dir,
+    set_waveform_worker,
 )
 from app.api.segments import router as segments_router
 from app.api.export import router as export_router
@@ -525,3 +527,54 @@ class TestShowCardPanel:
         assert response.status_code == 200
         data = response.json()
         assert data["show_card_panel"] is True
+
+
+class TestWaveform:
+    """Tests for waveform endpoints."""
+
+    @pytest.fixture
+    def audio(self, temp_dirs):
+        import wave
+
+        _, jobs_dir = temp_dirs
+        set_waveform_worker(WaveformWorker())
+        source_dir = jobs_dir / "test_job" / "source"
+        source_dir.mkdir(parents=True)
+        with wave.open(str(source_dir / "audio.wav"), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(8000)
+            wav.writeframes(b"\x00\x10" * 8000 * 10)
+
+    def test_generate_then_fetch_range(self, client, sample_timeline, audio):
+        """Test generating peaks and fetching a zoomed window."""
+        timeline_id = sample_timeline.timeline_id
+        response = client.post(f"/timelines/{timeline_id}/waveform/generate")
+        assert response.json()["status"] == "completed"
+
+        response = client.get(
+            f"/timelines/{timeline_id}/waveform/original/range?start=2&end=4&width=100"
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["rate"] == 100
+        assert len(data["max"]) == 200
+        assert data["max"][0] == data["scale"]
+
+        response = client.get(f"/timelines/{timeline_id}/waveform/original?rate=10")
+        assert response.status_code == 200
+        assert len(response.json()["peaks"]) == 100
+
+    def test_range_not_generated(self, client, sample_timeline, audio):
+        """Test range request before generation."""
+        response = client.get(
+            f"/timelines/{sample_timeline.timeline_id}/waveform/original/range?end=4"
+        )
+        assert response.status_code == 404
+
+    def test_range_invalid(self, client, sample_timeline):
+        """Test rejecting an empty range."""
+        response = client.get(
+            f"/timelines/{sample_timeline.timeline_id}/waveform/original/range?start=4&end=2"
+        )
+        assert response.status_code == 400
@@ -308,3 +308,47 @@ class TestWebSocketCleanup:
         assert good_ws in manager.active_connections
         # Bad one should be removed
         assert bad_ws not in manager.active_connections
+
+
+class TestExportUpdates:
+    """Tests for export progress pushes."""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_export_update(self):
+        """Export updates reach timeline, exports-topic and all subscribers."""
+        manager = ConnectionManager()
+
+        timeline_subscriber = AsyncMock()
+        other_timeline = AsyncMock()
+        topic_subscriber = AsyncMock()
+        all_subscriber = AsyncMock()
+
+        manager.subscribe_timeline(timeline_subscriber, "tl123")
+        manager.subscribe_timeline(other_timeline, "tl999")
+        manager.subscribe_topic(topic_subscriber, "exports")
+        manager.subscribe_topic(all_subscriber, "all")
+
+        await manager.broadcast_export_update("tl123", {
+            "status": "exporting",
+            "progress": 42.0,
+        })
+
+        assert timeline_subscriber.send_json.called
+        assert topic_subscriber.send_json.called
+        assert all_subscriber.send_json.called
+        assert not other_timeline.send_json.called
+
+        call_args = timeline_subscriber.send_json.call_args[0][0]
+        assert call_args["type"] == "export_update"
+        assert call_args["timeline_id"] == "tl123"
+        assert call_args["data"]["progress"] == 42.0
+
+    def test_disconnect_removes_timeline_subscription(self):
+        """Disconnect should drop empty timeline subscriptions."""
+        manager = ConnectionManager()
+        ws = MagicMock()
+        manager.subscribe_timeline(ws, "tl123")
+
+        manager.disconnect(ws)
+
+        assert "tl123" not in manager.timeline_subscriptions
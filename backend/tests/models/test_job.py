@@ -70,6 +70,31 @@ class TestJobStepTiming:
         assert job.total_processing_seconds is not None
         assert job.total_processing_seconds >= 0.1
 
+    def test_total_processing_seconds_counts_overlap_once(self):
+        """Concurrent steps count their shared wall time once."""
+        job = Job(url="https://example.com/video")
+        job.step_timings = {
+            "transcribe": {
+                "started_at": "2025-01-01T00:00:00",
+                "ended_at": "2025-01-01T00:01:00",
+                "duration_seconds": 60.0,
+            },
+            "diarize": {
+                "started_at": "2025-01-01T00:00:00",
+                "ended_at": "2025-01-01T00:00:40",
+                "duration_seconds": 40.0,
+            },
+            "translate": {
+                "started_at": "2025-01-01T00:02:00",
+                "ended_at": "2025-01-01T00:02:30",
+                "duration_seconds": 30.0,
+            },
+        }
+
+        job._recalculate_totals()
+
+        assert job.total_processing_seconds == 90.0
+
 
 class TestJobApiCostTracking:
     """Tests for job API cost tracking."""
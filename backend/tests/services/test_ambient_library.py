@@ -46,16 +46,16 @@ class TestAmbientSoundsRegistry:
 class TestAmbientLibraryListSounds:
     """Tests for list_sounds()."""
 
-    def test_empty_directory(self, library):
-        sounds = library.list_sounds()
+    async def test_empty_directory(self, library):
+        sounds = await library.list_sounds()
         assert len(sounds) == 15
         assert all(s["available"] is False for s in sounds)
 
-    def test_some_files_present(self, library, tmp_ambient_dir):
+    async def test_some_files_present(self, library, tmp_ambient_dir):
         _create_fake_wav(tmp_ambient_dir / "rain.wav")
         _create_fake_wav(tmp_ambient_dir / "ocean.wav")
 
-        sounds = library.list_sounds()
+        sounds = await library.list_sounds()
         rain = next(s for s in sounds if s["name"] == "rain")
         ocean = next(s for s in sounds if s["name"] == "ocean")
         thunder = next(s for s in sounds if s["name"] == "thunder")
@@ -64,9 +64,9 @@ class TestAmbientLibraryListSounds:
         assert ocean["available"] is True
         assert thunder["available"] is False
 
-    def test_sound_metadata_fields(self, library, tmp_ambient_dir):
+    async def test_sound_metadata_fields(self, library, tmp_ambient_dir):
         _create_fake_wav(tmp_ambient_dir / "rain.wav")
-        sounds = library.list_sounds()
+        sounds = await library.list_sounds()
         rain = next(s for s in sounds if s["name"] == "rain")
 
         assert rain["name"] == "rain"
@@ -75,15 +75,15 @@ class TestAmbientLibraryListSounds:
         assert "available" in rain
         assert "duration_seconds" in rain
 
-    def test_supports_mp3(self, library, tmp_ambient_dir):
+    async def test_supports_mp3(self, library, tmp_ambient_dir):
         (tmp_ambient_dir / "wind.mp3").write_bytes(b"\x00" * 10)
-        sounds = library.list_sounds()
+        sounds = await library.list_sounds()
         wind = next(s for s in sounds if s["name"] == "wind")
         assert wind["available"] is True
 
-    def test_supports_flac(self, library, tmp_ambient_dir):
+    async def test_supports_flac(self, library, tmp_ambient_dir):
         (tmp_ambient_dir / "forest.flac").write_bytes(b"\x00" * 10)
-        sounds = library.list_sounds()
+        sounds = await library.list_sounds()
         forest = next(s for s in sounds if s["name"] == "forest")
         assert forest["available"] is True
 
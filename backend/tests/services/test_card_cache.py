@@ -0,0 +1,135 @@
+"""Tests for the card cache and its storage backends."""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.card import EntityCard, EntityType, IdiomCard, WordCard
+from app.services.card_cache import (
+    BloomFilter,
+    CardCache,
+    JsonCardStore,
+    SqliteCardStore,
+    get_card_cache,
+    migrate_cards,
+)
+from app.services.metadata_store import close_databases
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def cache(request, tmp_path):
+    """Create an empty card cache for each backend."""
+    yield CardCache(tmp_path / "cards", backend=request.param)
+    close_databases()
+
+
+def _age(cache, kind, key, days):
+    """Rewrite a stored record as fetched ``days`` ago."""
+    fetched_at = datetime.now() - timedelta(days=days)
+    data = json.loads(cache.store.get(kind, key))
+    data["fetched_at"] = fetched_at.isoformat()
+    cache.store.put(kind, key, json.dumps(data), fetched_at.timestamp())
+    cache._memory.clear()
+
+
+class TestCardCache:
+    """Behaviour shared by both backends."""
+
+    def test_roundtrip_and_delete(self, cache):
+        cache.set_word_card(WordCard(word="Run", lemma="run"), cache_key="run:zh-TW")
+        cache.set_entity_card(
+            EntityCard(entity_id="Q84", entity_type=EntityType.PLACE, name="London", description="city")
+        )
+        cache.set_idiom_card(IdiomCard(text="break the ice"))
+
+        assert cache.get_word_card("run", cache_key="run:zh-TW").lemma == "run"
+        assert cache.get_entity_card("Q84").name == "London"
+        assert cache.get_idiom_card("break the ice").text == "break the ice"
+        cache._memory.clear()
+        assert cache.get_entity_card("Q84").name == "London"  # From storage
+        assert cache.get_stats()["total_cached"] == 3
+
+        assert cache.delete_idiom_card("break the ice")
+        assert not cache.delete_idiom_card("break the ice")
+        assert cache.get_idiom_card("break the ice") is None
+
+    def test_returned_cards_are_copies(self, cache):
+        cache.set_word_card(WordCard(word="run", lemma="run"))
+
+        cache.get_word_card("run").lemma = "changed"
+
+        assert cache.get_word_card("run").lemma == "run"
+
+    def test_clear_expired(self, cache):
+        cache.set_word_card(WordCard(word="old", lemma="old"))
+        cache.set_word_card(WordCard(word="new", lemma="new"))
+        _age(cache, "word", "old", days=31)
+
+        assert cache.get_word_card("old") is None
+        assert cache.clear_expired()["words_cleared"] == 1
+        assert cache.get_stats()["words_cached"] == 1
+        assert cache.get_word_card("new") is not None
+
+    def test_negative_cache(self, cache):
+        assert not cache.is_negative_cached("qwxz")
+
+        cache.set_negative_cache("qwxz")
+
+        assert cache.is_negative_cached("qwxz")
+        assert CardCache(cache.cards_dir, backend=cache.store.name).is_negative_cached("qwxz")
+        _age(cache, "notfound", "qwxz", days=8)
+        assert not cache.is_negative_cached("qwxz")
+
+    def test_negative_filter_is_read_from_storage_once(self, cache):
+        cache.set_negative_cache("qwxz")
+        other = CardCache(cache.cards_dir, backend=cache.store.name)
+        assert other._negatives is None  # Not scanned at construction
+
+        assert other.is_negative_cached("qwxz")
+        negatives = other._negatives
+        assert not other.is_negative_cached("zzzz")
+        assert other._negatives is negatives
+
+    def test_memory_is_bounded(self, cache):
+        cache._memory_limit = 2
+        for word in ("a", "b", "c"):
+            cache.set_word_card(WordCard(word=word, lemma=word))
+
+        assert [key for _, key in cache._memory] == ["b", "c"]
+        assert cache.get_word_card("a").word == "a"
+
+
+def test_bloom_filter_has_no_false_negatives():
+    negatives = BloomFilter(1000)
+    words = [f"word{i}" for i in range(1000)]
+    for word in words:
+        negatives.add(word)
+
+    assert all(word in negatives for word in words)
+    assert sum(f"other{i}" in negatives for i in range(1000)) < 50
+
+
+def test_migrate_cards(tmp_path):
+    cards_dir = tmp_path / "cards"
+    json_cache = CardCache(cards_dir, backend="json")
+    json_cache.set_word_card(WordCard(word="run", lemma="run"))
+    json_cache.set_idiom_card(IdiomCard(text="break the ice"))
+    json_cache.set_negative_cache("qwxz")
+
+    copied = migrate_cards(JsonCardStore(cards_dir), SqliteCardStore(cards_dir / "cards.db"))
+
+    assert copied == {"word": 1, "entity": 0, "idiom": 1, "notfound": 1}
+    sqlite_cache = CardCache(cards_dir, backend="sqlite")
+    assert sqlite_cache.get_word_card("run").lemma == "run"
+    assert sqlite_cache.is_negative_cached("qwxz")
+    assert sqlite_cache.get_stats()["backend"] == "sqlite"
+    close_databases()
+
+
+def test_process_shares_one_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr("app.config.settings.data_dir", tmp_path)
+    monkeypatch.setattr("app.services.card_cache._cache", None)
+
+    assert get_card_cache() is get_card_cache()
+    assert get_card_cache().cards_dir == tmp_path / "cards"
@@ -0,0 +1,130 @@
+"""Tests for ExportProgressRegistry service."""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.models.timeline import ExportStatus
+from app.models.transcript import TranslatedSegment, TranslatedTranscript
+from app.services.export_progress import ExportProgressRegistry
+from app.services.timeline_manager import TimelineManager
+
+
+@pytest.fixture
+def temp_timelines_dir():
+    """Create a temporary directory for timeline storage."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def timeline_manager(temp_timelines_dir):
+    """Create a timeline manager with temporary storage."""
+    return TimelineManager(timelines_dir=temp_timelines_dir)
+
+
+@pytest.fixture
+def timeline(timeline_manager):
+    """Create a timeline to export."""
+    return timeline_manager.create_from_transcript(
+        job_id="export_job",
+        source_url="test",
+        source_title="Export",
+        source_duration=5.0,
+        translated_transcript=TranslatedTranscript(
+            source_language="en",
+            target_language="zh",
+            num_speakers=1,
+            segments=[
+                TranslatedSegment(
+                    start=0.0, end=5.0, text="Hi.", speaker="SPEAKER_00", translation="嗨。",
+                ),
+            ],
+        ),
+    )
+
+
+def _logged_ops(timelines_dir: Path, timeline_id: str) -> int:
+    log_path = timelines_dir / f"{timeline_id}.log"
+    if not log_path.exists():
+        return 0
+    return len(log_path.read_text(encoding="utf-8").splitlines())
+
+
+class TestExportProgressRegistry:
+    """Tests for in-memory export progress."""
+
+    def test_ticks_are_not_persisted(self, timeline_manager, timeline, temp_timelines_dir):
+        """Progress ticks within one status should not touch disk."""
+        registry = ExportProgressRegistry(timeline_manager)
+        tid = timeline.timeline_id
+
+        registry.begin(tid, message="Preparing export...")
+        writes_after_begin = _logged_ops(temp_timelines_dir, tid)
+        for i in range(1000):
+            registry.update(tid, ExportStatus.EXPORTING, progress=i / 10, message=f"tick {i}")
+        assert _logged_ops(temp_timelines_dir, tid) == writes_after_begin
+
+        # Live progress is visible through the manager and the registry
+        assert timeline_manager.get_timeline(tid).export_progress == 99.9
+        assert registry.get(tid)["message"] == "tick 999"
+
+        registry.update(tid, ExportStatus.COMPLETED, progress=100.0, message="done")
+        assert _logged_ops(temp_timelines_dir, tid) == writes_after_begin + 1
+
+        reloaded = TimelineManager(timelines_dir=temp_timelines_dir).get_timeline(tid)
+        assert reloaded.export_status == ExportStatus.COMPLETED
+        assert reloaded.export_progress == 100.0
+
+    def test_late_tick_does_not_resurrect_cancelled_export(self, timeline_manager, timeline):
+        """A progress tick after cancellation must not flip status back."""
+        registry = ExportProgressRegistry(timeline_manager)
+        tid = timeline.timeline_id
+
+        registry.begin(tid)
+        registry.update(tid, ExportStatus.CANCELLING, progress=40.0)
+        assert registry.update(tid, ExportStatus.EXPORTING, progress=41.0) is False
+        assert timeline_manager.get_timeline(tid).export_status == ExportStatus.CANCELLING
+
+        assert registry.update(tid, ExportStatus.IDLE) is True
+        assert timeline_manager.get_timeline(tid).export_status == ExportStatus.IDLE
+
+    def test_begin_restarts_after_completed(self, timeline_manager, timeline):
+        """A new export run starts even if the previous one completed."""
+        registry = ExportProgressRegistry(timeline_manager)
+        tid = timeline.timeline_id
+
+        registry.begin(tid)
+        registry.update(tid, ExportStatus.COMPLETED, progress=100.0)
+        assert registry.begin(tid) is True
+        assert timeline_manager.get_timeline(tid).export_status == ExportStatus.EXPORTING
+
+    def test_unknown_timeline(self, timeline_manager):
+        """Updates for a missing timeline are ignored."""
+        registry = ExportProgressRegistry(timeline_manager)
+        assert registry.update("missing", ExportStatus.EXPORTING) is False
+        assert registry.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_broadcast_is_rate_limited(self, timeline_manager, timeline):
+        """Same-status ticks are pushed at most once per interval; transitions always."""
+        broadcast = AsyncMock()
+        registry = ExportProgressRegistry(
+            timeline_manager, broadcast_callback=broadcast, min_interval=60.0
+        )
+        tid = timeline.timeline_id
+
+        registry.begin(tid)
+        for i in range(50):
+            registry.update(tid, ExportStatus.EXPORTING, progress=float(i))
+        registry.update(tid, ExportStatus.COMPLETED, progress=100.0)
+
+        # Let scheduled broadcast tasks run
+        for task in list(registry._tasks):
+            await task
+
+        pushed = [call.args[1]["status"] for call in broadcast.await_args_list]
+        assert pushed == ["exporting", "completed"]
+        assert broadcast.await_args_list[-1].args[0] == tid
@@ -0,0 +1,67 @@
+"""Tests for the card image store."""
+
+import os
+import time
+
+import pytest
+
+from app.services.image_store import ImageStore, TokenBucket, card_image_urls
+
+
+def _cached(store, url, size, age):
+    """Put a fake cached image for ``url`` on disk, last used ``age`` seconds ago."""
+    store.cache_dir.mkdir(parents=True, exist_ok=True)
+    path = store._stem(url).with_suffix(".webp")
+    path.write_bytes(b"x" * size)
+    used = time.time() - age
+    os.utime(path, (used, used))
+    return path
+
+
+class TestTokenBucket:
+    def test_bursts_then_spaces_requests(self):
+        bucket = TokenBucket(rate=10.0, burst=2)
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.1, abs=0.01)
+        assert waits[3] == pytest.approx(0.2, abs=0.01)
+
+
+class TestImageStore:
+    def test_disk_quota_evicts_least_recently_used(self, tmp_path):
+        store = ImageStore(tmp_path, max_disk_mb=1, max_memory_mb=1)
+        old = _cached(store, "https://a/old.jpg", 400_000, age=300)
+        used = _cached(store, "https://a/used.jpg", 400_000, age=200)
+        _cached(store, "https://a/new.jpg", 400_000, age=100)
+
+        assert store.cached_path("https://a/used.jpg") == used  # Marks it recently used
+        assert store.evict() == 1
+
+        assert not old.exists()
+        assert store.cached_path("https://a/used.jpg") == used
+        stats = store.stats()
+        assert stats["disk_files"] == 2
+        assert stats["disk_bytes"] == 800_000
+        assert stats["disk_evictions"] == 1
+
+    async def test_fetch_serves_cached_images_and_counts_hits(self, tmp_path):
+        store = ImageStore(tmp_path, max_disk_mb=1, max_memory_mb=1)
+        legacy = store._stem("https://a/legacy.jpg").with_suffix(".png")
+        tmp_path.mkdir(exist_ok=True)
+        legacy.write_bytes(b"png")  # Cached as PNG by earlier versions
+
+        assert await store.fetch("https://a/legacy.jpg") == legacy
+        assert await store.fetch("") is None
+
+        stats = store.stats()
+        assert stats["disk_hits"] == 1
+        assert stats["hit_rate"] == 1.0
+        assert stats["downloads"] == 0
+
+
+def test_card_image_urls():
+    assert card_image_urls({"image_url": "e.jpg"}, "entity") == ["e.jpg"]
+    assert card_image_urls({"images": ["1", "2", "3", "4"]}, "word") == ["1", "2", "3"]
+    assert card_image_urls(None, "word") == []
@@ -9,6 +9,7 @@ from datetime import datetime
 from app.models.source import SourceType
 from app.models.item import ItemStatus, ItemCreate
 from app.services.item_manager import ItemManager
+from app.services.metadata_store import close_databases
 
 
 @pytest.fixture
@@ -262,3 +263,54 @@ class TestItemManager:
         assert "youtube" in overview
         assert overview["youtube"]["item_count"] == 2
         assert overview["youtube"]["active_pipelines"] == 1
+
+    def test_reload_uses_summary_index(self, temp_data_dir):
+        """Items survive a restart and are hydrated only when requested."""
+        with patch("app.services.item_manager.settings") as mock_settings:
+            mock_settings.items_dir = temp_data_dir / "items"
+            mock_settings.items_dir.mkdir(parents=True, exist_ok=True)
+            first = ItemManager()
+            item = first.create_item(ItemCreate(
+                source_type=SourceType.YOUTUBE,
+                source_id="yt_reload",
+                original_url="https://youtube.com/watch?v=reload",
+                original_title="Reload Item",
+            ))
+            first.update_pipeline_status(item.item_id, "zh_main", "processing", 0.2)
+            first.flush_index()
+
+            second = ItemManager()
+            assert len(second._documents) == 0
+            assert second.get_stats()["total"] == 1
+            assert second.get_overview_by_source_type()["youtube"]["active_pipelines"] == 1
+            assert len(second._documents) == 0
+
+            reloaded = second.get_item_by_url("yt_reload", "https://youtube.com/watch?v=reload")
+            assert reloaded.item_id == item.item_id
+            assert reloaded.pipelines["zh_main"].status == "processing"
+
+    def test_sqlite_backend(self, temp_data_dir):
+        """Items are stored in and listed from the SQLite metadata store."""
+        with patch("app.services.item_manager.settings") as mock_settings, \
+                patch("app.services.metadata_store.settings") as store_settings:
+            mock_settings.items_dir = temp_data_dir / "items"
+            mock_settings.items_dir.mkdir(parents=True, exist_ok=True)
+            store_settings.metadata_backend = "sqlite"
+            store_settings.data_dir = temp_data_dir
+            first = ItemManager()
+            for i in range(3):
+                first.create_item(ItemCreate(
+                    source_type=SourceType.YOUTUBE,
+                    source_id="yt_a" if i < 2 else "yt_b",
+                    original_url=f"https://youtube.com/watch?v=sql{i}",
+                    original_title=f"SQLite Item {i}",
+                ))
+
+            second = ItemManager()
+            assert not list(mock_settings.items_dir.rglob("*.json"))
+            assert [i.original_title for i in second.list_items(source_id="yt_a")] == [
+                "SQLite Item 1", "SQLite Item 0",
+            ]
+            assert second.get_stats()["by_status"] == {"discovered": 3}
+            assert second.get_item_by_url("yt_b", "https://youtube.com/watch?v=sql2")
+        close_databases()
@@ -0,0 +1,160 @@
+"""Tests for the pluggable metadata stores."""
+
+import json
+import pytest
+import tempfile
+from pathlib import Path
+
+from app.services.metadata_store import (
+    JsonFileStore,
+    SqliteMetadataStore,
+    close_databases,
+    migrate_store,
+)
+
+COLUMNS = ("status", "source_id", "created_at", "url")
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary storage directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+        close_databases()
+
+
+def _json_store(directory: Path) -> JsonFileStore:
+    docs_dir = directory / "docs"
+    docs_dir.mkdir(exist_ok=True)
+    return JsonFileStore(
+        "docs", docs_dir, lambda doc_id, summary: docs_dir / f"{doc_id}.json", COLUMNS,
+        order_column="created_at",
+    )
+
+
+def _sqlite_store(directory: Path) -> SqliteMetadataStore:
+    return SqliteMetadataStore(directory / "metadata.db", "docs", COLUMNS, "created_at")
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request, temp_dir):
+    """Create an empty store for each backend."""
+    factory = _json_store if request.param == "json" else _sqlite_store
+    return factory(temp_dir)
+
+
+def _put(store, doc_id: str, status: str, source_id: str, day: int, url: str = None) -> None:
+    summary = {
+        "id": doc_id,
+        "status": status,
+        "source_id": source_id,
+        "created_at": f"2025-01-{day:02d}T00:00:00",
+        "url": url or f"https://example.com/{doc_id}",
+    }
+    store.write(doc_id, json.dumps({**summary, "body": "x" * day}), summary)
+
+
+class TestMetadataStore:
+    """Behaviour shared by both backends."""
+
+    def test_write_read_delete(self, store):
+        """Documents round-trip and disappear on delete."""
+        _put(store, "a", "pending", "src1", 1)
+
+        assert "a" in store
+        assert len(store) == 1
+        assert store.get("a")["status"] == "pending"
+        assert json.loads(store.read("a"))["body"] == "x"
+
+        store.delete("a")
+        assert "a" not in store
+        assert store.read("a") is None
+        assert store.get("a") is None
+
+    def test_query_filters_sorts_and_pages(self, store):
+        """Filters, membership, range, order and paging are applied."""
+        for day in range(1, 7):
+            status = "done" if day % 2 else "pending"
+            _put(store, f"d{day}", status, "src1" if day <= 4 else "src2", day)
+
+        done = store.query({"status": "done"}, order_by="created_at", descending=True)
+        assert [s["id"] for s in done] == ["d5", "d3", "d1"]
+
+        page = store.query(order_by="created_at", descending=True, limit=2, offset=1)
+        assert [s["id"] for s in page] == ["d5", "d4"]
+
+        both = store.query({"status": ["done", "pending"], "source_id": "src2"},
+                           order_by="created_at")
+        assert [s["id"] for s in both] == ["d5", "d6"]
+
+        recent = store.query(order_by="created_at", since=("created_at", "2025-01-05"))
+        assert [s["id"] for s in recent] == ["d5", "d6"]
+
+    def test_count_by(self, store):
+        """Counts are grouped by column value."""
+        _put(store, "a", "pending", "src1", 1)
+        _put(store, "b", "done", "src1", 2)
+        _put(store, "c", "done", "src2", 3)
+
+        assert store.count_by("status") == {"pending": 1, "done": 2}
+        assert store.count_by("status", {"source_id": "src2"}) == {"done": 1}
+
+    def test_duplicates(self, store):
+        """Documents sharing a column value are grouped."""
+        _put(store, "a", "done", "src1", 1, url="https://example.com/same")
+        _put(store, "b", "done", "src1", 2, url="https://example.com/same")
+        _put(store, "c", "done", "src1", 3)
+
+        groups = store.duplicates("url")
+        assert len(groups) == 1
+        assert sorted(s["id"] for s in groups[0]) == ["a", "b"]
+
+    def test_put_summary_keeps_body(self, store):
+        """Updating a summary does not touch the stored document."""
+        _put(store, "a", "pending", "src1", 1)
+        store.put_summary("a", {**store.get("a"), "status": "done"})
+
+        assert store.count_by("status") == {"done": 1}
+        assert json.loads(store.read("a"))["status"] == "pending"
+
+
+class TestSqliteMetadataStore:
+    """SQLite-specific behaviour."""
+
+    def test_persists_across_connections(self, temp_dir):
+        """Documents survive closing and reopening the database."""
+        store = _sqlite_store(temp_dir)
+        _put(store, "a", "pending", "src1", 1)
+        close_databases()
+
+        reopened = _sqlite_store(temp_dir)
+        assert reopened.get("a")["source_id"] == "src1"
+
+    def test_filtered_page_uses_index(self, temp_dir):
+        """Filter + newest-first pages are served by a composite index."""
+        store = _sqlite_store(temp_dir)
+        plan = store._execute(
+            "EXPLAIN QUERY PLAN SELECT summary FROM docs WHERE status = ? "
+            "ORDER BY created_at DESC LIMIT 10",
+            ("done",),
+        )
+        detail = " ".join(row[-1] for row in plan)
+        assert "docs_status" in detail
+        assert "TEMP B-TREE" not in detail
+
+    def test_rejects_unknown_columns(self, temp_dir):
+        """Only declared columns can be filtered on."""
+        store = _sqlite_store(temp_dir)
+        with pytest.raises(ValueError):
+            store.query({"title": "x"})
+
+    def test_migrate_from_json(self, temp_dir):
+        """migrate_store copies documents and summaries."""
+        source = _json_store(temp_dir)
+        _put(source, "a", "pending", "src1", 1)
+        _put(source, "b", "done", "src2", 2)
+
+        target = _sqlite_store(temp_dir)
+        assert migrate_store(source, target) == 2
+        assert target.get("b") == source.get("b")
+        assert target.read("a") == source.read("a")
@@ -0,0 +1,152 @@
+"""Tests for the shared external process runner."""
+
+import asyncio
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.services.process_runner import (
+    ProcessError,
+    ProcessTimeoutError,
+    check_process,
+    ffmpeg_progress,
+    parse_ffmpeg_time,
+    parse_ytdlp_percent,
+    run_process,
+    ytdlp_progress,
+)
+
+PYTHON = sys.executable
+
+
+def _script(code: str) -> list:
+    return [PYTHON, "-c", code]
+
+
+async def _max_loop_lag(task: asyncio.Task, interval: float = 0.01) -> float:
+    """Tick the event loop until a task finishes; return the worst tick delay."""
+    worst = 0.0
+    while not task.done():
+        before = time.monotonic()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.monotonic() - before - interval)
+    await task
+    return worst
+
+
+class TestRunProcess:
+    """Tests for run_process()."""
+
+    async def test_captures_output_and_returncode(self):
+        """stdout, stderr and the exit code are returned."""
+        result = await run_process(_script(
+            "import sys; print('out'); print('err', file=sys.stderr); sys.exit(3)"
+        ))
+
+        assert result.returncode == 3
+        assert result.stdout.strip() == "out"
+        assert result.stderr == "err"
+
+    async def test_does_not_block_event_loop(self):
+        """Other coroutines keep running while the process works."""
+        task = asyncio.create_task(run_process(_script(
+            "import time\nend = time.time() + 0.5\nwhile time.time() < end: pass"
+        )))
+
+        assert await _max_loop_lag(task) < 0.1
+
+    async def test_timeout_terminates_process(self):
+        """An expired timeout kills the process and raises."""
+        started = time.monotonic()
+        with pytest.raises(ProcessTimeoutError):
+            await run_process(_script("import time; time.sleep(30)"), timeout=0.3)
+
+        assert time.monotonic() - started < 5
+
+    async def test_cancellation_terminates_process(self):
+        """Cancelling the awaiting task stops the process."""
+        procs = []
+        task = asyncio.create_task(run_process(
+            _script("import time; time.sleep(30)"), on_start=procs.append
+        ))
+        while not procs:
+            await asyncio.sleep(0.01)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert procs[0].returncode is not None
+
+    async def test_stderr_ring_buffer(self):
+        """Only the trailing stderr lines are kept."""
+        result = await run_process(
+            _script("import sys\nfor i in range(1000): print(i, file=sys.stderr)"),
+            stderr_lines=5,
+        )
+
+        assert result.stderr.splitlines() == ["995", "996", "997", "998", "999"]
+
+    async def test_line_callbacks_split_carriage_returns(self):
+        """stderr progress lines ending in \\r are delivered one by one."""
+        lines = []
+        await run_process(
+            _script("import sys; sys.stderr.write('frame=1\\rframe=2\\rdone\\n')"),
+            on_stderr_line=lines.append,
+        )
+
+        assert lines == ["frame=1", "frame=2", "done"]
+
+    async def test_per_tool_concurrency_limit(self):
+        """No more than the configured number of processes run at once."""
+        running = 0
+        peak = 0
+
+        async def one():
+            nonlocal running, peak
+
+            def on_start(_proc):
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+
+            await run_process(
+                _script("import time; time.sleep(0.2)"), tool="ffmpeg", on_start=on_start
+            )
+            running -= 1
+
+        with patch("app.services.process_runner.settings") as mock_settings:
+            mock_settings.ffmpeg_max_concurrency = 2
+            await asyncio.gather(*(one() for _ in range(5)))
+
+        assert peak == 2
+
+    async def test_check_process_raises_on_failure(self):
+        """check_process turns a non-zero exit into ProcessError."""
+        with pytest.raises(ProcessError) as exc_info:
+            await check_process(_script("import sys; print('boom', file=sys.stderr); sys.exit(1)"))
+
+        assert exc_info.value.stderr == "boom"
+
+
+class TestProgressParsing:
+    """Tests for the progress line parsers."""
+
+    def test_parse_ffmpeg_time(self):
+        assert parse_ffmpeg_time("out_time=00:01:02.500000") == pytest.approx(62.5)
+        assert parse_ffmpeg_time(
+            "frame=  100 fps= 25 q=28.0 size=512kB time=01:00:00.00 bitrate=1000kbits/s"
+        ) == pytest.approx(3600.0)
+        assert parse_ffmpeg_time("Press [q] to stop") is None
+
+    def test_parse_ytdlp_percent(self):
+        assert parse_ytdlp_percent("[download]  42.3% of 10.00MiB at 1.00MiB/s") == 42.3
+        assert parse_ytdlp_percent("[info] Writing video metadata") is None
+
+    def test_progress_handlers_report_fractions(self):
+        fractions = []
+        ffmpeg_progress(100.0, fractions.append)("out_time=00:00:25.000000")
+        ytdlp_progress(fractions.append)("[download] 100% of 10.00MiB")
+
+        assert fractions == [0.25, 1.0]
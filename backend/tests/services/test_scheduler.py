@@ -0,0 +1,96 @@
+"""Tests for resource-aware stage scheduling."""
+
+import asyncio
+
+from app.services.queue import JobQueue
+from app.services.scheduler import Resource, ResourcePools
+
+
+def _pools(**sizes) -> ResourcePools:
+    return ResourcePools({Resource(name): size for name, size in sizes.items()})
+
+
+class TestResourcePools:
+    """Tests for ResourcePools."""
+
+    async def test_limits_stages_per_resource(self):
+        """No more stages than the pool capacity run at once."""
+        pools = _pools(gpu=1, network=0)
+        running = {"gpu": 0, "network": 0}
+        peak = {"gpu": 0, "network": 0}
+
+        async def stage(resource: Resource, job_id: str):
+            async with pools.acquire(resource, job_id, "stage"):
+                running[resource.value] += 1
+                peak[resource.value] = max(peak[resource.value], running[resource.value])
+                await asyncio.sleep(0.02)
+                running[resource.value] -= 1
+
+        await asyncio.gather(
+            *(stage(Resource.GPU, f"g{i}") for i in range(4)),
+            *(stage(Resource.NETWORK, f"n{i}") for i in range(4)),
+        )
+
+        assert peak == {"gpu": 1, "network": 4}
+
+    async def test_stats(self):
+        """Active and waiting stages are reported per pool."""
+        pools = _pools(gpu=1)
+        release = asyncio.Event()
+
+        async def hold(job_id: str):
+            async with pools.acquire(Resource.GPU, job_id, "transcribe"):
+                await release.wait()
+
+        tasks = [asyncio.create_task(hold(job_id)) for job_id in ("a", "b")]
+        await asyncio.sleep(0.01)
+
+        gpu = pools.get_stats()["gpu"]
+        assert gpu["active"] == 1
+        assert gpu["waiting"] == 1
+        assert gpu["stages"] == ["a:transcribe"]
+
+        release.set()
+        await asyncio.gather(*tasks)
+        gpu = pools.get_stats()["gpu"]
+        assert gpu["active"] == 0
+        assert gpu["completed"] == 2
+
+    async def test_slot_released_on_error(self):
+        """A failing stage frees its slot."""
+        pools = _pools(gpu=1)
+
+        try:
+            async with pools.acquire(Resource.GPU, "a", "transcribe"):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        async with pools.acquire(Resource.GPU, "b", "transcribe"):
+            assert pools.get_stats()["gpu"]["active"] == 1
+
+
+class TestJobQueueWithPools:
+    """Jobs overlap stage by stage when the queue runs with pools."""
+
+    async def test_download_overlaps_transcription(self):
+        pools = _pools(network=1, gpu=1)
+        events = []
+
+        async def process(job_id: str):
+            async with pools.acquire(Resource.NETWORK, job_id, "download"):
+                events.append((job_id, "download"))
+                await asyncio.sleep(0.05)
+            async with pools.acquire(Resource.GPU, job_id, "transcribe"):
+                events.append((job_id, "transcribe"))
+                # Job b's download starts while job a is transcribing
+                await asyncio.sleep(0.05)
+
+        queue = JobQueue(max_concurrent=4, process_func=process, resources=pools)
+        await queue.start()
+        await queue.add_batch(["a", "b"])
+        await queue._queue.join()
+        await queue.stop()
+
+        assert events[:3] == [("a", "download"), ("a", "transcribe"), ("b", "download")]
+        assert queue.get_stats()["resources"]["gpu"]["completed"] == 2
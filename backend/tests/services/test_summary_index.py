@@ -0,0 +1,168 @@
+"""Tests for the summary index and document cache."""
+
+import gc
+import json
+import os
+import pytest
+import tempfile
+from pathlib import Path
+
+from app.services.summary_index import INDEX_FILENAME, DocumentCache, SummaryIndex
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary document directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+def _write(path: Path, data: dict) -> None:
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def _documents(directory: Path) -> dict:
+    return {p.stem: [p] for p in directory.glob("*.json")}
+
+
+class _Doc:
+    """Weak-referenceable stand-in for a hydrated model."""
+
+
+class TestSummaryIndex:
+    """Tests for SummaryIndex."""
+
+    def _summarizer(self, directory: Path, calls: list):
+        def summarize(doc_id: str):
+            calls.append(doc_id)
+            data = json.loads((directory / f"{doc_id}.json").read_text(encoding="utf-8"))
+            return {"id": doc_id, "status": data["status"]}
+        return summarize
+
+    def test_refresh_builds_and_persists(self, temp_dir):
+        """A first refresh reads every document and writes the index file."""
+        _write(temp_dir / "a.json", {"status": "pending"})
+        _write(temp_dir / "b.json", {"status": "done"})
+        calls = []
+
+        index = SummaryIndex(temp_dir / INDEX_FILENAME)
+        rebuilt = index.refresh(_documents(temp_dir), self._summarizer(temp_dir, calls))
+
+        assert rebuilt == 2
+        assert sorted(calls) == ["a", "b"]
+        assert index.get("b") == {"id": "b", "status": "done"}
+        assert (temp_dir / INDEX_FILENAME).exists()
+
+    def test_refresh_only_rereads_changed_documents(self, temp_dir):
+        """Unchanged files are served from the persisted index."""
+        _write(temp_dir / "a.json", {"status": "pending"})
+        _write(temp_dir / "b.json", {"status": "pending"})
+        SummaryIndex(temp_dir / INDEX_FILENAME).refresh(
+            _documents(temp_dir), self._summarizer(temp_dir, [])
+        )
+
+        _write(temp_dir / "b.json", {"status": "completed"})
+        stat = os.stat(temp_dir / "b.json")
+        os.utime(temp_dir / "b.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        calls = []
+        index = SummaryIndex(temp_dir / INDEX_FILENAME)
+        rebuilt = index.refresh(_documents(temp_dir), self._summarizer(temp_dir, calls))
+
+        assert rebuilt == 1
+        assert calls == ["b"]
+        assert index.get("a")["status"] == "pending"
+        assert index.get("b")["status"] == "completed"
+
+    def test_refresh_drops_deleted_and_unreadable_documents(self, temp_dir):
+        """Documents removed from disk or failing to load are not indexed."""
+        _write(temp_dir / "a.json", {"status": "pending"})
+        _write(temp_dir / "b.json", {"status": "pending"})
+        SummaryIndex(temp_dir / INDEX_FILENAME).refresh(
+            _documents(temp_dir), self._summarizer(temp_dir, [])
+        )
+
+        (temp_dir / "a.json").unlink()
+        (temp_dir / "c.json").write_text("{not json", encoding="utf-8")
+        index = SummaryIndex(temp_dir / INDEX_FILENAME)
+        index.refresh(_documents(temp_dir), self._summarizer(temp_dir, []))
+
+        assert "a" not in index
+        assert "c" not in index
+        assert len(index) == 1
+
+    def test_version_bump_forces_rebuild(self, temp_dir):
+        """A different summary version ignores the persisted index."""
+        _write(temp_dir / "a.json", {"status": "pending"})
+        SummaryIndex(temp_dir / INDEX_FILENAME).refresh(
+            _documents(temp_dir), self._summarizer(temp_dir, [])
+        )
+
+        calls = []
+        SummaryIndex(temp_dir / INDEX_FILENAME, version=2).refresh(
+            _documents(temp_dir), self._summarizer(temp_dir, calls)
+        )
+        assert calls == ["a"]
+
+    def test_put_and_remove(self, temp_dir):
+        """Runtime updates are visible immediately and persisted on flush."""
+        path = temp_dir / "a.json"
+        _write(path, {"status": "pending"})
+        index = SummaryIndex(temp_dir / INDEX_FILENAME)
+        index.put("a", {"id": "a", "status": "pending"}, [path])
+        index.flush()
+
+        calls = []
+        reloaded = SummaryIndex(temp_dir / INDEX_FILENAME)
+        reloaded.refresh(_documents(temp_dir), self._summarizer(temp_dir, calls))
+        assert calls == []
+        assert reloaded.get("a")["status"] == "pending"
+
+        reloaded.remove("a")
+        assert "a" not in reloaded
+        assert reloaded.summaries() == []
+
+
+class TestDocumentCache:
+    """Tests for DocumentCache."""
+
+    def test_evicts_least_recently_used(self):
+        """Documents beyond the byte budget are evicted in LRU order."""
+        cache = DocumentCache(max_bytes=100)
+        cache.put("a", _Doc(), 40)
+        cache.put("b", _Doc(), 40)
+        cache.get("a")
+        cache.put("c", _Doc(), 40)
+
+        assert len(cache) == 2
+        assert cache.get_stats()["bytes"] == 80
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+
+    def test_evicted_document_still_referenced_keeps_identity(self):
+        """An evicted document that is still in use is returned, not reloaded."""
+        cache = DocumentCache(max_bytes=10)
+        held = _Doc()
+        cache.put("held", held, 10)
+        cache.put("other", _Doc(), 10)
+
+        assert cache.get("held") is held
+
+        del held
+        gc.collect()
+        assert cache.get("held") is None
+
+    def test_most_recent_document_kept_over_budget(self):
+        """A single oversized document stays resident."""
+        cache = DocumentCache(max_bytes=10)
+        doc = _Doc()
+        cache.put("big", doc, 1000)
+        assert len(cache) == 1
+
+    def test_pop(self):
+        """Popped documents are no longer returned."""
+        cache = DocumentCache(max_bytes=100)
+        doc = _Doc()
+        cache.put("a", doc, 10)
+        cache.pop("a")
+        assert cache.get("a") is None
+        assert "a" not in cache
@@ -474,3 +474,214 @@ class TestTimelineManagerMigration:
         new_manager = TimelineManager(timelines_dir=temp_timelines_dir)
         reloaded = new_manager.get_timeline(tid)
         assert reloaded.subtitle_style_mode == SubtitleStyleMode.FLOATING
+
+
+class TestTimelineManagerOpLog:
+    """Tests for the append-only operation log."""
+
+    def _create(self, manager, transcript):
+        return manager.create_from_transcript(
+            job_id="oplog_job",
+            source_url="test",
+            source_title="Op Log",
+            source_duration=15.0,
+            translated_transcript=transcript,
+        )
+
+    def test_segment_update_appends_instead_of_rewriting(
+        self, timeline_manager, sample_transcript, temp_timelines_dir
+    ):
+        """Segment edits should go to the log and leave the snapshot untouched."""
+        timeline = self._create(timeline_manager, sample_transcript)
+        tid = timeline.timeline_id
+        snapshot = (temp_timelines_dir / f"{tid}.json").read_text(encoding="utf-8")
+
+        timeline_manager.update_segment(tid, 1, SegmentUpdate(state=SegmentState.DROP))
+
+        assert (temp_timelines_dir / f"{tid}.json").read_text(encoding="utf-8") == snapshot
+        log_lines = (temp_timelines_dir / f"{tid}.log").read_text(encoding="utf-8").splitlines()
+        assert len(log_lines) == 1
+        assert json.loads(log_lines[0])["op"] == "segment"
+
+    def test_log_replayed_on_load(
+        self, timeline_manager, sample_transcript, temp_timelines_dir
+    ):
+        """A fresh manager should see every logged edit."""
+        from app.models.timeline import ExportStatus, PinnedCardCreate, PinnedCardType
+
+        timeline = self._create(timeline_manager, sample_transcript)
+        tid = timeline.timeline_id
+
+        timeline_manager.update_segment(tid, 0, SegmentUpdate(en="Hi there.", trim_start=0.5))
+        timeline_manager.batch_update_segments(tid, [1, 2], SegmentState.KEEP)
+        timeline_manager.update_export_status(tid, ExportStatus.EXPORTING, progress=40.0)
+        kept = timeline_manager.add_pinned_card(tid, PinnedCardCreate(
+            card_type=PinnedCardType.WORD, card_id="hello", segment_id=0,
+            timestamp=1.0, card_data={"word": "hello"},
+        ))
+        removed = timeline_manager.add_pinned_card(tid, PinnedCardCreate(
+            card_type=PinnedCardType.WORD, card_id="show", segment_id=0,
+            timestamp=2.0, card_data={"word": "show"},
+        ))
+        timeline_manager.remove_pinned_card(tid, removed.id)
+        timeline_manager.update_pinned_card_note(tid, kept.id, "greeting")
+
+        reloaded = TimelineManager(timelines_dir=temp_timelines_dir).get_timeline(tid)
+        original = timeline_manager.get_timeline(tid)
+
+        assert reloaded.segments[0].en == "Hi there."
+        assert reloaded.segments[0].trim_start == 0.5
+        assert reloaded.segments[1].state == SegmentState.KEEP
+        assert reloaded.segments[2].state == SegmentState.KEEP
+        assert reloaded.export_status == ExportStatus.EXPORTING
+        assert reloaded.export_progress == 40.0
+        assert [c.id for c in reloaded.pinned_cards] == [kept.id]
+        assert reloaded.pinned_cards[0].note == "greeting"
+        assert reloaded.pinned_cards[0].display_end == original.pinned_cards[0].display_end
+        assert reloaded.updated_at == original.updated_at
+
+    def test_compact_folds_log_into_snapshot(
+        self, timeline_manager, sample_transcript, temp_timelines_dir
+    ):
+        """Compaction should rewrite the snapshot and drop the log."""
+        timeline = self._create(timeline_manager, sample_transcript)
+        tid = timeline.timeline_id
+        timeline_manager.update_segment(tid, 2, SegmentUpdate(state=SegmentState.KEEP))
+
+        assert timeline_manager.compact(tid) is True
+        assert not (temp_timelines_dir / f"{tid}.log").exists()
+        assert timeline_manager.compact(tid) is False
+
+        with open(temp_timelines_dir / f"{tid}.json", "r", encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["segments"][2]["state"] == "keep"
+
+        # Edits after compaction replay on top of the new snapshot
+        timeline_manager.update_segment(tid, 0, SegmentUpdate(state=SegmentState.DROP))
+        reloaded = TimelineManager(timelines_dir=temp_timelines_dir).get_timeline(tid)
+        assert reloaded.segments[0].state == SegmentState.DROP
+        assert reloaded.segments[2].state == SegmentState.KEEP
+
+    def test_background_compaction_after_threshold(
+        self, sample_transcript, temp_timelines_dir
+    ):
+        """Crossing compact_after should schedule a background compaction."""
+        from app.services.timeline_manager import _compaction_executor
+
+        manager = TimelineManager(timelines_dir=temp_timelines_dir, compact_after=3)
+        timeline = self._create(manager, sample_transcript)
+        tid = timeline.timeline_id
+        for state in (SegmentState.KEEP, SegmentState.DROP, SegmentState.KEEP):
+            manager.update_segment(tid, 0, SegmentUpdate(state=state))
+
+        # Wait for the single-threaded executor to drain
+        _compaction_executor.submit(lambda: None).result(timeout=5)
+
+        assert not (temp_timelines_dir / f"{tid}.log").exists()
+        reloaded = TimelineManager(timelines_dir=temp_timelines_dir).get_timeline(tid)
+        assert reloaded.segments[0].state == SegmentState.KEEP
+
+    def test_torn_log_line_is_skipped(
+        self, timeline_manager, sample_transcript, temp_timelines_dir
+    ):
+        """A partially written trailing op must not break loading."""
+        timeline = self._create(timeline_manager, sample_transcript)
+        tid = timeline.timeline_id
+        timeline_manager.update_segment(tid, 0, SegmentUpdate(state=SegmentState.KEEP))
+        with open(temp_timelines_dir / f"{tid}.log", "a", encoding="utf-8") as f:
+            f.write('{"seq": 2, "op": "segm')
+
+        reloaded = TimelineManager(timelines_dir=temp_timelines_dir).get_timeline(tid)
+        assert reloaded.segments[0].state == SegmentState.KEEP
+
+    def test_full_save_truncates_log(
+        self, timeline_manager, sample_transcript, temp_timelines_dir
+    ):
+        """save_timeline writes a snapshot that already covers logged ops."""
+        timeline = self._create(timeline_manager, sample_transcript)
+        tid = timeline.timeline_id
+        timeline_manager.update_segment(tid, 0, SegmentUpdate(state=SegmentState.KEEP))
+
+        timeline.source_title = "Renamed"
+        timeline_manager.save_timeline(timeline)
+
+        assert not (temp_timelines_dir / f"{tid}.log").exists()
+        reloaded = TimelineManager(timelines_dir=temp_timelines_dir).get_timeline(tid)
+        assert reloaded.source_title == "Renamed"
+        assert reloaded.segments[0].state == SegmentState.KEEP
+
+    def test_delete_removes_log(
+        self, timeline_manager, sample_transcript, temp_timelines_dir
+    ):
+        """Deleting a timeline should remove its op log too."""
+        timeline = self._create(timeline_manager, sample_transcript)
+        tid = timeline.timeline_id
+        timeline_manager.update_segment(tid, 0, SegmentUpdate(state=SegmentState.KEEP))
+
+        timeline_manager.delete_timeline(tid)
+        assert not (temp_timelines_dir / f"{tid}.log").exists()
+
+
+class TestTimelineManagerLazyLoading:
+    """Tests for the summary index and on-demand hydration."""
+
+    def _create(self, manager, transcript, job_id="lazy_job"):
+        return manager.create_from_transcript(
+            job_id=job_id,
+            source_url="test",
+            source_title="Lazy",
+            source_duration=15.0,
+            translated_transcript=transcript,
+        )
+
+    def test_restart_lists_without_hydrating(
+        self, timeline_manager, sample_transcript, temp_timelines_dir
+    ):
+        """A restart serves summaries from the index and loads timelines on demand."""
+        timeline = self._create(timeline_manager, sample_transcript)
+        tid = timeline.timeline_id
+        timeline_manager.flush_index()
+
+        reloaded = TimelineManager(timelines_dir=temp_timelines_dir)
+        assert len(reloaded._documents) == 0
+        summaries = reloaded.list_timelines()
+        assert [s.timeline_id for s in summaries] == [tid]
+        assert len(reloaded._documents) == 0
+
+        assert reloaded.get_timeline(tid).source_title == "Lazy"
+        assert reloaded.get_timeline_by_job("lazy_job").timeline_id == tid
+
+    def test_summary_reflects_logged_edits(
+        self, timeline_manager, sample_transcript, temp_timelines_dir
+    ):
+        """List and stats pick up edits that only went to the op log."""
+        timeline = self._create(timeline_manager, sample_transcript)
+        tid = timeline.timeline_id
+        timeline_manager.update_segment(tid, 0, SegmentUpdate(state=SegmentState.KEEP))
+        timeline_manager.mark_reviewed(tid)
+
+        summary = timeline_manager.list_timelines()[0]
+        assert summary.keep_count == 1
+        assert summary.is_reviewed is True
+        assert timeline_manager.get_stats()["reviewed"] == 1
+
+        reloaded = TimelineManager(timelines_dir=temp_timelines_dir)
+        assert reloaded.list_timelines(reviewed_only=True)[0].keep_count == 1
+
+    def test_evicted_timeline_is_rehydrated(
+        self, timeline_manager, sample_transcript
+    ):
+        """Timelines evicted from the LRU are reloaded with their logged edits."""
+        first = self._create(timeline_manager, sample_transcript, job_id="job_a")
+        first_id = first.timeline_id
+        timeline_manager.update_segment(
+            first_id, 2, SegmentUpdate(state=SegmentState.DROP)
+        )
+        del first
+
+        timeline_manager._documents.max_bytes = 1
+        self._create(timeline_manager, sample_transcript, job_id="job_b")
+        assert first_id not in timeline_manager._documents
+
+        rehydrated = timeline_manager.get_timeline(first_id)
+        assert rehydrated.segments[2].state == SegmentState.DROP
@@ -0,0 +1,39 @@
+"""Tests for the transcript char-offset index."""
+
+from app.models.timeline import EditableSegment
+from app.services.transcript_index import TranscriptIndex
+
+
+def _index(texts):
+    return TranscriptIndex([
+        EditableSegment(id=10 + i, start=float(i), end=i + 0.5, en=text, zh="")
+        for i, text in enumerate(texts)
+    ])
+
+
+class TestTranscriptIndex:
+    def test_joins_non_empty_segments(self):
+        index = _index(["I moved to New", "  ", "York last year."])
+
+        assert index.text == "I moved to New York last year."
+        assert index.segment_ids == [10, 12]
+        assert index.starts == [0, 15]
+
+    def test_locate_offsets(self):
+        index = _index(["I moved to New", "York last year."])
+
+        assert index.locate(0) == 0
+        assert index.locate(13) == 0
+        assert index.locate(14) is None  # The separator
+        assert index.locate(15) == 1
+        assert index.locate(len(index.text)) is None
+
+    def test_split_spans(self):
+        index = _index(["I moved to New", "York last year.", "Then Paris."])
+        paris = index.text.index("Paris")
+
+        assert index.split(paris, paris + 5) == [(2, 5, 10)]
+        # "New York" straddles the first boundary
+        assert index.split(11, 19) == [(0, 11, 14), (1, 0, 4)]
+        assert index.split(14, 15) == []  # Only the separator
+        assert index.split(5, 5) == []
@@ -0,0 +1,115 @@
+"""Tests for the in-process dubbed audio mixer."""
+
+import wave
+
+import numpy as np
+import pytest
+
+from app.workers.audio_mixer import SAMPLE_RATE, AudioMixerWorker, _time_stretch
+
+
+def _write_wav(path, samples, sample_rate, channels=1):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes((np.asarray(samples) * 32767).astype("<i2").tobytes())
+
+
+def _read_wav(path):
+    with wave.open(str(path), "rb") as wav:
+        assert (wav.getnchannels(), wav.getframerate()) == (2, SAMPLE_RATE)
+        frames = wav.readframes(wav.getnframes())
+    return np.frombuffer(frames, dtype="<i2").reshape(-1, 2) / 32767
+
+
+def _segment(tmp_path, seg_id, start, end, seconds, level=0.5, rate=24000):
+    path = tmp_path / f"seg_{seg_id}.wav"
+    _write_wav(path, np.full(int(seconds * rate), level), rate)
+    return {"id": seg_id, "start": start, "end": end, "dubbed_path": str(path)}
+
+
+class TestVocalsTrack:
+    async def test_segments_placed_at_offsets(self, tmp_path):
+        segments = [
+            _segment(tmp_path, 1, 1.0, 2.0, 0.5),
+            _segment(tmp_path, 2, 3.0, 4.0, 1.0, level=0.25),
+            {"id": 3, "start": 5.0, "end": 6.0, "dubbed_path": None},
+        ]
+        out = tmp_path / "vocals.wav"
+
+        await AudioMixerWorker()._create_vocals_track(segments, out, total_duration=6.0)
+
+        track = _read_wav(out)
+        assert len(track) == 6 * SAMPLE_RATE
+        assert np.all(track[:SAMPLE_RATE] == 0)
+        assert track[int(1.25 * SAMPLE_RATE)] == pytest.approx([0.5, 0.5], abs=1e-3)
+        assert np.all(track[int(1.51 * SAMPLE_RATE):3 * SAMPLE_RATE] == 0)
+        assert track[int(3.5 * SAMPLE_RATE)] == pytest.approx([0.25, 0.25], abs=1e-3)
+        assert sorted(p.name for p in tmp_path.iterdir() if "vocals" in p.name) == ["vocals.wav"]
+
+    async def test_long_segment_fitted_to_slot(self, tmp_path):
+        segments = [
+            # 1.1 s into a 1 s slot: compressed, nothing cut
+            _segment(tmp_path, 1, 0.0, 1.0, 1.1),
+            # 2 s into a 1 s slot: compressed by max_stretch, then cut
+            _segment(tmp_path, 2, 1.0, 2.0, 2.0),
+            _segment(tmp_path, 3, 2.0, 2.5, 0.5, level=0.1),
+        ]
+        out = tmp_path / "vocals.wav"
+
+        await AudioMixerWorker(max_stretch=1.15)._create_vocals_track(segments, out, 3.0)
+
+        track = _read_wav(out)[:, 0]
+        assert track[int(0.5 * SAMPLE_RATE)] == pytest.approx(0.5, abs=1e-2)
+        assert track[int(1.9 * SAMPLE_RATE)] == pytest.approx(0.5, abs=1e-2)
+        assert track[int(2.25 * SAMPLE_RATE)] == pytest.approx(0.1, abs=1e-3)
+        assert np.all(track[int(2.5 * SAMPLE_RATE):] == 0)
+        # Faded out at the cut instead of a click
+        assert abs(track[2 * SAMPLE_RATE - 1]) < 0.01
+
+    def test_time_stretch_keeps_pitch(self):
+        t = np.arange(SAMPLE_RATE) / SAMPLE_RATE
+        tone = np.sin(2 * np.pi * 440 * t).astype(np.float32)[:, None]
+
+        stretched = _time_stretch(tone, int(SAMPLE_RATE / 1.1))
+
+        assert len(stretched) == int(SAMPLE_RATE / 1.1)
+        spectrum = np.abs(np.fft.rfft(stretched[:, 0]))
+        peak_hz = np.argmax(spectrum) * SAMPLE_RATE / len(stretched)
+        assert peak_hz == pytest.approx(440, abs=3)
+
+
+class TestMixDubbedAudio:
+    async def test_mix_with_ducking(self, tmp_path):
+        segments = [_segment(tmp_path, 1, 2.0, 3.0, 1.0, level=0.4)]
+        bgm = tmp_path / "bgm.wav"
+        _write_wav(bgm, np.full(5 * SAMPLE_RATE * 2, 0.5), SAMPLE_RATE, channels=2)
+        out = tmp_path / "mixed.wav"
+
+        await AudioMixerWorker(duck_ramp=0.1).mix_dubbed_audio(
+            segments, bgm, None, out, total_duration=6.0,
+            bgm_volume=0.4, vocal_volume=1.0, duck_volume=0.5,
+        )
+
+        mix = _read_wav(out)[:, 0]
+        assert len(mix) == 6 * SAMPLE_RATE
+        assert mix[SAMPLE_RATE] == pytest.approx(0.2, abs=1e-3)  # BGM only
+        assert mix[int(2.5 * SAMPLE_RATE)] == pytest.approx(0.4 + 0.1, abs=1e-3)  # ducked
+        ramp = mix[int(1.9 * SAMPLE_RATE):2 * SAMPLE_RATE]
+        assert np.all(np.diff(ramp) <= 1e-4)  # BGM fades down before speech
+        assert mix[int(5.5 * SAMPLE_RATE)] == 0  # past the end of the BGM
+        vocals = _read_wav(tmp_path / "dubbed_vocals_track.wav")[:, 0]
+        assert vocals[int(2.5 * SAMPLE_RATE)] == pytest.approx(0.4, abs=1e-3)
+
+    async def test_without_bgm_or_sfx(self, tmp_path):
+        segments = [_segment(tmp_path, 1, 0.5, 1.0, 0.5)]
+        out = tmp_path / "mixed.wav"
+
+        await AudioMixerWorker().mix_dubbed_audio(
+            segments, None, tmp_path / "missing_sfx.wav", out, 2.0, vocal_volume=0.5
+        )
+
+        mix = _read_wav(out)[:, 0]
+        assert mix[int(0.75 * SAMPLE_RATE)] == pytest.approx(0.25, abs=1e-3)
+        assert not list(tmp_path.glob("*.tmp")) and not list(tmp_path.glob("*.f32"))
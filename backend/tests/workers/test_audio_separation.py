@@ -0,0 +1,126 @@
+"""Tests for windowed audio separation."""
+
+import wave
+
+import numpy as np
+import pytest
+
+from app.workers.audio_separation import (
+    MIN_WINDOW_SECONDS,
+    SAMPLE_RATE,
+    _BYTES_PER_FRAME,
+    _MODEL_OVERHEAD_MB,
+    plan_window,
+    separate_streaming,
+)
+
+
+def _write_wav(path, samples, channels):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(samples.astype("<i2").tobytes())
+
+
+def _read_wav(path):
+    with wave.open(str(path), "rb") as wav:
+        assert wav.getnchannels() == 2
+        assert wav.getframerate() == SAMPLE_RATE
+        frames = wav.readframes(wav.getnframes())
+    return np.frombuffer(frames, dtype="<i2").reshape(-1, 2).T
+
+
+def _scale_stems(mix):
+    """Pointwise fake separator: stems are fixed fractions of the mix."""
+    return np.stack([mix * 0.5, mix * 0.3, mix * 0.2])
+
+
+@pytest.fixture
+def stereo_wav(tmp_path):
+    rng = np.random.default_rng(0)
+    frames = 10_007
+    samples = (rng.standard_normal((frames, 2)) * 6000).clip(-32768, 32767)
+    path = tmp_path / "audio.wav"
+    _write_wav(path, samples, channels=2)
+    return path, samples.astype("<i2").T
+
+
+class TestPlanWindow:
+    def test_window_fits_budget(self):
+        window, crossfade = plan_window(2048, 3.0)
+        assert crossfade == 3 * SAMPLE_RATE
+        assert window * _BYTES_PER_FRAME <= (2048 - _MODEL_OVERHEAD_MB) * 2**20
+        assert window > 60 * SAMPLE_RATE
+
+    def test_small_budget_uses_minimum_window(self):
+        window, crossfade = plan_window(64, 20.0)
+        assert window == max(int(MIN_WINDOW_SECONDS * SAMPLE_RATE), 2 * crossfade)
+
+
+class TestSeparateStreaming:
+    def test_windows_match_whole_file(self, tmp_path, stereo_wav):
+        audio_path, samples = stereo_wav
+        paths = [tmp_path / f"{name}.wav" for name in ("vocals", "bgm", "sfx")]
+        windows = []
+
+        def separate_window(mix):
+            windows.append(mix.shape[1])
+            return _scale_stems(mix)
+
+        frames = separate_streaming(audio_path, paths, separate_window, 3000, 500)
+
+        assert frames == samples.shape[1]
+        assert max(windows) <= 3000
+        assert len(windows) == 4  # 3000 + 3 * 2500 new frames cover 10007
+        expected = _scale_stems(samples.astype(np.float32) / 32768.0)
+        for path, stem in zip(paths, expected):
+            np.testing.assert_allclose(_read_wav(path) / 32767, stem, atol=2e-4)
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_crossfade_weights_sum_to_one(self, tmp_path, stereo_wav):
+        audio_path, samples = stereo_wav
+        paths = [tmp_path / "a.wav", tmp_path / "b.wav"]
+        count = 0
+
+        def separate_window(mix):
+            # Constant per window, differing between windows
+            nonlocal count
+            count += 1
+            stems = np.full((2, *mix.shape), 0.25, dtype=np.float32)
+            stems[1] *= count
+            return stems
+
+        separate_streaming(audio_path, paths, separate_window, 3000, 500)
+
+        first = _read_wav(paths[0]) / 32767
+        np.testing.assert_allclose(first, 0.25, atol=1e-4)
+        second = _read_wav(paths[1])[0] / 32767
+        # Ramps from window 1 to window 2 across the first overlap
+        fade = second[2500:3000]
+        assert fade[0] == pytest.approx(0.25, abs=1e-3)
+        assert fade[-1] == pytest.approx(0.5, abs=1e-3)
+        assert np.all(np.diff(fade) >= 0)
+
+    def test_mono_input_is_upmixed(self, tmp_path):
+        samples = np.linspace(-8000, 8000, 4000)
+        audio_path = tmp_path / "mono.wav"
+        _write_wav(audio_path, samples, channels=1)
+        paths = [tmp_path / "out.wav"]
+
+        separate_streaming(audio_path, paths, lambda mix: mix[None], 1500, 100)
+
+        out = _read_wav(paths[0])
+        assert out.shape == (2, 4000)
+        np.testing.assert_array_equal(out[0], out[1])
+
+    def test_failure_leaves_no_partial_output(self, tmp_path, stereo_wav):
+        audio_path, _ = stereo_wav
+        paths = [tmp_path / "vocals.wav"]
+
+        def separate_window(mix):
+            raise RuntimeError("out of memory")
+
+        with pytest.raises(RuntimeError):
+            separate_streaming(audio_path, paths, separate_window, 3000, 500)
+        assert not list(tmp_path.glob("vocals.wav*"))
@@ -0,0 +1,96 @@
+"""Tests for coalesced card generator lookups."""
+
+import asyncio
+
+from app.models.card import WordCard
+from app.services.card_cache import CardCache
+from app.workers.card_generator import CardGeneratorWorker
+
+
+class CountingApi(CardGeneratorWorker):
+    """Card generator whose TomTrove word lookups are slow and counted."""
+
+    def __init__(self, cache):
+        super().__init__(card_cache=cache)
+        self.calls = []
+        self.down = False
+
+    async def _fetch_word_from_tomtrove(self, word, lang, force_refresh=False):
+        self.calls.append((word, lang, force_refresh))
+        await asyncio.sleep(0.02)
+        if self.down:
+            return None
+        return WordCard(word=word, lemma=word) if word == "popular" else None
+
+    async def _fetch_entity_from_tomtrove(self, entity_id, target_lang=None, force_refresh=False):
+        self.calls.append((entity_id, target_lang, force_refresh))
+        return None
+
+
+class TestSingleFlight:
+    async def test_concurrent_lookups_share_one_fetch(self, tmp_path):
+        api = CountingApi(CardCache(tmp_path / "cards"))
+
+        cards = await asyncio.gather(*[api.get_word_card(" Popular ", target_lang="zh-TW") for _ in range(5)])
+
+        assert len(api.calls) == 1
+        assert all(card.word == "popular" for card in cards)
+        assert len({id(card) for card in cards}) == 5  # Each caller gets its own copy
+        assert api.get_lookup_stats() == {"hits": 0, "misses": 1, "coalesced": 4, "in_flight": 0, "recent": 1}
+
+    async def test_recent_results_answer_repeat_lookups(self, tmp_path):
+        api = CountingApi(CardCache(tmp_path / "cards"))
+
+        assert await api.get_word_card("popular") is not None
+        assert await api.get_word_card("popular") is not None
+        await api.get_word_card("popular", target_lang="zh-CN")  # Same TomTrove language
+        assert await api.get_word_card("rare") is None
+        assert await api.get_word_card("rare") is None  # Not-found results are reused too
+
+        assert api.lookup_stats == {"hits": 3, "misses": 2, "coalesced": 0}
+
+    async def test_forced_refresh_and_forget_bypass_recent_results(self, tmp_path):
+        api = CountingApi(CardCache(tmp_path / "cards"))
+        await api.get_word_card("popular")
+
+        await api.get_word_card("popular", use_cache=False)
+        assert api.calls[-1] == ("popular", "zh-Hans", True)
+
+        api.forget("word", "popular")
+        api.cache.delete_word_card("popular:zh-Hans")
+        await api.get_word_card("popular")
+        assert len(api.calls) == 2 + 1  # Refetched after forget
+
+    async def test_forget_matches_ids_as_lookups_normalize_them(self, tmp_path):
+        api = CountingApi(CardCache(tmp_path / "cards"))
+        api._recent[("entity", "CUSTOM_AB12", "zh-Hans")] = (float("inf"), None)
+
+        api.forget("entity", " custom_ab12 ")
+        assert api._recent == {}
+
+    async def test_failed_forced_refresh_does_not_hide_the_cached_card(self, tmp_path):
+        api = CountingApi(CardCache(tmp_path / "cards"))
+        await api.get_word_card("popular")
+        api.down = True
+
+        assert await api.get_word_card("popular", use_cache=False) is None
+        assert (await api.get_word_card("popular")).word == "popular"
+
+    async def test_entity_keys_normalize_the_language(self, tmp_path):
+        api = CountingApi(CardCache(tmp_path / "cards"))
+
+        await api.get_entity_card("q42", target_lang="zh-TW")
+        await api.get_entity_card("Q42")
+
+        assert len(api.calls) == 1
+
+    async def test_cancelled_caller_does_not_cancel_the_others(self, tmp_path):
+        api = CountingApi(CardCache(tmp_path / "cards"))
+
+        first = asyncio.create_task(api.get_word_card("popular"))
+        second = asyncio.create_task(api.get_word_card("popular"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert (await second).word == "popular"
+        assert len(api.calls) == 1
@@ -0,0 +1,98 @@
+"""Tests for concurrent pinned-card prefetch."""
+
+import asyncio
+
+from app.models.card import WordCard
+from app.models.timeline import PinnedCard, PinnedCardType
+from app.services.card_cache import CardCache
+from app.workers.card_generator import CardGeneratorWorker
+from app.workers.card_prefetch import load_cards, prefetch_cards, resolve_cards, set_card_generator
+
+
+class SlowApi(CardGeneratorWorker):
+    """Card generator whose API lookups take a while and are counted."""
+
+    def __init__(self, cache):
+        super().__init__(card_cache=cache)
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_word_card(self, word, use_cache=True, target_lang=None):
+        self.calls.append(word)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.02)
+        self.in_flight -= 1
+        if word == "unknown":
+            return None
+        return WordCard(word=word, lemma=word)
+
+
+def _pin(word, card_data=None, card_type=PinnedCardType.WORD):
+    return PinnedCard(
+        card_type=card_type, card_id=word, segment_id=0, timestamp=0.0,
+        display_start=0.0, display_end=5.0, card_data=card_data,
+    )
+
+
+class TestResolveCards:
+    async def test_distinct_keys_fetched_concurrently_once(self, tmp_path):
+        api = SlowApi(CardCache(tmp_path / "cards"))
+        words = [f"word{i}" for i in range(6)]
+
+        resolved = await resolve_cards([("word", w) for w in words + words], api, concurrency=3)
+
+        assert sorted(api.calls) == sorted(words)
+        assert api.max_in_flight == 3
+        assert resolved[("word", "word0")][0]["word"] == "word0"
+        assert resolved[("word", "word0")][1] == "api"
+
+    async def test_cache_hits_skip_the_api(self, tmp_path):
+        cache = CardCache(tmp_path / "cards")
+        cache.set_word_card(WordCard(word="cached", lemma="cached"))
+        api = SlowApi(cache)
+
+        resolved = await resolve_cards([("word", "cached")], api)
+
+        assert api.calls == []
+        assert resolved[("word", "cached")][1] == "cache"
+
+
+    async def test_uses_the_shared_generator_by_default(self, tmp_path, monkeypatch):
+        api = SlowApi(CardCache(tmp_path / "cards"))
+        monkeypatch.setattr("app.workers.card_prefetch._card_generator", None)
+        set_card_generator(api)
+
+        await resolve_cards([("word", "shared")])
+
+        assert api.calls == ["shared"]
+
+
+class TestLoadCards:
+    async def test_fills_card_data_with_embedded_fallback(self, tmp_path):
+        api = SlowApi(CardCache(tmp_path / "cards"))
+        cards = [
+            _pin("hello"),
+            _pin("unknown", card_data={"word": "unknown", "images": []}),
+            _pin("unknown"),
+            _pin("insight-1", card_data={"title": "t"}, card_type=PinnedCardType.INSIGHT),
+        ]
+
+        assert await load_cards(cards, api, images=False) == 3
+        assert cards[0].card_data["word"] == "hello"
+        assert cards[1].card_data == {"word": "unknown", "images": []}
+        assert not cards[2].card_data
+        assert cards[3].card_data == {"title": "t"}
+
+    async def test_export_joins_the_pin_time_prefetch(self, tmp_path):
+        api = SlowApi(CardCache(tmp_path / "cards"))
+        cards = [_pin("shared"), _pin("other")]
+
+        prefetch = asyncio.create_task(prefetch_cards(cards, api))
+        await asyncio.sleep(0)  # The prefetch lookups are now in flight
+        await load_cards(cards, api, images=False)
+        await prefetch
+
+        assert sorted(api.calls) == ["other", "shared"]
+        assert cards[0].card_data["word"] == "shared"
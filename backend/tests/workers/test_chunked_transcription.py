@@ -0,0 +1,171 @@
+"""Tests for parallel chunked transcription."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import app.workers.chunked_transcription as chunked
+from app.workers.chunked_transcription import (
+    parse_silences,
+    plan_chunks,
+    stitch_chunks,
+    transcribe_chunked,
+)
+
+
+def _segment(text, start, end):
+    words = text.split()
+    step = (end - start) / len(words)
+    return SimpleNamespace(
+        start=start,
+        end=end,
+        text=text,
+        words=[
+            SimpleNamespace(start=start + i * step, end=start + (i + 1) * step, word=f" {w}")
+            for i, w in enumerate(words)
+        ],
+    )
+
+
+class TestParseSilences:
+    def test_pairs_start_and_end(self):
+        lines = [
+            "[silencedetect @ 0x1] silence_start: -0.01",
+            "[silencedetect @ 0x1] silence_end: 1.5 | silence_duration: 1.51",
+            "size=N/A time=00:00:10.00 bitrate=N/A",
+            "[silencedetect @ 0x1] silence_start: 60.25",
+            "[silencedetect @ 0x1] silence_end: 61.75 | silence_duration: 1.5",
+            "[silencedetect @ 0x1] silence_start: 119.0",  # trailing, never ends
+        ]
+        assert parse_silences(lines) == [(0.0, 1.5), (60.25, 61.75)]
+
+
+class TestPlanChunks:
+    def test_single_chunk(self):
+        assert plan_chunks([(10, 11)], 100.0, 1) == [(0.0, 100.0)]
+
+    def test_cuts_in_nearest_silence(self):
+        silences = [(40.0, 42.0), (95.0, 97.0), (130.0, 131.0), (205.0, 207.0)]
+        chunks = plan_chunks(silences, 300.0, 3)
+        assert chunks == [(0.0, 96.0), (96.0, 206.0), (206.0, 300.0)]
+
+    def test_cuts_at_split_point_without_silence(self):
+        chunks = plan_chunks([(5.0, 6.0)], 200.0, 2)
+        assert chunks == [(0.0, 100.0), (100.0, 200.0)]
+
+    def test_chunks_cover_duration_in_order(self):
+        silences = [(t, t + 1.0) for t in range(0, 3600, 37)]
+        chunks = plan_chunks(silences, 3600.0, 7)
+        assert len(chunks) == 7
+        assert chunks[0][0] == 0.0 and chunks[-1][1] == 3600.0
+        assert all(a[1] == b[0] and a[0] < a[1] for a, b in zip(chunks, chunks[1:]))
+
+
+class TestStitchChunks:
+    def test_offsets_segments_and_words(self):
+        stitched = stitch_chunks([
+            (0.0, [_segment("one two", 0.0, 1.0)]),
+            (60.0, [_segment("three four", 0.5, 1.5)]),
+        ])
+        assert [seg.start for seg in stitched] == [0.0, 60.5]
+        assert [w.start for w in stitched[1].words] == [60.5, 61.0]
+
+
+class FakeModel:
+    """Shared model that records how many chunks run at once."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+        self.languages = []
+
+    def transcribe(self, audio, language=None, word_timestamps=False, vad_filter=False):
+        start, end = audio
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            self.languages.append(language)
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+        text = f"Chunk starting at {int(start)} seconds."
+        return iter([_segment(text, 1.0, 6.0)]), SimpleNamespace(language="fr")
+
+
+class TestTranscribeChunked:
+    @pytest.fixture(autouse=True)
+    def fake_audio(self, monkeypatch):
+        async def detect_silences(audio_path):
+            return [(299.0, 301.0), (598.0, 602.0), (900.0, 901.0)], 1200.0
+
+        monkeypatch.setattr(chunked, "detect_silences", detect_silences)
+        monkeypatch.setattr(chunked, "_decode_chunk", lambda path, start, end: (start, end))
+
+    async def test_transcribes_chunks_in_parallel(self, tmp_path):
+        model = FakeModel()
+        transcript = await transcribe_chunked(
+            tmp_path / "audio.wav", "en", "small", workers=4, model=model, num_chunks=4
+        )
+
+        assert model.peak > 1
+        assert model.languages == ["en"] * 4
+        assert [seg.text for seg in transcript.segments] == [
+            "Chunk starting at 0 seconds.",
+            "Chunk starting at 300 seconds.",
+            "Chunk starting at 600 seconds.",
+            "Chunk starting at 900 seconds.",
+        ]
+        assert [seg.start for seg in transcript.segments] == pytest.approx(
+            [1.0, 301.0, 601.0, 901.5]
+        )
+
+    async def test_detects_language_on_first_chunk(self, tmp_path):
+        model = FakeModel()
+        transcript = await transcribe_chunked(
+            tmp_path / "audio.wav", None, "small", workers=2, model=model, num_chunks=2
+        )
+
+        assert model.languages == [None, "fr"]
+        assert transcript.language == "fr"
+
+    async def test_short_audio_not_split(self, tmp_path, monkeypatch):
+        async def detect_silences(audio_path):
+            return [], 90.0
+
+        monkeypatch.setattr(chunked, "detect_silences", detect_silences)
+        assert await transcribe_chunked(
+            tmp_path / "audio.wav", "en", "small", workers=4, model=FakeModel()
+        ) is None
+
+
+class TestPools:
+    def test_thread_pools_kept_per_worker_count(self):
+        two = chunked._get_thread_pool(2)
+        three = chunked._get_thread_pool(3)
+        assert three is not two
+        # An earlier size is not shut down while another job may use it
+        assert chunked._get_thread_pool(2) is two
+        assert two.submit(lambda: 1).result() == 1
+
+    def test_process_pools_kept_per_model(self, monkeypatch):
+        created = []
+
+        class FakeProcessPool:
+            def __init__(self, **kwargs):
+                created.append(kwargs)
+
+            def shutdown(self, *args, **kwargs):
+                raise AssertionError("pool in use was shut down")
+
+        monkeypatch.setattr(chunked, "ProcessPoolExecutor", FakeProcessPool)
+        monkeypatch.setattr(chunked, "_process_pools", {})
+
+        small = chunked._get_process_pool("small", 2)
+        large = chunked._get_process_pool("large-v3", 2)
+        assert chunked._get_process_pool("small", 2) is small
+        assert large is not small
+        assert len(created) == 2
+        assert all(c["mp_context"].get_start_method() == "spawn" for c in created)
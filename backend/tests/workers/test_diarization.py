@@ -0,0 +1,96 @@
+"""Tests for speaker assignment in DiarizationWorker."""
+
+import random
+from unittest.mock import patch
+
+from app.config import settings
+from app.models.transcript import Segment, Transcript, Word
+from app.workers.diarization import DiarizationWorker, SpeakerIndex
+
+
+def _brute_force_speaker(start, end, turns):
+    best_speaker, best_overlap = "SPEAKER_0", 0.0
+    for turn in turns:
+        overlap = max(0, min(end, turn["end"]) - max(start, turn["start"]))
+        if overlap > best_overlap:
+            best_overlap, best_speaker = overlap, turn["speaker"]
+    return best_speaker
+
+
+def _turn(start, end, speaker):
+    return {"start": start, "end": end, "speaker": speaker}
+
+
+def _segment(words, start=0.0, step=0.5):
+    timed = [Word(start=start + i * step, end=start + (i + 1) * step - 0.05, word=w)
+             for i, w in enumerate(words)]
+    return Segment(start=timed[0].start, end=timed[-1].end, text=" ".join(words), words=timed)
+
+
+async def _merge(segments, turns, split=True):
+    with patch.object(settings, "diarization_split_segments", split):
+        return await DiarizationWorker().merge_with_transcript(
+            Transcript(language="en", segments=segments), turns
+        )
+
+
+class TestSpeakerIndex:
+    def test_matches_linear_scan(self):
+        rng = random.Random(7)
+        turns = []
+        t = 0.0
+        for _ in range(300):
+            start = t + rng.uniform(-1.0, 2.0)  # overlapping and gapped turns
+            end = start + rng.uniform(0.2, 12.0)
+            turns.append(_turn(start, end, f"SPEAKER_{rng.randrange(4)}"))
+            t = end
+        index = SpeakerIndex(turns)
+
+        for _ in range(2000):
+            start = rng.uniform(-5.0, t + 5.0)
+            end = start + rng.uniform(0.0, 20.0)
+            assert index.speaker_for(start, end) == _brute_force_speaker(start, end, turns)
+
+    def test_nested_turn(self):
+        index = SpeakerIndex([_turn(0, 100, "A"), _turn(10, 12, "B"), _turn(50, 51, "C")])
+        assert index.speaker_for(60, 70) == "A"
+        assert index.speaker_for(10.5, 11.5) == "A"  # tie keeps the earlier turn
+
+    def test_no_overlap_uses_default(self):
+        index = SpeakerIndex([_turn(0, 1, "A")])
+        assert index.speaker_for(5, 6) == "SPEAKER_0"
+        assert index.speaker_for(5, 6, default=None) is None
+        assert SpeakerIndex([]).speaker_for(0, 1) == "SPEAKER_0"
+
+
+class TestMergeWithTranscript:
+    async def test_splits_at_speaker_change(self):
+        segment = _segment(["So", "what", "do", "you", "think?", "I", "think", "so."])
+        turns = [_turn(0.0, 2.4, "A"), _turn(2.4, 5.0, "B")]
+
+        result = await _merge([segment], turns)
+
+        assert [(s.speaker, s.text) for s in result.segments] == [
+            ("A", "So what do you think?"),
+            ("B", "I think so."),
+        ]
+        assert result.segments[0].start == segment.start
+        assert result.segments[1].end == segment.end
+        assert result.num_speakers == 2
+
+    async def test_short_run_does_not_split(self):
+        segment = _segment(["Yes", "I", "agree", "with", "that", "completely."])
+        # One word overlaps another speaker's backchannel
+        turns = [_turn(0.0, 1.5, "A"), _turn(1.5, 1.9, "B"), _turn(1.9, 4.0, "A")]
+
+        result = await _merge([segment], turns)
+
+        assert [(s.speaker, s.text) for s in result.segments] == [("A", segment.text)]
+
+    async def test_split_disabled_or_no_words(self):
+        segment = _segment(["So", "what", "do", "you", "think?", "I", "think", "so."])
+        turns = [_turn(0.0, 1.9, "A"), _turn(1.9, 5.0, "B")]
+        no_words = Segment(start=segment.start, end=segment.end, text=segment.text)
+
+        for result in (await _merge([segment], turns, split=False), await _merge([no_words], turns)):
+            assert [(s.speaker, s.text) for s in result.segments] == [("B", segment.text)]
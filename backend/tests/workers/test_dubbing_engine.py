@@ -0,0 +1,184 @@
+"""Tests for batched XTTS synthesis."""
+
+import threading
+import time
+import wave
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.workers.dubbing_engine import (
+    XTTS_SAMPLE_RATE,
+    DubItem,
+    SpeakerLatentCache,
+    get_synthesis_pool,
+    synthesize_batched,
+)
+from app.workers.voice_clone import VoiceCloneWorker
+
+
+class FakeXtts:
+    """XTTS stand-in: 0.1 s of audio per character at speed 1."""
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.latent_calls = []
+        self.inference_calls = []
+        self.running = 0
+        self.overlapped = False
+        self._lock = threading.Lock()
+
+    def get_conditioning_latents(self, audio_path):
+        if audio_path[0].endswith("broken.wav"):
+            raise RuntimeError("unreadable sample")
+        self.latent_calls.append(audio_path[0])
+        seed = float(len(self.latent_calls))
+        return np.full((1, 4), seed, dtype=np.float32), np.full((1, 8), seed, dtype=np.float32)
+
+    def inference(self, text, language, gpt_cond_latent, speaker_embedding, speed=1.0, **options):
+        with self._lock:
+            self.inference_calls.append((text, speed, options.get("temperature")))
+            self.running += 1
+            self.overlapped |= self.running > 1
+        try:
+            time.sleep(0.001)  # Leaves room for another thread to overlap
+            if text == self.fail_on:
+                raise RuntimeError("synthesis failed")
+            frames = int(len(text) * 0.1 * XTTS_SAMPLE_RATE / speed)
+            return {"wav": np.full(frames, 0.1, dtype=np.float32)}
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+@pytest.fixture
+def samples(tmp_path):
+    paths = {}
+    for speaker in ("A", "B"):
+        path = tmp_path / f"{speaker}.wav"
+        path.write_bytes(f"voice of {speaker}".encode())
+        paths[speaker] = path
+    return paths
+
+
+def _items():
+    return [
+        DubItem(id=i, text="x" * 10, speaker="A" if i % 3 else "B", target_duration=1.0)
+        for i in range(7)
+    ]
+
+
+async def _run(model, items, samples, tmp_path, cache=None, **kwargs):
+    cache = cache or SpeakerLatentCache(tmp_path / "latents", "xtts")
+    return await synthesize_batched(
+        model, items, samples, cache, tmp_path / "out", "zh-cn",
+        workers=kwargs.pop("workers", 2), batch_size=kwargs.pop("batch_size", 2), **kwargs
+    )
+
+
+class TestSynthesizeBatched:
+    async def test_latents_computed_once_per_speaker(self, tmp_path, samples):
+        model = FakeXtts()
+        results = await _run(model, _items(), samples, tmp_path)
+
+        assert [r.id for r in results] == list(range(7))
+        assert all(r.path.exists() and not r.resumed for r in results)
+        assert sorted(model.latent_calls) == [str(samples["A"]), str(samples["B"])]
+
+        # A new cache (e.g. after a restart) loads the latents from disk
+        other = FakeXtts()
+        cache = SpeakerLatentCache(tmp_path / "latents", "xtts")
+        for result in results:
+            result.path.unlink()
+        await _run(other, _items(), samples, tmp_path, cache=cache)
+        assert other.latent_calls == []
+        assert cache.computed == 0
+
+    async def test_speed_fitted_to_target_duration(self, tmp_path, samples):
+        model = FakeXtts()
+        items = [
+            DubItem(id=0, text="x" * 12, speaker="A", target_duration=1.0),  # 1.2 s
+            DubItem(id=1, text="x" * 10, speaker="A", target_duration=1.0),  # fits
+            DubItem(id=2, text="x" * 40, speaker="A", target_duration=1.0),  # capped at 1.5x
+        ]
+        results = await _run(model, items, samples, tmp_path, temperature=0.3)
+
+        assert [round(r.duration, 2) for r in results] == [1.0, 1.0, 2.67]
+        speeds = sorted((text, speed) for text, speed, _ in model.inference_calls if speed != 1.0)
+        assert speeds == [("x" * 12, pytest.approx(1.2)), ("x" * 40, 1.5)]
+        assert {temperature for _, _, temperature in model.inference_calls} == {0.3}
+        with wave.open(str(results[0].path), "rb") as wav:
+            assert wav.getframerate() == XTTS_SAMPLE_RATE
+            assert wav.getnframes() == XTTS_SAMPLE_RATE
+
+    async def test_resume_skips_existing_segments(self, tmp_path, samples):
+        await _run(FakeXtts(), _items(), samples, tmp_path)
+
+        model = FakeXtts()
+        items = _items()
+        items[4].text = "y" * 10
+        results = await _run(model, items, samples, tmp_path)
+
+        assert [r.resumed for r in results] == [i != 4 for i in range(7)]
+        assert [text for text, _, _ in model.inference_calls] == ["y" * 10]
+        assert results[0].duration == pytest.approx(1.0)
+        # The take with the old text is replaced
+        assert len(list((tmp_path / "out").glob("segment_4_*.wav"))) == 1
+
+    async def test_failed_segment_does_not_stop_batch(self, tmp_path, samples):
+        model = FakeXtts(fail_on="bad")
+        items = [
+            DubItem(id=0, text="good", speaker="A"),
+            DubItem(id=1, text="bad", speaker="A"),
+            DubItem(id=2, text="fine", speaker="A"),
+        ]
+        results = await _run(model, items, samples, tmp_path, batch_size=8)
+
+        assert [r.error for r in results] == [None, "synthesis failed", None]
+        assert results[1].path is None
+        assert results[2].path.exists()
+        assert not list((tmp_path / "out").glob("*.tmp"))
+
+    async def test_inference_on_one_model_is_serialized(self, tmp_path, samples):
+        model = FakeXtts()
+        await _run(model, _items(), samples, tmp_path, workers=4, batch_size=1)
+
+        assert len(model.inference_calls) >= 7
+        assert not model.overlapped
+
+    async def test_unreadable_sample_fails_only_its_speaker(self, tmp_path, samples):
+        samples["B"] = tmp_path / "broken.wav"
+        samples["B"].write_bytes(b"")
+
+        results = await _run(FakeXtts(), _items(), samples, tmp_path)
+
+        assert [r.error for r in results if r.error] == ["unreadable sample"] * 3  # ids 0, 3, 6
+        assert all(r.path.exists() for r in results if not r.error)
+
+    def test_pools_are_not_shut_down_when_another_size_is_asked_for(self):
+        pool = get_synthesis_pool(3)
+        get_synthesis_pool(5)
+
+        assert pool.submit(lambda: 1).result() == 1
+
+
+class TestDubSegments:
+    async def test_maps_results_onto_segments(self, tmp_path, samples, monkeypatch):
+        monkeypatch.setattr("app.config.settings.models_cache_dir", tmp_path / "models")
+        worker = VoiceCloneWorker(device="cpu", workers=2, batch_size=2)
+        worker.tts = SimpleNamespace(synthesizer=SimpleNamespace(tts_model=FakeXtts()))
+        segments = [
+            {"id": 1, "speaker": "A", "start": 0.0, "end": 1.0, "zh": "x" * 10},
+            {"id": 2, "speaker": "C", "start": 1.0, "end": 2.0, "zh": "x" * 10},
+            {"id": 3, "speaker": "B", "start": 2.0, "end": 3.0, "zh": " "},
+            {"id": 4, "speaker": "B", "start": 3.0, "end": 4.0, "zh": "x" * 10},
+        ]
+
+        results = await worker.dub_segments(segments, samples, tmp_path / "dubbed")
+
+        assert [r["id"] for r in results] == [1, 2, 3, 4]
+        assert [r["dubbed_path"] is not None for r in results] == [True, False, False, True]
+        assert results[0]["dubbed_duration"] == pytest.approx(1.0)
+        assert results[3]["resumed"] is False
+        assert (tmp_path / "models" / "xtts_latents").is_dir()
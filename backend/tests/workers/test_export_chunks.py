@@ -0,0 +1,296 @@
+"""Tests for incremental (chunked) re-export."""
+
+from fractions import Fraction
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from app.models.timeline import EditableSegment, SegmentState, SubtitleStyleMode, Timeline
+from app.workers import export as export_module
+from app.workers.export import ExportWorker
+from app.workers.export_chunks import (
+    chunk_frame_ranges,
+    frame_ranges,
+    map_output_frames,
+    plan_chunks,
+    select_filter,
+    shift_cards,
+    slice_ass,
+)
+
+ASS = """[Script Info]
+PlayResX: 1920
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Dialogue: 0,0:00:05.00,0:00:08.00,English,,0,0,0,,first
+Dialogue: 0,0:00:58.50,0:01:02.00,English,,0,0,0,,across, the boundary
+Dialogue: 0,0:01:30.00,0:01:31.00,English,,0,0,0,,second
+"""
+
+
+class TestPlanning:
+    def test_chunks_are_frame_aligned(self):
+        fps = Fraction(30000, 1001)
+        plan = plan_chunks(150.0, fps, 60.0)
+
+        assert [c.frames for c in plan] == [1798, 1798, 900]
+        assert sum(c.frames for c in plan) == round(150 * fps)
+        assert plan[1].start == pytest.approx(1798 / fps)
+        assert plan[1].end == plan[2].start
+
+    def test_slice_ass_shifts_and_clips_events(self):
+        chunk = slice_ass(ASS, 60.0, 120.0)
+
+        assert "[Script Info]" in chunk and "Format: Layer" in chunk
+        events = [line for line in chunk.splitlines() if line.startswith("Dialogue:")]
+        assert events == [
+            "Dialogue: 0,0:00:00.00,0:00:02.00,English,,0,0,0,,across, the boundary",
+            "Dialogue: 0,0:00:30.00,0:00:31.00,English,,0,0,0,,second",
+        ]
+
+    def test_shift_cards_keeps_visible_cards(self):
+        cards = [("a.png", 10.0, 20.0, "right"), ("b.png", 59.9, 70.0, "left"), ("c.png", 130.0, 140.0, "right")]
+
+        assert shift_cards(cards, 60.0, 120.0) == [("b.png", pytest.approx(-0.1), 10.0, "left")]
+
+    def test_essence_ranges_snap_merge_and_split_by_chunk(self):
+        fps = Fraction(25)
+        ranges = frame_ranges([(50.0, 70.02), (70.0, 75.0), (10.0, 12.0), (30.0, 30.01)], fps)
+
+        assert ranges == [(250, 300), (1250, 1875)]
+        chunk = plan_chunks(200.0, fps, 60.0)[1]
+        assert chunk_frame_ranges(ranges, chunk) == [(0, 375)]
+        assert chunk_frame_ranges(ranges, plan_chunks(200.0, fps, 60.0)[0]) == [(250, 300), (1250, 1500)]
+        assert map_output_frames([(100, 200), (500, 900)], 50, 100) == [(150, 200), (500, 550)]
+        assert select_filter([(250, 300)], fps) == (
+            "select='gte(t,9.980000)*lt(t,11.980000)',setpts=N*1/25/TB"
+        )
+
+
+class FakeFfmpeg:
+    """Records ffmpeg invocations and writes their output files."""
+
+    def __init__(self):
+        self.encoded = []
+        self.commands = []
+        self.others = []
+        self.keyframes = [0.0, 2.0, 4.0]
+
+    async def __call__(self, cmd, **kwargs):
+        cmd = [str(arg) for arg in cmd]
+        if cmd[0] == "ffprobe":
+            stream = cmd[cmd.index("-show_entries") + 1]
+            if stream.startswith("packet"):
+                stdout = "\n".join(f"{t},K_" for t in self.keyframes) + "\n0.04,__"
+                return SimpleNamespace(returncode=0, stdout=stdout, stderr="")
+            stdout = "25/1" if "r_frame_rate" in stream else "1"
+            return SimpleNamespace(returncode=0, stdout=stdout, stderr="")
+        if "-frames:v" in cmd:
+            self.encoded.append(float(cmd[cmd.index("-ss") + 1]))
+            self.commands.append(cmd)
+        else:
+            self.others.append(cmd)
+        for i, arg in enumerate(cmd[:-1]):
+            if arg == "-y":  # Every output file, as with split outputs
+                Path(cmd[i + 1]).write_bytes(b"media")
+        return SimpleNamespace(returncode=0, stdout="", stderr="")
+
+
+@pytest.fixture
+def ffmpeg(monkeypatch):
+    fake = FakeFfmpeg()
+    monkeypatch.setattr(export_module, "run_process", fake)
+    monkeypatch.setattr("app.config.settings.export_chunk_seconds", 60.0)
+    return fake
+
+
+def _filter(cards, ass_path, duration):
+    inputs = []
+    for card in cards:
+        inputs.extend(["-i", str(card[0])])
+    times = ",".join(f"{c[1]}-{c[2]}" for c in cards)
+    return f"[0:v]ass={ass_path},cards={times}[out]", inputs, "out"
+
+
+async def _export(tmp_path, ass_text, cards, source_offset=0.0, essence=None, regions=None):
+    video = tmp_path / "source.mp4"
+    if not video.exists():
+        video.write_bytes(b"source")
+    ass_path = tmp_path / "subs.ass"
+    ass_path.write_text(ass_text)
+    output = tmp_path / "out" / "full_subtitled.mp4"
+    output.parent.mkdir(exist_ok=True)
+    await ExportWorker()._encode_chunked(
+        video, output, 200.0, _filter, cards, ass_path, source_offset=source_offset, essence=essence,
+        regions=regions,
+    )
+    return output
+
+
+class TestEncodeChunked:
+    async def test_reexport_encodes_only_dirty_chunks(self, tmp_path, ffmpeg):
+        card = tmp_path / "card.png"
+        card.write_bytes(b"card v1")
+        cards = [(card, 130.0, 140.0, "right")]
+
+        output = await _export(tmp_path, ASS, cards)
+        assert output.exists()
+        assert ffmpeg.encoded == [0.0, 60.0, 120.0, 180.0]
+
+        # Edit the subtitle at 1:30 → only the second chunk changes
+        ffmpeg.encoded.clear()
+        await _export(tmp_path, ASS.replace(",second", ",second, edited"), cards)
+        assert ffmpeg.encoded == [60.0]
+
+        # Re-rendered card image → only the chunk showing it
+        ffmpeg.encoded.clear()
+        card.write_bytes(b"card v2")
+        await _export(tmp_path, ASS.replace(",second", ",second, edited"), cards)
+        assert ffmpeg.encoded == [120.0]
+
+        chunk_dir = tmp_path / "out" / "full_subtitled_chunks"
+        assert len(list(chunk_dir.glob("chunk_*.mp4"))) == 4  # replaced chunks removed
+        assert (chunk_dir / "manifest.json").exists()
+
+    async def test_source_offset_changes_every_chunk(self, tmp_path, ffmpeg):
+        await _export(tmp_path, ASS, [])
+        ffmpeg.encoded.clear()
+
+        await _export(tmp_path, ASS, [], source_offset=10.0)
+
+        assert ffmpeg.encoded == [10.0, 70.0, 130.0, 190.0]
+
+    async def test_essence_shares_the_chunk_decode(self, tmp_path, ffmpeg):
+        essence_path = tmp_path / "out" / "essence.mp4"
+        essence = (essence_path, [(10.0, 12.0), (100.0, 130.0)])
+
+        await _export(tmp_path, ASS, [], essence=essence)
+
+        assert essence_path.exists()
+        assert ffmpeg.encoded == [0.0, 60.0, 120.0, 180.0]  # One decode per chunk
+        outputs = [sum(arg == "-y" for arg in cmd) for cmd in ffmpeg.commands]
+        assert outputs == [2, 2, 2, 1]  # The last chunk has no essence frames
+        assert "split=2[chunk_out][essence_in]" in ffmpeg.commands[1][ffmpeg.commands[1].index("-filter_complex") + 1]
+        chunk_dir = tmp_path / "out" / "full_subtitled_chunks"
+        assert len(list(chunk_dir.glob("essence_*.mp4"))) == 3
+
+        # Unchanged inputs: both outputs reused; new essence ranges re-encode
+        # only the chunks whose essence parts changed
+        ffmpeg.encoded.clear()
+        await _export(tmp_path, ASS, [], essence=essence)
+        assert ffmpeg.encoded == []
+        await _export(tmp_path, ASS, [], essence=(essence_path, [(10.0, 12.0), (100.0, 110.0)]))
+        assert ffmpeg.encoded == [60.0]  # Chunk 120-180 s no longer has essence frames
+        assert len(list(chunk_dir.glob("essence_*.mp4"))) == 2
+
+    async def test_exclusions_cut_inside_each_chunk(self, tmp_path, ffmpeg):
+        # 0-50 s and 70-240 s kept: 220 s of output
+        await _export(tmp_path, ASS, [], regions=[(0.0, 50.0), (70.0, 240.0)])
+
+        assert ffmpeg.encoded == [0.0, 80.0, 140.0, 200.0]  # Output 60 s is source 80 s
+        first = ffmpeg.commands[0]
+        graph = first[first.index("-filter_complex") + 1]
+        assert graph.startswith("[0:v]select='gte(t,-0.020000)*lt(t,49.980000)+gte(t,69.980000)*lt(t,79.980000)'")
+        assert "[cut]ass=" in graph
+        assert first[first.index("-t") + 1] == "80.080000"
+        assert "-frames:v" in first and first[first.index("-frames:v") + 1] == "1500"
+        audio = next(cmd for cmd in ffmpeg.others if "-c:a" in cmd)
+        assert audio.count("-i") == 1
+        assert audio[audio.index("-t") + 1] == "240.000000"
+        assert "aselect='gte(t,0.000000)*lt(t,50.000000)+gte(t,70.000000)*lt(t,240.000000)'" in (
+            audio[audio.index("-filter_complex") + 1]
+        )
+
+
+def _essence_timeline(count):
+    # A 2 s segment every 4 s, every other one kept, starting off the frame grid
+    segments = [
+        EditableSegment(
+            id=i, start=i * 4.0 + 0.013, end=i * 4.0 + 2.013, en=f"s{i}", zh=f"s{i}",
+            state=SegmentState.KEEP if i % 2 == 0 else SegmentState.DROP,
+        )
+        for i in range(count)
+    ]
+    return Timeline(
+        job_id="job", source_url="u", source_title="t", source_duration=count * 4.0,
+        segments=segments, subtitle_style_mode=SubtitleStyleMode.NONE,
+    )
+
+
+class TestExportEssence:
+    async def test_single_pass_cuts_every_segment_in_one_graph(self, tmp_path, ffmpeg, monkeypatch):
+        monkeypatch.setattr("app.config.settings.export_chunk_seconds", 0.0)
+        video = tmp_path / "source.mp4"
+        video.write_bytes(b"source")
+
+        await ExportWorker().export_essence(_essence_timeline(600), video, tmp_path / "essence.mp4")
+
+        assert len(ffmpeg.others) == 1  # No per-segment clips, no concat
+        cmd = ffmpeg.others[0]
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        assert graph.count("gte(t,") == 2 * 300  # Video select and audio aselect
+        assert graph.startswith("[0:v]select='gte(t,-0.020000)*lt(t,1.980000)+gte(t,7.980000)")
+        assert "[cut]setsar=1[vout]" in graph
+
+    async def test_chunked_encodes_each_chunk_once(self, tmp_path, ffmpeg):
+        video = tmp_path / "source.mp4"
+        video.write_bytes(b"source")
+
+        await ExportWorker().export_essence(_essence_timeline(600), video, tmp_path / "essence.mp4")
+
+        # 300 x 2 s kept: 600 s of output in 60 s chunks
+        assert len(ffmpeg.encoded) == 10
+        assert ffmpeg.encoded[1] == 240.0  # Output 60 s starts at kept segment 30 (source 240 s)
+        assert (tmp_path / "essence.mp4").exists()
+        # The audio of all 300 cuts comes from one opening of the source
+        audio = next(cmd for cmd in ffmpeg.others if "-c:a" in cmd)
+        assert audio.count("-i") == 1
+        assert audio[audio.index("-ss") + 1] == "0.000000"
+        assert audio[audio.index("-filter_complex") + 1].count("gte(t,") == 300
+
+    def test_subtitles_follow_the_frame_snapped_cuts(self):
+        worker = ExportWorker()
+        keep = [seg for seg in _essence_timeline(6).segments if seg.state == SegmentState.KEEP]
+
+        regions = worker._essence_regions(keep, Fraction(25))
+        retimed = worker._retime_segments_for_regions(keep, regions, tolerance=0.02)
+
+        assert regions == [(0.0, 2.0), (8.0, 10.0), (16.0, 18.0)]
+        # Start 13 ms into each cut; the end is clamped to the cut
+        assert [(start, end) for start, end, _, _ in retimed] == [
+            (0.013, 2.0), (pytest.approx(2.013), 4.0), (pytest.approx(4.013), 6.0)
+        ]
+
+
+class TestCombinedEssence:
+    def _timeline(self, exclusions):
+        segments = [
+            EditableSegment(id=0, start=5.0, end=8.0, en="a", zh="a", state=SegmentState.KEEP),
+            EditableSegment(id=1, start=20.0, end=24.0, en="b", zh="b", state=SegmentState.DROP),
+            EditableSegment(id=2, start=40.0, end=45.0, en="c", zh="c", state=SegmentState.KEEP, trim_start=1.0),
+        ]
+        return Timeline(
+            job_id="job", source_url="u", source_title="t", source_duration=60.0,
+            segments=segments, video_exclusion_ranges=exclusions,
+        )
+
+    def test_maps_keep_segments_into_output_time(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("app.config.settings.export_chunk_seconds", 60.0)
+        worker = ExportWorker()
+        timeline = self._timeline([[10.0, 30.0]])
+        path = tmp_path / "essence.mp4"
+
+        combined = worker._combined_essence(path, timeline, [(0.0, 10.0), (30.0, 60.0)])
+
+        assert combined == (path, [(5.0, 8.0), (21.0, 25.0)])
+        assert worker._combined_essence(None, timeline, [(0.0, 60.0)]) is None
+
+    def test_segment_across_a_cut_falls_back(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("app.config.settings.export_chunk_seconds", 60.0)
+        timeline = self._timeline([[7.0, 7.5]])  # Less than half of segment 0
+
+        assert ExportWorker()._combined_essence(
+            tmp_path / "essence.mp4", timeline, [(0.0, 7.0), (7.5, 60.0)]
+        ) is None
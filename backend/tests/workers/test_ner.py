@@ -0,0 +1,60 @@
+"""Tests for batched, cached timeline NER."""
+
+from app.models.timeline import EditableSegment, Timeline
+from app.workers.ner import NERWorker
+
+
+class CountingNER(NERWorker):
+    """Rule-based NER worker that records the texts it parses."""
+
+    def __init__(self):
+        super().__init__(use_spacy=False)
+        self.parsed = []
+
+    def _extract_vocabulary(self, text, doc=None):
+        self.parsed.append(text)
+        return super()._extract_vocabulary(text, doc)
+
+
+def _timeline(texts):
+    segments = [
+        EditableSegment(id=i, start=i * 2.0, end=i * 2.0 + 1.5, en=text, zh="")
+        for i, text in enumerate(texts)
+    ]
+    return Timeline(job_id="job", source_url="u", source_title="t", source_duration=60.0, segments=segments)
+
+
+class TestTimelineAnnotations:
+    def test_unchanged_timeline_is_a_cache_read(self):
+        worker = CountingNER()
+        timeline = _timeline(["We visited London yesterday.", "Remarkable architecture.", "Remarkable architecture."])
+
+        first = worker.process_timeline(timeline)
+
+        assert worker.parsed == ["We visited London yesterday.", "Remarkable architecture."]  # Repeats parsed once
+        assert [w.lemma for w in first.segments[1].words] == ["remarkable", "architecture"]
+        assert first.segments[2].words == first.segments[1].words
+        assert worker.process_timeline(timeline) is first
+        assert len(worker.parsed) == 2
+
+    def test_editing_a_segment_reparses_only_that_segment(self):
+        worker = CountingNER()
+        timeline = _timeline(["We visited London yesterday.", "Remarkable architecture."])
+        worker.process_timeline(timeline)
+        worker.parsed.clear()
+
+        timeline.segments[1].en = "Impressive cathedrals everywhere."
+        annotations = worker.process_timeline(timeline)
+
+        assert worker.parsed == ["Impressive cathedrals everywhere."]
+        assert "cathedrals" in annotations.unique_words
+        assert "architecture" not in annotations.unique_words
+
+    async def test_annotate_timeline_runs_off_the_event_loop(self):
+        worker = CountingNER()
+        timeline = _timeline(["Brilliant sunshine today."])
+
+        annotations = await worker.annotate_timeline(timeline, vocabulary_limit=1)
+
+        assert annotations.unique_words == ["brilliant"]
+        assert annotations.model_used == "rule_based"
@@ -0,0 +1,203 @@
+"""Tests for the job processing pipeline."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.config import settings
+from app.models.job import Job, JobStatus
+from app.models.transcript import (
+    DiarizedSegment,
+    DiarizedTranscript,
+    Segment,
+    Transcript,
+    TranslatedSegment,
+    TranslatedTranscript,
+)
+from app.workers.processor import process_job
+
+STAGE_SECONDS = 0.2
+
+
+SEGMENTS = [Segment(start=0, end=2, text="Um, hi."), Segment(start=2, end=4, text="Bye.")]
+
+
+class FakeStream:
+    def __init__(self):
+        self.segments = []
+
+    async def __aiter__(self):
+        for segment in SEGMENTS:
+            await asyncio.sleep(STAGE_SECONDS / len(SEGMENTS))
+            self.segments.append(segment)
+            yield segment
+
+    def transcript(self):
+        return Transcript(language="en", segments=self.segments)
+
+
+class FakeWhisper:
+    async def transcribe(self, audio_path, language=None, model_name=None):
+        await asyncio.sleep(STAGE_SECONDS)
+        return Transcript(language="en", segments=list(SEGMENTS))
+
+    def transcribe_stream(self, audio_path, language=None, model_name=None,
+                          checkpoint_path=None):
+        return FakeStream()
+
+    async def save_transcript(self, transcript, path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(transcript.model_dump_json())
+
+
+class FakeDiarization:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+
+    async def diarize(self, audio_path):
+        await asyncio.sleep(STAGE_SECONDS / 2)
+        if self.fail:
+            raise RuntimeError("diarization failed")
+        return [{"start": 0, "end": 2, "speaker": "SPEAKER_1"}]
+
+    async def merge_with_transcript(self, transcript, diarization_segments):
+        return DiarizedTranscript(
+            language=transcript.language,
+            num_speakers=1,
+            segments=[
+                DiarizedSegment(**seg.model_dump(), speaker=diarization_segments[0]["speaker"])
+                for seg in transcript.segments
+            ],
+        )
+
+    async def save_diarized_transcript(self, transcript, path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(transcript.model_dump_json())
+
+
+class FakeDefluff:
+    calls = []
+
+    async def clean_transcript(self, transcript):
+        FakeDefluff.calls.append("clean_transcript")
+        return transcript
+
+    async def clean_texts(self, texts):
+        FakeDefluff.calls.append("clean_texts")
+        return [text.replace("Um, h", "H") for text in texts]
+
+
+async def _translate(transcript, target_language, job=None):
+    return TranslatedTranscript(
+        source_language=transcript.language,
+        target_language=target_language,
+        num_speakers=transcript.num_speakers,
+        segments=[
+            TranslatedSegment(**seg.model_dump(), translation=f"zh:{seg.text}")
+            for seg in transcript.segments
+        ],
+    )
+
+
+@pytest.fixture
+def job(tmp_path):
+    job = Job(url="https://example.com/video")
+    audio = tmp_path / "audio.wav"
+    audio.write_bytes(b"")
+    return job
+
+
+@pytest.fixture
+def job_manager(job):
+    manager = MagicMock()
+    manager.get_job.return_value = job
+    manager.update_status = AsyncMock()
+    manager.handle_error = AsyncMock(return_value=False)
+    return manager
+
+
+async def _run(job, job_manager, tmp_path, diarization, streaming=False):
+    download = MagicMock()
+    download.download = AsyncMock(return_value={
+        "video_path": str(tmp_path / "video.mp4"),
+        "audio_path": str(tmp_path / "audio.wav"),
+        "title": "Video",
+        "duration": 2.0,
+        "channel": "Channel",
+    })
+    translation = MagicMock()
+    translation.translate_transcript = AsyncMock(side_effect=_translate)
+    translation.save_translation = AsyncMock()
+    FakeDefluff.calls = []
+    timeline_manager = MagicMock()
+    timeline_manager.create_from_transcript.return_value = MagicMock(
+        timeline_id="tl1", segments=[]
+    )
+
+    with patch.object(settings, "jobs_dir", tmp_path / "jobs"), \
+            patch.object(settings, "whisper_device", "cuda"), \
+            patch.object(settings, "diarization_device", "cuda"), \
+            patch.object(settings, "parallel_diarization", True), \
+            patch.object(settings, "whisper_streaming", streaming), \
+            patch("app.workers.defluff.DefluffWorker", FakeDefluff):
+        await process_job(
+            job_id=job.id,
+            job_manager=job_manager,
+            job_queue=MagicMock(add=AsyncMock()),
+            timeline_manager=timeline_manager,
+            download_worker=download,
+            whisper_worker=FakeWhisper(),
+            diarization_worker=diarization,
+            translation_worker=translation,
+        )
+    return translation
+
+
+class TestConcurrentDiarization:
+    """Transcription and diarization overlap."""
+
+    async def test_diarization_runs_during_transcription(self, job, job_manager, tmp_path):
+        await _run(job, job_manager, tmp_path, FakeDiarization())
+
+        transcribe = job.step_timings["transcribe"]
+        diarize = job.step_timings["diarize"]
+        assert datetime.fromisoformat(diarize["started_at"]) < datetime.fromisoformat(
+            transcribe["ended_at"]
+        )
+        # Diarization time is hidden behind transcription
+        overlap_total = transcribe["duration_seconds"] + diarize["duration_seconds"]
+        assert job.total_processing_seconds < overlap_total
+
+        diarized = DiarizedTranscript.model_validate_json(
+            (tmp_path / "jobs" / job.id / "transcript" / "diarized.json").read_text()
+        )
+        assert diarized.segments[0].speaker == "SPEAKER_1"
+        job_manager.update_status.assert_any_await(job, JobStatus.AWAITING_REVIEW, 0.80)
+
+    async def test_diarization_failure_fails_job(self, job, job_manager, tmp_path):
+        await _run(job, job_manager, tmp_path, FakeDiarization(fail=True))
+
+        job_manager.handle_error.assert_awaited_once()
+        assert not (tmp_path / "jobs" / job.id / "transcript" / "raw.json").exists()
+
+
+class TestStreamingTranscription:
+    """Cleanup and translation start on streamed sentences."""
+
+    async def test_streamed_text_reused_after_speaker_merge(self, job, job_manager, tmp_path):
+        translation = await _run(job, job_manager, tmp_path, FakeDiarization(), streaming=True)
+
+        # Only the early batch went to the LLM; the stages reused its results
+        assert FakeDefluff.calls == ["clean_texts"]
+        translation.translate_transcript.assert_awaited_once()
+        translated = translation.save_translation.await_args.args[0]
+        assert [seg.text for seg in translated.segments] == ["Hi.", "Bye."]
+        assert [seg.translation for seg in translated.segments] == ["zh:Hi.", "zh:Bye."]
+        assert {seg.speaker for seg in translated.segments} == {"SPEAKER_1"}
+
+        transcript_dir = tmp_path / "jobs" / job.id / "transcript"
+        assert (transcript_dir / "raw.json").exists()
+        assert not (transcript_dir / "raw.partial.json").exists()
+        job_manager.update_status.assert_any_await(job, JobStatus.AWAITING_REVIEW, 0.80)
@@ -18,6 +18,7 @@ from app.workers.resegment import (
     _split_long_segment,
     _Word,
     _WordGroup,
+    StreamingResegmenter,
     resegment_words,
 )
 
@@ -575,3 +576,46 @@ class TestResegmentWords:
         result = resegment_words([seg])
         assert len(result) == 1
         assert "U.S." in result[0].text
+
+
+# ---------------------------------------------------------------------------
+# Tests: StreamingResegmenter
+# ---------------------------------------------------------------------------
+
+class TestStreamingResegmenter:
+    def _stream(self, segments):
+        resegmenter = StreamingResegmenter()
+        emitted = []
+        for seg in segments:
+            emitted.append(resegmenter.feed(seg))
+        return emitted, resegmenter.finish()
+
+    def test_matches_batch_resegmentation(self):
+        segments = [
+            _make_segment(["I", "like", "cats.", "She"], start=0.0, gap=0.5),
+            _make_segment(["likes", "dogs.", "Yes."], start=3.0, gap=0.5),
+            MockSegment(start=5.0, end=6.0, text="no words here", words=None),
+            _make_segment(["The", "U.S.", "is", "large,", "and", "so", "is", "Canada."],
+                          start=6.5, gap=0.5),
+        ]
+        emitted, rest = self._stream(segments)
+        streamed = [seg for batch in emitted for seg in batch] + rest
+        assert streamed == resegment_words(segments)
+
+    def test_emits_sentences_before_finish(self):
+        segments = [
+            _make_segment(["I", "like", "cats."], start=0.0, gap=0.5),
+            _make_segment(["She", "likes", "dogs."], start=2.0, gap=0.5),
+            _make_segment(["We", "like", "birds."], start=4.0, gap=0.5),
+        ]
+        emitted, rest = self._stream(segments)
+        assert emitted[0] == []  # may still absorb a short next sentence
+        assert [seg.text for seg in emitted[1]] == ["I like cats."]
+        assert [seg.text for seg in emitted[2]] == ["She likes dogs."]
+        assert [seg.text for seg in rest] == ["We like birds."]
+
+    def test_fallback_without_word_data(self):
+        segments = [MockSegment(start=0.0, end=2.0, text="Hello  >>world", words=None)]
+        emitted, rest = self._stream(segments)
+        assert emitted == [[]]
+        assert rest == resegment_words(segments)
@@ -0,0 +1,99 @@
+"""Tests for reusing rendered export stills across exports."""
+
+import os
+
+import pytest
+
+from app.models.timeline import EditableSegment, SubtitleLanguageMode
+from app.workers.export import ExportWorker
+from app.workers.still_cache import StillCache, cache_rendered_stills, stills_to_render
+
+
+STYLE = {"enColor": "#ffffff", "zhColor": "#facc15", "enFontSize": 58, "zhFontSize": 58}
+
+
+@pytest.fixture
+def frontend(tmp_path, monkeypatch):
+    frontend = tmp_path / "frontend"
+    (frontend / "remotion").mkdir(parents=True)
+    (frontend / "remotion" / "renderStills.mjs").write_text("// v1")
+    monkeypatch.setattr("app.config.settings.frontend_dir", frontend)
+    return frontend
+
+
+def _export(tmp_path, texts, out_dir, style=STYLE):
+    """One export's subtitle stills; returns the ids sent to the renderer."""
+    worker = ExportWorker()
+    segments = [
+        EditableSegment(id=i, start=i * 2.0, end=i * 2.0 + 1.5, en=en, zh=f"{en} zh")
+        for i, en in enumerate(texts)
+    ]
+    subtitles, _ = worker._build_subtitle_stills_input(
+        segments, 0.0, None, SubtitleLanguageMode.BOTH, use_traditional=False
+    )
+    data = {"style": style, "bgColor": "#1a2744", "languageMode": "both", "subtitles": subtitles}
+    keys = worker._still_cache_keys([], data, 672, 723)
+
+    cache = StillCache(tmp_path / "cache", max_mb=64)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    pending = stills_to_render(cache, subtitles, keys, out_dir)
+    for entry in pending:  # Stand-in for Remotion
+        (out_dir / f"{entry['id']}.png").write_bytes(entry["en"].encode() * 100)
+    cache_rendered_stills(cache, [entry["id"] for entry in pending], keys, out_dir)
+    assert all((out_dir / f"{entry['id']}.png").exists() for entry in subtitles)
+    return [entry["en"] for entry in pending]
+
+
+class TestExportStills:
+    def test_reexport_renders_only_edited_segment(self, tmp_path, frontend):
+        texts = ["one", "two", "three", "one"]
+        assert _export(tmp_path, texts, tmp_path / "a") == ["one", "two", "three"]
+
+        texts[1] = "two, edited"
+        assert _export(tmp_path, texts, tmp_path / "b") == ["two, edited"]
+        assert _export(tmp_path, texts, tmp_path / "b") == []
+
+    def test_stale_png_not_reused(self, tmp_path, frontend):
+        _export(tmp_path, ["one"], tmp_path / "a")
+        stale = next((tmp_path / "a").glob("sub_*.png"))
+        for path in (tmp_path / "cache").glob("*/*.png"):
+            path.unlink()
+
+        worker = ExportWorker()
+        subtitles, _ = worker._build_subtitle_stills_input(
+            [EditableSegment(id=0, start=0, end=1, en="one", zh="one zh")],
+            0.0, None, SubtitleLanguageMode.BOTH, use_traditional=False,
+        )
+        data = {"style": STYLE, "bgColor": "#1a2744", "languageMode": "both", "subtitles": subtitles}
+        keys = worker._still_cache_keys([], data, 672, 723)
+        cache = StillCache(tmp_path / "cache", max_mb=64)
+        assert stills_to_render(cache, subtitles, keys, tmp_path / "a") == subtitles
+        assert not stale.exists()
+
+    def test_style_and_renderer_changes_invalidate(self, tmp_path, frontend):
+        texts = ["one", "two"]
+        _export(tmp_path, texts, tmp_path / "out")
+        assert len(_export(tmp_path, texts, tmp_path / "out", {**STYLE, "enColor": "#ff0000"})) == 2
+
+        (frontend / "remotion" / "renderStills.mjs").write_text("// v2, new layout")
+        assert len(_export(tmp_path, texts, tmp_path / "out")) == 2
+
+
+class TestStillCache:
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = StillCache(tmp_path / "cache", max_mb=1)
+        src = tmp_path / "still.png"
+        src.write_bytes(b"x" * 400 * 1024)
+        keys = [StillCache.key("subtitle", {"en": str(i)}, 1920, 356, "r") for i in range(3)]
+        for age, key in enumerate(keys):
+            cache.store(key, src)
+            path = cache._path(key)
+            os.utime(path, (1000 + age, 1000 + age))
+        # Using the oldest still makes the second one the least recently used
+        assert cache.fetch(keys[0], tmp_path / "used.png")
+        cache.store(StillCache.key("subtitle", {"en": "new"}, 1920, 356, "r"), src)
+
+        assert cache.evict() == 2
+        assert cache.fetch(keys[0], tmp_path / "again.png")
+        assert not cache.fetch(keys[1], tmp_path / "gone.png")
+        assert not cache.fetch(keys[2], tmp_path / "gone.png")
@@ -0,0 +1,106 @@
+"""Tests for cleanup and translation during streaming transcription."""
+
+from app.models.transcript import (
+    DiarizedSegment,
+    DiarizedTranscript,
+    Segment,
+    TranslatedSegment,
+    TranslatedTranscript,
+)
+from app.workers.streaming_text import StreamingTextPipeline
+
+
+class FakeDefluff:
+    def __init__(self):
+        self.calls = []
+
+    async def clean_texts(self, texts):
+        self.calls.append(list(texts))
+        return [text.replace("um ", "") for text in texts]
+
+
+class FakeTranslation:
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    async def translate_transcript(self, transcript, target_language, job=None):
+        self.calls.append([seg.text for seg in transcript.segments])
+        if self.fail:
+            raise RuntimeError("LLM unavailable")
+        return TranslatedTranscript(
+            source_language=transcript.language,
+            target_language=target_language,
+            num_speakers=transcript.num_speakers,
+            segments=[
+                TranslatedSegment(**seg.model_dump(), translation=f"zh:{seg.text}")
+                for seg in transcript.segments
+            ],
+        )
+
+
+SEGMENTS = [
+    Segment(start=0, end=2, text="um Hello there."),
+    Segment(start=2, end=5, text="um What do you think? I agree."),
+    Segment(start=5, end=7, text="Goodbye."),
+]
+
+
+def _diarized(segments):
+    return DiarizedTranscript(
+        language="en",
+        num_speakers=2,
+        segments=[DiarizedSegment(**seg.model_dump(), speaker="A") for seg in segments],
+    )
+
+
+async def _stream(defluff, translation, batch_size=2):
+    pipeline = StreamingTextPipeline(defluff, translation, "zh-TW", batch_size=batch_size)
+    for segment in SEGMENTS:
+        pipeline.add(segment)
+    await pipeline.finish()
+    return pipeline
+
+
+class TestStreamingTextPipeline:
+    async def test_reuses_streamed_results(self):
+        defluff, translation = FakeDefluff(), FakeTranslation()
+        pipeline = await _stream(defluff, translation)
+        assert len(defluff.calls) == len(translation.calls) == 2  # batches of 2 + 1
+
+        cleaned = await pipeline.clean(_diarized(SEGMENTS))
+        translated = await pipeline.translate(cleaned)
+
+        assert len(defluff.calls) == len(translation.calls) == 2
+        assert [seg.text for seg in cleaned.segments] == [
+            "Hello there.", "What do you think? I agree.", "Goodbye.",
+        ]
+        assert translated.segments[1].translation == "zh:What do you think? I agree."
+
+    async def test_redoes_only_split_segments(self):
+        defluff, translation = FakeDefluff(), FakeTranslation()
+        pipeline = await _stream(defluff, translation)
+        split = [
+            SEGMENTS[0],
+            Segment(start=2, end=3.5, text="um What do you think?"),
+            Segment(start=3.5, end=5, text="I agree."),
+            SEGMENTS[2],
+        ]
+
+        translated = await pipeline.translate(await pipeline.clean(_diarized(split)))
+
+        assert defluff.calls[-1] == ["um What do you think?", "I agree."]
+        assert translation.calls[-1] == ["What do you think?", "I agree."]
+        assert [seg.translation for seg in translated.segments] == [
+            "zh:Hello there.", "zh:What do you think?", "zh:I agree.", "zh:Goodbye.",
+        ]
+
+    async def test_failed_batches_fall_back(self):
+        defluff, translation = FakeDefluff(), FakeTranslation(fail=True)
+        pipeline = await _stream(defluff, translation)
+        translation.fail = False
+
+        translated = await pipeline.translate(await pipeline.clean(_diarized(SEGMENTS)))
+
+        assert len(translation.calls[-1]) == 3
+        assert translated.segments[0].translation == "zh:Hello there."
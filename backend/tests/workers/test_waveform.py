@@ -0,0 +1,92 @@
+"""Tests for the waveform peak pyramid."""
+
+import json
+import wave
+
+import numpy as np
+import pytest
+
+import app.workers.waveform as waveform_module
+from app.workers.waveform import WaveformWorker
+
+
+def _write_wav(path, samples, sample_rate, channels=1):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(samples.astype("<i2").tobytes())
+
+
+def _expected_min_max(mono, sample_rate, rate):
+    count = max(1, len(mono) * rate // sample_rate)
+    bounds = [i * sample_rate // rate for i in range(count)] + [len(mono)]
+    return np.array([
+        [mono[a:b].min(), mono[a:b].max()] for a, b in zip(bounds, bounds[1:])
+    ])
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    """Read audio in blocks that do not line up with peak windows."""
+    monkeypatch.setattr(waveform_module, "_BLOCK_FRAMES", 997)
+
+
+class TestGeneratePeaks:
+    @pytest.mark.parametrize("sample_rate,channels", [(16000, 1), (44100, 2)])
+    async def test_matches_per_window_scan(self, tmp_path, small_blocks, sample_rate, channels):
+        rng = np.random.default_rng(0)
+        samples = (rng.standard_normal(int(sample_rate * 2.5) * channels) * 8000).clip(
+            -32768, 32767
+        ).astype(np.int16)
+        _write_wav(tmp_path / "audio.wav", samples, sample_rate, channels)
+
+        result = await WaveformWorker().generate_peaks(
+            tmp_path / "audio.wav", tmp_path / "audio.peaks"
+        )
+
+        mono = (samples.astype(np.float32) / 32768).reshape(-1, channels).mean(axis=1)
+        expected = np.round(_expected_min_max(mono, sample_rate, 1000) * 32767)
+        stored = np.fromfile(tmp_path / "audio.peaks", dtype="<i2", count=expected.size)
+        np.testing.assert_array_equal(stored.reshape(-1, 2), expected)
+        assert result["total_samples"] == 2500
+        assert result["levels"] == [1000, 100, 10]
+
+    async def test_pyramid_levels(self, tmp_path):
+        sample_rate = 8000
+        samples = np.zeros(sample_rate * 3, dtype=np.int16)
+        samples[sample_rate + 100] = 16000  # one click at ~1.01 s
+        _write_wav(tmp_path / "audio.wav", samples, sample_rate)
+        worker = WaveformWorker()
+        await worker.generate_peaks(tmp_path / "audio.wav", tmp_path / "audio.peaks")
+
+        coarse = await worker.load_peaks(tmp_path / "audio.peaks", rate=10)
+        assert coarse["sample_rate"] == 10
+        assert len(coarse["peaks"]) == 30
+        assert coarse["peaks"][10] == 1.0
+        assert sum(coarse["peaks"]) == 1.0
+
+    async def test_load_range_reads_visible_window(self, tmp_path):
+        sample_rate = 16000
+        samples = np.zeros(sample_rate * 60, dtype=np.int16)
+        samples[sample_rate * 30:sample_rate * 31] = 1000
+        _write_wav(tmp_path / "audio.wav", samples, sample_rate)
+        worker = WaveformWorker()
+        await worker.generate_peaks(tmp_path / "audio.wav", tmp_path / "audio.peaks")
+
+        # 10 s drawn on 200 px: 20 peaks/s needed -> 100/s level
+        window = await worker.load_range(tmp_path / "audio.peaks", 25.0, 35.0, width=200)
+        assert window["rate"] == 100
+        assert (window["start"], window["end"]) == (25.0, 35.0)
+        assert len(window["min"]) == len(window["max"]) == 1000
+        assert window["max"][500:600] == [window["scale"]] * 100
+        assert window["max"][:500] == [0] * 500
+
+        fine = await worker.load_range(tmp_path / "audio.peaks", 59.5, 70.0, rate=1000)
+        assert fine["rate"] == 1000 and fine["end"] == 60.0 and len(fine["max"]) == 500
+
+    async def test_load_legacy_json(self, tmp_path):
+        legacy = {"peaks": [0.5, 1.0], "sample_rate": 1000, "duration": 0.002}
+        (tmp_path / "original.json").write_text(json.dumps(legacy))
+
+        assert await WaveformWorker().load_peaks(tmp_path / "original.json") == legacy
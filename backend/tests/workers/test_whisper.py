@@ -0,0 +1,103 @@
+"""Tests for streaming Whisper transcription with checkpoints."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import app.workers.whisper as whisper_module
+from app.models.transcript import Segment
+from app.workers.resegment import resegment_words
+from app.workers.whisper import WhisperWorker
+
+
+def _segment(words, start):
+    timed = []
+    t = start
+    for word in words:
+        timed.append(SimpleNamespace(start=t, end=t + 0.5, word=f" {word}"))
+        t += 0.6
+    return SimpleNamespace(
+        start=timed[0].start, end=timed[-1].end, text=" ".join(words), words=timed
+    )
+
+
+class FakeModel:
+    """faster-whisper model returning fixed segments."""
+
+    def __init__(self, segments):
+        self.segments = segments
+        self.audio = None
+
+    def transcribe(self, audio, language=None, word_timestamps=False, vad_filter=False):
+        self.audio = audio
+        return iter(self.segments), SimpleNamespace(language=language or "en")
+
+
+@pytest.fixture
+def audio_path(tmp_path):
+    path = tmp_path / "audio.wav"
+    path.write_bytes(b"")
+    return path
+
+
+def _worker(model) -> WhisperWorker:
+    worker = WhisperWorker()
+    worker.model = model
+    worker._loaded_model_name = worker.model_name
+    return worker
+
+
+class TestTranscriptionStream:
+    async def test_streams_same_sentences_as_batch(self, audio_path, tmp_path, monkeypatch):
+        monkeypatch.setattr(whisper_module, "_CHECKPOINT_INTERVAL", 0.0)
+        segments = [
+            _segment(["I", "like", "cats.", "She"], 0.0),
+            _segment(["likes", "dogs.", "We", "like", "birds."], 3.0),
+        ]
+        checkpoint = tmp_path / "raw.partial.json"
+        stream = _worker(FakeModel(segments)).transcribe_stream(
+            audio_path, checkpoint_path=checkpoint
+        )
+
+        streamed = [seg async for seg in stream]
+
+        assert streamed == resegment_words(segments)
+        assert stream.transcript().segments == streamed
+        assert stream.language == "en"
+        saved = json.loads(checkpoint.read_text())
+        assert saved["language"] == "en"
+        assert saved["segments"] and saved["resume_from"] == saved["segments"][-1]["end"]
+
+    async def test_resumes_after_checkpoint(self, audio_path, tmp_path, monkeypatch):
+        checkpoint = tmp_path / "raw.partial.json"
+        saved = Segment(start=0.0, end=4.0, text="Saved before the crash.")
+        checkpoint.write_text(json.dumps({
+            "language": "de",
+            "resume_from": 4.0,
+            "segments": [saved.model_dump()],
+        }))
+        monkeypatch.setattr(
+            whisper_module, "_decode_audio", lambda path, offset: ("samples from", offset)
+        )
+        model = FakeModel([_segment(["Then", "it", "continued."], 0.5)])
+        stream = _worker(model).transcribe_stream(audio_path, checkpoint_path=checkpoint)
+
+        streamed = [seg async for seg in stream]
+
+        assert model.audio == ("samples from", 4.0)
+        assert streamed[0] == saved
+        assert streamed[1].text == "Then it continued."
+        assert streamed[1].start == pytest.approx(4.5)
+        assert stream.language == "de"
+
+    async def test_corrupt_checkpoint_starts_over(self, audio_path, tmp_path):
+        checkpoint = tmp_path / "raw.partial.json"
+        checkpoint.write_text("{not json")
+        model = FakeModel([_segment(["Fresh", "start", "here."], 0.0)])
+        stream = _worker(model).transcribe_stream(audio_path, checkpoint_path=checkpoint)
+
+        streamed = [seg async for seg in stream]
+
+        assert model.audio == str(audio_path)
+        assert [seg.text for seg in streamed] == ["Fresh start here."]
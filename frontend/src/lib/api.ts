@@ -15,6 +15,7 @@ import type {
   ProbeSubtitlesResponse,
   SegmentState,
   WaveformData,
+  WaveformRange,
   CoverFrameResponse,
   TitleCandidatesResponse,
   ThumbnailGenerateRequest,
@@ -870,6 +871,18 @@ export async function getWaveform(
   return fetchAPI<WaveformData>(`/timelines/${timelineId}/waveform/${trackType}`);
 }
 
+export async function getWaveformRange(
+  timelineId: string,
+  trackType: "original" | "dubbing" | "bgm",
+  start: number,
+  end: number,
+  width: number
+): Promise<WaveformRange> {
+  return fetchAPI<WaveformRange>(
+    `/timelines/${timelineId}/waveform/${trackType}/range?start=${start}&end=${end}&width=${Math.round(width)}`
+  );
+}
+
 export async function generateWaveform(
   timelineId: string,
   trackType: "original" | "dubbing" | "bgm" = "original"
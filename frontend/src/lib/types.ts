@@ -388,6 +388,17 @@ export interface WaveformData {
   duration: number;        // Total duration in seconds
 }
 
+export interface WaveformRange {
+  track_type: string;
+  rate: number;            // Peaks per second of the zoom level used (1000, 100 or 10)
+  start: number;           // Start of the first peak window (seconds)
+  end: number;             // End of the last peak window (seconds)
+  duration: number;        // Total duration in seconds
+  scale: number;           // Value of a full-height peak (divide min/max by it)
+  min: number[];
+  max: number[];
+}
+
 export interface TimelineState {
   playheadTime: number;    // Current playhead position (seconds)
   zoom: number;            // Pixels per second
@@ -700,6 +711,7 @@ export interface DubbingConfig {
   bgm_volume: number;
   sfx_volume: number;
   vocal_volume: number;
+  duck_volume: number;  // 0-1, BGM/SFX gain under dubbed speech (1 = no ducking)
   target_language: string;
   keep_bgm: boolean;
   keep_sfx: boolean;
@@ -714,6 +726,7 @@ export interface DubbingConfigUpdate {
   bgm_volume?: number;
   sfx_volume?: number;
   vocal_volume?: number;
+  duck_volume?: number;
   target_language?: string;
   keep_bgm?: boolean;
   keep_sfx?: boolean;
@@ -751,6 +764,7 @@ export interface DubbingStatus {
   dubbed_segments: number;
   total_segments: number;
   error: string | null;
+  step_timings: Record<string, number>;
 }
 
 export interface LipSyncStatus {